@@ -888,6 +888,8 @@ class DatabaseSetup:
             "CREATE INDEX IF NOT EXISTS idx_papers_keywords ON papers USING GIN(keywords)",
             "CREATE INDEX IF NOT EXISTS idx_papers_created_at ON papers(created_at)",
             "CREATE INDEX IF NOT EXISTS idx_papers_deleted_at ON papers(deleted_at)",
+            "CREATE INDEX IF NOT EXISTS idx_papers_checksum ON papers(checksum) WHERE checksum IS NOT NULL AND deleted_at IS NULL",
+            "CREATE INDEX IF NOT EXISTS idx_project_papers_paper_id ON project_papers(paper_id)",
             "CREATE INDEX IF NOT EXISTS idx_conversations_type ON conversations(type)",
             "CREATE INDEX IF NOT EXISTS idx_conversations_created_by ON conversations(created_by)",
             "CREATE INDEX IF NOT EXISTS idx_conversations_created_at ON conversations(created_at)",
@@ -1213,6 +1215,7 @@ class DatabaseSetup:
             messages = self.mongo_db.messages
             message_indexes = [
                 [("conversation_id", 1), ("timestamp", 1)],
+                [("conversation_id", 1), ("deleted_at", 1), ("_id", -1)],
                 [("sender_id", 1), ("timestamp", -1)],
                 [("conversation_id", 1), ("message_type", 1)],
                 [("metadata.paper_id", 1)],
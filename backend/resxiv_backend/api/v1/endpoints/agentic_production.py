@@ -29,6 +29,8 @@ from app.models.agentic_models import (
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
 from app.core.ratelimiter import limiter
 from app.config.settings import get_settings
+from app.database.connection import db_manager
+from app.utils.sse import sse_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -78,34 +80,12 @@ async def process_project_message(
     try:
         logger.info(f"Processing project-scoped agentic request: project {project_id}, user {user_id}")
         
-        from app.repositories.conversation_repository import ConversationRepository
-        from app.models.conversation_models import ConversationType
-
-        conversation_id = agentic_request.conversation_id
-
-        if not conversation_id:
-            # Create a brand-new AGENTIC conversation (one-off session)
-            conv_repo = ConversationRepository(session)
-            new_conv = await conv_repo.create(
-                type=ConversationType.AGENTIC,
-                entity=project_id,
-                is_group=False,
-                created_by=user_id
-            )
-            await session.commit()
-            conversation_id = str(new_conv.id)
-            logger.info(f"Created new agentic conversation {conversation_id} for project {project_id}")
-        
-        # Enhanced context with comprehensive project information
-        processing_context = {
-            "user_id": str(user_id),
-            "project_id": str(project_id),
-            "conversation_id": conversation_id,
-            "project_access": project_access,
-            "user_role": project_access.get("user_role", "member"),
-            "user_preferences": agentic_request.preferences,
-            **agentic_request.context
-        }
+        conversation_id = await _resolve_agentic_conversation(
+            session, project_id, user_id, agentic_request.conversation_id
+        )
+        processing_context = _agentic_processing_context(
+            agentic_request, project_id, user_id, conversation_id, project_access
+        )
         
         # Process through agentic service with project context
         result = await production_agentic_service.process_message(
@@ -125,27 +105,9 @@ async def process_project_message(
             )
         
         # Format response with enhanced metadata
-        processing_time = time.time() - start_time
-        
-        response = AgenticResponse(
-            success=True,
-            response=result.get("response", ""),
-            agent=result.get("agent"),
-            intent=result.get("intent"),
-            tool_calls=result.get("tool_calls", 0),
-            conversation_id=conversation_id,
-            processing_time=processing_time,
-            timestamp=datetime.utcnow().isoformat(),
-            metadata={
-                "project_id": str(project_id),
-                "project_scoped": True,
-                "user_role": project_access.get("user_role"),
-                "conversation_type": "project_agentic",
-                **(result.get("metadata", {}))
-            }
-        )
+        response = _agentic_response(result, project_id, conversation_id, project_access, start_time)
         
-        logger.info(f"Successfully processed project-scoped agentic request in {processing_time:.3f}s")
+        logger.info(f"Successfully processed project-scoped agentic request in {response.processing_time:.3f}s")
         return response
         
     except ServiceError:
@@ -162,6 +124,138 @@ async def process_project_message(
         )
 
 
+async def _resolve_agentic_conversation(
+    session: AsyncSession,
+    project_id: uuid.UUID,
+    user_id: uuid.UUID,
+    conversation_id: Optional[str]
+) -> str:
+    """Use the given conversation or create a brand-new AGENTIC one (one-off session)"""
+    if conversation_id:
+        return conversation_id
+    
+    from app.repositories.conversation_repository import ConversationRepository
+    from app.models.conversation_models import ConversationType
+    
+    conv_repo = ConversationRepository(session)
+    new_conv = await conv_repo.create(
+        type=ConversationType.AGENTIC,
+        entity=project_id,
+        is_group=False,
+        created_by=user_id
+    )
+    await session.commit()
+    conversation_id = str(new_conv.id)
+    logger.info(f"Created new agentic conversation {conversation_id} for project {project_id}")
+    return conversation_id
+
+
+def _agentic_processing_context(
+    agentic_request: AgenticRequest,
+    project_id: uuid.UUID,
+    user_id: uuid.UUID,
+    conversation_id: str,
+    project_access: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Enhanced context with comprehensive project information"""
+    return {
+        "user_id": str(user_id),
+        "project_id": str(project_id),
+        "conversation_id": conversation_id,
+        "project_access": project_access,
+        "user_role": project_access.get("user_role", "member"),
+        "user_preferences": agentic_request.preferences,
+        **agentic_request.context
+    }
+
+
+def _agentic_response(
+    result: Dict[str, Any],
+    project_id: uuid.UUID,
+    conversation_id: str,
+    project_access: Dict[str, Any],
+    start_time: float
+) -> AgenticResponse:
+    return AgenticResponse(
+        success=True,
+        response=result.get("response", ""),
+        agent=result.get("agent"),
+        intent=result.get("intent"),
+        tool_calls=result.get("tool_calls", 0),
+        conversation_id=conversation_id,
+        processing_time=time.time() - start_time,
+        timestamp=datetime.utcnow().isoformat(),
+        metadata={
+            "project_id": str(project_id),
+            "project_scoped": True,
+            "user_role": project_access.get("user_role"),
+            "conversation_type": "project_agentic",
+            **(result.get("metadata", {}))
+        }
+    )
+
+
+@router.post("/{project_id}/process/stream", tags=["Agentic", "Projects", "Streaming"])
+@limiter.limit("30/minute")
+@handle_service_errors("stream agentic message")
+async def stream_project_message(
+    request: Request,
+    project_id: uuid.UUID,
+    agentic_request: AgenticRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user_required),
+    project_access: Dict[str, Any] = Depends(verify_project_access),
+    session: AsyncSession = Depends(get_postgres_session)
+):
+    """
+    Server-sent-event variant of ``/process``.
+    
+    Events:
+    - ``progress``: a LangGraph node finished (``node``, ``status``, ``agent``, ``elapsed``)
+    - ``done``: the final ``AgenticResponse`` payload
+    - ``error``: processing failed after the stream started
+    
+    **Requires:** Project read access
+    **Rate Limited:** 30 requests per minute per user
+    """
+    if not project_access.get("can_read", False):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to access this project"
+        )
+    
+    start_time = time.time()
+    user_id = uuid.UUID(current_user["user_id"])
+    conversation_id = await _resolve_agentic_conversation(
+        session, project_id, user_id, agentic_request.conversation_id
+    )
+    processing_context = _agentic_processing_context(
+        agentic_request, project_id, user_id, conversation_id, project_access
+    )
+    
+    async def events():
+        yield {"event": "start", "data": {"conversation_id": conversation_id}}
+        async for event in production_agentic_service.stream_message(
+            message=agentic_request.message,
+            user_id=str(user_id),
+            project_id=str(project_id),
+            conversation_id=conversation_id,
+            context=processing_context
+        ):
+            if event["event"] == "done":
+                if "error" in event["data"]:
+                    raise ServiceError(
+                        f"Processing failed: {event['data']['error']}",
+                        ErrorCodes.AGENTIC_PROCESSING_ERROR
+                    )
+                response = _agentic_response(
+                    event["data"], project_id, conversation_id, project_access, start_time
+                )
+                event = {"event": "done", "data": response.dict()}
+            yield event
+    
+    return sse_response(events())
+
+
 @router.get("/{project_id}/conversations/{conversation_id}/history", 
            response_model=ConversationHistoryResponse, 
            tags=["Agentic", "Projects"])
@@ -408,41 +502,63 @@ async def paper_chat(
         )
 
 
-@router.post("/{project_id}/drop_chat", response_model=DropChatResponse, tags=["Agentic", "PDF Chat"])
-@limiter.limit("10/minute")
-@handle_service_errors("drop chat")
-async def drop_chat(
+async def _stream_turn(service_class, stream_method: str, turn: Dict[str, Any], start_time: float):
+    """
+    Stream a prepared chat turn on a session owned by the generator.
+    
+    The request-scoped session may be closed by dependency teardown once the
+    response starts, so the streaming half of the turn gets its own service
+    and session for as long as the stream runs.
+    """
+    async with db_manager.get_postgres_session() as stream_session:
+        service = service_class(stream_session)
+        await service.initialize()
+        async for event in getattr(service, stream_method)(turn, start_time):
+            yield event
+
+
+@router.post("/{project_id}/paper_chat/stream", tags=["Agentic", "PDF Chat", "Streaming"])
+@limiter.limit("20/minute")
+@handle_service_errors("stream paper chat")
+async def paper_chat_stream(
     request: Request,
     project_id: uuid.UUID,
-    file: UploadFile = File(..., description="PDF file to chat with"),
-    message: str = Form(..., description="Your message about the PDF"),
-    conversation_id: Optional[str] = Form(None, description="Optional conversation ID"),
+    chat_request: PaperChatRequest,
     current_user: Dict[str, Any] = Depends(get_current_user_required),
     project_access: Dict[str, Any] = Depends(verify_project_access),
     session: AsyncSession = Depends(get_postgres_session)
 ):
     """
-    Chat with a dropped PDF file within a project context. Reads the uploaded PDF 
-    content and enables AI-powered conversation about the document using GPT-4o-mini.
+    Server-sent-event variant of ``/paper_chat``.
     
-    Features:
-    - Upload and read PDF content using PyPDF (configurable size limit)
-    - Project-scoped for proper access control and organization
-    - Conversation history management
-    - GPT-4o-mini powered responses
-    - MongoDB conversation storage
+    Events: ``start`` (conversation and paper IDs), ``token`` (content delta),
+    ``done`` (the ``PaperChatResponse`` payload) or ``error``. Messages are
+    stored once the stream completes.
     
     **Requires:** Project read access
-    **Rate Limited:** 10 requests per minute per user
-    **File Limit:** Configurable (default 50MB) for research papers
+    **Rate Limited:** 20 requests per minute per user
     """
-    # Verify read access
     if not project_access.get("can_read", False):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions to access this project"
+            detail="Insufficient permissions to access papers in this project"
         )
     
+    start_time = time.time()
+    pdf_chat_service = PDFChatService(session)
+    await pdf_chat_service.initialize()
+    turn = await pdf_chat_service.prepare_paper_chat(
+        paper_id=chat_request.paper_id,
+        project_id=str(project_id),
+        user_id=str(current_user["user_id"]),
+        message=chat_request.message,
+        conversation_id=chat_request.conversation_id
+    )
+    return sse_response(_stream_turn(PDFChatService, "stream_chat_turn", turn, start_time))
+
+
+def _validate_dropped_pdf(file: UploadFile) -> None:
+    """Reject non-PDF uploads and files above the configured size limit"""
     # Validate file type
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(
@@ -465,6 +581,44 @@ async def drop_chat(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File size ({file_size_mb}MB) exceeds the maximum allowed size of {max_size_mb}MB"
         )
+
+
+@router.post("/{project_id}/drop_chat", response_model=DropChatResponse, tags=["Agentic", "PDF Chat"])
+@limiter.limit("10/minute")
+@handle_service_errors("drop chat")
+async def drop_chat(
+    request: Request,
+    project_id: uuid.UUID,
+    file: UploadFile = File(..., description="PDF file to chat with"),
+    message: str = Form(..., description="Your message about the PDF"),
+    conversation_id: Optional[str] = Form(None, description="Optional conversation ID"),
+    current_user: Dict[str, Any] = Depends(get_current_user_required),
+    project_access: Dict[str, Any] = Depends(verify_project_access),
+    session: AsyncSession = Depends(get_postgres_session)
+):
+    """
+    Chat with a dropped PDF file within a project context. Reads the uploaded PDF 
+    content and enables AI-powered conversation about the document using GPT-4o-mini.
+    
+    Features:
+    - Upload and read PDF content using PyPDF (configurable size limit)
+    - Project-scoped for proper access control and organization
+    - Conversation history management
+    - GPT-4o-mini powered responses
+    - MongoDB conversation storage
+    
+    **Requires:** Project read access
+    **Rate Limited:** 10 requests per minute per user
+    **File Limit:** Configurable (default 50MB) for research papers
+    """
+    # Verify read access
+    if not project_access.get("can_read", False):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to access this project"
+        )
+    
+    _validate_dropped_pdf(file)
     
     try:
         user_id = str(current_user["user_id"])
@@ -503,6 +657,48 @@ async def drop_chat(
         )
 
 
+@router.post("/{project_id}/drop_chat/stream", tags=["Agentic", "PDF Chat", "Streaming"])
+@limiter.limit("10/minute")
+@handle_service_errors("stream drop chat")
+async def drop_chat_stream(
+    request: Request,
+    project_id: uuid.UUID,
+    file: UploadFile = File(..., description="PDF file to chat with"),
+    message: str = Form(..., description="Your message about the PDF"),
+    conversation_id: Optional[str] = Form(None, description="Optional conversation ID"),
+    current_user: Dict[str, Any] = Depends(get_current_user_required),
+    project_access: Dict[str, Any] = Depends(verify_project_access),
+    session: AsyncSession = Depends(get_postgres_session)
+):
+    """
+    Server-sent-event variant of ``/drop_chat``.
+    
+    The PDF is extracted before the stream starts. Events: ``start``,
+    ``token``, ``done`` (the ``DropChatResponse`` payload) or ``error``.
+    
+    **Requires:** Project read access
+    **Rate Limited:** 10 requests per minute per user
+    """
+    if not project_access.get("can_read", False):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to access this project"
+        )
+    _validate_dropped_pdf(file)
+    
+    start_time = time.time()
+    pdf_chat_service = PDFChatService(session)
+    await pdf_chat_service.initialize()
+    turn = await pdf_chat_service.prepare_drop_chat(
+        file=file,
+        project_id=str(project_id),
+        user_id=str(current_user["user_id"]),
+        message=message,
+        conversation_id=conversation_id
+    )
+    return sse_response(_stream_turn(PDFChatService, "stream_chat_turn", turn, start_time))
+
+
 # =====================================================
 # SIMPLE CHAT ENDPOINTS (NEW)
 # =====================================================
@@ -575,6 +771,46 @@ async def simple_chat(
         )
 
 
+@router.post("/{project_id}/simple_chat/stream", tags=["Agentic", "Simple Chat", "Streaming"])
+@limiter.limit("20/minute")
+@handle_service_errors("stream simple chat")
+async def simple_chat_stream(
+    request: Request,
+    project_id: uuid.UUID,
+    chat_request: SimpleChatRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user_required),
+    project_access: Dict[str, Any] = Depends(verify_project_access),
+    session: AsyncSession = Depends(get_postgres_session)
+):
+    """
+    Server-sent-event variant of ``/simple_chat``.
+    
+    Events: ``start`` (conversation ID), ``token`` (content delta), ``done``
+    (the ``SimpleChatResponse`` payload) or ``error``. Messages are stored
+    once the stream completes.
+    
+    **Requires:** Project read access
+    **Rate Limited:** 20 requests per minute per user
+    """
+    if not project_access.get("can_read", False):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to access this project"
+        )
+    
+    from app.services.simple_ai_chat_service import SimpleAIChatService
+    start_time = time.time()
+    ai_chat_service = SimpleAIChatService(session)
+    await ai_chat_service.initialize()
+    turn = await ai_chat_service.prepare_chat(
+        user_id=str(current_user["user_id"]),
+        project_id=str(project_id),
+        message=chat_request.message,
+        conversation_id=chat_request.conversation_id
+    )
+    return sse_response(_stream_turn(SimpleAIChatService, "stream_chat", turn, start_time))
+
+
 # =====================================================
 # LATEX EDITOR ENDPOINTS (NEW)
 # =====================================================
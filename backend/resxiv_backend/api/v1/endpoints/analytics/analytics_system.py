@@ -5,6 +5,7 @@ Focused module for system-wide analytics functionality.
 Extracted from bloated analytics.py for SOLID compliance.
 """
 
+import uuid
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -156,4 +157,42 @@ async def get_system_health(
                 "status": "healthy" if recent_errors < 5 else "warning" if recent_errors < 20 else "critical"
             }
         }
-    } 
\ No newline at end of file
+    } 
+
+@router.get("/system/llm", response_model=Dict[str, Any])
+@handle_service_errors("LLM usage retrieval")
+async def get_llm_usage(
+    project_id: Optional[uuid.UUID] = Query(None, description="Restrict usage to one project"),
+    current_user: Dict = Depends(get_current_user_required),
+    session: AsyncSession = Depends(get_postgres_session)
+):
+    """
+    Get LLM gateway usage and response cache hit rates
+    
+    System admins may read any project or all of them; other users only a
+    project they are a member of.
+    """
+    from app.core.llm_gateway import llm_gateway
+    from app.core.llm_cache import llm_response_cache
+    from app.services.admin_service import AdminService
+    from app.repositories.project_repository import ProjectRepository
+    
+    user_id = uuid.UUID(str(current_user["user_id"]))
+    if not await AdminService(session).is_system_admin(user_id):
+        if project_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied: Usage across all projects is admin-only"
+            )
+        if not await ProjectRepository(session).is_user_member(project_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied: Not a member of this project"
+            )
+    
+    return {
+        "success": True,
+        "timestamp": datetime.utcnow().isoformat(),
+        "usage": llm_gateway.get_usage(project_id),
+        "cache": llm_response_cache.get_stats()
+    }
@@ -25,6 +25,7 @@ from app.core.ratelimiter import limiter
 from app.config.settings import get_settings
 settings_cfg = get_settings()
 from app.core.auth import AuthService
+from app.core.user_directory import user_directory
 
 logger = logging.getLogger(__name__)
 
@@ -469,8 +470,7 @@ async def get_users_batch(
             detail="Maximum 100 user IDs allowed per request"
         )
     
-    user_service = UserService(session)
-    users_info = await user_service.get_users_basic_info_batch(user_ids)
+    users_info = await user_directory.get_many(user_ids)
     
     return {
         "success": True,
@@ -54,7 +54,7 @@ async def create_conversation(
 @handle_service_errors("list conversations")
 async def list_user_conversations(
     page: int = Query(1, ge=1, description="Page number"),
-    size: int = Query(20, ge=1, le=100, description="Items per page"),
+    size: int = Query(20, ge=1, le=200, description="Items per page"),
     conversation_type: Optional[ConversationType] = Query(None, description="Filter by type"),
     current_user: Dict = Depends(get_current_user_required),
     session: AsyncSession = Depends(get_postgres_session),
@@ -19,7 +19,7 @@ from app.services.journal_service import JournalService
 from app.models.journal_models import (
     JournalCreate, JournalUpdate, JournalDetailResponse, JournalListResponse,
     JournalCollaboratorCreate, JournalCollaboratorResponse,
-    JournalVersionResponse, JournalTagCreate, JournalTagResponse,
+    JournalVersionResponse, JournalVersionSummary, JournalTagCreate, JournalTagResponse,
     JournalSearchFilters, JournalPermissionCheck,
     BulkJournalOperation, BulkOperationResult, JournalStatus
 )
@@ -200,10 +200,10 @@ async def list_project_journals(
         journal_service = JournalService(session)
         journals = await journal_service.list_project_journals(
             project_id=project_id,
-            user_id=uuid.UUID(current_user["user_id"]),
-            filters=filters,
-            page=page,
-            per_page=per_page
+            limit=per_page,
+            offset=(page - 1) * per_page,
+            status_filter=filters.status,
+            search_query=filters.query
         )
         
         return journals
@@ -371,7 +371,7 @@ async def list_journal_collaborators(
 # Version Management
 # ================================
 
-@router.get("/journals/{journal_id}/versions", response_model=List[JournalVersionResponse])
+@router.get("/journals/{journal_id}/versions", response_model=List[JournalVersionSummary])
 async def get_journal_versions(
     journal_id: uuid.UUID = Path(..., description="Journal ID"),
     current_user: Dict = Depends(get_current_user_required),
@@ -380,16 +380,25 @@ async def get_journal_versions(
     """
     Get version history of a journal
     
-    Returns all versions of the journal in reverse chronological order.
-    Users must have read access to the journal.
+    Returns version metadata in reverse chronological order; fetch a single
+    version for its content. Users must have read access to the journal.
     """
     try:
         journal_service = JournalService(session)
-        versions = await journal_service.get_journal_versions(
+        
+        permissions = await journal_service.check_journal_permission(
             journal_id=journal_id,
             user_id=uuid.UUID(current_user["user_id"])
         )
         
+        if not permissions.can_read:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied: Cannot read this journal"
+            )
+        
+        versions = await journal_service.get_journal_versions(journal_id)
+        
         return versions
         
     except HTTPException:
@@ -429,37 +438,15 @@ async def get_journal_version(
                 detail="Access denied: Cannot read this journal"
             )
         
-        # Get specific version
-        result = await session.execute(
-            text("""
-                SELECT jv.id, jv.journal_id, jv.version_number, jv.title, jv.content,
-                       jv.changed_by, jv.change_summary, jv.created_at,
-                       u.name as changed_by_name
-                FROM journal_versions jv
-                LEFT JOIN users u ON jv.changed_by = u.id
-                WHERE jv.journal_id = %s AND jv.version_number = %s
-            """),
-            [str(journal_id), version_number]
-        )
-        
-        row = result.fetchone()
-        if not row:
+        # Rebuilt from the nearest keyframe
+        version = await journal_service.get_journal_version(journal_id, version_number)
+        if not version:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Journal version not found"
             )
         
-        return JournalVersionResponse(
-            id=row.id,
-            journal_id=row.journal_id,
-            version_number=row.version_number,
-            title=row.title,
-            content=row.content,
-            changed_by=row.changed_by,
-            change_summary=row.change_summary,
-            created_at=row.created_at,
-            changed_by_name=row.changed_by_name
-        )
+        return version
         
     except HTTPException:
         raise
@@ -606,103 +593,17 @@ async def bulk_journal_operation(
     Perform bulk operations on journals
     
     Supports operations like bulk delete, archive, publish, etc.
-    Only affects journals the user has appropriate permissions for.
+    Only affects journals the user has appropriate permissions for; the
+    result reports the outcome for every requested journal.
     """
     try:
         journal_service = JournalService(session)
         user_id = uuid.UUID(current_user["user_id"])
         
-        results = []
-        successful = 0
-        failed = 0
-        
-        for journal_id in operation.journal_ids:
-            try:
-                # Check permissions for this journal
-                permissions = await journal_service.check_journal_permission(journal_id, user_id)
-                
-                if operation.operation == "delete":
-                    if not permissions.can_admin:
-                        results.append({
-                            "journal_id": str(journal_id),
-                            "status": "failed",
-                            "reason": "Insufficient permissions"
-                        })
-                        failed += 1
-                        continue
-                    
-                    await journal_service.delete_journal(journal_id, user_id)
-                    results.append({
-                        "journal_id": str(journal_id),
-                        "status": "success",
-                        "message": "Journal deleted"
-                    })
-                    successful += 1
-                
-                elif operation.operation in ["archive", "publish"]:
-                    if not permissions.can_write:
-                        results.append({
-                            "journal_id": str(journal_id),
-                            "status": "failed",
-                            "reason": "Insufficient permissions"
-                        })
-                        failed += 1
-                        continue
-                    
-                    # Update status
-                    status_map = {
-                        "archive": JournalStatus.ARCHIVED,
-                        "publish": JournalStatus.PUBLISHED
-                    }
-                    
-                    update_data = JournalUpdate(status=status_map[operation.operation])
-                    await journal_service.update_journal(journal_id, update_data, user_id)
-                    
-                    results.append({
-                        "journal_id": str(journal_id),
-                        "status": "success",
-                        "message": f"Journal {operation.operation}d"
-                    })
-                    successful += 1
-                
-                elif operation.operation in ["make_public", "make_private"]:
-                    if not permissions.can_admin:
-                        results.append({
-                            "journal_id": str(journal_id),
-                            "status": "failed",
-                            "reason": "Insufficient permissions"
-                        })
-                        failed += 1
-                        continue
-                    
-                    is_public = operation.operation == "make_public"
-                    update_data = JournalUpdate(is_public=is_public)
-                    await journal_service.update_journal(journal_id, update_data, user_id)
-                    
-                    results.append({
-                        "journal_id": str(journal_id),
-                        "status": "success",
-                        "message": f"Journal made {'public' if is_public else 'private'}"
-                    })
-                    successful += 1
-                
-            except Exception as e:
-                results.append({
-                    "journal_id": str(journal_id),
-                    "status": "failed",
-                    "reason": str(e)
-                })
-                failed += 1
-        
+        result = await journal_service.bulk_journal_operation(operation, user_id)
         await session.commit()
         
-        return BulkOperationResult(
-            operation=operation.operation,
-            total_requested=len(operation.journal_ids),
-            successful=successful,
-            failed=failed,
-            results=results
-        )
+        return result
         
     except Exception as e:
         await session.rollback()
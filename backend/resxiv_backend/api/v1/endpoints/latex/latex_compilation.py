@@ -5,11 +5,10 @@ Focused on LaTeX compilation, PDF generation, and preview functionality.
 
 import uuid
 import logging
-import asyncio
 from typing import Dict, Any, Optional
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path as FastAPIPath, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path as FastAPIPath
 from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +16,8 @@ from api.dependencies import (
     get_postgres_session, get_current_user_required, verify_project_access
 )
 from app.services.git_service import GitService
+from app.core.error_handling import ServiceError
+from app.utils.sse import sse_response
 from app.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -27,7 +28,6 @@ settings = get_settings()
 
 @router.post("/projects/{project_id}/latex/{latex_id}/compile")
 async def compile_latex_project(
-    background_tasks: BackgroundTasks,
     project_id: uuid.UUID = FastAPIPath(..., description="Project UUID"),
     latex_id: str = FastAPIPath(..., description="LaTeX project ID"),
     main_file: str = Query("main.tex", description="Main LaTeX file to compile"),
@@ -82,15 +82,7 @@ async def compile_latex_project(
         
         compilation_id = result["compilation_id"]
         
-        # Schedule background compilation monitoring
-        background_tasks.add_task(
-            _monitor_compilation,
-            session,
-            project_id,
-            latex_id,
-            compilation_id
-        )
-        
+        # The compile pool enforces the build timeout and records the final status
         return {
             "success": True,
             "compilation_id": compilation_id,
@@ -155,6 +147,30 @@ async def get_compilation_status(
         )
 
 
+@router.get("/projects/{project_id}/latex/{latex_id}/compile/{compilation_id}/events")
+async def stream_compilation_events(
+    project_id: uuid.UUID = FastAPIPath(..., description="Project UUID"),
+    latex_id: str = FastAPIPath(..., description="LaTeX project ID"),
+    compilation_id: str = FastAPIPath(..., description="Compilation ID"),
+    current_user: Dict[str, Any] = Depends(get_current_user_required),
+    session: AsyncSession = Depends(get_postgres_session),
+    _project: Dict[str, Any] = Depends(verify_project_access)
+):
+    """
+    Stream compilation progress as server-sent events.
+    
+    Sends the current ``status`` first, then ``status`` transitions and
+    ``log`` lines as they happen; the final status carries ``artifact_url``
+    when the PDF is ready. The stream ends once the compilation finishes.
+    """
+    git_service = GitService(session)
+    try:
+        events = await git_service.compilation_events(project_id, compilation_id)
+    except ServiceError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    return sse_response(events)
+
+
 @router.get("/projects/{project_id}/latex/{latex_id}/compile/{compilation_id}/download")
 async def download_compiled_pdf(
     project_id: uuid.UUID = FastAPIPath(..., description="Project UUID"),
@@ -305,58 +321,3 @@ async def get_compilation_history(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get compilation history"
         )
-
-
-async def _monitor_compilation(
-    session: AsyncSession,
-    project_id: uuid.UUID,
-    latex_id: str,
-    compilation_id: str
-):
-    """
-    Background task to monitor compilation progress.
-    
-    Updates compilation status and handles completion/failure.
-    """
-    try:
-        git_service = GitService(session)
-        
-        # Monitor compilation with timeout
-        timeout = 300  # 5 minutes
-        start_time = asyncio.get_event_loop().time()
-        
-        while True:
-            # Check if timeout exceeded
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                await git_service.mark_compilation_timeout(
-                    project_id=project_id,
-                    latex_id=latex_id,
-                    compilation_id=compilation_id
-                )
-                break
-            
-            # Check compilation status
-            status_result = await git_service.check_compilation_progress(
-                project_id=project_id,
-                latex_id=latex_id,
-                compilation_id=compilation_id
-            )
-            
-            if status_result["status"] in ["completed", "failed", "timeout"]:
-                break
-            
-            # Wait before next check
-            await asyncio.sleep(5)
-        
-    except Exception as e:
-        logger.error(f"Error monitoring compilation: {str(e)}")
-        # Mark compilation as failed
-        try:
-            await git_service.mark_compilation_failed(
-                project_id=project_id,
-                latex_id=latex_id,
-                compilation_id=compilation_id,
-                error=str(e)
-            )
-        except Exception:
-            pass 
\ No newline at end of file
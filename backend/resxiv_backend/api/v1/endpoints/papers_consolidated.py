@@ -63,17 +63,15 @@ async def search_project_papers(
     paper_service = PaperService(session)
     
     result = await paper_service.search_papers(
-        project_id=project_id,
         query=query,
-        limit=limit,
-        search_type=search_type,
-        user_id=current_user["user_id"]
+        project_id=project_id,
+        limit=limit
     )
     
     return {
         "success": True,
         "papers": result["papers"],
-        "total": result["total"],
+        "total": result["pagination"]["total_results"],
         "query": query,
         "search_type": search_type,
         "project_id": str(project_id)
@@ -19,7 +19,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from api.dependencies import get_postgres_session, get_current_user_required
-from app.services.paper_service import PaperEmbeddingService
+from app.services.search import hybrid_search_service, suggestion_service
+from app.core.error_handling import ServiceError
 from app.services.research_aggregator_service import ResearchAggregatorService
 from app.services.user_service import UserService
 from app.services.core.project_service_core import ProjectCoreService
@@ -41,8 +42,7 @@ async def unified_search(
     search_type: str = Query("hybrid", description="Search type: semantic, keyword, hybrid"),
     limit: int = Query(20, ge=1, le=100, description="Maximum results per entity type"),
     include_content: bool = Query(True, description="Include content snippets in results"),
-    current_user: Dict = Depends(get_current_user_required),
-    session: AsyncSession = Depends(get_postgres_session)
+    current_user: Dict = Depends(get_current_user_required)
 ):
     """
     Unified search across all ResXiv entities
@@ -50,8 +50,8 @@ async def unified_search(
     Provides intelligent search with:
     - Semantic understanding using embeddings
     - Keyword matching with relevance scoring
-    - Cross-entity result ranking
-    - User access filtering
+    - Hybrid paper search fusing both rankings with reciprocal-rank fusion
+    - Concurrent search across entity types
     """
     try:
         # Parse entity types
@@ -60,192 +60,29 @@ async def unified_search(
         else:
             search_entities = ["papers", "projects", "users", "conversations"]
         
-        results = {
-            "query": q,
-            "search_type": search_type,
-            "entity_types": search_entities,
-            "results": {}
-        }
-        
-        # Search papers using embedding service
-        if "papers" in search_entities:
-            embedding_service = PaperEmbeddingService(session)
-            
-            if search_type in ["semantic", "hybrid"]:
-                paper_results = await embedding_service.search_similar_papers(
-                    query_text=q,
-                    limit=limit,
-                    threshold=0.5  # Lower threshold for broader results
-                )
-                
-                if paper_results["success"]:
-                    # Enhance with paper metadata
-                    enhanced_papers = []
-                    for paper in paper_results["results"]:
-                        # Get paper details from database
-                        paper_details = await session.execute(
-                            text("""
-                                SELECT p.id, p.title, p.authors, p.created_at,
-                                       pp.project_id
-                                FROM papers p
-                                LEFT JOIN project_papers pp ON p.id = pp.paper_id
-                                WHERE p.id = %s
-                                LIMIT 1
-                            """),
-                            [paper["paper_id"]]
-                        )
-                        paper_row = paper_details.fetchone()
-                        
-                        if paper_row:
-                            enhanced_papers.append({
-                                "id": paper["paper_id"],
-                                "title": paper_row.title,
-                                "authors": paper_row.authors or [],
-                                "relevance_score": paper["similarity_score"],
-                                "match_type": "semantic",
-                                "project_id": str(paper_row.project_id) if paper_row.project_id else None,
-                                "created_at": paper_row.created_at.isoformat() if paper_row.created_at else None,
-                                "snippet": paper["source_text"][:200] + "..." if len(paper["source_text"]) > 200 else paper["source_text"]
-                            })
-                    
-                    results["results"]["papers"] = {
-                        "total": len(enhanced_papers),
-                        "items": enhanced_papers
-                    }
-                else:
-                    results["results"]["papers"] = {"total": 0, "items": []}
-            else:
-                # Keyword search for papers
-                paper_search = await session.execute(
-                    text("""
-                        SELECT p.id, p.title, p.authors, p.created_at,
-                               pp.project_id,
-                               ts_rank(to_tsvector('english', p.title || ' ' || COALESCE(array_to_string(p.authors, ' '), '')), 
-                                       plainto_tsquery('english', %s)) as rank
-                        FROM papers p
-                        LEFT JOIN project_papers pp ON p.id = pp.paper_id
-                        WHERE to_tsvector('english', p.title || ' ' || COALESCE(array_to_string(p.authors, ' '), '')) 
-                              @@ plainto_tsquery('english', %s)
-                        ORDER BY rank DESC
-                        LIMIT %s
-                    """),
-                    [q, q, limit]
-                )
-                
-                paper_rows = paper_search.fetchall()
-                paper_items = []
-                for row in paper_rows:
-                    paper_items.append({
-                        "id": str(row.id),
-                        "title": row.title,
-                        "authors": row.authors or [],
-                        "relevance_score": float(row.rank),
-                        "match_type": "keyword",
-                        "project_id": str(row.project_id) if row.project_id else None,
-                        "created_at": row.created_at.isoformat() if row.created_at else None
-                    })
-                
-                results["results"]["papers"] = {
-                    "total": len(paper_items),
-                    "items": paper_items
-                }
-        
-        # Search projects
-        if "projects" in search_entities:
-            project_search = await session.execute(
-                text("""
-                    SELECT p.id, p.name, p.description, p.created_at,
-                           pm.member_count, pp.paper_count,
-                           ts_rank(to_tsvector('english', p.name || ' ' || COALESCE(p.description, '')), 
-                                   plainto_tsquery('english', %s)) as rank
-                    FROM projects p
-                    LEFT JOIN (
-                        SELECT project_id, COUNT(*) as member_count 
-                        FROM project_members 
-                        GROUP BY project_id
-                    ) pm ON p.id = pm.project_id
-                    LEFT JOIN (
-                        SELECT project_id, COUNT(*) as paper_count 
-                        FROM project_papers 
-                        GROUP BY project_id
-                    ) pp ON p.id = pp.project_id
-                    WHERE p.deleted_at IS NULL
-                    AND to_tsvector('english', p.name || ' ' || COALESCE(p.description, '')) 
-                        @@ plainto_tsquery('english', %s)
-                    ORDER BY rank DESC
-                    LIMIT %s
-                """),
-                [q, q, limit]
-            )
-            
-            project_rows = project_search.fetchall()
-            project_items = []
-            for row in project_rows:
-                project_items.append({
-                    "id": str(row.id),
-                    "name": row.name,
-                    "description": row.description,
-                    "member_count": row.member_count or 0,
-                    "paper_count": row.paper_count or 0,
-                    "relevance_score": float(row.rank),
-                    "match_type": "keyword",
-                    "created_at": row.created_at.isoformat() if row.created_at else None
-                })
-            
-            results["results"]["projects"] = {
-                "total": len(project_items),
-                "items": project_items
-            }
-        
-        # Search users
-        if "users" in search_entities:
-            user_search = await session.execute(
-                text("""
-                    SELECT u.id, u.name, u.email, u.interests,
-                           ts_rank(to_tsvector('english', u.name || ' ' || COALESCE(u.email, '') || ' ' || 
-                                               COALESCE(array_to_string(u.interests, ' '), '')), 
-                                   plainto_tsquery('english', %s)) as rank
-                    FROM users u
-                    WHERE u.deleted_at IS NULL
-                    AND to_tsvector('english', u.name || ' ' || COALESCE(u.email, '') || ' ' || 
-                                    COALESCE(array_to_string(u.interests, ' '), '')) 
-                        @@ plainto_tsquery('english', %s)
-                    ORDER BY rank DESC
-                    LIMIT %s
-                """),
-                [q, q, limit]
-            )
-            
-            user_rows = user_search.fetchall()
-            user_items = []
-            for row in user_rows:
-                user_items.append({
-                    "id": str(row.id),
-                    "name": row.name,
-                    "email": row.email,
-                    "interests": row.interests or [],
-                    "relevance_score": float(row.rank),
-                    "match_type": "keyword"
-                })
-            
-            results["results"]["users"] = {
-                "total": len(user_items),
-                "items": user_items
-            }
+        # Entity searches run concurrently on their own sessions
+        found = await hybrid_search_service.search(
+            query=q,
+            entity_types=search_entities,
+            search_type=search_type,
+            limit=limit
+        )
         
         # Calculate overall statistics
-        total_results = sum(
-            results["results"][entity]["total"] 
-            for entity in results["results"]
-        )
+        total_results = sum(entity["total"] for entity in found["results"].values())
         
         return {
             "success": True,
             "total_results": total_results,
-            "search_time_ms": 245,  # This would be measured in real implementation
-            **results
+            "search_time_ms": found["search_time_ms"],
+            "query": q,
+            "search_type": search_type,
+            "entity_types": search_entities,
+            "results": found["results"]
         }
         
+    except ServiceError as e:
+        raise HTTPException(status_code=400, detail=e.message)
     except Exception as e:
         logger.error(f"Error in unified search: {str(e)}")
         raise HTTPException(
@@ -265,63 +102,40 @@ async def semantic_search(
     similarity_threshold: float = Body(0.7, ge=0.0, le=1.0, description="Minimum similarity score"),
     limit: int = Body(20, ge=1, le=100, description="Maximum results"),
     filters: Optional[Dict[str, Any]] = Body(None, description="Additional filters"),
-    current_user: Dict = Depends(get_current_user_required),
-    session: AsyncSession = Depends(get_postgres_session)
+    current_user: Dict = Depends(get_current_user_required)
 ):
     """
     Semantic search using vector embeddings
     
-    Performs intelligent semantic matching for papers using existing embedding service
+    Performs nearest-neighbour matching over paper embeddings
     """
     try:
         if entity_type == "papers":
-            # Use existing paper embedding service
-            embedding_service = PaperEmbeddingService(session)
-            
-            result = await embedding_service.search_similar_papers(
-                query_text=query,
+            papers = await hybrid_search_service.search_papers(
+                query,
                 limit=limit,
-                threshold=similarity_threshold
+                search_type="semantic",
+                similarity_threshold=similarity_threshold
             )
-            
-            if result["success"]:
-                # Enhance results with paper details
-                enhanced_results = []
-                for item in result["results"]:
-                    # Get additional paper metadata
-                    paper_details = await session.execute(
-                        text("""
-                            SELECT p.title, p.authors, p.created_at, pp.project_id
-                            FROM papers p
-                            LEFT JOIN project_papers pp ON p.id = pp.paper_id
-                            WHERE p.id = %s
-                            LIMIT 1
-                        """),
-                        [item["paper_id"]]
-                    )
-                    paper_row = paper_details.fetchone()
-                    
-                    if paper_row:
-                        enhanced_results.append({
-                            **item,
-                            "title": paper_row.title,
-                            "authors": paper_row.authors or [],
-                            "created_at": paper_row.created_at.isoformat() if paper_row.created_at else None,
-                            "project_id": str(paper_row.project_id) if paper_row.project_id else None,
-                            "search_type": "semantic",
-                            "entity_type": "paper"
-                        })
-                
-                return {
-                    "success": True,
-                    "query": query,
-                    "entity_type": entity_type,
-                    "similarity_threshold": similarity_threshold,
-                    "results": enhanced_results,
-                    "total_found": len(enhanced_results)
+            enhanced_results = [
+                {
+                    **paper,
+                    "paper_id": paper["id"],
+                    "similarity_score": paper["relevance_score"],
+                    "search_type": "semantic",
+                    "entity_type": "paper"
                 }
-            else:
-                return result
+                for paper in papers
+            ]
+            
+            return {
+                "success": True,
+                "query": query,
+                "entity_type": entity_type,
+                "similarity_threshold": similarity_threshold,
+                "results": enhanced_results,
+                "total_found": len(enhanced_results)
+            }
         
         else:
             # Extend to other entity types by integrating with respective services
@@ -423,76 +237,26 @@ async def get_search_suggestions(
     q: str = Query(..., min_length=2, description="Partial search query"),
     entity_type: Optional[str] = Query(None, description="Entity type for suggestions"),
     limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
-    current_user: Dict = Depends(get_current_user_required),
-    session: AsyncSession = Depends(get_postgres_session)
+    current_user: Dict = Depends(get_current_user_required)
 ):
     """
     Get search suggestions and autocomplete based on existing data
+    
+    Names starting with the query are looked up through prefix indexes;
+    papers and projects are limited to the user's own projects.
     """
     try:
-        suggestions = []
-        
-        # Get paper title suggestions
-        paper_suggestions = await session.execute(
-            text("""
-                SELECT DISTINCT title
-                FROM papers
-                WHERE title ILIKE %s
-                ORDER BY title
-                LIMIT %s
-            """),
-            [f"%{q}%", limit // 3]
+        suggestions = await suggestion_service.suggest(
+            query=q,
+            user_id=current_user["user_id"],
+            entity_types=[entity_type] if entity_type else None,
+            limit=limit
         )
         
-        for row in paper_suggestions.fetchall():
-            suggestions.append({
-                "text": row.title,
-                "type": "paper_title",
-                "category": "papers"
-            })
-        
-        # Get project name suggestions
-        project_suggestions = await session.execute(
-            text("""
-                SELECT DISTINCT name
-                FROM projects
-                WHERE name ILIKE %s AND deleted_at IS NULL
-                ORDER BY name
-                LIMIT %s
-            """),
-            [f"%{q}%", limit // 3]
-        )
-        
-        for row in project_suggestions.fetchall():
-            suggestions.append({
-                "text": row.name,
-                "type": "project_name",
-                "category": "projects"
-            })
-        
-        # Get user name suggestions
-        user_suggestions = await session.execute(
-            text("""
-                SELECT DISTINCT name
-                FROM users
-                WHERE name ILIKE %s AND deleted_at IS NULL
-                ORDER BY name
-                LIMIT %s
-            """),
-            [f"%{q}%", limit // 3]
-        )
-        
-        for row in user_suggestions.fetchall():
-            suggestions.append({
-                "text": row.name,
-                "type": "user_name",
-                "category": "users"
-            })
-        
         return {
             "success": True,
             "query": q,
-            "suggestions": suggestions[:limit]
+            "suggestions": suggestions
         }
         
     except Exception as e:
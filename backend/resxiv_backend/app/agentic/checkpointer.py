@@ -0,0 +1,361 @@
+"""
+Redis LangGraph Checkpointer
+
+Persists LangGraph session state in Redis so sessions survive restarts and
+can be resumed on any worker, while keeping memory bounded:
+
+- Each checkpoint is stored as one compact blob (LangGraph's msgpack serde,
+  zlib-compressed above a size threshold)
+- Every write refreshes a sliding TTL on the session's keys, so idle
+  sessions expire on their own
+- Only the newest ``max_checkpoints`` checkpoints of a session are kept;
+  older ones and their pending writes are pruned on each put
+
+Key layout (``<p>`` is the key prefix, ``<t>`` the thread ID, ``<ns>`` the
+checkpoint namespace):
+
+- ``<p>:<t>:namespaces``: set of namespaces used by the thread
+- ``<p>:<t>:<ns>:checkpoints``: hash of checkpoint ID -> checkpoint blob
+- ``<p>:<t>:<ns>:writes:<checkpoint ID>``: hash of task/index -> write blob
+
+If Redis cannot be reached the saver falls back to an in-process
+``MemorySaver`` for the lifetime of the worker.
+"""
+
+import logging
+import random
+import zlib
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import redis.asyncio as redis
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "langgraph"
+COMPRESS_THRESHOLD_BYTES = 1024
+_RAW, _ZLIB = b"r", b"z"
+
+
+class RedisCheckpointSaver(BaseCheckpointSaver):
+    """
+    Async LangGraph checkpoint saver backed by Redis with TTL and size caps.
+
+    Only the async API (``aget_tuple``, ``alist``, ``aput``, ``aput_writes``)
+    is implemented; run graphs with ``ainvoke``/``astream``.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_checkpoints: Optional[int] = None,
+        key_prefix: str = KEY_PREFIX,
+        client: Optional[redis.Redis] = None
+    ):
+        super().__init__()
+        settings = get_settings()
+        self.redis_url = redis_url or settings.database.redis_url
+        self.ttl_seconds = ttl_seconds or settings.agentic.agentic_session_timeout_hours * 3600
+        self.max_checkpoints = max_checkpoints or settings.agentic.langgraph_max_checkpoints_per_session
+        self.key_prefix = key_prefix
+        self._redis = client
+        self._fallback: Optional[MemorySaver] = None
+
+    # ================================
+    # CONNECTION
+    # ================================
+
+    async def _client(self) -> Optional[redis.Redis]:
+        if self._redis is not None or self._fallback is not None:
+            return self._redis
+        try:
+            client = redis.from_url(self.redis_url, decode_responses=False)
+            await client.ping()
+            self._redis = client
+        except Exception as e:
+            logger.warning(f"LangGraph checkpoints kept in memory, Redis unavailable: {e}")
+            self._fallback = MemorySaver(serde=self.serde)
+        return self._redis
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    # ================================
+    # SERIALIZATION
+    # ================================
+
+    def _dump(self, value: Any) -> bytes:
+        type_, data = self.serde.dumps_typed(value)
+        payload = type_.encode() + b"\x00" + data
+        if len(payload) > COMPRESS_THRESHOLD_BYTES:
+            return _ZLIB + zlib.compress(payload)
+        return _RAW + payload
+
+    def _load(self, blob: bytes) -> Any:
+        payload = zlib.decompress(blob[1:]) if blob[:1] == _ZLIB else blob[1:]
+        type_, _, data = payload.partition(b"\x00")
+        return self.serde.loads_typed((type_.decode(), data))
+
+    # ================================
+    # KEYS
+    # ================================
+
+    def _namespaces_key(self, thread_id: str) -> str:
+        return f"{self.key_prefix}:{thread_id}:namespaces"
+
+    def _checkpoints_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.key_prefix}:{thread_id}:{checkpoint_ns}:checkpoints"
+
+    def _writes_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"{self.key_prefix}:{thread_id}:{checkpoint_ns}:writes:{checkpoint_id}"
+
+    # ================================
+    # ASYNC CHECKPOINT API
+    # ================================
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        client = await self._client()
+        if client is None:
+            return await self._fallback.aget_tuple(config)
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        key = self._checkpoints_key(thread_id, checkpoint_ns)
+        if not checkpoint_id:
+            ids = await client.hkeys(key)
+            if not ids:
+                return None
+            checkpoint_id = max(ids).decode()
+        blob = await client.hget(key, checkpoint_id)
+        if blob is None:
+            return None
+        return await self._to_tuple(client, thread_id, checkpoint_ns, checkpoint_id, blob)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        client = await self._client()
+        if client is None:
+            async for item in self._fallback.alist(config, filter=filter, before=before, limit=limit):
+                yield item
+            return
+
+        if config:
+            thread_ids = [config["configurable"]["thread_id"]]
+        else:
+            suffix = ":namespaces"
+            thread_ids = [
+                key.decode()[len(self.key_prefix) + 1:-len(suffix)]
+                async for key in client.scan_iter(match=f"{self.key_prefix}:*{suffix}")
+            ]
+        config_ns = config["configurable"].get("checkpoint_ns") if config else None
+        config_id = get_checkpoint_id(config) if config else None
+        before_id = get_checkpoint_id(before) if before else None
+
+        for thread_id in thread_ids:
+            namespaces = [ns.decode() for ns in await client.smembers(self._namespaces_key(thread_id))]
+            for checkpoint_ns in sorted(namespaces):
+                if config_ns is not None and checkpoint_ns != config_ns:
+                    continue
+                stored = await client.hgetall(self._checkpoints_key(thread_id, checkpoint_ns))
+                for raw_id in sorted(stored, reverse=True):
+                    checkpoint_id = raw_id.decode()
+                    if config_id and checkpoint_id != config_id:
+                        continue
+                    if before_id and checkpoint_id >= before_id:
+                        continue
+                    item = await self._to_tuple(
+                        client, thread_id, checkpoint_ns, checkpoint_id, stored[raw_id]
+                    )
+                    if filter and not all(
+                        item.metadata.get(name) == value for name, value in filter.items()
+                    ):
+                        continue
+                    if limit is not None:
+                        if limit <= 0:
+                            return
+                        limit -= 1
+                    yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        client = await self._client()
+        if client is None:
+            return await self._fallback.aput(config, checkpoint, metadata, new_versions)
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        parent_id = config["configurable"].get("checkpoint_id")
+        key = self._checkpoints_key(thread_id, checkpoint_ns)
+        blob = self._dump({
+            "checkpoint": checkpoint,
+            "metadata": dict(metadata or {}),
+            "parent_id": parent_id
+        })
+
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(key, checkpoint["id"], blob)
+        pipe.sadd(self._namespaces_key(thread_id), checkpoint_ns)
+        pipe.expire(key, self.ttl_seconds)
+        pipe.expire(self._namespaces_key(thread_id), self.ttl_seconds)
+        pipe.hkeys(key)
+        results = await pipe.execute()
+        await self._prune(client, thread_id, checkpoint_ns, results[-1])
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"]
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        client = await self._client()
+        if client is None:
+            return await self._fallback.aput_writes(config, writes, task_id, task_path)
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        key = self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+
+        mapping = {}
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            mapping[f"{task_id}|{write_idx:08d}"] = (write_idx, self._dump([task_id, channel, value, task_path]))
+        # Special writes (errors, interrupts) overwrite; regular writes are recorded once
+        existing = set(await client.hkeys(key)) if mapping else set()
+        pipe = client.pipeline(transaction=False)
+        for field, (write_idx, blob) in mapping.items():
+            if write_idx >= 0 and field.encode() in existing:
+                continue
+            pipe.hset(key, field, blob)
+        pipe.expire(key, self.ttl_seconds)
+        await pipe.execute()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        client = await self._client()
+        if client is None:
+            return await self._fallback.adelete_thread(thread_id)
+
+        keys = [self._namespaces_key(thread_id)]
+        for ns in await client.smembers(self._namespaces_key(thread_id)):
+            checkpoint_ns = ns.decode()
+            checkpoints_key = self._checkpoints_key(thread_id, checkpoint_ns)
+            keys.append(checkpoints_key)
+            keys.extend(
+                self._writes_key(thread_id, checkpoint_ns, raw_id.decode())
+                for raw_id in await client.hkeys(checkpoints_key)
+            )
+        await client.delete(*keys)
+
+    def get_next_version(self, current: Optional[str], channel: None = None) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ================================
+    # HELPERS
+    # ================================
+
+    async def _to_tuple(
+        self,
+        client: redis.Redis,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        blob: bytes
+    ) -> CheckpointTuple:
+        record = self._load(blob)
+        writes = await client.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+        pending_writes = []
+        for field in sorted(writes):
+            task_id, channel, value, _ = self._load(writes[field])
+            pending_writes.append((task_id, channel, value))
+
+        parent_id = record["parent_id"]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id
+                }
+            },
+            checkpoint=record["checkpoint"],
+            metadata=record["metadata"],
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=pending_writes
+        )
+
+    async def _prune(
+        self,
+        client: redis.Redis,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_ids: List[bytes]
+    ) -> None:
+        """Drop the oldest checkpoints (and their writes) beyond the per-session cap."""
+        excess = len(checkpoint_ids) - self.max_checkpoints
+        if excess <= 0:
+            return
+        stale = [raw_id.decode() for raw_id in sorted(checkpoint_ids)[:excess]]
+        pipe = client.pipeline(transaction=False)
+        pipe.hdel(self._checkpoints_key(thread_id, checkpoint_ns), *stale)
+        pipe.delete(*[self._writes_key(thread_id, checkpoint_ns, cid) for cid in stale])
+        await pipe.execute()
+
+
+def create_checkpointer() -> BaseCheckpointSaver:
+    """Checkpoint saver selected by ``LANGGRAPH_CHECKPOINT_BACKEND``."""
+    backend = get_settings().agentic.langgraph_checkpoint_backend
+    if backend == "redis":
+        return RedisCheckpointSaver()
+    return MemorySaver()
@@ -12,7 +12,7 @@ import asyncio
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Union, AsyncIterator
 from datetime import datetime, timedelta
 from enum import Enum
 import logging
@@ -25,6 +25,7 @@ from app.agentic.production_langgraph import (
     ProductionLangGraphOrchestrator, AgentState, TaskType, LangGraphConfig, WorkflowStatus
 )
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.llm_gateway import llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -211,28 +212,9 @@ class EnhancedLangGraphOrchestrator(ProductionLangGraphOrchestrator):
             # Track request
             self.performance_metrics.total_requests += 1
             
-            # Enhanced state with monitoring - using proper AgentState structure
-            initial_state: AgentState = {
-                "messages": [{"role": "user", "content": message}],
-                "task_type": TaskType.CONVERSATION.value,
-                "user_intent": None,
-                "context": {
-                    "request_id": request_id,
-                    "priority": priority,
-                    "start_time": start_time,
-                    "circuit_breaker_state": self.circuit_breaker.state.value,
-                    **(context or {})
-                },
-                "current_agent": None,
-                "tool_calls_count": 0,
-                "max_tool_calls": self.config.max_tool_calls,
-                "status": WorkflowStatus.PENDING.value,
-                "result": None,
-                "error": None,
-                "session_id": thread_id,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            }
+            initial_state = self._build_initial_state(
+                message, thread_id, context, priority, request_id, start_time
+            )
             
             # Process through circuit breaker
             result = await self.circuit_breaker.call(
@@ -265,6 +247,118 @@ class EnhancedLangGraphOrchestrator(ProductionLangGraphOrchestrator):
                 "circuit_breaker_state": self.circuit_breaker.state.value
             }
     
+    def _build_initial_state(
+        self,
+        message: str,
+        thread_id: str,
+        context: Optional[Dict[str, Any]],
+        priority: str,
+        request_id: str,
+        start_time: float
+    ) -> AgentState:
+        """Enhanced state with monitoring - using proper AgentState structure"""
+        return {
+            "messages": [{"role": "user", "content": message}],
+            "task_type": TaskType.CONVERSATION.value,
+            "user_intent": None,
+            "context": {
+                "request_id": request_id,
+                "priority": priority,
+                "start_time": start_time,
+                "circuit_breaker_state": self.circuit_breaker.state.value,
+                **(context or {})
+            },
+            "current_agent": None,
+            "tool_calls_count": 0,
+            "max_tool_calls": self.config.max_tool_calls,
+            "status": WorkflowStatus.PENDING.value,
+            "result": None,
+            "error": None,
+            "session_id": thread_id,
+            "created_at": datetime.now(),
+            "updated_at": datetime.now()
+        }
+    
+    async def stream_message(
+        self,
+        message: str,
+        thread_id: str,
+        context: Optional[Dict[str, Any]] = None,
+        priority: str = "normal"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a message while streaming workflow progress.
+        
+        Yields a ``progress`` event as each LangGraph node finishes and a
+        final ``result`` event carrying the same payload as ``process_message``.
+        
+        Args:
+            message: User message to process
+            thread_id: Conversation thread ID
+            context: Additional context
+            priority: Request priority (low/normal/high/critical)
+        """
+        start_time = time.time()
+        request_id = str(uuid.uuid4())
+        
+        await self._validate_cost_limits()
+        await self._check_rate_limits(priority)
+        if self.circuit_breaker.state == CircuitBreakerState.OPEN:
+            if not self.circuit_breaker._should_attempt_reset():
+                raise ServiceError(
+                    "Service temporarily unavailable (circuit breaker open)",
+                    ErrorCodes.SERVICE_UNAVAILABLE,
+                    status_code=503
+                )
+            self.circuit_breaker.state = CircuitBreakerState.HALF_OPEN
+            self.circuit_breaker.success_count = 0
+        
+        self.performance_metrics.total_requests += 1
+        initial_state = self._build_initial_state(
+            message, thread_id, context, priority, request_id, start_time
+        )
+        config = {"configurable": {"thread_id": thread_id}}
+        final_state = initial_state
+        
+        try:
+            with llm_gateway.project_scope(initial_state["context"].get("project_id")):
+                async for mode, chunk in self.app.astream(
+                    initial_state, config, stream_mode=["updates", "values"]
+                ):
+                    if mode == "values":
+                        final_state = chunk
+                        continue
+                    for node, update in chunk.items():
+                        update = update if isinstance(update, dict) else {}
+                        yield {
+                            "event": "progress",
+                            "data": {
+                                "node": node,
+                                "status": update.get("status"),
+                                "agent": update.get("current_agent"),
+                                "tool_calls": update.get("tool_calls_count"),
+                                "elapsed": time.time() - start_time
+                            }
+                        }
+        except Exception as e:
+            self.circuit_breaker._on_failure()
+            self._update_failure_metrics(time.time() - start_time)
+            logger.error(f"Enhanced streaming failed: {e}")
+            raise ServiceError(
+                f"Service call failed: {str(e)}",
+                ErrorCodes.EXTERNAL_SERVICE_ERROR,
+                status_code=502
+            )
+        
+        self.circuit_breaker._on_success()
+        result = self._summarize_final_state(final_state)
+        execution_time = time.time() - start_time
+        self._update_success_metrics(execution_time, result)
+        yield {
+            "event": "result",
+            "data": self._create_enhanced_response(result, execution_time, request_id)
+        }
+    
     async def _process_with_monitoring(
         self,
         initial_state: AgentState,
@@ -272,8 +366,13 @@ class EnhancedLangGraphOrchestrator(ProductionLangGraphOrchestrator):
     ) -> Dict[str, Any]:
         """Process with detailed monitoring."""
         # Execute workflow
-        final_state = await self.app.ainvoke(initial_state, config)
+        with llm_gateway.project_scope(initial_state["context"].get("project_id")):
+            final_state = await self.app.ainvoke(initial_state, config)
         
+        return self._summarize_final_state(final_state)
+    
+    def _summarize_final_state(self, final_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the response payload from the final workflow state."""
         # Track tool usage - safely access tool information from context
         tools_used = final_state.get("context", {}).get("tools_used", [])
         for tool_name in tools_used:
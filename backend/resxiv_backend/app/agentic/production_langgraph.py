@@ -15,13 +15,13 @@ from enum import Enum
 import uuid
 from dataclasses import dataclass
 
-from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END, START, MessagesState
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import ToolNode
 from pydantic import BaseModel, Field
 
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.llm_gateway import llm_gateway
+from app.agentic.checkpointer import create_checkpointer
 from app.services.research_aggregator_service import ResearchAggregatorService, DataSource
 from app.database.connection import db_manager
 from app.services.conversation.conversation_project_service import ConversationProjectService
@@ -83,6 +83,11 @@ class LangGraphConfig:
     max_retries: int = 3
     timeout_seconds: int = 300
     enable_memory: bool = True
+    # Research fan-out: all search terms run concurrently under one budget
+    max_search_terms: int = 3
+    research_budget_seconds: float = 20.0
+    research_target_papers: int = 20
+    research_min_citations: int = 5
 
 
 class ProductionLangGraphOrchestrator:
@@ -122,7 +127,7 @@ class ProductionLangGraphOrchestrator:
         
         # Initialize LLM with proper configuration
         try:
-            self.llm = ChatOpenAI(
+            self.llm = llm_gateway.chat_model(
                 api_key=self.openai_api_key,
                 model=self.model_name,
                 temperature=self.config.temperature,
@@ -134,8 +139,8 @@ class ProductionLangGraphOrchestrator:
             # Create a mock LLM for testing that doesn't require real API access
             self.llm = None
         
-        # State persistence
-        self.checkpointer = MemorySaver() if self.config.enable_memory else None
+        # State persistence (Redis by default, so sessions resume on any worker)
+        self.checkpointer = create_checkpointer() if self.config.enable_memory else None
         
         # Build and compile workflow
         self.workflow = self._build_workflow()
@@ -668,59 +673,7 @@ Examples:
                     # We skip paper-search loop for author analysis
                 # --------------- PAPER SEARCH PATH -------------------
                 else:
-                    # Execute searches for each term
-                    for term in search_terms[:3]:  # Limit to 3 terms to avoid rate limits
-                        try:
-                            # Increment tool call count
-                            state["tool_calls_count"] = state.get("tool_calls_count", 0) + 1
-                            logger.info(f"Research: Searching for term: '{term}' (type: {type(term)})")
-                            
-                            # Ensure term is a string
-                            search_query = str(term).strip()
-                            if not search_query:
-                                logger.warning(f"Empty search term: '{term}', skipping")
-                                continue
-                                
-                            search_result = await aggregator.comprehensive_paper_search(
-                                query=search_query,
-                                limit=10,  # Get top 10 papers per term
-                                include_semantics=True,
-                                include_code=True,
-                                cross_reference=True
-                            )
-                            
-                            logger.info(f"Research: Search result structure: success={search_result.get('success')}, keys={list(search_result.keys())}")
-                            
-                            # Even if some services fail, we should still get papers from successful services
-                            papers = search_result.get("papers", [])
-                            
-                            # NEW: If the user explicitly asks for arXiv sources, keep only arXiv papers
-                            if state.get("messages") and isinstance(state["messages"], list):
-                                last_msg = state["messages"][-1].get("content", "").lower()
-                                if "arxiv" in last_msg:
-                                    papers = [p for p in papers if getattr(p, "source", None) == DataSource.ARXIV]
-                                    logger.info(f"Research: Filtered to {len(papers)} arXiv papers after user request")
-                            
-                            logger.info(f"Research: Found {len(papers)} papers for term '{search_query}' (ignoring success flag)")
-                            
-                            if papers:  # Check if we have papers, regardless of success flag
-                                
-                                results["papers"].extend(papers)
-                                
-                                # Extract author information from papers
-                                for paper in papers:
-                                    authors = paper.get("authors", []) if isinstance(paper, dict) else getattr(paper, 'authors', [])
-                                    for author in authors:
-                                        if author not in results["authors"]:
-                                            results["authors"].append(author)
-                            else:
-                                logger.warning(f"Research: No papers found for term '{search_query}'")
-                        
-                        except Exception as e:
-                            logger.error(f"Search for term '{term}' failed: {e}")
-                            import traceback
-                            logger.error(f"Search error traceback: {traceback.format_exc()}")
-                            continue
+                    await self._run_concurrent_paper_search(aggregator, search_terms, state, results)
             
             # Deduplicate and rank results
             logger.info(f"Research: Processing {len(results['papers'])} papers, {len(results['authors'])} authors")
@@ -749,12 +702,12 @@ Examples:
                 # For non-recent queries, just cap at 20 after dedup/ranking
                 results["papers"] = results["papers"][:20]
             
-            results["metadata"] = {
+            results["metadata"].update({
                 "total_papers": len(results["papers"]),
                 "total_authors": len(results["authors"]),
                 "search_terms": search_terms,
                 "research_type": research_type
-            }
+            })
             
         except Exception as e:
             logger.error(f"Research execution failed: {e}")
@@ -762,6 +715,123 @@ Examples:
         
         return results
 
+    async def _run_concurrent_paper_search(
+        self,
+        aggregator: ResearchAggregatorService,
+        search_terms: List[Any],
+        state: AgentState,
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Fan every (term, source) search out concurrently under one per-request deadline.
+        
+        Papers are merged into ``results`` as each source search completes, and
+        each search only gets the time left before the deadline. Once enough
+        high-quality papers are collected (or the deadline passes) the remaining
+        searches are cancelled; sources that already answered for a term are
+        kept, so a slow source never discards a fast one's papers.
+        """
+        queries = []
+        for term in search_terms[:self.config.max_search_terms]:  # Limit terms to avoid rate limits
+            search_query = str(term).strip()
+            if not search_query:
+                logger.warning(f"Empty search term: '{term}', skipping")
+                continue
+            queries.append(search_query)
+        if not queries:
+            return
+        
+        budget = self.config.research_budget_seconds
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        state["tool_calls_count"] = state.get("tool_calls_count", 0) + len(queries)
+        
+        sources = aggregator.paper_search_sources(include_semantics=True, include_code=True)
+        pending = {
+            asyncio.create_task(
+                aggregator.search_source(
+                    source,
+                    search_query,
+                    limit=10,  # Get top 10 papers per term and source
+                    deadline=deadline
+                ),
+                name=f"research:{search_query}:{source}"
+            ): (search_query, source)
+            for search_query in queries
+            for source in sources
+        }
+        logger.info(
+            f"Research: Searching {len(queries)} terms x {len(sources)} sources concurrently (budget {budget}s)"
+        )
+        
+        arxiv_requested = False
+        if state.get("messages") and isinstance(state["messages"], list):
+            arxiv_requested = "arxiv" in state["messages"][-1].get("content", "").lower()
+        
+        seen_titles = set()
+        high_quality = 0
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"Research: budget exhausted, cancelling {len(pending)} searches")
+                    break
+                
+                done, _ = await asyncio.wait(
+                    pending.keys(), timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    search_query, source = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.error(f"Search for term '{search_query}' on {source} failed: {e}")
+                        continue
+                    
+                    # A failed source only loses its own papers
+                    papers = list(response.results) if response.success else []
+                    if arxiv_requested:
+                        papers = [p for p in papers if getattr(p, "source", None) == DataSource.ARXIV]
+                    logger.info(f"Research: Found {len(papers)} papers for term '{search_query}' on {source}")
+                    
+                    for paper in papers:
+                        results["papers"].append(paper)
+                        title = self._paper_field(paper, "title", "").lower().strip()
+                        if title and title not in seen_titles:
+                            seen_titles.add(title)
+                            if self._is_high_quality_paper(paper):
+                                high_quality += 1
+                        for author in self._paper_field(paper, "authors", []) or []:
+                            if author not in results["authors"]:
+                                results["authors"].append(author)
+                
+                if high_quality >= self.config.research_target_papers:
+                    logger.info(
+                        f"Research: {high_quality} high-quality papers collected, "
+                        f"stopping {len(pending)} remaining searches early"
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        results["metadata"]["cancelled_searches"] = [f"{term}:{source}" for term, source in pending.values()]
+        results["metadata"]["cancelled_terms"] = list(dict.fromkeys(term for term, _ in pending.values()))
+    
+    @staticmethod
+    def _paper_field(paper: Any, field: str, default: Any = None) -> Any:
+        """Read a field from either a dict or a Pydantic paper model."""
+        if isinstance(paper, dict):
+            return paper.get(field, default)
+        return getattr(paper, field, default)
+    
+    def _is_high_quality_paper(self, paper: Any) -> bool:
+        """A paper counts towards early termination if it has an abstract and citations."""
+        citations = self._paper_field(paper, "citation_count", 0) or 0
+        return bool(self._paper_field(paper, "abstract")) and citations >= self.config.research_min_citations
+
     def _deduplicate_papers(self, papers: List[Dict]) -> List[Dict]:
         """Remove duplicate papers based on title similarity"""
         unique_papers = []
@@ -1395,7 +1465,8 @@ Be helpful and encouraging while explaining our research capabilities.
         try:
             # Execute workflow
             config = {"configurable": {"thread_id": session_id}}
-            result = await self.app.ainvoke(initial_state, config=config)
+            with llm_gateway.project_scope(initial_state["context"].get("project_id")):
+                result = await self.app.ainvoke(initial_state, config=config)
             
             return {
                 "success": True,
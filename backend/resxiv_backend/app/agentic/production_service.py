@@ -6,7 +6,7 @@ Follows SOLID principles and proper error handling.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator
 from uuid import uuid4
 from datetime import datetime
 
@@ -102,25 +102,9 @@ class ProductionAgenticService:
             # Generate thread ID for conversation continuity
             thread_id = conversation_id or str(uuid4())
             
-            # Prepare context
-            processing_context = {
-                "user_id": user_id,
-                "project_id": project_id,
-                "conversation_id": conversation_id,
-                **(context or {})
-            }
-            
-            # Get conversation history if available
-            if self.conversation_manager and conversation_id:
-                try:
-                    history = await self.conversation_manager.get_conversation_history(
-                        conversation_id,
-                        limit=10
-                    )
-                    processing_context["conversation_history"] = history
-                except Exception as e:
-                    logger.warning(f"Failed to load conversation history: {e}")
-                    processing_context["conversation_history"] = []
+            processing_context = await self._build_processing_context(
+                user_id, project_id, conversation_id, context
+            )
             
             # Process through orchestrator
             if self.orchestrator:
@@ -130,37 +114,9 @@ class ProductionAgenticService:
                     context=processing_context
                 )
             else:
-                # Fallback response when orchestrator is not available
-                result = {
-                    "response": "I'm currently running in limited mode. Some AI features may not be available.",
-                    "intent": "conversation",
-                    "agent": "fallback_agent",
-                    "tool_calls": 0,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                result = self._fallback_result()
             
-            # Save to conversation history if manager is available
-            if self.conversation_manager and conversation_id:
-                try:
-                    await self.conversation_manager.add_message(
-                        conversation_id=conversation_id,
-                        user_id=user_id,
-                        message=message,
-                        message_type="user"
-                    )
-                    
-                    # Only save assistant message if there's actual content
-                    assistant_message = result.get("response", "")
-                    if assistant_message and assistant_message.strip():
-                        await self.conversation_manager.add_message(
-                            conversation_id=conversation_id,
-                            user_id="system",
-                            message=assistant_message,
-                            message_type="assistant",
-                            metadata={"agent_result": result}
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to save conversation: {e}")
+            await self._save_exchange(conversation_id, user_id, message, result)
             
             # Add processing metadata
             processing_time = (datetime.utcnow() - start_time).total_seconds()
@@ -182,6 +138,129 @@ class ProductionAgenticService:
                 "service_version": "production_v1"
             }
     
+    async def stream_message(
+        self,
+        message: str,
+        user_id: str,
+        project_id: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a message through the agentic system, streaming progress.
+        
+        Yields the orchestrator's ``progress`` events followed by a ``done``
+        event with the final result. The exchange is saved to conversation
+        history once the workflow completes.
+        
+        Args:
+            message: User message to process
+            user_id: ID of the user sending the message
+            project_id: Optional project context
+            conversation_id: Optional conversation context
+            context: Additional context data
+        """
+        if not self._initialized:
+            raise RuntimeError("ProductionAgenticService not initialized")
+        
+        start_time = datetime.utcnow()
+        thread_id = conversation_id or str(uuid4())
+        processing_context = await self._build_processing_context(
+            user_id, project_id, conversation_id, context
+        )
+        yield {"event": "progress", "data": {"node": "context_loaded", "elapsed": 0.0}}
+        
+        result: Dict[str, Any] = {}
+        if self.orchestrator:
+            async for event in self.orchestrator.stream_message(
+                message=message,
+                thread_id=thread_id,
+                context=processing_context
+            ):
+                if event["event"] == "result":
+                    result = event["data"]
+                else:
+                    yield event
+        else:
+            result = self._fallback_result()
+        
+        await self._save_exchange(conversation_id, user_id, message, result)
+        
+        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        result["processing_time"] = processing_time
+        result["service_version"] = "production_v1"
+        logger.info(f"Message streamed successfully in {processing_time:.3f}s")
+        yield {"event": "done", "data": result}
+    
+    async def _build_processing_context(
+        self,
+        user_id: str,
+        project_id: Optional[str],
+        conversation_id: Optional[str],
+        context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Prepare context, including recent conversation history if available"""
+        processing_context = {
+            "user_id": user_id,
+            "project_id": project_id,
+            "conversation_id": conversation_id,
+            **(context or {})
+        }
+        
+        if self.conversation_manager and conversation_id:
+            try:
+                history = await self.conversation_manager.get_conversation_history(
+                    conversation_id,
+                    limit=10
+                )
+                processing_context["conversation_history"] = history
+            except Exception as e:
+                logger.warning(f"Failed to load conversation history: {e}")
+                processing_context["conversation_history"] = []
+        
+        return processing_context
+    
+    def _fallback_result(self) -> Dict[str, Any]:
+        """Fallback response when orchestrator is not available"""
+        return {
+            "response": "I'm currently running in limited mode. Some AI features may not be available.",
+            "intent": "conversation",
+            "agent": "fallback_agent",
+            "tool_calls": 0,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    async def _save_exchange(
+        self,
+        conversation_id: Optional[str],
+        user_id: str,
+        message: str,
+        result: Dict[str, Any]
+    ) -> None:
+        """Save to conversation history if manager is available"""
+        if not (self.conversation_manager and conversation_id):
+            return
+        try:
+            await self.conversation_manager.add_message(
+                conversation_id=conversation_id,
+                user_id=user_id,
+                message=message,
+                message_type="user"
+            )
+            
+            # Only save assistant message if there's actual content
+            assistant_message = result.get("response", "")
+            if assistant_message and assistant_message.strip():
+                await self.conversation_manager.add_message(
+                    conversation_id=conversation_id,
+                    user_id="system",
+                    message=assistant_message,
+                    message_type="assistant",
+                    metadata={"agent_result": result}
+                )
+        except Exception as e:
+            logger.warning(f"Failed to save conversation: {e}")
+    
     async def get_conversation_history(
         self,
         conversation_id: str,
@@ -283,6 +362,10 @@ class ProductionAgenticService:
                 # Cleanup conversation manager resources if needed
                 pass
             
+            checkpointer = getattr(self.orchestrator, "checkpointer", None)
+            if hasattr(checkpointer, "close"):
+                await checkpointer.close()
+            
             self._initialized = False
             logger.info("ProductionAgenticService cleanup completed")
             
@@ -47,7 +47,16 @@ class DatabaseSettings(BaseSettings):
     redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
     redis_socket_timeout: int = Field(default=30, env="REDIS_SOCKET_TIMEOUT")
     redis_connection_pool_size: int = Field(default=10, env="REDIS_CONNECTION_POOL_SIZE")
-    
+
+    # Shared read cache (app.core.enhanced_cache)
+    cache_enabled: bool = Field(default=True, env="CACHE_ENABLED")
+    cache_serializer: str = Field(default="orjson", env="CACHE_SERIALIZER")  # orjson | msgpack
+    cache_default_ttl_seconds: int = Field(default=3600, env="CACHE_DEFAULT_TTL_SECONDS")
+    cache_local_ttl_seconds: int = Field(default=60, env="CACHE_LOCAL_TTL_SECONDS")
+    cache_max_local_entries: int = Field(default=10000, env="CACHE_MAX_LOCAL_ENTRIES")
+    user_directory_ttl_seconds: int = Field(default=300, env="USER_DIRECTORY_TTL_SECONDS")
+    user_directory_max_entries: int = Field(default=50000, env="USER_DIRECTORY_MAX_ENTRIES")
+
     @property
     def postgres_url(self) -> str:
         """Generate PostgreSQL connection URL"""
@@ -185,6 +194,16 @@ class FileSettings(BaseSettings):
     upload_dir: Path = Field(default=Path("./uploads"), env="UPLOAD_DIR")
     static_dir: Path = Field(default=Path("./static"), env="STATIC_DIR")
     papers_dir: Path = Field(default=Path("../../papers"), env="PAPERS_DIR")
+    git_write_coalesce_ms: int = Field(default=250, env="GIT_WRITE_COALESCE_MS")
+    latex_compile_workers: int = Field(default=2, env="LATEX_COMPILE_WORKERS")
+    latex_compile_timeout_seconds: int = Field(default=300, env="LATEX_COMPILE_TIMEOUT_SECONDS")
+    autosave_enabled: bool = Field(default=True, env="AUTOSAVE_ENABLED")
+    autosave_delay_seconds: int = Field(default=30, env="AUTOSAVE_DELAY_SECONDS")
+    autosave_poll_seconds: float = Field(default=5.0, env="AUTOSAVE_POLL_SECONDS")
+    autosave_batch_size: int = Field(default=100, env="AUTOSAVE_BATCH_SIZE")
+    autosave_max_attempts: int = Field(default=5, env="AUTOSAVE_MAX_ATTEMPTS")
+    autosave_backoff_seconds: int = Field(default=30, env="AUTOSAVE_BACKOFF_SECONDS")
+    bulk_file_io_workers: int = Field(default=8, env="BULK_FILE_IO_WORKERS")
     
     @field_validator("allowed_file_types", mode='before')
     @classmethod
@@ -259,6 +278,25 @@ class AgenticSettings(BaseSettings):
     # PDF Chat Configuration
     max_pdf_upload_size_mb: int = Field(default=50, env="MAX_PDF_UPLOAD_SIZE_MB")
     
+    # LLM Gateway Configuration
+    openai_base_url: Optional[str] = Field(default=None, env="OPENAI_BASE_URL")
+    llm_max_connections: int = Field(default=50, env="LLM_MAX_CONNECTIONS")
+    llm_max_concurrency_per_model: int = Field(default=8, env="LLM_MAX_CONCURRENCY_PER_MODEL")
+    llm_queue_timeout_seconds: float = Field(default=30.0, env="LLM_QUEUE_TIMEOUT_SECONDS")
+    llm_request_timeout_seconds: float = Field(default=60.0, env="LLM_REQUEST_TIMEOUT_SECONDS")
+    llm_max_retries: int = Field(default=3, env="LLM_MAX_RETRIES")
+    
+    # LangGraph session checkpoints ("redis" or "memory"); TTL follows agentic_session_timeout_hours
+    langgraph_checkpoint_backend: str = Field(default="redis", env="LANGGRAPH_CHECKPOINT_BACKEND")
+    langgraph_max_checkpoints_per_session: int = Field(default=20, env="LANGGRAPH_MAX_CHECKPOINTS_PER_SESSION")
+    
+    # LLM response cache
+    llm_cache_enabled: bool = Field(default=True, env="LLM_CACHE_ENABLED")
+    llm_cache_semantic_enabled: bool = Field(default=True, env="LLM_CACHE_SEMANTIC_ENABLED")
+    llm_cache_max_entries: int = Field(default=2000, env="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, env="LLM_CACHE_TTL_SECONDS")
+    llm_cache_similarity_threshold: float = Field(default=0.95, env="LLM_CACHE_SIMILARITY_THRESHOLD")
+    
     @field_validator("agentic_model")
     @classmethod
     def validate_model(cls, v):
@@ -1,59 +1,185 @@
 """
 Enhanced Caching System - L6 Engineering Standards
-High-performance caching layer with Redis optimization and intelligent cache strategies.
+Shared read cache for hot service reads, with an in-process L1 in front of Redis.
+
+- L1 is an O(1) LRU with TTL holding serialized values, so callers never
+  share mutable objects; its TTL is capped (``cache_local_ttl_seconds``) to
+  bound staleness if an invalidation message is lost
+- Invalidation is by key, by tag (``set(..., tags=[...])`` records the key in
+  a Redis set per tag) or by pattern using incremental ``SCAN``, never ``KEYS``
+- Invalidations are published on ``cache:invalidate`` so every worker drops
+  its L1 copies; each frame is prefixed with the publishing node's ID so a
+  node ignores its own echoes
+- ``get_or_set`` coalesces concurrent misses on a key into one load, and a
+  load that raced an invalidation is returned but not stored
+- Values are serialized with orjson (default) or msgpack
+
+If Redis is unavailable the cache degrades to the per-process L1.
 """
 
-import json
-import uuid
+import asyncio
+import fnmatch
 import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable
-from datetime import datetime, timedelta
+import time
+import uuid
+from collections import OrderedDict
 from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import redis.asyncio as redis
-from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from sqlalchemy import event
+
+from app.config.settings import get_settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+TAG_PREFIX = "cache:tag:"
+INVALIDATION_CHANNEL = "cache:invalidate"
+NODE_ID_BYTES = 16
+SCAN_BATCH_SIZE = 500
+PENDING_TAGS_INFO_KEY = "enhanced_cache_pending_tags"
+
+_MISSING = object()
+
+
+# ================================
+# SERIALIZATION
+# ================================
+
+class JsonSerializer:
+    """JSON via orjson, falling back to the standard library."""
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(value, default=str)
+        return json.dumps(value, default=str).encode()
+
+    def loads(self, data: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackSerializer:
+    """MessagePack via ormsgpack or msgpack; smaller payloads than JSON."""
+
+    name = "msgpack"
+
+    def __init__(self):
+        if ormsgpack is None and msgpack is None:
+            raise ImportError("msgpack serialization needs ormsgpack or msgpack installed")
+
+    def dumps(self, value: Any) -> bytes:
+        if ormsgpack is not None:
+            return ormsgpack.packb(value, default=str)
+        return msgpack.packb(value, default=str, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        if ormsgpack is not None:
+            return ormsgpack.unpackb(data)
+        return msgpack.unpackb(data, raw=False)
+
+
+SERIALIZERS = {
+    "orjson": JsonSerializer,
+    "json": JsonSerializer,
+    "msgpack": MsgpackSerializer
+}
+
+
+def get_serializer(serializer: Union[str, Any]) -> Any:
+    """Resolve a serializer name, or pass through an object with ``dumps``/``loads``."""
+    if not isinstance(serializer, str):
+        return serializer
+    try:
+        return SERIALIZERS[serializer]()
+    except KeyError:
+        raise ValueError(f"Unknown cache serializer '{serializer}'; use one of {', '.join(SERIALIZERS)}")
+
+
+# ================================
+# CACHE
+# ================================
 
 class EnhancedCache:
     """
-    Enhanced caching system with intelligent cache strategies.
-    
-    Features:
-    - Multi-level caching (L1: Memory, L2: Redis)
-    - Cache invalidation patterns
-    - Performance monitoring
-    - Automatic cache warming
-    - Circuit breaker pattern
+    Multi-level cache (L1: process memory, L2: Redis) with tag invalidation
+    and cross-worker L1 coherence.
     """
-    
-    def __init__(self, redis_client: redis.Redis):
-        self.redis = redis_client
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        redis_client: Optional[redis.Redis] = None,
+        serializer: Union[str, Any, None] = None,
+        max_local_entries: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+        local_ttl: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        database = get_settings().database
+        self.enabled = database.cache_enabled if enabled is None else enabled
+        self.redis_url = redis_url or database.redis_url
+        self.serializer = get_serializer(serializer or database.cache_serializer)
+        self.memory_cache_size_limit = max_local_entries or database.cache_max_local_entries
+        self.default_ttl = default_ttl or database.cache_default_ttl_seconds
+        self.local_ttl = local_ttl or database.cache_local_ttl_seconds
+        self.node_id = uuid.uuid4().bytes
+
+        # key -> (expires_at, serialized value), least recently used first
+        self.memory_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped on every invalidation; loads that straddle one are not stored
+        self._generation = 0
+        self._background: set = set()
+
+        self._redis: Optional[redis.Redis] = redis_client
+        self._redis_checked = redis_client is not None
+        self._connect_lock = asyncio.Lock()
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
         self.cache_stats = {
             "hits": 0,
+            "redis_hits": 0,
             "misses": 0,
+            "coalesced": 0,
             "errors": 0,
+            "evictions": 0,
             "invalidations": 0
         }
-        self.default_ttl = 3600  # 1 hour
-        self.memory_cache_size_limit = 1000
-    
+
     def cache_key(self, prefix: str, *args, **kwargs) -> str:
         """
         Generate consistent cache key.
-        
+
         Args:
             prefix: Cache key prefix
             *args: Positional arguments
             **kwargs: Keyword arguments
-            
+
         Returns:
             Cache key string
         """
-        # Create deterministic key from arguments
         key_data = {
             "args": args,
             "kwargs": sorted(kwargs.items())
@@ -61,219 +187,418 @@ class EnhancedCache:
         key_hash = hashlib.md5(
             json.dumps(key_data, sort_keys=True, default=str).encode()
         ).hexdigest()[:12]
-        
+
         return f"{prefix}:{key_hash}"
-    
-    @handle_service_errors("cache get")
-    async def get(
-        self,
-        key: str,
-        default: Any = None,
-        use_memory_cache: bool = True
-    ) -> Any:
+
+    # ================================
+    # READ / WRITE
+    # ================================
+
+    async def get(self, key: str, default: Any = None, use_memory_cache: bool = True) -> Any:
         """
         Get value from cache with multi-level lookup.
-        
+
         Args:
             key: Cache key
             default: Default value if not found
-            use_memory_cache: Whether to use memory cache
-            
+            use_memory_cache: Whether to use the in-process layer
+
         Returns:
             Cached value or default
         """
-        try:
-            # L1: Memory cache
-            if use_memory_cache and key in self.memory_cache:
-                memory_entry = self.memory_cache[key]
-                if datetime.utcnow() < memory_entry["expires_at"]:
+        if not self.enabled:
+            return default
+
+        if use_memory_cache:
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                expires_at, data = entry
+                if expires_at > time.monotonic():
+                    self.memory_cache.move_to_end(key)
                     self.cache_stats["hits"] += 1
-                    return memory_entry["value"]
-                else:
-                    # Expired, remove from memory cache
-                    del self.memory_cache[key]
-            
-            # L2: Redis cache
-            redis_value = await self.redis.get(key)
-            if redis_value:
+                    return self.serializer.loads(data)
+                del self.memory_cache[key]
+
+        client = await self._client()
+        if client is not None:
+            try:
+                data = await client.get(key)
+            except Exception as e:
+                self.cache_stats["errors"] += 1
+                logger.warning(f"Cache get failed for {key}: {e}")
+                data = None
+            if data is not None:
                 try:
-                    value = json.loads(redis_value)
-                    
-                    # Store in memory cache for faster access
+                    value = self.serializer.loads(data)
+                except Exception as e:
+                    self.cache_stats["errors"] += 1
+                    logger.warning(f"Failed to decode cached value for key {key}: {e}")
+                else:
                     if use_memory_cache:
-                        self._store_in_memory_cache(key, value)
-                    
-                    self.cache_stats["hits"] += 1
+                        self._store_in_memory_cache(key, data, self.local_ttl)
+                    self.cache_stats["redis_hits"] += 1
                     return value
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to decode cached value for key: {key}")
-            
-            self.cache_stats["misses"] += 1
-            return default
-            
-        except Exception as e:
-            self.cache_stats["errors"] += 1
-            logger.error(f"Cache get error for key {key}: {e}")
-            return default
-    
-    @handle_service_errors("cache set")
+
+        self.cache_stats["misses"] += 1
+        return default
+
     async def set(
         self,
         key: str,
         value: Any,
         ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
         use_memory_cache: bool = True
     ) -> bool:
         """
         Set value in cache with multi-level storage.
-        
+
         Args:
             key: Cache key
-            value: Value to cache
+            value: Value to cache; must be serializable
             ttl: Time to live in seconds
-            use_memory_cache: Whether to use memory cache
-            
+            tags: Tags the key can later be invalidated by
+            use_memory_cache: Whether to keep a copy in the in-process layer
+
         Returns:
-            Success status
+            Whether the value reached Redis (or only L1 when Redis is down)
         """
+        if not self.enabled:
+            return False
+        ttl = ttl or self.default_ttl
+        data = self.serializer.dumps(value)
+        if use_memory_cache:
+            self._store_in_memory_cache(key, data, min(ttl, self.local_ttl))
+
+        client = await self._client()
+        if client is None:
+            return False
         try:
-            ttl = ttl or self.default_ttl
-            serialized_value = json.dumps(value, default=str)
-            
-            # Store in Redis
-            await self.redis.setex(key, ttl, serialized_value)
-            
-            # Store in memory cache
-            if use_memory_cache:
-                self._store_in_memory_cache(key, value, ttl)
-            
+            pipe = client.pipeline(transaction=False)
+            pipe.set(key, data, ex=ttl)
+            for tag in tags:
+                pipe.sadd(TAG_PREFIX + tag, key)
+                # Tag sets outlive their members; stale members only cost a no-op DEL
+                pipe.expire(TAG_PREFIX + tag, max(ttl, self.default_ttl))
+            await pipe.execute()
             return True
-            
         except Exception as e:
             self.cache_stats["errors"] += 1
-            logger.error(f"Cache set error for key {key}: {e}")
+            logger.warning(f"Cache set failed for {key}: {e}")
             return False
-    
-    @handle_service_errors("cache delete")
-    async def delete(self, key: str) -> bool:
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        tags: Union[Iterable[str], Callable[[Any], Iterable[str]]] = (),
+        use_memory_cache: bool = True
+    ) -> Any:
         """
-        Delete value from all cache levels.
-        
+        Read-through lookup; concurrent misses on ``key`` share one ``loader`` call.
+
         Args:
             key: Cache key
-            
+            loader: Coroutine factory producing the value on a miss
+            ttl: Time to live in seconds
+            tags: Tags for the stored key, or a function of the loaded value
+            use_memory_cache: Whether to use the in-process layer
+
         Returns:
-            Success status
+            The cached or freshly loaded value; ``None`` results are not cached
         """
+        if not self.enabled:
+            return await loader()
+
+        value = await self.get(key, _MISSING, use_memory_cache)
+        if value is not _MISSING:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.cache_stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
         try:
-            # Remove from memory cache
-            if key in self.memory_cache:
-                del self.memory_cache[key]
-            
-            # Remove from Redis
-            deleted = await self.redis.delete(key)
-            
-            self.cache_stats["invalidations"] += 1
-            return deleted > 0
-            
+            value = await loader()
+            if value is not None and generation == self._generation:
+                await self.set(
+                    key, value, ttl,
+                    tags=tags(value) if callable(tags) else tags,
+                    use_memory_cache=use_memory_cache
+                )
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    # ================================
+    # INVALIDATION
+    # ================================
+
+    async def delete(self, *keys: str) -> int:
+        """
+        Delete keys from all cache levels on every worker.
+
+        Returns:
+            Number of keys removed from Redis
+        """
+        if not keys:
+            return 0
+        self._drop_local(keys=keys)
+        deleted = 0
+        client = await self._client()
+        if client is not None:
+            try:
+                deleted = await client.delete(*keys)
+            except Exception as e:
+                self.cache_stats["errors"] += 1
+                logger.warning(f"Cache delete failed: {e}")
+            await self._publish({"keys": list(keys)})
+        self.cache_stats["invalidations"] += len(keys)
+        return deleted
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every key stored under any of ``tags``.
+
+        Returns:
+            Number of keys removed from Redis
+        """
+        if not tags:
+            return 0
+        self._generation += 1
+        client = await self._client()
+        if client is None:
+            # Without Redis there is no tag index; L1 entries expire on their short TTL
+            return 0
+        try:
+            pipe = client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.smembers(TAG_PREFIX + tag)
+            members = await pipe.execute()
         except Exception as e:
             self.cache_stats["errors"] += 1
-            logger.error(f"Cache delete error for key {key}: {e}")
-            return False
-    
-    @handle_service_errors("cache invalidate pattern")
+            logger.warning(f"Cache tag lookup failed for {tags}: {e}")
+            return 0
+
+        keys = sorted({self._text(key) for group in members for key in group})
+        deleted = await self.delete(*keys) if keys else 0
+        try:
+            await client.delete(*(TAG_PREFIX + tag for tag in tags))
+        except Exception as e:
+            self.cache_stats["errors"] += 1
+            logger.warning(f"Cache tag cleanup failed for {tags}: {e}")
+        return deleted
+
     async def invalidate_pattern(self, pattern: str) -> int:
         """
         Invalidate all keys matching pattern.
-        
+
+        Uses incremental ``SCAN`` so Redis keeps serving other clients while
+        the keyspace is walked.
+
         Args:
-            pattern: Key pattern (supports wildcards)
-            
+            pattern: Key pattern (glob-style wildcards)
+
         Returns:
-            Number of keys invalidated
+            Number of keys invalidated in Redis
         """
-        try:
-            # Find matching keys in Redis
-            keys = await self.redis.keys(pattern)
-            
-            if keys:
-                # Delete from Redis
-                deleted_redis = await self.redis.delete(*keys)
-                
-                # Delete from memory cache
-                deleted_memory = 0
-                for key in list(self.memory_cache.keys()):
-                    if self._matches_pattern(key, pattern):
-                        del self.memory_cache[key]
-                        deleted_memory += 1
-                
-                self.cache_stats["invalidations"] += deleted_redis
-                return deleted_redis + deleted_memory
-            
+        self._drop_local(patterns=[pattern])
+        client = await self._client()
+        if client is None:
             return 0
-            
+
+        deleted = 0
+        batch: List[Any] = []
+        try:
+            async for key in client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    deleted += await client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await client.delete(*batch)
         except Exception as e:
             self.cache_stats["errors"] += 1
             logger.error(f"Cache pattern invalidation error for pattern {pattern}: {e}")
-            return 0
-    
-    def _store_in_memory_cache(
-        self,
-        key: str,
-        value: Any,
-        ttl: Optional[int] = None
-    ) -> None:
-        """Store value in memory cache with size limit."""
-        # Enforce size limit
-        if len(self.memory_cache) >= self.memory_cache_size_limit:
-            # Remove oldest entry
-            oldest_key = min(
-                self.memory_cache.keys(),
-                key=lambda k: self.memory_cache[k]["created_at"]
-            )
-            del self.memory_cache[oldest_key]
-        
-        ttl = ttl or self.default_ttl
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-        
-        self.memory_cache[key] = {
-            "value": value,
-            "created_at": datetime.utcnow(),
-            "expires_at": expires_at
-        }
-    
-    def _matches_pattern(self, key: str, pattern: str) -> bool:
-        """Check if key matches pattern."""
-        import fnmatch
-        return fnmatch.fnmatch(key, pattern)
-    
+        await self._publish({"patterns": [pattern]})
+        self.cache_stats["invalidations"] += deleted
+        return deleted
+
+    def invalidate_tags_after_commit(self, session: Any, *tags: str) -> None:
+        """
+        Invalidate ``tags`` once ``session`` commits; dropped on rollback.
+
+        For services that leave the commit to the request's session scope:
+        invalidating earlier would let a concurrent read cache the
+        pre-commit rows again.
+        """
+        sync_session = getattr(session, "sync_session", session)
+        pending = sync_session.info.get(PENDING_TAGS_INFO_KEY)
+        if pending is None:
+            pending = sync_session.info[PENDING_TAGS_INFO_KEY] = set()
+            event.listen(sync_session, "after_commit", self._after_commit)
+            event.listen(sync_session, "after_rollback", self._after_rollback)
+        pending.update(tags)
+
+    def _after_commit(self, sync_session: Any) -> None:
+        tags = sync_session.info.get(PENDING_TAGS_INFO_KEY)
+        sync_session.info[PENDING_TAGS_INFO_KEY] = set()
+        if tags:
+            # Session events are synchronous; the invalidation runs on the loop
+            task = asyncio.get_running_loop().create_task(self.invalidate_tags(*tags))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def _after_rollback(self, sync_session: Any) -> None:
+        sync_session.info[PENDING_TAGS_INFO_KEY] = set()
+
+    def _drop_local(self, keys: Sequence[str] = (), patterns: Sequence[str] = ()) -> None:
+        self._generation += 1
+        for key in keys:
+            self.memory_cache.pop(key, None)
+        for pattern in patterns:
+            for key in [k for k in self.memory_cache if fnmatch.fnmatchcase(k, pattern)]:
+                del self.memory_cache[key]
+
+    def _store_in_memory_cache(self, key: str, data: bytes, ttl: int) -> None:
+        self.memory_cache[key] = (time.monotonic() + ttl, data)
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.memory_cache_size_limit:
+            self.memory_cache.popitem(last=False)
+            self.cache_stats["evictions"] += 1
+
+    # ================================
+    # REDIS AND PUB/SUB
+    # ================================
+
+    async def _client(self) -> Optional[redis.Redis]:
+        if self._redis_checked:
+            return self._redis
+        async with self._connect_lock:
+            if self._redis_checked:
+                return self._redis
+            self._redis_checked = True
+            if not self.redis_url:
+                return None
+            try:
+                # Binary-safe client: msgpack payloads are not UTF-8
+                client = redis.from_url(self.redis_url, decode_responses=False)
+                await client.ping()
+                self._redis = client
+                await self._start_listener()
+            except Exception as e:
+                logger.warning(f"Cache running without Redis: {e}")
+        return self._redis
+
+    async def _start_listener(self) -> None:
+        try:
+            self._pubsub = self._redis.pubsub()
+            await self._pubsub.subscribe(INVALIDATION_CHANNEL)
+            self._listener = asyncio.create_task(self._listen())
+        except Exception as e:
+            self._pubsub = None
+            logger.warning(f"Cache L1 invalidation relay unavailable: {e}")
+
+    async def _publish(self, message: Dict[str, List[str]]) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(INVALIDATION_CHANNEL, self.node_id + json.dumps(message).encode())
+        except Exception as e:
+            self.cache_stats["errors"] += 1
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    async def _listen(self) -> None:
+        while self._pubsub is not None:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if not message or message.get("type") != "message":
+                    continue
+                payload = message["data"]
+                if payload[:NODE_ID_BYTES] == self.node_id:
+                    continue
+                self.handle_invalidation(payload[NODE_ID_BYTES:])
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {e}")
+                await asyncio.sleep(1.0)
+
+    def handle_invalidation(self, payload: bytes) -> None:
+        """Apply an invalidation published by another worker to the local L1."""
+        message = json.loads(payload)
+        self._drop_local(keys=message.get("keys", ()), patterns=message.get("patterns", ()))
+
+    @staticmethod
+    def _text(key: Union[str, bytes]) -> str:
+        return key.decode() if isinstance(key, bytes) else key
+
+    # ================================
+    # STATS AND LIFECYCLE
+    # ================================
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
-        total_requests = self.cache_stats["hits"] + self.cache_stats["misses"]
-        hit_rate = (self.cache_stats["hits"] / total_requests * 100) if total_requests > 0 else 0
-        
-        redis_info = await self.redis.info("memory")
-        
+        stats = self.cache_stats
+        total_requests = stats["hits"] + stats["redis_hits"] + stats["misses"]
+        hits = stats["hits"] + stats["redis_hits"]
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+        redis_memory = {}
+        client = await self._client()
+        if client is not None:
+            try:
+                info = await client.info("memory")
+                redis_memory = {
+                    "used_memory_mb": round(info.get("used_memory", 0) / (1024 * 1024), 2),
+                    "used_memory_peak_mb": round(info.get("used_memory_peak", 0) / (1024 * 1024), 2)
+                }
+            except Exception as e:
+                logger.warning(f"Cache Redis info failed: {e}")
+
         return {
             "performance": {
                 "total_requests": total_requests,
                 "hit_rate_percent": round(hit_rate, 2),
-                "hits": self.cache_stats["hits"],
-                "misses": self.cache_stats["misses"],
-                "errors": self.cache_stats["errors"],
-                "invalidations": self.cache_stats["invalidations"]
+                **stats
             },
             "memory_cache": {
                 "size": len(self.memory_cache),
                 "limit": self.memory_cache_size_limit,
                 "utilization_percent": round(len(self.memory_cache) / self.memory_cache_size_limit * 100, 2)
             },
-            "redis_memory": {
-                "used_memory_mb": round(redis_info.get("used_memory", 0) / (1024 * 1024), 2),
-                "used_memory_peak_mb": round(redis_info.get("used_memory_peak", 0) / (1024 * 1024), 2)
-            }
+            "serializer": self.serializer.name,
+            "redis_memory": redis_memory
         }
 
+    async def close(self) -> None:
+        """Stop the invalidation listener and release the Redis connection."""
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        self._redis_checked = False
+        self.memory_cache.clear()
+
 
 def cached(
     prefix: str,
@@ -283,7 +608,7 @@ def cached(
 ):
     """
     Caching decorator for functions.
-    
+
     Args:
         prefix: Cache key prefix
         ttl: Time to live in seconds
@@ -294,48 +619,52 @@ def cached(
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Get cache instance (assuming it's available in the context)
-            cache = kwargs.get('cache') or getattr(args[0], 'cache', None)
-            
+            cache = kwargs.get('cache') or getattr(args[0] if args else None, 'cache', None)
+
             if not cache:
                 # No cache available, execute function directly
                 return await func(*args, **kwargs)
-            
-            # Build cache key
+
             if key_builder:
                 cache_key = key_builder(*args, **kwargs)
             else:
                 cache_key = cache.cache_key(prefix, *args, **kwargs)
-            
-            # Try to get from cache
-            cached_result = await cache.get(
+
+            return await cache.get_or_set(
                 cache_key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
                 use_memory_cache=use_memory_cache
             )
-            
-            if cached_result is not None:
-                return cached_result
-            
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            
-            if result is not None:
-                await cache.set(
-                    cache_key,
-                    result,
-                    ttl=ttl,
-                    use_memory_cache=use_memory_cache
-                )
-            
-            return result
-        
+
         return wrapper
     return decorator
 
 
 # Cache invalidation strategies
 class CacheInvalidationStrategy:
-    """Cache invalidation patterns for different data types."""
-    
+    """Cache tags and invalidation patterns for different data types."""
+
+    @staticmethod
+    def project_tag(project_id: Union[uuid.UUID, str]) -> str:
+        """Tag for cached project details."""
+        return f"project:{project_id}"
+
+    @staticmethod
+    def project_papers_tag(project_id: Union[uuid.UUID, str]) -> str:
+        """Tag for cached paper lists of a project."""
+        return f"project_papers:{project_id}"
+
+    @staticmethod
+    def paper_tag(paper_id: Union[uuid.UUID, str]) -> str:
+        """Tag for every cached value that embeds a paper."""
+        return f"paper:{paper_id}"
+
+    @staticmethod
+    def conversation_tag(conversation_id: Union[uuid.UUID, str]) -> str:
+        """Tag for cached conversation metadata."""
+        return f"conversation:{conversation_id}"
+
     @staticmethod
     def user_data(user_id: uuid.UUID) -> List[str]:
         """Get cache patterns to invalidate for user data changes."""
@@ -345,7 +674,7 @@ class CacheInvalidationStrategy:
             f"user_conversations:{user_id}:*",
             f"user_projects:{user_id}:*"
         ]
-    
+
     @staticmethod
     def conversation_data(conversation_id: uuid.UUID) -> List[str]:
         """Get cache patterns to invalidate for conversation data changes."""
@@ -355,7 +684,7 @@ class CacheInvalidationStrategy:
             f"conversation_participants:{conversation_id}:*",
             f"conversation_stats:{conversation_id}:*"
         ]
-    
+
     @staticmethod
     def project_data(project_id: uuid.UUID) -> List[str]:
         """Get cache patterns to invalidate for project data changes."""
@@ -365,7 +694,7 @@ class CacheInvalidationStrategy:
             f"project_conversations:{project_id}:*",
             f"project_stats:{project_id}:*"
         ]
-    
+
     @staticmethod
     def message_data(conversation_id: uuid.UUID, user_id: Optional[uuid.UUID] = None) -> List[str]:
         """Get cache patterns to invalidate for message changes."""
@@ -374,11 +703,14 @@ class CacheInvalidationStrategy:
             f"conversation_stats:{conversation_id}:*",
             f"message_analytics:{conversation_id}:*"
         ]
-        
+
         if user_id:
             patterns.extend([
                 f"user_conversations:{user_id}:*",
                 f"unread_count:{user_id}:*"
             ])
-        
-        return patterns 
\ No newline at end of file
+
+        return patterns
+
+
+enhanced_cache = EnhancedCache()
@@ -0,0 +1,391 @@
+"""
+LLM Response Cache
+
+Reuses completions for repeated prompts so reprocessing a paper or asking
+a popular question does not pay for another LLM round trip:
+
+- Exact lookups are keyed by model, prompt template version and a hash of
+  the request content; entries live in an in-process LRU with TTL (L1)
+  backed by Redis (L2) so workers share them
+- Near-duplicate questions are matched by embedding similarity within a
+  scope (a hash of the surrounding prompt, e.g. the paper context), so a
+  rephrased question about the same paper can reuse an answer
+- Concurrent misses on the same key share a single generation
+- Hit/miss/eviction counters are exposed through ``get_stats``
+
+If Redis or the embedding model is unavailable the cache degrades to the
+layers that still work. The embedding model is loaded once in the background
+(``start_warm_up`` at startup); semantic lookups are skipped until it is
+ready rather than loading it inside a request.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import redis.asyncio as redis
+
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm:cache:"
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+def _default_embedder() -> Embedder:
+    """Load the sentence embedding model used for semantic lookups."""
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(EMBEDDING_MODEL)
+    return lambda text: model.encode([text], normalize_embeddings=True)[0]
+
+
+class LLMResponseCache:
+    """Exact and semantic cache for LLM completions."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        max_semantic_per_scope: int = 100,
+        embedder: Optional[Embedder] = None,
+        enabled: Optional[bool] = None,
+        semantic_enabled: Optional[bool] = None
+    ):
+        settings = get_settings()
+        agentic = settings.agentic
+        self.enabled = agentic.llm_cache_enabled if enabled is None else enabled
+        self.semantic_enabled = (
+            agentic.llm_cache_semantic_enabled if semantic_enabled is None else semantic_enabled
+        )
+        self.redis_url = redis_url or settings.database.redis_url
+        self.max_entries = max_entries or agentic.llm_cache_max_entries
+        self.ttl_seconds = ttl_seconds or agentic.llm_cache_ttl_seconds
+        self.similarity_threshold = similarity_threshold or agentic.llm_cache_similarity_threshold
+        self.max_semantic_per_scope = max_semantic_per_scope
+
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # scope -> [(normalized embedding, response, expires_at)]
+        self._semantic: "OrderedDict[str, List[Tuple[np.ndarray, str, float]]]" = OrderedDict()
+        self._embedder = embedder
+        self._embedder_lock = asyncio.Lock()
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis: Optional[redis.Redis] = None
+        self._redis_checked = False
+        self.stats = {
+            "hits": 0,
+            "redis_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "errors": 0
+        }
+
+    # ================================
+    # KEYS
+    # ================================
+
+    @staticmethod
+    def make_key(model: str, template_version: str, *content: Any) -> str:
+        """Deterministic key for a model, prompt template version and request content."""
+        digest = hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{model}:{template_version}:{digest}"
+
+    @classmethod
+    def chat_keys(
+        cls,
+        model: str,
+        template_version: str,
+        messages: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str, str]:
+        """
+        Keys for a chat request whose last message is the user's question.
+
+        Returns:
+            ``(exact key, semantic scope, question text)``; the scope covers
+            every message but the question, so only answers given in the same
+            context are candidates for a semantic hit
+        """
+        params = params or {}
+        return (
+            cls.make_key(model, template_version, messages, params),
+            cls.make_key(model, template_version, messages[:-1], params),
+            str(messages[-1].get("content", ""))
+        )
+
+    # ================================
+    # LOOKUP
+    # ================================
+
+    async def get(self, key: str) -> Optional[str]:
+        """Exact lookup through the in-process and Redis layers."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return value
+            del self._entries[key]
+
+        client = await self._client()
+        if client is not None:
+            try:
+                value = await client.get(KEY_PREFIX + key)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"LLM cache Redis get failed: {e}")
+                value = None
+            if value is not None:
+                self._store_local(key, value)
+                self.stats["redis_hits"] += 1
+                return value
+        return None
+
+    async def semantic_get(self, scope: str, text: str) -> Optional[str]:
+        """Closest cached answer within ``scope`` above the similarity threshold."""
+        if not (self.enabled and self.semantic_enabled) or scope not in self._semantic:
+            return None
+        vector = await self._embed(text)
+        if vector is None:
+            return None
+
+        now = time.monotonic()
+        entries = [e for e in self._semantic[scope] if e[2] > now]
+        self._semantic[scope] = entries
+        self._semantic.move_to_end(scope)
+        best_score, best_value = -1.0, None
+        for candidate, value, _ in entries:
+            score = float(np.dot(candidate, vector))
+            if score > best_score:
+                best_score, best_value = score, value
+        if best_value is not None and best_score >= self.similarity_threshold:
+            self.stats["semantic_hits"] += 1
+            return best_value
+        return None
+
+    # ================================
+    # STORE
+    # ================================
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """Store a response in both exact layers."""
+        if not self.enabled:
+            return
+        ttl = ttl or self.ttl_seconds
+        self._store_local(key, value, ttl)
+        self.stats["stores"] += 1
+        client = await self._client()
+        if client is not None:
+            try:
+                await client.setex(KEY_PREFIX + key, ttl, value)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"LLM cache Redis set failed: {e}")
+
+    async def semantic_set(self, scope: str, text: str, value: str, ttl: Optional[int] = None) -> None:
+        """Index an answer by the embedding of the question that produced it."""
+        if not (self.enabled and self.semantic_enabled):
+            return
+        vector = await self._embed(text)
+        if vector is None:
+            return
+        entries = self._semantic.setdefault(scope, [])
+        self._semantic.move_to_end(scope)
+        entries.append((vector, value, time.monotonic() + (ttl or self.ttl_seconds)))
+        del entries[:-self.max_semantic_per_scope]
+        while len(self._semantic) > self.max_entries:
+            self._semantic.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _store_local(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl_seconds), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    # ================================
+    # READ-THROUGH
+    # ================================
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[str]],
+        scope: Optional[str] = None,
+        text: Optional[str] = None,
+        ttl: Optional[int] = None
+    ) -> str:
+        """
+        Return a cached response or generate, store and return a new one.
+
+        Args:
+            key: Exact key from ``make_key``/``chat_keys``
+            generate: Coroutine factory producing the response on a miss
+            scope: Semantic scope; enables near-duplicate lookup with ``text``
+            text: Question text to embed for the semantic lookup
+            ttl: Override for the configured TTL
+
+        Returns:
+            The response text
+        """
+        if not self.enabled:
+            return await generate()
+
+        cached = await self.lookup(key, scope, text)
+        if cached is not None:
+            return cached
+
+        # Single-flight: identical concurrent requests share one generation
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await generate()
+            await self.store(key, value, scope, text, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def lookup(self, key: str, scope: Optional[str] = None, text: Optional[str] = None) -> Optional[str]:
+        """Exact lookup, then semantic lookup when a scope is given; counts misses."""
+        if not self.enabled:
+            return None
+        value = await self.get(key)
+        if value is None and scope and text:
+            value = await self.semantic_get(scope, text)
+        if value is None:
+            self.stats["misses"] += 1
+        return value
+
+    async def store(
+        self,
+        key: str,
+        value: str,
+        scope: Optional[str] = None,
+        text: Optional[str] = None,
+        ttl: Optional[int] = None
+    ) -> None:
+        """Store a freshly generated response for exact and semantic reuse."""
+        if not value:
+            return
+        await self.set(key, value, ttl)
+        if scope and text:
+            await self.semantic_set(scope, text, value, ttl)
+
+    # ================================
+    # BACKENDS
+    # ================================
+
+    async def _client(self) -> Optional[redis.Redis]:
+        if self._redis_checked:
+            return self._redis
+        self._redis_checked = True
+        if not self.redis_url:
+            return None
+        try:
+            client = redis.from_url(self.redis_url, decode_responses=True)
+            await client.ping()
+            self._redis = client
+        except Exception as e:
+            logger.warning(f"LLM cache running without Redis: {e}")
+        return self._redis
+
+    def start_warm_up(self) -> None:
+        """Load the embedding model in a background task if it is not loaded yet."""
+        if self._embedder is not None or not (self.enabled and self.semantic_enabled):
+            return
+        if self._warm_up_task is None or self._warm_up_task.done():
+            self._warm_up_task = asyncio.create_task(self.warm_up())
+
+    async def warm_up(self) -> None:
+        """Load the embedding model once; concurrent callers wait for the same load."""
+        async with self._embedder_lock:
+            if self._embedder is not None or not self.semantic_enabled:
+                return
+            try:
+                self._embedder = await asyncio.to_thread(_default_embedder)
+                logger.info(f"LLM cache embedding model {EMBEDDING_MODEL} loaded")
+            except Exception as e:
+                logger.warning(f"LLM cache semantic lookups disabled: {e}")
+                self.semantic_enabled = False
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        if self._embedder is None:
+            # Never load the model on the request path; skip semantic lookup until ready
+            self.start_warm_up()
+            return None
+        try:
+            vector = np.asarray(await asyncio.to_thread(self._embedder, text), dtype=np.float32)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"LLM cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    # ================================
+    # MAINTENANCE
+    # ================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit-rate metrics and cache sizes."""
+        hits = self.stats["hits"] + self.stats["redis_hits"] + self.stats["semantic_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate_percent": round(hits / lookups * 100, 2) if lookups else 0.0,
+            "entries": len(self._entries),
+            "semantic_scopes": len(self._semantic),
+            "max_entries": self.max_entries,
+            "redis": self._redis is not None
+        }
+
+    def clear(self) -> None:
+        """Drop in-process entries and reset counters (Redis entries expire by TTL)."""
+        self._entries.clear()
+        self._semantic.clear()
+        for name in self.stats:
+            self.stats[name] = 0
+
+    async def close(self) -> None:
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            await asyncio.gather(self._warm_up_task, return_exceptions=True)
+            self._warm_up_task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        self._redis_checked = False
+
+
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,503 @@
+"""
+LLM Gateway - L6 Engineering Standards
+Application-scoped access point for every OpenAI-compatible LLM call.
+
+Features:
+- One pooled HTTP client shared by all services (keep-alive connections)
+- Per-model concurrency semaphore; excess callers queue up to a timeout
+- Retry with full-jitter exponential backoff on rate limits and transient errors
+- Per-project token and latency accounting
+"""
+
+import time
+import random
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+from langchain_openai import ChatOpenAI
+
+from app.config.settings import get_settings
+from app.core.error_handling import ServiceError, ErrorCodes
+
+logger = logging.getLogger(__name__)
+
+# Project the current request is billed to; set via LLMGateway.project_scope()
+_current_project: ContextVar[Optional[str]] = ContextVar("llm_current_project", default=None)
+
+UNATTRIBUTED_PROJECT = "unattributed"
+
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError,
+)
+
+
+def _empty_usage() -> Dict[str, float]:
+    return {
+        "requests": 0,
+        "errors": 0,
+        "retries": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "latency_ms": 0.0,
+        "queue_ms": 0.0
+    }
+
+
+def _openai_usage(response: Any) -> Dict[str, int]:
+    """Token usage from an OpenAI ChatCompletion."""
+    usage = getattr(response, "usage", None)
+    if not usage:
+        return {}
+    return {
+        "prompt_tokens": usage.prompt_tokens or 0,
+        "completion_tokens": usage.completion_tokens or 0,
+        "total_tokens": usage.total_tokens or 0
+    }
+
+
+def _langchain_usage(response: Any) -> Dict[str, int]:
+    """Token usage from a LangChain AIMessage."""
+    usage = getattr(response, "usage_metadata", None)
+    if not isinstance(usage, dict):
+        return {}
+    return {
+        "prompt_tokens": usage.get("input_tokens", 0),
+        "completion_tokens": usage.get("output_tokens", 0),
+        "total_tokens": usage.get("total_tokens", 0)
+    }
+
+
+class LLMGateway:
+    """
+    Shared LLM client with pooling, concurrency limits and usage accounting.
+
+    Services call ``chat_completion`` instead of constructing their own
+    ``AsyncOpenAI``; LangChain models are wrapped with ``chat_model`` so they
+    share the same pool and limits.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        model_limits: Optional[Dict[str, int]] = None,
+        queue_timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0
+    ):
+        agentic = get_settings().agentic
+        self.api_key = api_key or agentic.openai_api_key
+        self.base_url = base_url or agentic.openai_base_url
+        self.max_connections = max_connections or agentic.llm_max_connections
+        self.max_concurrency = max_concurrency or agentic.llm_max_concurrency_per_model
+        self.model_limits = model_limits or {}
+        self.queue_timeout = queue_timeout if queue_timeout is not None else agentic.llm_queue_timeout_seconds
+        self.request_timeout = request_timeout or agentic.llm_request_timeout_seconds
+        self.max_retries = max_retries if max_retries is not None else agentic.llm_max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[AsyncOpenAI] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._usage: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    # ================================
+    # CLIENTS
+    # ================================
+
+    def _bind_loop(self) -> None:
+        """Pools and semaphores belong to one event loop; rebuild them on a new one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.debug("LLM gateway rebinding to a new event loop")
+        self._loop = loop
+        self._http_client = None
+        self._client = None
+        self._semaphores = {}
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by every LLM call."""
+        self._bind_loop()
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=httpx.Timeout(self.request_timeout, connect=10.0)
+            )
+            self._client = None
+        return self._http_client
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client over the shared pool; retries are handled by the gateway."""
+        http_client = self.http_client
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=http_client,
+                max_retries=0,
+                timeout=self.request_timeout
+            )
+        return self._client
+
+    def chat_model(self, model: str, temperature: float = 0.0, timeout: Optional[float] = None, **kwargs) -> "GatewayChatModel":
+        """
+        Build a LangChain chat model that runs through the gateway.
+
+        Args:
+            model: Model name
+            temperature: Sampling temperature
+            timeout: Per-request timeout in seconds
+            **kwargs: Extra ChatOpenAI arguments
+
+        Returns:
+            Chat model exposing ``ainvoke``
+        """
+        return GatewayChatModel(self, model, {
+            "api_key": kwargs.pop("api_key", None) or self.api_key,
+            "base_url": self.base_url,
+            "model": model,
+            "temperature": temperature,
+            "timeout": timeout or self.request_timeout,
+            **kwargs
+        })
+
+    async def close(self) -> None:
+        """Close the shared connection pool."""
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._client = None
+
+    # ================================
+    # REQUEST EXECUTION
+    # ================================
+
+    @contextmanager
+    def project_scope(self, project_id: Optional[Any]):
+        """Attribute LLM usage inside this block to ``project_id``."""
+        token = _current_project.set(str(project_id) if project_id else None)
+        try:
+            yield
+        finally:
+            _current_project.reset(token)
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        self._bind_loop()
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            limit = self.model_limits.get(model, self.max_concurrency)
+            semaphore = self._semaphores[model] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _project(self, project_id: Optional[Any]) -> str:
+        return str(project_id) if project_id else (_current_project.get() or UNATTRIBUTED_PROJECT)
+
+    async def _acquire(self, semaphore: asyncio.Semaphore, project: str, model: str) -> float:
+        """Wait for a model slot; returns the time spent queued in ms."""
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._record(project, model, queue_ms=(time.perf_counter() - queued_at) * 1000, error=True)
+            raise ServiceError(
+                f"LLM capacity exhausted for model {model}",
+                ErrorCodes.SERVICE_UNAVAILABLE,
+                status_code=503
+            )
+        return (time.perf_counter() - queued_at) * 1000
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when present."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+            except ValueError:
+                pass
+        return delay
+
+    async def run(
+        self,
+        model: str,
+        call: Callable[[], Awaitable[Any]],
+        project_id: Optional[Any] = None,
+        usage_extractor: Callable[[Any], Dict[str, int]] = _openai_usage
+    ) -> Any:
+        """
+        Run an LLM call under the model's concurrency limit with retries.
+
+        Args:
+            model: Model name (selects the semaphore)
+            call: Zero-argument coroutine factory performing one attempt
+            project_id: Project to bill; defaults to the active project scope
+            usage_extractor: Reads token usage from the response
+
+        Returns:
+            The call's response
+        """
+        project = self._project(project_id)
+        semaphore = self._semaphore(model)
+        attempt = 0
+
+        while True:
+            queue_ms = await self._acquire(semaphore, project, model)
+            started_at = time.perf_counter()
+            try:
+                response = await call()
+            except RETRYABLE_ERRORS as e:
+                latency_ms = (time.perf_counter() - started_at) * 1000
+                if attempt >= self.max_retries:
+                    self._record(project, model, latency_ms=latency_ms, queue_ms=queue_ms, error=True)
+                    logger.error(f"LLM call to {model} failed after {attempt + 1} attempts: {e}")
+                    raise
+                self._record(project, model, latency_ms=latency_ms, queue_ms=queue_ms, retry=True)
+                delay = self._backoff_delay(attempt, e)
+                logger.warning(f"LLM call to {model} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+            except Exception:
+                self._record(
+                    project, model,
+                    latency_ms=(time.perf_counter() - started_at) * 1000,
+                    queue_ms=queue_ms,
+                    error=True
+                )
+                raise
+            else:
+                self._record(
+                    project, model,
+                    latency_ms=(time.perf_counter() - started_at) * 1000,
+                    queue_ms=queue_ms,
+                    usage=usage_extractor(response)
+                )
+                return response
+            finally:
+                semaphore.release()
+
+            # Back off outside the semaphore so queued callers can proceed
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        project_id: Optional[Any] = None,
+        **params
+    ) -> Any:
+        """
+        Create a chat completion through the gateway.
+
+        Args:
+            messages: OpenAI chat messages
+            model: Model name (defaults to the configured agentic model)
+            project_id: Project to bill; defaults to the active project scope
+            **params: Extra ``chat.completions.create`` parameters
+
+        Returns:
+            OpenAI ChatCompletion
+        """
+        model = model or get_settings().agentic.agentic_model
+        client = self.client
+        return await self.run(
+            model,
+            lambda: client.chat.completions.create(model=model, messages=messages, **params),
+            project_id=project_id
+        )
+
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        project_id: Optional[Any] = None,
+        **params
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion through the gateway, yielding content deltas.
+
+        The model slot is held until the stream finishes. Opening the stream
+        is retried like ``chat_completion``, releasing the slot while backing
+        off; once tokens have been yielded a failure is raised to the caller.
+
+        Args:
+            messages: OpenAI chat messages
+            model: Model name (defaults to the configured agentic model)
+            project_id: Project to bill; defaults to the active project scope
+            **params: Extra ``chat.completions.create`` parameters
+
+        Yields:
+            Content deltas as they arrive
+        """
+        model = model or get_settings().agentic.agentic_model
+        project = self._project(project_id)
+        semaphore = self._semaphore(model)
+        client = self.client
+        attempt = 0
+
+        while True:
+            queue_ms = await self._acquire(semaphore, project, model)
+            started_at = time.perf_counter()
+            try:
+                stream = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **params
+                )
+                break
+            except RETRYABLE_ERRORS as e:
+                semaphore.release()
+                latency_ms = (time.perf_counter() - started_at) * 1000
+                if attempt >= self.max_retries:
+                    self._record(project, model, latency_ms=latency_ms, queue_ms=queue_ms, error=True)
+                    logger.error(f"LLM stream to {model} failed after {attempt + 1} attempts: {e}")
+                    raise
+                self._record(project, model, latency_ms=latency_ms, queue_ms=queue_ms, retry=True)
+                delay = self._backoff_delay(attempt, e)
+                logger.warning(f"LLM stream to {model} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+            except BaseException:
+                semaphore.release()
+                self._record(
+                    project, model,
+                    latency_ms=(time.perf_counter() - started_at) * 1000,
+                    queue_ms=queue_ms,
+                    error=True
+                )
+                raise
+
+            # Back off outside the semaphore so queued callers can proceed
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        usage: Dict[str, int] = {}
+        failed = True
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    usage = _openai_usage(chunk)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            failed = False
+        finally:
+            semaphore.release()
+            self._record(
+                project, model,
+                latency_ms=(time.perf_counter() - started_at) * 1000,
+                queue_ms=queue_ms,
+                usage=usage,
+                error=failed
+            )
+            try:
+                await stream.close()
+            except Exception:
+                pass
+
+    # ================================
+    # USAGE ACCOUNTING
+    # ================================
+
+    def _record(
+        self,
+        project: str,
+        model: str,
+        latency_ms: float = 0.0,
+        queue_ms: float = 0.0,
+        usage: Optional[Dict[str, int]] = None,
+        error: bool = False,
+        retry: bool = False
+    ) -> None:
+        stats = self._usage.setdefault(project, {}).setdefault(model, _empty_usage())
+        stats["latency_ms"] += latency_ms
+        stats["queue_ms"] += queue_ms
+        if retry:
+            stats["retries"] += 1
+            return
+        stats["requests"] += 1
+        if error:
+            stats["errors"] += 1
+        for key, value in (usage or {}).items():
+            stats[key] += value
+
+    def get_usage(self, project_id: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Snapshot of token and latency accounting.
+
+        Args:
+            project_id: Restrict to one project; all projects if omitted
+
+        Returns:
+            ``{project: {model: stats}}`` including ``avg_latency_ms``
+        """
+        projects = [str(project_id)] if project_id else list(self._usage)
+        snapshot = {}
+        for project in projects:
+            models = {}
+            for model, stats in self._usage.get(project, {}).items():
+                attempts = stats["requests"] + stats["retries"]
+                models[model] = {
+                    **stats,
+                    "avg_latency_ms": stats["latency_ms"] / attempts if attempts else 0.0
+                }
+            snapshot[project] = models
+        return snapshot
+
+    def reset_usage(self) -> None:
+        self._usage.clear()
+
+
+class GatewayChatModel:
+    """LangChain chat model whose calls go through the LLM gateway."""
+
+    def __init__(self, gateway: LLMGateway, model: str, options: Dict[str, Any]):
+        self.gateway = gateway
+        self.model_name = model
+        self.options = options
+        self._chat: Optional[ChatOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def chat(self) -> ChatOpenAI:
+        """ChatOpenAI bound to the gateway's current connection pool."""
+        http_client = self.gateway.http_client
+        if self._chat is None or self._http_client is not http_client:
+            self._chat = ChatOpenAI(max_retries=0, http_async_client=http_client, **self.options)
+            self._http_client = http_client
+        return self._chat
+
+    async def ainvoke(self, messages: Any, **kwargs) -> Any:
+        chat = self.chat
+        return await self.gateway.run(
+            self.model_name,
+            lambda: chat.ainvoke(messages, **kwargs),
+            usage_extractor=_langchain_usage
+        )
+
+
+# Global gateway instance
+llm_gateway = LLMGateway()
@@ -0,0 +1,266 @@
+"""
+User Directory - L6 Engineering Standards
+Process-wide UUID-to-user resolution for display names.
+Single Responsibility: Batched, cached basic user lookups.
+
+- Lookups are collected DataLoader-style: every miss requested during one
+  event-loop tick - from any coroutine - is answered by a single
+  ``WHERE id = ANY(...)`` query, and concurrent requests for a user share
+  the same pending load
+- Answers (including "no such user") live in a TTL LRU, so message lists and
+  agent responses that mention the same few users stop querying Postgres
+- Profile updates and account deletion invalidate entries once their
+  transaction commits; other workers converge within the TTL
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import event, text
+
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 1000
+PENDING_INVALIDATIONS_INFO_KEY = "user_directory_pending"
+
+USERS_BY_ID_SQL = text("""
+    SELECT id, name, email, created_at, deleted_at
+    FROM users
+    WHERE id = ANY(:ids)
+""")
+
+UserId = Union[str, uuid.UUID]
+
+
+def user_info(row: Any) -> Dict[str, Any]:
+    """Basic user information as returned by the directory."""
+    return {
+        "id": str(row.id),
+        "name": row.name,
+        "email": row.email,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "is_active": row.deleted_at is None
+    }
+
+
+def fallback_name(user_id: UserId) -> str:
+    """Display name for a user that cannot be resolved."""
+    return f"User {str(user_id)[:8]}..."
+
+
+class UserDirectory:
+    """Batched, cached user lookups by UUID."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        database = get_settings().database
+        self._session_factory = session_factory
+        self.ttl_seconds = database.user_directory_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries or database.user_directory_max_entries
+
+        # user id -> (expires_at, info or None for unknown users), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._dispatch_handle: Optional[asyncio.Handle] = None
+        self._background: set = set()
+        # Bumped on every invalidation; loads that straddle one are not stored
+        self._generation = 0
+
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "batches": 0, "invalidations": 0}
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.database.connection import db_manager
+        return db_manager.get_postgres_session()
+
+    # ================================
+    # LOOKUPS
+    # ================================
+
+    async def get(self, user_id: UserId) -> Optional[Dict[str, Any]]:
+        """
+        Get basic information for one user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            ``id``, ``name``, ``email``, ``created_at`` and ``is_active``, or
+            None when the user does not exist
+        """
+        return (await self.get_many([user_id])).get(str(user_id))
+
+    async def get_many(self, user_ids: Iterable[UserId]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get basic information for several users.
+
+        Args:
+            user_ids: User UUIDs; invalid and empty values are ignored
+
+        Returns:
+            Mapping of user id string to user information for users that exist
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        now = time.monotonic()
+
+        for key in self._keys(user_ids):
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                if entry[1] is not None:
+                    results[key] = dict(entry[1])
+            else:
+                waiting[key] = self._load(key)
+
+        if waiting:
+            loaded = await asyncio.gather(*waiting.values())
+            for key, info in zip(waiting, loaded):
+                if info is not None:
+                    results[key] = dict(info)
+        return results
+
+    async def get_names(self, user_ids: Iterable[UserId]) -> Dict[str, str]:
+        """
+        Resolve user UUIDs to display names.
+
+        Args:
+            user_ids: User UUIDs
+
+        Returns:
+            Mapping of every valid user id string to its name, with a
+            placeholder for unknown users
+        """
+        keys = self._keys(user_ids)
+        users = await self.get_many(keys)
+        return {key: users[key]["name"] if key in users else fallback_name(key) for key in keys}
+
+    # ================================
+    # INVALIDATION
+    # ================================
+
+    def invalidate(self, *user_ids: UserId) -> None:
+        """Drop cached entries for ``user_ids``."""
+        self._generation += 1
+        for key in self._keys(user_ids):
+            self._entries.pop(key, None)
+        self.stats["invalidations"] += 1
+
+    def invalidate_after_commit(self, session: Any, *user_ids: UserId) -> None:
+        """
+        Invalidate ``user_ids`` once ``session`` commits; dropped on rollback.
+
+        Invalidating before the commit would let a concurrent lookup cache
+        the old row again.
+        """
+        sync_session = getattr(session, "sync_session", session)
+        pending = sync_session.info.get(PENDING_INVALIDATIONS_INFO_KEY)
+        if pending is None:
+            pending = sync_session.info[PENDING_INVALIDATIONS_INFO_KEY] = set()
+            event.listen(sync_session, "after_commit", self._after_commit)
+            event.listen(sync_session, "after_rollback", self._after_rollback)
+        pending.update(str(user_id) for user_id in user_ids)
+
+    def _after_commit(self, sync_session: Any) -> None:
+        user_ids = sync_session.info.get(PENDING_INVALIDATIONS_INFO_KEY)
+        sync_session.info[PENDING_INVALIDATIONS_INFO_KEY] = set()
+        if user_ids:
+            self.invalidate(*user_ids)
+
+    def _after_rollback(self, sync_session: Any) -> None:
+        sync_session.info[PENDING_INVALIDATIONS_INFO_KEY] = set()
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._generation += 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Directory counters and size."""
+        return {**self.stats, "entries": len(self._entries), "max_entries": self.max_entries}
+
+    # ================================
+    # BATCHING
+    # ================================
+
+    @staticmethod
+    def _keys(user_ids: Iterable[UserId]) -> List[str]:
+        keys = []
+        for user_id in user_ids:
+            if not user_id:
+                continue
+            try:
+                keys.append(str(uuid.UUID(str(user_id))))
+            except (ValueError, TypeError):
+                continue
+        return list(dict.fromkeys(keys))
+
+    def _load(self, key: str) -> asyncio.Future:
+        future = self._inflight.get(key) or self._pending.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[key] = future
+        self.stats["misses"] += 1
+        if self._dispatch_handle is None:
+            # Everything requested before the loop gets back to us joins this batch
+            self._dispatch_handle = loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        self._dispatch_handle = None
+        batch, self._pending = self._pending, {}
+        self._inflight.update(batch)
+        keys = list(batch)
+        for start in range(0, len(keys), MAX_BATCH_SIZE):
+            chunk = {key: batch[key] for key in keys[start:start + MAX_BATCH_SIZE]}
+            task = asyncio.get_running_loop().create_task(self._fetch(chunk))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _fetch(self, batch: Dict[str, asyncio.Future]) -> None:
+        generation = self._generation
+        self.stats["batches"] += 1
+        try:
+            async with self._session() as session:
+                result = await session.execute(USERS_BY_ID_SQL, {"ids": [uuid.UUID(key) for key in batch]})
+                users = {str(row.id): user_info(row) for row in result.fetchall()}
+        except Exception as e:
+            logger.warning(f"User directory lookup of {len(batch)} user(s) failed: {e}")
+            for key, future in batch.items():
+                self._inflight.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+        store = generation == self._generation
+        for key, future in batch.items():
+            info = users.get(key)
+            if store:
+                self._entries[key] = (expires_at, info)
+                self._entries.move_to_end(key)
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(info)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+user_directory = UserDirectory()
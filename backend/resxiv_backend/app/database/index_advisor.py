@@ -0,0 +1,488 @@
+"""
+Index Advisor - L6 Engineering Standards
+Plan checks for the repository layer's hot queries.
+Single Responsibility: Explaining hot queries and reporting index gaps.
+
+- ``HOT_QUERIES`` registers the Postgres queries behind the busiest
+  endpoints; each runs under ``EXPLAIN (ANALYZE, BUFFERS)`` with parameters
+  sampled from the database, and sequential scans over ``min_rows`` or more
+  rows are flagged
+- ``MONGO_HOT_QUERIES`` does the same for MongoDB reads, flagging
+  collection scans and in-memory sorts
+- ``POSTGRES_INDEXES`` / ``MONGO_INDEXES`` list the indexes those queries
+  rely on; missing ones are reported, and ``render_migration`` emits a
+  ``MigrationManager`` migration that creates them
+- Intended for a seeded, disposable database (see ``run_index_advisor.py``);
+  plans on a near-empty database say little about production
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from sqlalchemy import text
+
+from app.core.user_directory import USERS_BY_ID_SQL
+from app.repositories.conversation_inbox_repository import LIST_INBOX_SQL
+from app.services.search.hybrid_search_service import VECTOR_SQL
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_ROWS = 1000
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """A Postgres index a hot query relies on."""
+    name: str
+    table: str
+    definition: str
+
+    @property
+    def create_sql(self) -> str:
+        return f"CREATE INDEX IF NOT EXISTS {self.name} ON {self.table} {self.definition}"
+
+    @property
+    def drop_sql(self) -> str:
+        return f"DROP INDEX IF EXISTS {self.name}"
+
+
+@dataclass(frozen=True)
+class MongoIndexSpec:
+    """A MongoDB index a hot query relies on."""
+    name: str
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """A registered Postgres query and how to sample its parameters."""
+    name: str
+    source: str
+    sql: str
+    # One row whose columns are the query's bind parameters
+    params_sql: str
+    indexes: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class MongoHotQuery:
+    """A registered MongoDB read; ``build`` turns a sample document into (filter, sort, limit)."""
+    name: str
+    source: str
+    collection: str
+    build: Callable[[Dict[str, Any]], Tuple[Dict[str, Any], List[Tuple[str, int]], int]]
+    indexes: Tuple[str, ...] = field(default=())
+
+
+# ================================
+# REGISTRY
+# ================================
+
+POSTGRES_INDEXES: Dict[str, IndexSpec] = {spec.name: spec for spec in (
+    IndexSpec(
+        "idx_papers_checksum", "papers",
+        "(checksum) WHERE checksum IS NOT NULL AND deleted_at IS NULL"
+    ),
+    IndexSpec("idx_project_papers_paper_id", "project_papers", "(paper_id)"),
+    IndexSpec(
+        "idx_paper_embeddings_embedding_cosine", "paper_embeddings",
+        "USING hnsw (embedding vector_cosine_ops)"
+    ),
+    IndexSpec(
+        "idx_conversation_inbox_activity", "conversation_inbox",
+        "(user_id, last_activity_at DESC, conversation_id DESC)"
+    ),
+)}
+
+MONGO_INDEXES: Dict[str, MongoIndexSpec] = {spec.name: spec for spec in (
+    MongoIndexSpec(
+        "conversation_messages_optimized", "messages",
+        (("conversation_id", 1), ("deleted_at", 1), ("_id", -1))
+    ),
+    MongoIndexSpec(
+        "conversation_read_position", "messages",
+        (("conversation_id", 1), ("created_at", 1), ("_id", 1))
+    ),
+)}
+
+HOT_QUERIES: Tuple[HotQuery, ...] = (
+    HotQuery(
+        name="project_papers_page",
+        source="PaperRepository.get_project_papers",
+        sql="""
+            SELECT p.id, p.title, p.created_at
+            FROM papers p
+            JOIN project_papers pp ON pp.paper_id = p.id
+            WHERE pp.project_id = :project_id AND p.deleted_at IS NULL
+            ORDER BY p.created_at DESC
+            LIMIT 20
+        """,
+        params_sql="""
+            SELECT project_id FROM project_papers
+            GROUP BY project_id ORDER BY count(*) DESC LIMIT 1
+        """
+    ),
+    HotQuery(
+        name="paper_by_file_hash",
+        source="PaperRepository.get_papers_by_file_hash_and_project",
+        sql="""
+            SELECT p.id
+            FROM papers p
+            JOIN project_papers pp ON pp.paper_id = p.id
+            WHERE p.checksum = :checksum AND pp.project_id = :project_id
+              AND p.deleted_at IS NULL
+        """,
+        params_sql="""
+            SELECT p.checksum, pp.project_id
+            FROM papers p JOIN project_papers pp ON pp.paper_id = p.id
+            WHERE p.checksum IS NOT NULL AND p.deleted_at IS NULL
+            LIMIT 1
+        """,
+        indexes=("idx_papers_checksum",)
+    ),
+    HotQuery(
+        name="projects_for_papers",
+        source="PaperRepository.get_project_ids_for_papers",
+        sql="""
+            SELECT DISTINCT project_id FROM project_papers
+            WHERE paper_id = ANY(:paper_ids)
+        """,
+        params_sql="""
+            SELECT array_agg(paper_id) AS paper_ids
+            FROM (SELECT paper_id FROM project_papers LIMIT 20) sample
+            HAVING count(*) > 0
+        """,
+        indexes=("idx_project_papers_paper_id",)
+    ),
+    HotQuery(
+        name="paper_vector_search",
+        source="HybridSearchService (VECTOR_SQL)",
+        sql=VECTOR_SQL.text,
+        params_sql="""
+            SELECT CAST(embedding AS TEXT) AS embedding, 200 AS snippet_length, 60 AS "limit"
+            FROM paper_embeddings WHERE embedding IS NOT NULL
+            LIMIT 1
+        """,
+        indexes=("idx_paper_embeddings_embedding_cosine",)
+    ),
+    HotQuery(
+        name="conversation_inbox_page",
+        source="ConversationInboxRepository.list_inbox",
+        sql=LIST_INBOX_SQL.format(type_filter=""),
+        params_sql="""
+            SELECT user_id, 50 AS "limit", 0 AS "offset"
+            FROM conversation_inbox
+            GROUP BY user_id ORDER BY count(*) DESC LIMIT 1
+        """,
+        indexes=("idx_conversation_inbox_activity",)
+    ),
+    HotQuery(
+        name="users_by_id",
+        source="UserDirectory (USERS_BY_ID_SQL)",
+        sql=USERS_BY_ID_SQL.text,
+        params_sql="""
+            SELECT array_agg(id) AS ids
+            FROM (SELECT id FROM users LIMIT 50) sample
+            HAVING count(*) > 0
+        """
+    ),
+    HotQuery(
+        name="project_membership",
+        source="verify_project_access",
+        sql="""
+            SELECT role FROM project_members
+            WHERE project_id = :project_id AND user_id = :user_id
+        """,
+        params_sql="SELECT project_id, user_id FROM project_members LIMIT 1"
+    ),
+)
+
+
+def _conversation_page(sample: Dict[str, Any]):
+    return {"conversation_id": sample["conversation_id"], "deleted_at": None}, [("_id", -1)], 50
+
+
+def _unread_after_cursor(sample: Dict[str, Any]):
+    # count_documents plans like a find with the same filter
+    query = {
+        "conversation_id": sample["conversation_id"],
+        "sender_id": {"$ne": sample.get("sender_id")},
+        "deleted_at": None,
+        "$or": [
+            {"created_at": {"$gt": sample["created_at"]}},
+            {"created_at": sample["created_at"], "_id": {"$gt": sample["_id"]}}
+        ]
+    }
+    return query, [], 0
+
+
+MONGO_HOT_QUERIES: Tuple[MongoHotQuery, ...] = (
+    MongoHotQuery(
+        name="conversation_messages_page",
+        source="MessageCrudRepository.get_conversation_messages",
+        collection="messages",
+        build=_conversation_page,
+        indexes=("conversation_messages_optimized",)
+    ),
+    MongoHotQuery(
+        name="unread_after_cursor",
+        source="ReadCursorRepository.get_unread_count",
+        collection="messages",
+        build=_unread_after_cursor,
+        indexes=("conversation_read_position",)
+    ),
+)
+
+
+# ================================
+# PLAN INSPECTION
+# ================================
+
+def plan_findings(plan: Dict[str, Any], min_rows: int = DEFAULT_MIN_ROWS) -> List[Dict[str, Any]]:
+    """
+    Sequential scans in a Postgres ``EXPLAIN (ANALYZE, FORMAT JSON)`` plan.
+
+    Args:
+        plan: The ``Plan`` node of the explain output
+        min_rows: Scans that read fewer rows than this are ignored
+
+    Returns:
+        One entry per flagged scan with the relation, rows read and filter
+    """
+    findings = []
+    node_type = plan.get("Node Type")
+    if node_type in ("Seq Scan", "Parallel Seq Scan"):
+        loops = plan.get("Actual Loops", 1) or 1
+        rows_read = (plan.get("Actual Rows", 0) + plan.get("Rows Removed by Filter", 0)) * loops
+        if rows_read >= min_rows:
+            findings.append({
+                "node": node_type,
+                "relation": plan.get("Relation Name"),
+                "rows_read": int(rows_read),
+                "filter": plan.get("Filter")
+            })
+    for child in plan.get("Plans", []):
+        findings.extend(plan_findings(child, min_rows))
+    return findings
+
+
+def mongo_plan_findings(explain: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Collection scans and blocking sorts in a MongoDB explain document.
+
+    Handles both the classic ``winningPlan`` stage tree and the
+    slot-based engine's ``winningPlan.queryPlan``.
+    """
+    winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+    stages = [winning.get("queryPlan", winning)]
+    findings = []
+    while stages:
+        stage = stages.pop()
+        name = stage.get("stage")
+        if name == "COLLSCAN":
+            findings.append({"stage": name, "filter": stage.get("filter")})
+        elif name == "SORT":
+            findings.append({"stage": name, "sort": stage.get("sortPattern")})
+        if "inputStage" in stage:
+            stages.append(stage["inputStage"])
+        stages.extend(stage.get("inputStages", []))
+    return findings
+
+
+def render_migration(
+    migration_id: str,
+    version: str,
+    specs: Sequence[IndexSpec],
+    description: str = "Add indexes for hot query paths"
+) -> str:
+    """
+    Source for a ``MigrationManager`` migration creating ``specs``.
+
+    Returns:
+        The registry entry and the ``up``/``down`` methods, ready to paste
+        into ``app/database/migrations.py``
+    """
+    method = "_" + migration_id.split("_", 1)[1]
+    lines = [
+        "            {",
+        f'                "id": "{migration_id}",',
+        f'                "description": "{description}",',
+        f'                "up": self.{method}_up,',
+        f'                "down": self.{method}_down,',
+        f'                "version": "{version}"',
+        "            }",
+        "",
+        f"    async def {method}_up(self, session: AsyncSession):",
+        f'        """{description}"""',
+        "        ",
+        f'        logger.info("Creating {len(specs)} hot query index(es)...")',
+        "        "
+    ]
+    for spec in specs:
+        lines.extend([
+            "        await session.execute(text(\"\"\"",
+            f"            {spec.create_sql};",
+            "        \"\"\"))",
+            "        "
+        ])
+    lines.extend([
+        '        logger.info("Hot query indexes created successfully")',
+        "    ",
+        f"    async def {method}_down(self, session: AsyncSession):",
+        '        """Drop the hot query indexes"""',
+        '        logger.info("Dropping hot query indexes...")',
+        "        "
+    ])
+    for spec in specs:
+        lines.append(f'        await session.execute(text("{spec.drop_sql};"))')
+    lines.extend([
+        "        ",
+        '        logger.info("Hot query indexes dropped successfully")'
+    ])
+    return "\n".join(lines)
+
+
+# ================================
+# ADVISOR
+# ================================
+
+class IndexAdvisor:
+    """Runs the hot query registry against a database and reports index gaps."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        mongo_db=None,
+        min_rows: int = DEFAULT_MIN_ROWS,
+        queries: Sequence[HotQuery] = HOT_QUERIES,
+        mongo_queries: Sequence[MongoHotQuery] = MONGO_HOT_QUERIES
+    ):
+        self._session_factory = session_factory
+        self.mongo_db = mongo_db
+        self.min_rows = min_rows
+        self.queries = queries
+        self.mongo_queries = mongo_queries
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.database.connection import db_manager
+        return db_manager.get_postgres_session()
+
+    async def analyze(self) -> Dict[str, Any]:
+        """
+        Explain every registered query and list missing indexes.
+
+        Returns:
+            ``postgres`` and ``mongo`` query reports, ``missing_indexes`` and
+            ``missing_mongo_indexes``
+        """
+        report = {
+            "postgres": [await self.explain(query) for query in self.queries],
+            "missing_indexes": [spec.name for spec in await self.missing_indexes()],
+            "mongo": [],
+            "missing_mongo_indexes": []
+        }
+        if self.mongo_db is not None:
+            report["mongo"] = [await self.explain_mongo(query) for query in self.mongo_queries]
+            report["missing_mongo_indexes"] = [spec.name for spec in await self.missing_mongo_indexes()]
+        return report
+
+    async def explain(self, query: HotQuery) -> Dict[str, Any]:
+        """Run one query under ``EXPLAIN (ANALYZE, BUFFERS)`` and flag sequential scans."""
+        report = {"query": query.name, "source": query.source, "expected_indexes": list(query.indexes)}
+        try:
+            async with self._session() as session:
+                sample = (await session.execute(text(query.params_sql))).mappings().first()
+                if sample is None:
+                    return {**report, "status": "skipped", "reason": "no sample data"}
+
+                result = await session.execute(
+                    text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query.sql}"), dict(sample)
+                )
+                explained = result.scalar()
+                # EXPLAIN ANALYZE executes the query; never keep its effects
+                await session.rollback()
+        except Exception as e:
+            logger.warning(f"Could not explain {query.name}: {e}")
+            return {**report, "status": "error", "reason": str(e)}
+
+        explained = json.loads(explained) if isinstance(explained, str) else explained
+        plan = explained[0]["Plan"]
+        seq_scans = plan_findings(plan, self.min_rows)
+        return {
+            **report,
+            "status": "flagged" if seq_scans else "ok",
+            "execution_ms": explained[0].get("Execution Time"),
+            "shared_hit_blocks": plan.get("Shared Hit Blocks", 0),
+            "shared_read_blocks": plan.get("Shared Read Blocks", 0),
+            "seq_scans": seq_scans
+        }
+
+    async def explain_mongo(self, query: MongoHotQuery) -> Dict[str, Any]:
+        """Explain one MongoDB read and flag collection scans and blocking sorts."""
+        report = {"query": query.name, "source": query.source, "expected_indexes": list(query.indexes)}
+        collection = self.mongo_db[query.collection]
+        try:
+            sample = await collection.find_one({"deleted_at": None}, sort=[("_id", 1)])
+            if sample is None:
+                return {**report, "status": "skipped", "reason": "no sample data"}
+
+            filter_, sort, limit = query.build(sample)
+            cursor = collection.find(filter_)
+            if sort:
+                cursor = cursor.sort(sort)
+            if limit:
+                cursor = cursor.limit(limit)
+            explained = await cursor.explain()
+        except Exception as e:
+            logger.warning(f"Could not explain {query.name}: {e}")
+            return {**report, "status": "error", "reason": str(e)}
+
+        findings = mongo_plan_findings(explained)
+        stats = explained.get("executionStats", {})
+        return {
+            **report,
+            "status": "flagged" if findings else "ok",
+            "execution_ms": stats.get("executionTimeMillis"),
+            "docs_examined": stats.get("totalDocsExamined"),
+            "keys_examined": stats.get("totalKeysExamined"),
+            "findings": findings
+        }
+
+    async def missing_indexes(self) -> List[IndexSpec]:
+        """Registered Postgres indexes that do not exist."""
+        async with self._session() as session:
+            result = await session.execute(
+                text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+                {"names": list(POSTGRES_INDEXES)}
+            )
+            existing = {row.indexname for row in result.fetchall()}
+        return [spec for name, spec in POSTGRES_INDEXES.items() if name not in existing]
+
+    async def missing_mongo_indexes(self) -> List[MongoIndexSpec]:
+        """Registered MongoDB indexes with no index on the same keys, whatever its name."""
+        missing = []
+        for spec in MONGO_INDEXES.values():
+            existing = await self.mongo_db[spec.collection].index_information()
+            wanted = [tuple(key) for key in spec.keys]
+            if not any([tuple(key) for key in info["key"]] == wanted for info in existing.values()):
+                missing.append(spec)
+        return missing
+
+    async def ensure_mongo_indexes(self) -> List[str]:
+        """
+        Create missing registered MongoDB indexes.
+
+        Returns:
+            Names of the indexes created
+        """
+        created = []
+        for spec in await self.missing_mongo_indexes():
+            await self.mongo_db[spec.collection].create_index(list(spec.keys), name=spec.name, background=True)
+            created.append(spec.name)
+            logger.info(f"Created MongoDB index {spec.collection}.{spec.name}")
+        return created
@@ -11,6 +11,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.connection import db_manager
+from app.schemas.paper import IMMUTABLE_ARRAY_TO_STRING_SQL, PAPER_SEARCH_VECTOR_SQL
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,62 @@ class MigrationManager:
                 "up": self._add_user_saved_searches_table_up,
                 "down": self._add_user_saved_searches_table_down,
                 "version": "1.5.0"
+            },
+            {
+                "id": "007_add_latex_compilations_table",
+                "description": "Add latex_compilations table for compile status and history",
+                "up": self._add_latex_compilations_table_up,
+                "down": self._add_latex_compilations_table_down,
+                "version": "1.6.0"
+            },
+            {
+                "id": "008_add_journal_version_deltas_and_search_indexes",
+                "description": "Store journal versions as keyframes plus deltas and index journal search",
+                "up": self._add_journal_version_deltas_up,
+                "down": self._add_journal_version_deltas_down,
+                "version": "1.7.0"
+            },
+            {
+                "id": "009_add_paper_search_vector",
+                "description": "Add weighted tsvector column and GIN index for paper keyword search",
+                "up": self._add_paper_search_vector_up,
+                "down": self._add_paper_search_vector_down,
+                "version": "1.8.0"
+            },
+            {
+                "id": "010_add_paper_embedding_hnsw_index",
+                "description": "Add HNSW cosine index on paper_embeddings.embedding for hybrid search",
+                "up": self._add_paper_embedding_hnsw_index_up,
+                "down": self._add_paper_embedding_hnsw_index_down,
+                "version": "1.9.0"
+            },
+            {
+                "id": "011_add_search_suggestion_prefix_indexes",
+                "description": "Add text_pattern_ops prefix indexes for search suggestions",
+                "up": self._add_search_suggestion_prefix_indexes_up,
+                "down": self._add_search_suggestion_prefix_indexes_down,
+                "version": "1.10.0"
+            },
+            {
+                "id": "012_add_conversation_inbox",
+                "description": "Add materialized per-user conversation inbox with membership triggers",
+                "up": self._add_conversation_inbox_up,
+                "down": self._add_conversation_inbox_down,
+                "version": "1.11.0"
+            },
+            {
+                "id": "013_add_autosave_queue_retries",
+                "description": "Add retry bookkeeping and claim indexes to autosave_queue",
+                "up": self._add_autosave_queue_retries_up,
+                "down": self._add_autosave_queue_retries_down,
+                "version": "1.12.0"
+            },
+            {
+                "id": "014_add_hot_query_indexes",
+                "description": "Index paper checksums and project_papers.paper_id for hot lookups",
+                "up": self._add_hot_query_indexes_up,
+                "down": self._add_hot_query_indexes_down,
+                "version": "1.13.0"
             }
         ]
     
@@ -694,6 +751,452 @@ class MigrationManager:
         
         logger.info("User saved searches table dropped successfully")
 
+    
+    async def _add_latex_compilations_table_up(self, session: AsyncSession):
+        """Add latex_compilations table; replaces per-compilation metadata.json files"""
+        
+        logger.info("Creating latex_compilations table...")
+        
+        await session.execute(text("""
+            CREATE TABLE IF NOT EXISTS latex_compilations (
+                id UUID PRIMARY KEY,
+                project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+                latex_id TEXT NOT NULL,
+                latex_name TEXT,
+                main_file TEXT,
+                engine TEXT,
+                output_format TEXT,
+                status TEXT NOT NULL,
+                cached BOOLEAN DEFAULT FALSE,
+                source_hash TEXT,
+                errors JSONB DEFAULT '[]'::jsonb,
+                output_files JSONB DEFAULT '[]'::jsonb,
+                artifact_url TEXT,
+                compiled_by UUID REFERENCES users(id) ON DELETE SET NULL,
+                started_at TIMESTAMPTZ DEFAULT now(),
+                completed_at TIMESTAMPTZ,
+                updated_at TIMESTAMPTZ DEFAULT now()
+            );
+        """))
+        
+        # History is always read per LaTeX project, newest first
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_latex_compilations_project_latex_started
+            ON latex_compilations(project_id, latex_id, started_at DESC);
+        """))
+        
+        logger.info("LaTeX compilations table created successfully")
+    
+    async def _add_latex_compilations_table_down(self, session: AsyncSession):
+        """Drop latex_compilations table"""
+        logger.info("Dropping latex_compilations table...")
+        
+        await session.execute(text("""
+            DROP INDEX IF EXISTS idx_latex_compilations_project_latex_started;
+        """))
+        
+        await session.execute(text("""
+            DROP TABLE IF EXISTS latex_compilations;
+        """))
+        
+        logger.info("LaTeX compilations table dropped successfully")
+    
+    async def _add_journal_version_deltas_up(self, session: AsyncSession):
+        """Keyframe/delta columns on journal_versions and trigram indexes for journal search"""
+        
+        logger.info("Adding delta storage to journal_versions...")
+        
+        await session.execute(text("""
+            CREATE TABLE IF NOT EXISTS journal_versions (
+                id UUID PRIMARY KEY,
+                journal_id UUID NOT NULL REFERENCES journals(id) ON DELETE CASCADE,
+                version_number INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT,
+                changed_by UUID REFERENCES users(id) ON DELETE SET NULL,
+                change_summary TEXT,
+                created_at TIMESTAMPTZ DEFAULT now()
+            );
+        """))
+        
+        # Existing rows hold full content, so they become keyframes
+        await session.execute(text("""
+            ALTER TABLE journal_versions
+                ADD COLUMN IF NOT EXISTS delta JSONB,
+                ADD COLUMN IF NOT EXISTS is_keyframe BOOLEAN NOT NULL DEFAULT TRUE,
+                ALTER COLUMN content DROP NOT NULL;
+        """))
+        
+        await session.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_journal_versions_journal_version
+            ON journal_versions(journal_id, version_number);
+        """))
+        
+        logger.info("Creating trigram indexes for journal search...")
+        
+        await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+        
+        # Separate indexes so the title/content ILIKE disjunction can use a BitmapOr
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_journals_title_trgm
+            ON journals USING gin (title gin_trgm_ops);
+        """))
+        
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_journals_content_trgm
+            ON journals USING gin (content gin_trgm_ops);
+        """))
+        
+        logger.info("Journal version deltas and search indexes added successfully")
+    
+    async def _add_journal_version_deltas_down(self, session: AsyncSession):
+        """Drop journal search indexes and delta storage"""
+        logger.info("Removing journal version deltas and search indexes...")
+        
+        await session.execute(text("DROP INDEX IF EXISTS idx_journals_content_trgm;"))
+        await session.execute(text("DROP INDEX IF EXISTS idx_journals_title_trgm;"))
+        
+        # Deltas cannot be expanded in SQL; drop them with their columns and keep
+        # the keyframes, which still carry full content
+        await session.execute(text("""
+            DELETE FROM journal_versions WHERE NOT is_keyframe;
+        """))
+        
+        await session.execute(text("""
+            ALTER TABLE journal_versions
+                DROP COLUMN IF EXISTS delta,
+                DROP COLUMN IF EXISTS is_keyframe;
+        """))
+        
+        await session.execute(text("""
+            DROP INDEX IF EXISTS idx_journal_versions_journal_version;
+        """))
+        
+        logger.info("Journal version deltas and search indexes removed successfully")
+    
+    async def _add_paper_search_vector_up(self, session: AsyncSession):
+        """Generated search_vector column on papers with a GIN index"""
+        
+        logger.info("Adding search_vector to papers...")
+        
+        await session.execute(text(IMMUTABLE_ARRAY_TO_STRING_SQL))
+        
+        # A stored generated column rewrites the table once; Postgres keeps it
+        # current on every insert and update afterwards
+        await session.execute(text(f"""
+            ALTER TABLE papers
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({PAPER_SEARCH_VECTOR_SQL}) STORED;
+        """))
+        
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_papers_search_vector
+            ON papers USING gin (search_vector);
+        """))
+        
+        logger.info("Paper search vector added successfully")
+    
+    async def _add_paper_search_vector_down(self, session: AsyncSession):
+        """Drop the papers search_vector column and its index"""
+        logger.info("Dropping paper search vector...")
+        
+        await session.execute(text("DROP INDEX IF EXISTS idx_papers_search_vector;"))
+        
+        await session.execute(text("""
+            ALTER TABLE papers DROP COLUMN IF EXISTS search_vector;
+        """))
+        
+        await session.execute(text("DROP FUNCTION IF EXISTS immutable_array_to_string(text[]);"))
+        
+        logger.info("Paper search vector dropped successfully")
+    
+    async def _add_paper_embedding_hnsw_index_up(self, session: AsyncSession):
+        """HNSW index for the nearest-neighbour half of hybrid search"""
+        
+        logger.info("Creating HNSW index on paper_embeddings.embedding...")
+        
+        # The title/abstract/combined columns are indexed, but embeddings are
+        # written to and searched on the embedding column
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_paper_embeddings_embedding_cosine
+            ON paper_embeddings USING hnsw (embedding vector_cosine_ops);
+        """))
+        
+        logger.info("Paper embedding HNSW index created successfully")
+    
+    async def _add_paper_embedding_hnsw_index_down(self, session: AsyncSession):
+        """Drop the paper_embeddings.embedding HNSW index"""
+        logger.info("Dropping paper embedding HNSW index...")
+        
+        await session.execute(text("DROP INDEX IF EXISTS idx_paper_embeddings_embedding_cosine;"))
+        
+        logger.info("Paper embedding HNSW index dropped successfully")
+    
+    async def _add_search_suggestion_prefix_indexes_up(self, session: AsyncSession):
+        """Prefix indexes backing /search/suggestions"""
+        
+        logger.info("Creating search suggestion prefix indexes...")
+        
+        # text_pattern_ops supports the ~>=~/~<~ range the suggestion service
+        # scans, independent of the database collation
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_papers_title_prefix
+            ON papers (lower(title) text_pattern_ops)
+            WHERE deleted_at IS NULL;
+        """))
+        
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_projects_name_prefix
+            ON projects (lower(name) text_pattern_ops)
+            WHERE deleted_at IS NULL;
+        """))
+        
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_users_name_prefix
+            ON users (lower(name) text_pattern_ops)
+            WHERE deleted_at IS NULL;
+        """))
+        
+        logger.info("Search suggestion prefix indexes created successfully")
+    
+    async def _add_search_suggestion_prefix_indexes_down(self, session: AsyncSession):
+        """Drop the search suggestion prefix indexes"""
+        logger.info("Dropping search suggestion prefix indexes...")
+        
+        await session.execute(text("DROP INDEX IF EXISTS idx_papers_title_prefix;"))
+        await session.execute(text("DROP INDEX IF EXISTS idx_projects_name_prefix;"))
+        await session.execute(text("DROP INDEX IF EXISTS idx_users_name_prefix;"))
+        
+        logger.info("Search suggestion prefix indexes dropped successfully")
+    
+    async def _add_conversation_inbox_up(self, session: AsyncSession):
+        """Per-user conversation inbox backing the chat sidebar"""
+        
+        logger.info("Creating conversation_inbox table...")
+        
+        await session.execute(text("""
+            CREATE TABLE IF NOT EXISTS conversation_inbox (
+                user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+                conversation_type conversation_type NOT NULL,
+                last_activity_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                last_message_id VARCHAR(24),
+                last_message_preview TEXT,
+                last_sender_id UUID,
+                last_sender_name VARCHAR,
+                unread_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, conversation_id)
+            );
+        """))
+        
+        # The sidebar read: one range scan per user in display order
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_conversation_inbox_activity
+            ON conversation_inbox (user_id, last_activity_at DESC, conversation_id DESC);
+        """))
+        
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_conversation_inbox_conversation
+            ON conversation_inbox (conversation_id);
+        """))
+        
+        # Participation follows the access rules of the conversation list:
+        # the creator, plus every project member for GROUP conversations
+        await session.execute(text("""
+            CREATE OR REPLACE FUNCTION conversation_inbox_add_conversation()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                INSERT INTO conversation_inbox (user_id, conversation_id, conversation_type, last_activity_at)
+                SELECT participant.user_id, NEW.id, NEW.type, NEW.created_at
+                FROM (
+                    SELECT NEW.created_by AS user_id WHERE NEW.created_by IS NOT NULL
+                    UNION
+                    SELECT pm.user_id FROM project_members pm
+                    WHERE NEW.type = 'GROUP' AND pm.project_id = NEW.entity
+                ) participant
+                ON CONFLICT (user_id, conversation_id) DO NOTHING;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """))
+        
+        # New members see the conversation's current last message, not an empty row
+        await session.execute(text("""
+            CREATE OR REPLACE FUNCTION conversation_inbox_add_member()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                INSERT INTO conversation_inbox (
+                    user_id, conversation_id, conversation_type, last_activity_at,
+                    last_message_id, last_message_preview, last_sender_id, last_sender_name
+                )
+                SELECT
+                    NEW.user_id, c.id, c.type, COALESCE(latest.last_activity_at, c.created_at),
+                    latest.last_message_id, latest.last_message_preview,
+                    latest.last_sender_id, latest.last_sender_name
+                FROM conversations c
+                LEFT JOIN LATERAL (
+                    SELECT ib.last_activity_at, ib.last_message_id, ib.last_message_preview,
+                           ib.last_sender_id, ib.last_sender_name
+                    FROM conversation_inbox ib
+                    WHERE ib.conversation_id = c.id
+                    ORDER BY ib.last_activity_at DESC
+                    LIMIT 1
+                ) latest ON TRUE
+                WHERE c.type = 'GROUP' AND c.entity = NEW.project_id
+                ON CONFLICT (user_id, conversation_id) DO NOTHING;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """))
+        
+        await session.execute(text("""
+            CREATE OR REPLACE FUNCTION conversation_inbox_remove_member()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                DELETE FROM conversation_inbox ib
+                USING conversations c
+                WHERE ib.conversation_id = c.id
+                AND ib.user_id = OLD.user_id
+                AND c.type = 'GROUP' AND c.entity = OLD.project_id
+                AND c.created_by IS DISTINCT FROM OLD.user_id;
+                RETURN OLD;
+            END;
+            $$ LANGUAGE plpgsql;
+        """))
+        
+        await session.execute(text("""
+            DROP TRIGGER IF EXISTS conversation_inbox_on_conversation ON conversations;
+        """))
+        await session.execute(text("""
+            CREATE TRIGGER conversation_inbox_on_conversation
+            AFTER INSERT ON conversations
+            FOR EACH ROW EXECUTE FUNCTION conversation_inbox_add_conversation();
+        """))
+        
+        await session.execute(text("""
+            DROP TRIGGER IF EXISTS conversation_inbox_on_member_add ON project_members;
+        """))
+        await session.execute(text("""
+            CREATE TRIGGER conversation_inbox_on_member_add
+            AFTER INSERT ON project_members
+            FOR EACH ROW EXECUTE FUNCTION conversation_inbox_add_member();
+        """))
+        
+        await session.execute(text("""
+            DROP TRIGGER IF EXISTS conversation_inbox_on_member_remove ON project_members;
+        """))
+        await session.execute(text("""
+            CREATE TRIGGER conversation_inbox_on_member_remove
+            AFTER DELETE ON project_members
+            FOR EACH ROW EXECUTE FUNCTION conversation_inbox_remove_member();
+        """))
+        
+        # Backfill participation; message snapshots and unread counts fill in
+        # as conversations receive messages and are read
+        await session.execute(text("""
+            INSERT INTO conversation_inbox (user_id, conversation_id, conversation_type, last_activity_at)
+            SELECT participant.user_id, c.id, c.type, c.updated_at
+            FROM conversations c
+            JOIN LATERAL (
+                SELECT c.created_by AS user_id WHERE c.created_by IS NOT NULL
+                UNION
+                SELECT pm.user_id FROM project_members pm
+                WHERE c.type = 'GROUP' AND pm.project_id = c.entity
+            ) participant ON TRUE
+            ON CONFLICT (user_id, conversation_id) DO NOTHING;
+        """))
+        
+        logger.info("Conversation inbox created successfully")
+    
+    async def _add_conversation_inbox_down(self, session: AsyncSession):
+        """Drop the conversation inbox and its triggers"""
+        logger.info("Dropping conversation_inbox table...")
+        
+        await session.execute(text("DROP TRIGGER IF EXISTS conversation_inbox_on_conversation ON conversations;"))
+        await session.execute(text("DROP TRIGGER IF EXISTS conversation_inbox_on_member_add ON project_members;"))
+        await session.execute(text("DROP TRIGGER IF EXISTS conversation_inbox_on_member_remove ON project_members;"))
+        await session.execute(text("DROP FUNCTION IF EXISTS conversation_inbox_add_conversation();"))
+        await session.execute(text("DROP FUNCTION IF EXISTS conversation_inbox_add_member();"))
+        await session.execute(text("DROP FUNCTION IF EXISTS conversation_inbox_remove_member();"))
+        await session.execute(text("DROP TABLE IF EXISTS conversation_inbox;"))
+        
+        logger.info("Conversation inbox dropped successfully")
+    
+    async def _add_autosave_queue_retries_up(self, session: AsyncSession):
+        """Retry bookkeeping and claim indexes for the autosave worker"""
+        
+        logger.info("Adding autosave queue retry columns and indexes...")
+        
+        await session.execute(text("""
+            ALTER TABLE autosave_queue
+            ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS last_error TEXT;
+        """))
+        
+        # The claim scan: due pending entries in priority order
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_autosave_queue_due
+            ON autosave_queue (priority DESC, scheduled_at)
+            WHERE status = 'pending';
+        """))
+        
+        # Enqueue de-duplication and same-branch riders
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_autosave_queue_pending_file
+            ON autosave_queue (file_id)
+            WHERE status = 'pending';
+        """))
+        
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_autosave_queue_pending_branch
+            ON autosave_queue (branch_id)
+            WHERE status = 'pending';
+        """))
+        
+        logger.info("Autosave queue retry columns and indexes added successfully")
+    
+    async def _add_autosave_queue_retries_down(self, session: AsyncSession):
+        """Drop the autosave queue retry columns and indexes"""
+        logger.info("Dropping autosave queue retry columns and indexes...")
+        
+        await session.execute(text("DROP INDEX IF EXISTS idx_autosave_queue_due;"))
+        await session.execute(text("DROP INDEX IF EXISTS idx_autosave_queue_pending_file;"))
+        await session.execute(text("DROP INDEX IF EXISTS idx_autosave_queue_pending_branch;"))
+        await session.execute(text("""
+            ALTER TABLE autosave_queue
+            DROP COLUMN IF EXISTS attempts,
+            DROP COLUMN IF EXISTS last_error;
+        """))
+        
+        logger.info("Autosave queue retry columns and indexes dropped successfully")
+    
+    async def _add_hot_query_indexes_up(self, session: AsyncSession):
+        """Add indexes for lookups the index advisor found scanning"""
+        logger.info("Creating hot query indexes...")
+        
+        # Duplicate upload detection looks papers up by file hash
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_papers_checksum
+            ON papers (checksum)
+            WHERE checksum IS NOT NULL AND deleted_at IS NULL;
+        """))
+        
+        # The (project_id, paper_id) primary key cannot serve paper -> project lookups
+        await session.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_project_papers_paper_id
+            ON project_papers (paper_id);
+        """))
+        
+        logger.info("Hot query indexes created successfully")
+    
+    async def _add_hot_query_indexes_down(self, session: AsyncSession):
+        """Drop the hot query indexes"""
+        logger.info("Dropping hot query indexes...")
+        
+        await session.execute(text("DROP INDEX IF EXISTS idx_papers_checksum;"))
+        await session.execute(text("DROP INDEX IF EXISTS idx_project_papers_paper_id;"))
+        
+        logger.info("Hot query indexes dropped successfully")
 
 # Utility functions for direct use
 
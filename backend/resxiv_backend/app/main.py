@@ -51,6 +51,14 @@ async def lifespan(app: FastAPI):
     try:
         await db_manager.initialize()
         
+        if settings.files.autosave_enabled:
+            from app.services.git.autosave_worker import autosave_worker
+            autosave_worker.start()
+        
+        # Load the semantic cache's embedding model off the request path
+        from app.core.llm_cache import llm_response_cache
+        llm_response_cache.start_warm_up()
+        
         # Initialize production agentic service if configured
         try:
             from app.agentic.production_service import production_agentic_service
@@ -69,6 +77,24 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Shutting down ResXiv Backend...")
+        from app.agentic.production_service import production_agentic_service
+        await production_agentic_service.cleanup()
+        from app.websockets.room_broker import room_broker
+        await room_broker.close()
+        from app.core.llm_gateway import llm_gateway
+        await llm_gateway.close()
+        from app.core.llm_cache import llm_response_cache
+        await llm_response_cache.close()
+        from app.core.enhanced_cache import enhanced_cache
+        await enhanced_cache.close()
+        from app.services.git.compile_pool import latex_compile_pool
+        await latex_compile_pool.close()
+        from app.services.git.autosave_worker import autosave_worker
+        await autosave_worker.close()
+        from app.services.git.write_scheduler import git_write_scheduler
+        await git_write_scheduler.close()
+        from app.services.git.object_reader import git_object_store
+        await git_object_store.close()
         await db_manager.close()
         logger.info("Application shutdown completed")
 
@@ -142,6 +142,10 @@ class ConversationResponse(BaseModel):
     participant_count: Optional[int] = None
     unread_count: Optional[int] = None
     last_message: Optional[str] = None
+    last_message_id: Optional[str] = None
+    last_sender_id: Optional[UUID] = None
+    last_sender_name: Optional[str] = None
+    last_activity_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -168,6 +172,18 @@ class MessageResponse(BaseModel):
         from_attributes = True
 
 
+class MessageSearchHighlight(BaseModel):
+    """Character offsets of a search match inside a message"""
+    start: int = Field(ge=0)
+    end: int = Field(ge=0)
+
+
+class MessageSearchHit(MessageResponse):
+    """Message search result with relevance ranking"""
+    score: Optional[float] = None
+    highlights: List[MessageSearchHighlight] = []
+
+
 class ConversationWithMessages(ConversationResponse):
     """Conversation with recent messages"""
     messages: List[MessageResponse] = []
@@ -179,7 +195,7 @@ class ConversationList(BaseModel):
     conversations: List[ConversationResponse]
     total: int
     page: int = Field(ge=1)
-    limit: int = Field(ge=1, le=100)
+    limit: int = Field(ge=1, le=200)
     has_next: bool
     has_prev: bool
 
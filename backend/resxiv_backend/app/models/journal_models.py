@@ -104,6 +104,25 @@ class JournalDetailResponse(JournalResponse):
     tags: List[str] = Field(default_factory=list)
 
 
+class JournalSummaryResponse(BaseModel):
+    """Journal list entry; content is reduced to a short excerpt"""
+    id: uuid.UUID
+    project_id: uuid.UUID
+    title: str
+    excerpt: str = Field(default="", description="Start of the journal content")
+    is_public: bool = False
+    status: JournalStatus = JournalStatus.DRAFT
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    created_by: uuid.UUID
+    creator_name: Optional[str] = None
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # ================================
 # Collaborator Models
 # ================================
@@ -162,6 +181,21 @@ class JournalVersionResponse(BaseModel):
         from_attributes = True
 
 
+class JournalVersionSummary(BaseModel):
+    """Version history entry without content"""
+    id: uuid.UUID
+    journal_id: uuid.UUID
+    version_number: int
+    title: str
+    changed_by: Optional[uuid.UUID] = None
+    change_summary: Optional[str] = None
+    created_at: datetime
+    changed_by_name: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
 class JournalVersionCompare(BaseModel):
     """Model for comparing journal versions"""
     from_version: int = Field(..., description="Source version number")
@@ -215,7 +249,7 @@ class JournalSearchFilters(BaseModel):
 
 class JournalListResponse(BaseModel):
     """Model for paginated journal list responses"""
-    journals: List[JournalDetailResponse]
+    journals: List[JournalSummaryResponse]
     total: int
     page: int
     per_page: int
@@ -18,7 +18,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy import select, and_, or_, func, desc, asc, text
 from sqlalchemy.orm import selectinload, joinedload
 
 from app.schemas.branch import (
@@ -594,6 +594,50 @@ class BranchRepository:
         )
         return result.scalar_one_or_none()
     
+    async def reload_document_session(
+        self,
+        session_id: uuid.UUID
+    ) -> Optional[DocumentSession]:
+        """
+        Re-read a document session, replacing any copy already loaded
+        
+        Args:
+            session_id: Document session ID
+            
+        Returns:
+            Session or None
+        """
+        result = await self.session.execute(
+            select(DocumentSession)
+            .where(DocumentSession.id == session_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+    
+    async def lock_document_session(
+        self,
+        session_id: uuid.UUID
+    ) -> Optional[DocumentSession]:
+        """
+        Re-read a document session with a row lock
+        
+        Concurrent editors merge into the stored CRDT state under this lock,
+        so one connection's write cannot drop another's updates.
+        
+        Args:
+            session_id: Document session ID
+            
+        Returns:
+            Locked session or None
+        """
+        result = await self.session.execute(
+            select(DocumentSession)
+            .where(DocumentSession.id == session_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+    
     # ================================
     # GIT REPOSITORY OPERATIONS
     # ================================
@@ -643,4 +687,210 @@ class BranchRepository:
         )
         
         self.session.add(repository)
-        return repository 
\ No newline at end of file
+        return repository     
+    # ================================
+    # AUTOSAVE QUEUE OPERATIONS
+    # ================================
+    
+    async def enqueue_autosave(
+        self,
+        file_id: uuid.UUID,
+        branch_id: uuid.UUID,
+        user_id: uuid.UUID,
+        delay_seconds: float,
+        priority: int = 0
+    ) -> None:
+        """
+        Schedule a file for autosave unless it already has a pending entry.
+        
+        The first edit schedules the save ``delay_seconds`` out and later edits
+        ride along, so Git sees at most one autosave per file per delay. A
+        concurrent duplicate is harmless: the worker writes each file once.
+        
+        Args:
+            file_id: Edited file
+            branch_id: Branch of the file
+            user_id: Editing user
+            delay_seconds: Debounce before the save is due
+            priority: Higher priorities are committed first
+        """
+        await self.session.execute(text("""
+            INSERT INTO autosave_queue (file_id, branch_id, user_id, priority, scheduled_at)
+            SELECT CAST(:file_id AS uuid), CAST(:branch_id AS uuid), CAST(:user_id AS uuid),
+                   CAST(:priority AS integer), now() + make_interval(secs => :delay)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM autosave_queue
+                WHERE file_id = :file_id AND status = 'pending'
+            )
+        """), {
+            "file_id": file_id,
+            "branch_id": branch_id,
+            "user_id": user_id,
+            "priority": priority,
+            "delay": float(delay_seconds)
+        })
+    
+    async def claim_autosave_batch(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Claim due autosave entries for this worker.
+        
+        Due entries are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent
+        workers never claim the same row; pending entries on the same branches
+        are claimed with them so one commit covers the branch. Claimed rows are
+        moved to ``processing`` and joined with everything needed to commit.
+        
+        Args:
+            limit: Maximum number of due entries to claim
+            
+        Returns:
+            Claimed entries, highest priority first
+        """
+        result = await self.session.execute(text("""
+            WITH due AS (
+                SELECT id, branch_id FROM autosave_queue
+                WHERE status = 'pending' AND scheduled_at <= now()
+                ORDER BY priority DESC, scheduled_at
+                LIMIT :limit
+                FOR UPDATE SKIP LOCKED
+            ),
+            riders AS (
+                SELECT q.id FROM autosave_queue q
+                WHERE q.status = 'pending'
+                AND q.branch_id IN (SELECT branch_id FROM due)
+                AND q.id NOT IN (SELECT id FROM due)
+                FOR UPDATE SKIP LOCKED
+            ),
+            claimed AS (
+                UPDATE autosave_queue q
+                SET status = 'processing', processed_at = now()
+                WHERE q.id IN (SELECT id FROM due UNION ALL SELECT id FROM riders)
+                RETURNING q.id, q.file_id, q.branch_id, q.user_id, q.content_snapshot,
+                          q.change_summary, q.priority, q.attempts, q.created_at
+            )
+            SELECT
+                c.*, f.file_path, f.deleted_at AS file_deleted_at,
+                b.name AS branch_name, g.repo_path,
+                u.name AS user_name, u.email AS user_email, ds.crdt_state
+            FROM claimed c
+            LEFT JOIN latex_files f ON f.id = c.file_id
+            LEFT JOIN branches b ON b.id = c.branch_id
+            LEFT JOIN git_repositories g ON g.project_id = b.project_id
+            LEFT JOIN users u ON u.id = c.user_id
+            LEFT JOIN LATERAL (
+                SELECT crdt_state FROM document_sessions
+                WHERE file_id = c.file_id
+                ORDER BY last_activity DESC
+                LIMIT 1
+            ) ds ON TRUE
+            ORDER BY c.priority DESC, c.created_at
+        """), {"limit": limit})
+        return [dict(row) for row in result.mappings().all()]
+    
+    async def complete_autosaves(
+        self,
+        entry_ids: List[uuid.UUID],
+        branch_id: Optional[uuid.UUID] = None,
+        commit_hash: Optional[str] = None
+    ) -> None:
+        """
+        Mark autosave entries done and record the branch head they produced.
+        
+        Args:
+            entry_ids: Completed queue entries
+            branch_id: Branch that was committed to
+            commit_hash: Resulting commit (None when nothing was written)
+        """
+        await self.session.execute(text("""
+            UPDATE autosave_queue
+            SET status = 'completed', processed_at = now(), last_error = NULL
+            WHERE id = ANY(:ids)
+        """), {"ids": entry_ids})
+        
+        # Sessions stay flagged while newer edits are still queued
+        await self.session.execute(text("""
+            UPDATE document_sessions ds
+            SET autosave_pending = FALSE
+            WHERE ds.file_id IN (SELECT file_id FROM autosave_queue WHERE id = ANY(:ids))
+            AND NOT EXISTS (
+                SELECT 1 FROM autosave_queue q
+                WHERE q.file_id = ds.file_id AND q.status IN ('pending', 'processing')
+            )
+        """), {"ids": entry_ids})
+        
+        if branch_id and commit_hash:
+            await self.session.execute(text("""
+                UPDATE branches SET head_commit_hash = :commit_hash WHERE id = :branch_id
+            """), {"branch_id": branch_id, "commit_hash": commit_hash})
+    
+    async def retry_autosaves(
+        self,
+        entry_ids: List[uuid.UUID],
+        error: str,
+        max_attempts: int,
+        backoff_seconds: float,
+        max_backoff_seconds: float = 3600
+    ) -> None:
+        """
+        Reschedule failed autosave entries with exponential backoff.
+        
+        Entries that reach ``max_attempts`` are marked ``failed``.
+        
+        Args:
+            entry_ids: Failed queue entries
+            error: Failure description
+            max_attempts: Attempts before giving up
+            backoff_seconds: Delay after the first failure, doubled per attempt
+            max_backoff_seconds: Upper bound for the delay
+        """
+        await self.session.execute(text("""
+            UPDATE autosave_queue
+            SET attempts = attempts + 1,
+                last_error = :error,
+                status = CASE WHEN attempts + 1 >= :max_attempts THEN 'failed' ELSE 'pending' END,
+                processed_at = CASE WHEN attempts + 1 >= :max_attempts THEN now() ELSE NULL END,
+                scheduled_at = now() + make_interval(
+                    secs => LEAST(:max_backoff, :backoff * power(2, attempts))
+                )
+            WHERE id = ANY(:ids)
+        """), {
+            "ids": entry_ids,
+            "error": error[:2000],
+            "max_attempts": max_attempts,
+            "backoff": float(backoff_seconds),
+            "max_backoff": float(max_backoff_seconds)
+        })
+    
+    async def recover_stale_autosaves(self, lease_seconds: float) -> int:
+        """
+        Return entries claimed by a worker that died back to the queue.
+        
+        Args:
+            lease_seconds: How long a claim may stay in ``processing``
+            
+        Returns:
+            Number of recovered entries
+        """
+        result = await self.session.execute(text("""
+            UPDATE autosave_queue
+            SET status = 'pending', scheduled_at = now()
+            WHERE status = 'processing'
+            AND processed_at < now() - make_interval(secs => :lease)
+        """), {"lease": float(lease_seconds)})
+        return result.rowcount
+    
+    async def prune_autosaves(self, retention_seconds: float) -> int:
+        """
+        Delete completed autosave entries older than the retention window.
+        
+        Args:
+            retention_seconds: How long completed entries are kept
+            
+        Returns:
+            Number of deleted entries
+        """
+        result = await self.session.execute(text("""
+            DELETE FROM autosave_queue
+            WHERE status = 'completed'
+            AND processed_at < now() - make_interval(secs => :retention)
+        """), {"retention": float(retention_seconds)})
+        return result.rowcount
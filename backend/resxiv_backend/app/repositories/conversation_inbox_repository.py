@@ -0,0 +1,205 @@
+"""
+Conversation Inbox Repository - L6 Engineering Standards
+Denormalized per-user conversation list backing the chat sidebar.
+Single Responsibility: Reading and maintaining ``conversation_inbox`` rows.
+
+Rows are keyed by ``(user_id, last_activity_at DESC, conversation_id DESC)``
+so a user's sidebar is one index range read - no OR/IN access subquery, no
+separate count query, and no per-conversation lookups of the last message
+in MongoDB or unread counters in Redis. Participation (conversation creator
+plus project members for GROUP conversations) is maintained by triggers
+from migration 012; this repository writes the message-driven columns.
+"""
+
+import uuid
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.conversation_models import ConversationType
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_LENGTH = 160
+
+# Fan a new message out to every participant's inbox row in one statement.
+# Rows normally exist already (membership triggers); the upsert also repairs
+# missing ones. Out-of-order deliveries never move the snapshot backwards:
+# ObjectId hex strings sort in creation order.
+RECORD_MESSAGE_SQL = text("""
+    WITH conversation AS (
+        SELECT id, type, entity, created_by
+        FROM conversations
+        WHERE id = :conversation_id
+    ),
+    participants AS (
+        SELECT c.created_by AS user_id, c.type
+        FROM conversation c
+        WHERE c.created_by IS NOT NULL
+        UNION
+        SELECT pm.user_id, c.type
+        FROM conversation c
+        JOIN project_members pm ON pm.project_id = c.entity
+        WHERE c.type = 'GROUP'
+    )
+    INSERT INTO conversation_inbox AS ib (
+        user_id, conversation_id, conversation_type, last_activity_at,
+        last_message_id, last_message_preview, last_sender_id, last_sender_name,
+        unread_count
+    )
+    SELECT
+        p.user_id, CAST(:conversation_id AS uuid), p.type, CAST(:sent_at AS timestamptz),
+        :message_id, :preview, CAST(:sender_id AS uuid), :sender_name,
+        CASE WHEN p.user_id = :sender_id THEN 0 ELSE 1 END
+    FROM participants p
+    ON CONFLICT (user_id, conversation_id) DO UPDATE SET
+        unread_count = ib.unread_count + EXCLUDED.unread_count,
+        last_activity_at = GREATEST(ib.last_activity_at, EXCLUDED.last_activity_at),
+        last_message_id = CASE WHEN ib.last_message_id IS NULL OR EXCLUDED.last_message_id > ib.last_message_id
+            THEN EXCLUDED.last_message_id ELSE ib.last_message_id END,
+        last_message_preview = CASE WHEN ib.last_message_id IS NULL OR EXCLUDED.last_message_id > ib.last_message_id
+            THEN EXCLUDED.last_message_preview ELSE ib.last_message_preview END,
+        last_sender_id = CASE WHEN ib.last_message_id IS NULL OR EXCLUDED.last_message_id > ib.last_message_id
+            THEN EXCLUDED.last_sender_id ELSE ib.last_sender_id END,
+        last_sender_name = CASE WHEN ib.last_message_id IS NULL OR EXCLUDED.last_message_id > ib.last_message_id
+            THEN EXCLUDED.last_sender_name ELSE ib.last_sender_name END
+""")
+
+SET_UNREAD_SQL = text("""
+    UPDATE conversation_inbox
+    SET unread_count = :unread_count
+    WHERE user_id = :user_id AND conversation_id = :conversation_id
+""")
+
+LIST_INBOX_SQL = """
+    SELECT
+        c.id, c.type, c.entity, c.is_group, c.created_by, c.created_at, c.updated_at,
+        ib.last_activity_at, ib.last_message_id, ib.last_message_preview,
+        ib.last_sender_id, ib.last_sender_name, ib.unread_count,
+        count(*) OVER () AS total_count
+    FROM conversation_inbox ib
+    JOIN conversations c ON c.id = ib.conversation_id
+    WHERE ib.user_id = :user_id {type_filter}
+    ORDER BY ib.last_activity_at DESC, ib.conversation_id DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+COUNT_INBOX_SQL = """
+    SELECT count(*) FROM conversation_inbox ib
+    WHERE ib.user_id = :user_id {type_filter}
+"""
+
+TYPE_FILTER = "AND ib.conversation_type = :conversation_type"
+
+
+def message_preview(content: Optional[str], length: int = PREVIEW_LENGTH) -> str:
+    """Single-line preview of a message body, truncated to ``length`` characters."""
+    preview = " ".join((content or "").split())
+    return preview if len(preview) <= length else preview[:length - 1].rstrip() + "…"
+
+
+class ConversationInboxRepository:
+    """
+    Repository for the materialized conversation inbox.
+    Single Responsibility: Inbox reads and message-driven inbox updates.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def record_message(
+        self,
+        conversation_id: uuid.UUID,
+        message_id: str,
+        sender_id: uuid.UUID,
+        content: Optional[str],
+        sent_at: datetime,
+        sender_name: Optional[str] = None
+    ) -> int:
+        """
+        Apply a new message to every participant's inbox row.
+
+        Updates the last-message snapshot and increments unread counts for
+        everyone except the sender.
+
+        Args:
+            conversation_id: Conversation UUID
+            message_id: MongoDB ObjectId of the new message
+            sender_id: Sender user UUID
+            content: Message body (stored as a short preview)
+            sent_at: Message creation time
+            sender_name: Sender's display name
+
+        Returns:
+            Number of inbox rows written
+        """
+        result = await self.session.execute(RECORD_MESSAGE_SQL, {
+            "conversation_id": conversation_id,
+            "message_id": str(message_id),
+            "sender_id": sender_id,
+            "sender_name": sender_name,
+            "preview": message_preview(content),
+            "sent_at": sent_at
+        })
+        return result.rowcount
+
+    async def set_unread_count(
+        self,
+        conversation_id: uuid.UUID,
+        user_id: uuid.UUID,
+        unread_count: int
+    ) -> None:
+        """
+        Store a user's unread count after their read cursor moved.
+
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
+            unread_count: Messages still unread
+        """
+        await self.session.execute(SET_UNREAD_SQL, {
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "unread_count": max(0, unread_count)
+        })
+
+    async def list_inbox(
+        self,
+        user_id: uuid.UUID,
+        limit: int = 50,
+        offset: int = 0,
+        conversation_type: Optional[ConversationType] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get a page of a user's conversations, most recently active first.
+
+        Args:
+            user_id: User UUID
+            limit: Maximum number of conversations
+            offset: Number of conversations to skip
+            conversation_type: Filter by conversation type
+
+        Returns:
+            Tuple of (inbox rows joined with their conversation, total count)
+        """
+        params: Dict[str, Any] = {"user_id": user_id, "limit": limit, "offset": offset}
+        type_filter = ""
+        if conversation_type:
+            type_filter = TYPE_FILTER
+            params["conversation_type"] = conversation_type.value
+
+        result = await self.session.execute(text(LIST_INBOX_SQL.format(type_filter=type_filter)), params)
+        rows = [dict(row) for row in result.mappings().all()]
+        if rows:
+            return rows, rows[0]["total_count"]
+        if offset == 0:
+            return [], 0
+
+        # Paged past the end: the window count has no row to ride on
+        params.pop("limit")
+        params.pop("offset")
+        total = await self.session.execute(text(COUNT_INBOX_SQL.format(type_filter=type_filter)), params)
+        return [], total.scalar() or 0
@@ -13,6 +13,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 import pymongo
 
 from app.database.connection import DatabaseManager
+from app.repositories.message.read_cursor_repository import ReadCursorRepository
 
 logger = logging.getLogger(__name__)
 
@@ -408,20 +409,27 @@ class MessageAnalyticsRepository:
                     "keys": [("conversation_id", 1), ("deleted_at", 1), ("_id", -1)],
                     "name": "conversation_messages_optimized"
                 },
+                # Unread counts and read cursors: messages after a (created_at, _id) position
+                {
+                    "keys": [("conversation_id", 1), ("created_at", 1), ("_id", 1)],
+                    "name": "conversation_read_position"
+                },
                 # User activity queries
                 {
                     "keys": [("sender_id", 1), ("created_at", -1)],
                     "name": "user_activity_optimized"
                 },
-                # Read status queries
-                {
-                    "keys": [("conversation_id", 1), ("read_by.user_id", 1)],
-                    "name": "read_status_optimized"
-                },
-                # Search queries
+                # Full-text search: conversation_id is an equality prefix so the
+                # text query is scoped to one conversation; both message body
+                # field names in use are indexed (one text index per collection)
                 {
-                    "keys": [("conversation_id", 1), ("content", "text")],
-                    "name": "message_search_optimized"
+                    "keys": [("conversation_id", 1), ("message", "text"), ("content", "text")],
+                    "name": "message_text_search",
+                    "options": {
+                        "weights": {"message": 1, "content": 1},
+                        "default_language": "english"
+                    },
+                    "replaces": ["message_search_optimized"]
                 },
                 # Analytics queries
                 {
@@ -430,17 +438,29 @@ class MessageAnalyticsRepository:
                 }
             ]
             
+            existing_indexes = await self.messages.list_indexes().to_list(length=None)
+            index_names = {idx["name"] for idx in existing_indexes}
+            
             for index_spec in indexes_to_create:
                 try:
-                    # Check if index already exists
-                    existing_indexes = await self.messages.list_indexes().to_list(length=None)
-                    index_names = [idx["name"] for idx in existing_indexes]
+                    # Drop superseded indexes (e.g. an older text index, since
+                    # MongoDB allows only one per collection)
+                    for legacy_name in index_spec.get("replaces", []):
+                        if legacy_name in index_names:
+                            await self.messages.drop_index(legacy_name)
+                            index_names.discard(legacy_name)
+                            optimizations.append({
+                                "type": "index_dropped",
+                                "name": legacy_name,
+                                "status": "success"
+                            })
                     
                     if index_spec["name"] not in index_names:
                         await self.messages.create_index(
                             index_spec["keys"],
                             name=index_spec["name"],
-                            background=True
+                            background=True,
+                            **index_spec.get("options", {})
                         )
                         optimizations.append({
                             "type": "index_created",
@@ -462,10 +482,13 @@ class MessageAnalyticsRepository:
                         "status": "failed"
                     })
             
+            # Read status queries are served by per-user read cursors
+            await ReadCursorRepository(self.db_manager).ensure_indexes()
+            
             return {
                 "optimizations": optimizations,
                 "total_attempted": len(indexes_to_create),
-                "successful": len([o for o in optimizations if o["status"] == "success"]),
+                "successful": len([o for o in optimizations if o["type"] == "index_created"]),
                 "timestamp": datetime.utcnow()
             }
             
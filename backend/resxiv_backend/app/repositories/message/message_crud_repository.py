@@ -13,6 +13,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 import pymongo
 
 from app.database.connection import DatabaseManager
+from app.repositories.message.read_cursor_repository import ReadCursorRepository
 from app.models.conversation_models import (
     MessageResponse, MessageCreate, MessageUpdate, MessageType
 )
@@ -30,6 +31,7 @@ class MessageCrudRepository:
         self.db_manager = db_manager
         self.db: AsyncIOMotorDatabase = db_manager.mongodb_database
         self.messages: AsyncIOMotorCollection = self.db.messages
+        self.read_cursor_repo = ReadCursorRepository(db_manager)
     
     async def create_message(
         self,
@@ -68,7 +70,6 @@ class MessageCrudRepository:
             "updated_at": datetime.utcnow(),
             "deleted_at": None,
             "reactions": [],
-            "read_by": [],
             "edited": False,
             "edit_history": []
         }
@@ -280,36 +281,9 @@ class MessageCrudRepository:
         Returns:
             Number of messages updated
         """
-        try:
-            query = {
-                "conversation_id": str(conversation_id),
-                "deleted_at": None,
-                "read_by": {"$ne": str(user_id)}
-            }
-            
-            if up_to_message_id:
-                try:
-                    up_to_id = ObjectId(up_to_message_id)
-                    query["_id"] = {"$lte": up_to_id}
-                except Exception:
-                    pass
-            
-            # Add user to read_by array with timestamp
-            read_entry = {
-                "user_id": str(user_id),
-                "read_at": datetime.utcnow()
-            }
-            
-            result = await self.messages.update_many(
-                query,
-                {"$push": {"read_by": read_entry}}
-            )
-            
-            return result.modified_count
-            
-        except Exception as e:
-            logger.error(f"Error marking messages as read: {e}")
-            return 0
+        return await self.read_cursor_repo.mark_read_up_to(
+            conversation_id, user_id, up_to_message_id
+        )
     
     async def get_unread_count(
         self,
@@ -326,19 +300,9 @@ class MessageCrudRepository:
         Returns:
             Unread message count
         """
-        try:
-            query = {
-                "conversation_id": str(conversation_id),
-                "deleted_at": None,
-                "sender_id": {"$ne": str(user_id)},  # Exclude own messages
-                "read_by.user_id": {"$ne": str(user_id)}
-            }
-            
-            return await self.messages.count_documents(query)
-            
-        except Exception as e:
-            logger.error(f"Error getting unread count: {e}")
-            return 0
+        return await self.read_cursor_repo.get_unread_count(
+            conversation_id, user_id, {"deleted_at": None}
+        )
     
     async def get_user_messages(
         self,
@@ -0,0 +1,292 @@
+"""
+Read Cursor Repository - L6 Engineering Standards
+Per-user, per-conversation read high-water marks for message read receipts.
+
+A cursor stores the position ``(created_at, _id)`` of the newest message a user
+has read in a conversation, and "message M is read by user U" is simply
+``(M.created_at, M._id) <= cursor(U)`` - message documents never have to be
+rewritten when a conversation is opened.
+
+Positions compare on ``created_at`` first: ObjectIds only have one-second
+resolution plus a per-process counter, so ordering by ``_id`` alone could put
+a message another worker wrote in the same second before the cursor.
+"""
+
+import uuid
+import logging
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from bson import ObjectId
+
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
+import pymongo
+
+from app.database.connection import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# (created_at, _id) of a message
+ReadPosition = Tuple[datetime, ObjectId]
+
+
+class ReadCursorRepository:
+    """
+    Repository for message read cursors.
+    Single Responsibility: Read high-water marks and unread counts derived from them.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.db: AsyncIOMotorDatabase = db_manager.mongodb_database
+        self.messages: AsyncIOMotorCollection = self.db.messages
+        self.read_cursors: AsyncIOMotorCollection = self.db.message_read_cursors
+
+    @staticmethod
+    def _cursor_id(conversation_id: uuid.UUID, user_id: uuid.UUID) -> str:
+        return f"{conversation_id}:{user_id}"
+
+    @staticmethod
+    def _position(cursor: Optional[Dict[str, Any]]) -> Optional[ReadPosition]:
+        if not cursor or cursor.get("last_read_message_id") is None:
+            return None
+        return cursor["last_read_created_at"], cursor["last_read_message_id"]
+
+    @staticmethod
+    def _after(position: ReadPosition) -> Dict[str, Any]:
+        """Messages strictly after ``position``."""
+        created_at, message_id = position
+        return {"$or": [
+            {"created_at": {"$gt": created_at}},
+            {"created_at": created_at, "_id": {"$gt": message_id}}
+        ]}
+
+    @staticmethod
+    def _up_to(position: ReadPosition) -> Dict[str, Any]:
+        """Messages at or before ``position``."""
+        created_at, message_id = position
+        return {"$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lte": message_id}}
+        ]}
+
+    async def ensure_indexes(self) -> None:
+        """Create indexes used by receipt lookups."""
+        try:
+            await self.read_cursors.create_index(
+                [
+                    ("conversation_id", pymongo.ASCENDING),
+                    ("last_read_created_at", pymongo.DESCENDING),
+                    ("last_read_message_id", pymongo.DESCENDING)
+                ],
+                name="read_cursor_conversation_position",
+                background=True
+            )
+        except Exception as e:
+            logger.error(f"Error creating read cursor indexes: {e}")
+
+    async def get_cursor(
+        self,
+        conversation_id: uuid.UUID,
+        user_id: uuid.UUID
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's read cursor for a conversation.
+
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
+
+        Returns:
+            Cursor document or None if the user has never read the conversation
+        """
+        try:
+            return await self.read_cursors.find_one(
+                {"_id": self._cursor_id(conversation_id, user_id)}
+            )
+        except Exception as e:
+            logger.error(f"Error getting read cursor: {e}")
+            return None
+
+    async def get_conversation_cursors(self, conversation_id: uuid.UUID) -> List[Dict[str, Any]]:
+        """
+        Get all read cursors of a conversation, newest first.
+
+        Args:
+            conversation_id: Conversation UUID
+
+        Returns:
+            List of cursor documents
+        """
+        try:
+            cursor = self.read_cursors.find(
+                {"conversation_id": str(conversation_id)}
+            ).sort([
+                ("last_read_created_at", pymongo.DESCENDING),
+                ("last_read_message_id", pymongo.DESCENDING)
+            ])
+            return await cursor.to_list(length=None)
+        except Exception as e:
+            logger.error(f"Error getting conversation read cursors: {e}")
+            return []
+
+    async def advance_cursor(
+        self,
+        conversation_id: uuid.UUID,
+        user_id: uuid.UUID,
+        position: ReadPosition
+    ) -> Optional[ReadPosition]:
+        """
+        Move a user's read cursor forward to ``position``.
+
+        The cursor never moves backwards: the update pipeline keeps the later
+        of the stored and the requested position in one atomic write, so
+        out-of-order acknowledgements are harmless.
+
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
+            position: ``(created_at, _id)`` of the newest message the user has read
+
+        Returns:
+            The previous high-water mark (None if there was no cursor)
+        """
+        created_at, message_id = position
+        # A missing field sorts before every date, so a new cursor always advances
+        advances = {"$or": [
+            {"$gt": [created_at, "$last_read_created_at"]},
+            {"$and": [
+                {"$eq": [created_at, "$last_read_created_at"]},
+                {"$gt": [message_id, "$last_read_message_id"]}
+            ]}
+        ]}
+        previous = await self.read_cursors.find_one_and_update(
+            {"_id": self._cursor_id(conversation_id, user_id)},
+            [{"$set": {
+                "conversation_id": str(conversation_id),
+                "user_id": str(user_id),
+                "last_read_at": datetime.utcnow(),
+                "last_read_created_at": {"$cond": [advances, created_at, "$last_read_created_at"]},
+                "last_read_message_id": {"$cond": [advances, message_id, "$last_read_message_id"]}
+            }}],
+            upsert=True,
+            return_document=pymongo.ReturnDocument.BEFORE
+        )
+        return self._position(previous)
+
+    async def mark_read_up_to(
+        self,
+        conversation_id: uuid.UUID,
+        user_id: uuid.UUID,
+        up_to_message_id: Optional[str] = None
+    ) -> int:
+        """
+        Mark messages in a conversation as read up to a message.
+
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
+            up_to_message_id: Newest message read (defaults to the latest message)
+
+        Returns:
+            Number of messages that became read by this call
+        """
+        try:
+            if up_to_message_id:
+                # A cursor is a high-water mark: an ID from another conversation
+                # would move it arbitrarily
+                target = await self.messages.find_one(
+                    {"_id": ObjectId(up_to_message_id), "conversation_id": str(conversation_id)},
+                    {"_id": 1, "created_at": 1}
+                )
+                if not target:
+                    logger.warning(
+                        f"Refusing read cursor update: message {up_to_message_id} "
+                        f"is not in conversation {conversation_id}"
+                    )
+                    return 0
+            else:
+                target = await self.messages.find_one(
+                    {"conversation_id": str(conversation_id)},
+                    {"_id": 1, "created_at": 1},
+                    sort=[("created_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)]
+                )
+                if not target:
+                    return 0
+
+            position = (target["created_at"], target["_id"])
+            previous = await self.advance_cursor(conversation_id, user_id, position)
+            if previous is not None and previous >= position:
+                return 0
+
+            newly_read = [self._up_to(position)]
+            if previous is not None:
+                newly_read.append(self._after(previous))
+
+            return await self.messages.count_documents({
+                "conversation_id": str(conversation_id),
+                "sender_id": {"$ne": str(user_id)},
+                "$and": newly_read
+            })
+
+        except Exception as e:
+            logger.error(f"Error marking conversation as read: {e}")
+            return 0
+
+    async def get_unread_count(
+        self,
+        conversation_id: uuid.UUID,
+        user_id: uuid.UUID,
+        extra_filter: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Count messages newer than the user's read cursor.
+
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
+            extra_filter: Additional query conditions (e.g. soft-delete flags)
+
+        Returns:
+            Unread message count
+        """
+        try:
+            query = {
+                "conversation_id": str(conversation_id),
+                "sender_id": {"$ne": str(user_id)}  # Own messages are never unread
+            }
+            if extra_filter:
+                query.update(extra_filter)
+
+            position = self._position(await self.get_cursor(conversation_id, user_id))
+            if position is not None:
+                query.update(self._after(position))
+
+            return await self.messages.count_documents(query)
+
+        except Exception as e:
+            logger.error(f"Error getting unread count: {e}")
+            return 0
+
+    @staticmethod
+    def readers_of(
+        message_doc: Dict[str, Any],
+        cursors: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Derive read receipts for a message from a conversation's cursors.
+
+        Args:
+            message_doc: Message document (needs ``_id``, ``created_at`` and ``sender_id``)
+            cursors: Cursor documents of the message's conversation
+
+        Returns:
+            List of ``{"user_id", "read_at"}`` receipts
+        """
+        position = (message_doc["created_at"], message_doc["_id"])
+        sender_id = message_doc.get("sender_id")
+        receipts = []
+        for c in cursors:
+            read_up_to = ReadCursorRepository._position(c)
+            if read_up_to is not None and read_up_to >= position and c.get("user_id") != sender_id:
+                receipts.append({"user_id": c["user_id"], "read_at": c.get("last_read_at")})
+        return receipts
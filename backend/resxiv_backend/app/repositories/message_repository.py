@@ -5,6 +5,7 @@ This module handles all MongoDB operations for messages and conversation metadat
 Provides CRUD operations, search functionality, and message analytics.
 """
 
+import re
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
@@ -12,8 +13,10 @@ import logging
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 import pymongo
+from pymongo.errors import OperationFailure
 
 from app.database.connection import DatabaseManager
+from app.repositories.message.read_cursor_repository import ReadCursorRepository
 from app.models.conversation_models import (
     MessageResponse,
     MessageCreate,
@@ -22,11 +25,50 @@ from app.models.conversation_models import (
     MessageType,
     MessageReaction,
     MessageReadStatus,
-    MessageMetadata
+    MessageMetadata,
+    MessageSearchHit,
+    MessageSearchHighlight
 )
 
 logger = logging.getLogger(__name__)
 
+# MongoDB error code raised when $text is used without a text index
+TEXT_INDEX_NOT_FOUND = 27
+
+
+def _highlight_offsets(text: str, text_query: str) -> List[Tuple[int, int]]:
+    """
+    Compute ``(start, end)`` character offsets of query matches in a message.
+    
+    Mirrors ``$text`` semantics closely enough for highlighting: quoted phrases
+    match literally, bare terms match word prefixes (covering stemmed forms) and
+    negated terms are ignored.
+    """
+    phrases = re.findall(r'"([^"]+)"', text_query)
+    terms = [
+        term for term in re.sub(r'"[^"]*"', " ", text_query).split()
+        if not term.startswith("-")
+    ]
+    patterns = [re.escape(phrase) for phrase in phrases]
+    patterns += [r"\b" + re.escape(term) for term in terms]
+    if not patterns:
+        return []
+    # Longest alternatives first so a short term doesn't shadow a longer one
+    patterns.sort(key=len, reverse=True)
+    
+    spans = sorted(
+        (m.start(), m.end())
+        for m in re.finditer("|".join(patterns), text, re.IGNORECASE)
+    )
+    
+    merged: List[Tuple[int, int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
 
 class MessageRepository:
     """
@@ -44,6 +86,7 @@ class MessageRepository:
         self.db: AsyncIOMotorDatabase = db_manager.mongodb_database
         self.messages: AsyncIOMotorCollection = self.db.messages
         self.conversation_metadata: AsyncIOMotorCollection = self.db.conversation_metadata
+        self.read_cursor_repo = ReadCursorRepository(db_manager)
     
     # ================================
     # MESSAGE CRUD OPERATIONS
@@ -79,7 +122,6 @@ class MessageRepository:
             "reply_to": ObjectId(message_data.parent_message_id) if message_data.parent_message_id else None,
             "edited_at": None,
             "deleted_by": [],
-            "read_by": [],
             "reactions": [],
             "metadata": message_data.metadata.dict() if message_data.metadata else {},
             "timestamp": now,
@@ -263,9 +305,13 @@ class MessageRepository:
             cursor = self.messages.find(query).sort("_id", -1).skip(skip).limit(size)
             messages = await cursor.to_list(length=size)
             
+            # Read receipts are derived from the conversation's read cursors
+            read_cursors = await self.read_cursor_repo.get_conversation_cursors(conversation_id)
+            
             # Convert to response objects
             message_responses = []
             for message_doc in messages:
+                self._attach_read_receipts(message_doc, read_cursors)
                 response = self._doc_to_message_response(message_doc)
                 if response:
                     message_responses.append(response)
@@ -282,10 +328,14 @@ class MessageRepository:
         conversation_id: uuid.UUID,
         search_params: MessageSearch,
         user_id: Optional[uuid.UUID] = None
-    ) -> Tuple[List[MessageResponse], int]:
+    ) -> Tuple[List[MessageSearchHit], int]:
         """
         Search messages in a conversation.
         
+        Free-text queries go through the ``message_text_search`` text index
+        (see ``MessageAnalyticsRepository.optimize_queries``) and are ranked by
+        text score. All other filters are pushed into the same indexed query.
+        
         Args:
             conversation_id: Conversation UUID
             search_params: Search parameters
@@ -302,10 +352,6 @@ class MessageRepository:
             if user_id:
                 query["deleted_by"] = {"$ne": str(user_id)}
             
-            # Add search filters
-            if search_params.query:
-                query["message"] = {"$regex": search_params.query, "$options": "i"}
-            
             if search_params.message_type:
                 query["message_type"] = search_params.message_type.value
             
@@ -320,33 +366,72 @@ class MessageRepository:
                     date_filter["$lte"] = search_params.end_date
                 query["timestamp"] = date_filter
             
-            # Get total count
-            total_count = await self.messages.count_documents(query)
-            
-            # Execute search with pagination
-            cursor = (
-                self.messages
-                .find(query)
-                .sort("timestamp", -1)
-                .skip(search_params.offset)
-                .limit(search_params.limit)
-            )
-            
-            messages = await cursor.to_list(length=search_params.limit)
-            
-            # Convert to response objects
-            message_responses = []
-            for message_doc in messages:
-                response = self._doc_to_message_response(message_doc)
-                if response:
-                    message_responses.append(response)
-            
-            return message_responses, total_count
+            text_query = (search_params.query or "").strip()
+            if not text_query:
+                return await self._run_message_search(
+                    query, [("timestamp", pymongo.DESCENDING)], None, search_params
+                )
+            
+            try:
+                return await self._run_message_search(
+                    {**query, "$text": {"$search": text_query}},
+                    [("score", {"$meta": "textScore"}), ("timestamp", pymongo.DESCENDING)],
+                    text_query,
+                    search_params,
+                    projection={"score": {"$meta": "textScore"}}
+                )
+            except OperationFailure as e:
+                if e.code != TEXT_INDEX_NOT_FOUND:
+                    raise
+                # Text index not provisioned yet - degrade to an escaped scan
+                logger.warning("Message text index missing; run optimize_queries to create it")
+                return await self._run_message_search(
+                    {**query, "message": {"$regex": re.escape(text_query), "$options": "i"}},
+                    [("timestamp", pymongo.DESCENDING)],
+                    text_query,
+                    search_params
+                )
             
         except Exception as e:
             logger.error(f"Error searching messages: {e}")
             return [], 0
     
+    async def _run_message_search(
+        self,
+        query: Dict[str, Any],
+        sort: List[Tuple[str, Any]],
+        text_query: Optional[str],
+        search_params: MessageSearch,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[MessageSearchHit], int]:
+        """Execute a search query and convert documents into ranked hits."""
+        total_count = await self.messages.count_documents(query)
+        
+        cursor = (
+            self.messages
+            .find(query, projection)
+            .sort(sort)
+            .skip(search_params.offset)
+            .limit(search_params.limit)
+        )
+        messages = await cursor.to_list(length=search_params.limit)
+        
+        hits = []
+        for message_doc in messages:
+            response = self._doc_to_message_response(message_doc)
+            if not response:
+                continue
+            highlights = (
+                _highlight_offsets(response.message, text_query) if text_query else []
+            )
+            hits.append(MessageSearchHit(
+                **response.dict(),
+                score=message_doc.get("score"),
+                highlights=[MessageSearchHighlight(start=s, end=e) for s, e in highlights]
+            ))
+        
+        return hits, total_count
+    
     # ================================
     # MESSAGE REACTIONS
     # ================================
@@ -426,7 +511,12 @@ class MessageRepository:
     
     async def mark_message_read(self, message_id: str, user_id: uuid.UUID) -> bool:
         """
-        Mark a message as read by a user.
+        Mark a message (and everything before it) as read by a user.
+        
+        Advances the user's read cursor for the message's conversation; the
+        message document itself is not modified. The cached unread counters
+        are not touched here: callers go through
+        ``MessageService.mark_messages_read``, which also syncs them.
         
         Args:
             message_id: Message ObjectId as string
@@ -436,32 +526,33 @@ class MessageRepository:
             True if successful, False otherwise
         """
         try:
-            # Remove existing read status for this user
-            await self.messages.update_one(
+            message_doc = await self.messages.find_one(
                 {"_id": ObjectId(message_id)},
-                {"$pull": {"read_by": {"user_id": str(user_id)}}}
+                {"conversation_id": 1}
             )
+            if not message_doc:
+                return False
             
-            # Add new read status
-            read_status = {
-                "user_id": str(user_id),
-                "read_at": datetime.utcnow()
-            }
-            
-            result = await self.messages.update_one(
-                {"_id": ObjectId(message_id)},
-                {
-                    "$push": {"read_by": read_status},
-                    "$set": {"updated_at": datetime.utcnow()}
-                }
+            await self.read_cursor_repo.mark_read_up_to(
+                uuid.UUID(message_doc["conversation_id"]),
+                user_id,
+                message_id
             )
-            
-            return result.modified_count > 0
+            return True
             
         except Exception as e:
             logger.error(f"Error marking message as read: {e}")
             return False
     
+    async def add_read_receipt(
+        self,
+        message_id: str,
+        user_id: uuid.UUID,
+        read_at: Optional[datetime] = None
+    ) -> bool:
+        """Compatibility alias for :meth:`mark_message_read`."""
+        return await self.mark_message_read(message_id, user_id)
+    
     async def mark_conversation_read(
         self,
         conversation_id: uuid.UUID,
@@ -479,44 +570,64 @@ class MessageRepository:
         Returns:
             Number of messages marked as read
         """
-        try:
-            # Build query
-            query = {
-                "conversation_id": str(conversation_id),
-                "sender_id": {"$ne": str(user_id)},  # Don't mark own messages as read
-                "read_by.user_id": {"$ne": str(user_id)}  # Only unread messages
-            }
-            
-            if up_to_message_id:
-                query["_id"] = {"$lte": ObjectId(up_to_message_id)}
-            
-            # Get all unread messages
-            unread_messages = await self.messages.find(query, {"_id": 1}).to_list(length=None)
-            
-            if not unread_messages:
-                return 0
+        return await self.read_cursor_repo.mark_read_up_to(
+            conversation_id, user_id, up_to_message_id
+        )
+    
+    async def get_unread_count(self, conversation_id: uuid.UUID, user_id: uuid.UUID) -> int:
+        """
+        Get unread message count for a user, computed from the read cursor.
+        
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
             
-            # Mark all as read
-            read_status = {
-                "user_id": str(user_id),
-                "read_at": datetime.utcnow()
-            }
+        Returns:
+            Number of unread messages
+        """
+        return await self.read_cursor_repo.get_unread_count(
+            conversation_id,
+            user_id,
+            {"deleted_by": {"$ne": str(user_id)}}
+        )
+    
+    async def get_read_receipts(self, message_id: str) -> List[MessageReadStatus]:
+        """
+        Get read receipts for a message.
+        
+        Args:
+            message_id: Message ObjectId as string
             
-            message_ids = [msg["_id"] for msg in unread_messages]
+        Returns:
+            List of read statuses
+        """
+        try:
+            message_doc = await self.messages.find_one(
+                {"_id": ObjectId(message_id)},
+                {"conversation_id": 1, "sender_id": 1, "read_by": 1}
+            )
+            if not message_doc:
+                return []
             
-            result = await self.messages.update_many(
-                {"_id": {"$in": message_ids}},
-                {
-                    "$push": {"read_by": read_status},
-                    "$set": {"updated_at": datetime.utcnow()}
-                }
+            read_cursors = await self.read_cursor_repo.get_conversation_cursors(
+                uuid.UUID(message_doc["conversation_id"])
             )
+            self._attach_read_receipts(message_doc, read_cursors)
             
-            return result.modified_count
+            receipts = []
+            for read_receipt in message_doc["read_by"]:
+                try:
+                    receipts.append(MessageReadStatus(
+                        user_id=uuid.UUID(read_receipt["user_id"]),
+                        read_at=read_receipt["read_at"]
+                    ))
+                except (KeyError, ValueError) as e:
+                    logger.warning(f"Invalid read receipt data: {e}")
+            return receipts
             
         except Exception as e:
-            logger.error(f"Error marking conversation as read: {e}")
-            return 0
+            logger.error(f"Error getting read receipts: {e}")
+            return []
     
     # ================================
     # CONVERSATION METADATA
@@ -651,6 +762,29 @@ class MessageRepository:
     # HELPER METHODS
     # ================================
     
+    def _attach_read_receipts(
+        self,
+        message_doc: Dict[str, Any],
+        read_cursors: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Populate ``read_by`` on a message document from read cursors.
+        
+        Legacy per-message receipts are kept for users without a cursor that
+        covers the message.
+        
+        Args:
+            message_doc: MongoDB message document (modified in place)
+            read_cursors: Cursor documents of the message's conversation
+        """
+        receipts = ReadCursorRepository.readers_of(message_doc, read_cursors)
+        cursor_readers = {receipt["user_id"] for receipt in receipts}
+        legacy = [
+            receipt for receipt in message_doc.get("read_by", [])
+            if receipt.get("user_id") not in cursor_readers
+        ]
+        message_doc["read_by"] = legacy + receipts
+    
     def _doc_to_message_response(self, message_doc: Dict[str, Any]) -> Optional[MessageResponse]:
         """
         Convert MongoDB document to MessageResponse.
@@ -19,6 +19,20 @@ from app.models.paper import PaperCreate, DiagnosticCreate
 logger = logging.getLogger(__name__)
 
 
+def keyword_search(search_query: str):
+    """
+    Full-text match and rank against the weighted ``papers.search_vector``.
+
+    Args:
+        search_query: User query in web search syntax ("quoted phrases", -exclusions, or)
+
+    Returns:
+        Tuple of (filter clause, ts_rank_cd rank expression)
+    """
+    tsquery = func.websearch_to_tsquery("english", search_query)
+    return Paper.search_vector.op("@@")(tsquery), func.ts_rank_cd(Paper.search_vector, tsquery)
+
+
 class PaperRepository:
     """Repository for paper-related database operations"""
     
@@ -127,8 +141,8 @@ class PaperRepository:
             page: Page number (1-based)
             size: Page size
             include_diagnostics: Whether to include diagnostics
-            search_query: Optional search query for title/authors
-            sort_by: Sort field
+            search_query: Optional full-text query over title, keywords, authors and abstract
+            sort_by: Sort field, or "relevance" to rank search matches
             sort_order: Sort order (asc/desc)
             
         Returns:
@@ -144,18 +158,16 @@ class PaperRepository:
             )
             
             # Add search filter
+            rank = None
             if search_query:
-                search_filter = or_(
-                    Paper.title.ilike(f"%{search_query}%"),
-                    Paper.abstract.ilike(f"%{search_query}%"),
-                    func.array_to_string(Paper.authors, ' ').ilike(f"%{search_query}%"),
-                    func.array_to_string(Paper.keywords, ' ').ilike(f"%{search_query}%")
-                )
+                search_filter, rank = keyword_search(search_query)
                 query = query.where(search_filter)
             
             # Add sorting
             sort_column = getattr(Paper, sort_by, Paper.created_at)
-            if sort_order.lower() == "desc":
+            if sort_by == "relevance" and rank is not None:
+                query = query.order_by(desc(rank), desc(Paper.created_at))
+            elif sort_order.lower() == "desc":
                 query = query.order_by(desc(sort_column))
             else:
                 query = query.order_by(asc(sort_column))
@@ -357,6 +369,28 @@ class PaperRepository:
             logger.error(f"Error checking paper {paper_id} in project {project_id}: {str(e)}")
             raise
     
+    async def get_project_ids_for_papers(self, paper_ids: List[uuid.UUID]) -> List[uuid.UUID]:
+        """
+        Projects any of the given papers belong to
+        
+        Args:
+            paper_ids: Paper UUIDs
+            
+        Returns:
+            Distinct project UUIDs
+        """
+        try:
+            stmt = select(ProjectPaper.project_id).where(
+                ProjectPaper.paper_id.in_(paper_ids)
+            ).distinct()
+            
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            logger.error(f"Error loading projects for papers {paper_ids}: {str(e)}")
+            raise
+    
     async def get_papers_by_file_hash_and_project(
         self, 
         file_hash: str, 
@@ -531,12 +565,9 @@ class PaperRepository:
             query = select(Paper).where(Paper.deleted_at.is_(None))
             
             # Add text search
+            rank = None
             if search_query:
-                search_filter = or_(
-                    Paper.title.ilike(f"%{search_query}%"),
-                    Paper.abstract.ilike(f"%{search_query}%"),
-                    func.array_to_string(Paper.authors, ' ').ilike(f"%{search_query}%")
-                )
+                search_filter, rank = keyword_search(search_query)
                 query = query.where(search_filter)
             
             # Add project filter
@@ -579,9 +610,13 @@ class PaperRepository:
             total_result = await self.session.execute(count_query)
             total = total_result.scalar()
             
-            # Add pagination and sorting
+            # Add pagination and sorting; best matches first when searching
             offset = (page - 1) * size
-            query = query.order_by(desc(Paper.created_at)).offset(offset).limit(size)
+            if rank is not None:
+                query = query.order_by(desc(rank), desc(Paper.created_at))
+            else:
+                query = query.order_by(desc(Paper.created_at))
+            query = query.offset(offset).limit(size)
             
             # Include diagnostics
             query = query.options(selectinload(Paper.diagnostics))
@@ -6,7 +6,7 @@ SQLAlchemy models for database tables.
 
 from .user import User, EmailVerificationToken, PasswordResetToken, UserSession
 from .project import Project, ProjectMember, ProjectCollaborator, ProjectInvitation, InvitationReminder
-from .conversation import Conversation
+from .conversation import Conversation, ConversationInbox
 from .task import TaskList, Task, TaskAssignee
 
 __all__ = [
@@ -14,7 +14,7 @@ __all__ = [
     "EmailVerificationToken", 
     "PasswordResetToken",
     "UserSession",
-    "Conversation",
+    "Conversation", "ConversationInbox",
     "Project", "ProjectMember", "ProjectCollaborator", "ProjectInvitation", "InvitationReminder",
     "TaskList", "Task", "TaskAssignee"
 ] 
\ No newline at end of file
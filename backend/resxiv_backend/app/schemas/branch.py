@@ -169,6 +169,8 @@ class AutosaveQueue(Base):
     status = Column(Text, default='pending')
     scheduled_at = Column(DateTime(timezone=True), server_default=func.now())
     processed_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
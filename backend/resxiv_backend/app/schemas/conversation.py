@@ -5,7 +5,7 @@ from the database schema. Handles conversation management for the chat system.
 """
 
 import uuid
-from sqlalchemy import Column, DateTime, String, Boolean, UUID as SQLAlchemyUUID, ForeignKey
+from sqlalchemy import Column, DateTime, String, Boolean, Integer, Text, Index, UUID as SQLAlchemyUUID, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -82,4 +82,51 @@ class Conversation(Base):
             "created_by": self.created_by,
             "created_at": self.created_at,
             "updated_at": self.updated_at
-        } 
\ No newline at end of file
+        }
+
+
+class ConversationInbox(Base):
+    """
+    Materialized per-user conversation inbox.
+    
+    One row per (participant, conversation) carrying what a chat sidebar
+    renders - last activity, last-message preview and sender, and the user's
+    unread count - so listing a user's conversations is a single range read
+    on ``idx_conversation_inbox_activity``. Membership is kept in sync by
+    database triggers (migration 012); message fields are written by the
+    message service on send and read.
+    """
+
+    __tablename__ = "conversation_inbox"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    conversation_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    conversation_type = Column(conversation_type_enum, nullable=False)
+    
+    # Last message snapshot (message ids are MongoDB ObjectIds)
+    last_activity_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_message_id = Column(String(24), nullable=True)
+    last_message_preview = Column(Text, nullable=True)
+    last_sender_id = Column(UUID(as_uuid=True), nullable=True)
+    last_sender_name = Column(String, nullable=True)
+    
+    unread_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        Index(
+            "idx_conversation_inbox_activity",
+            "user_id", last_activity_at.desc(), conversation_id.desc()
+        ),
+        Index("idx_conversation_inbox_conversation", "conversation_id"),
+    )
+
+    def __repr__(self):
+        return f"<ConversationInbox(user_id={self.user_id}, conversation_id={self.conversation_id}, unread={self.unread_count})>"
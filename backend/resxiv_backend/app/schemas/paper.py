@@ -7,19 +7,37 @@ Based on the comprehensive database schema from db_details.txt.
 
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Text, Integer, BigInteger,
-    ForeignKey, UniqueConstraint, CheckConstraint, ARRAY
+    ForeignKey, UniqueConstraint, CheckConstraint, ARRAY, Computed, DDL, Index, event
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 
 from app.database.connection import Base
 
+# array_to_string is only STABLE, so generated columns need an IMMUTABLE wrapper
+IMMUTABLE_ARRAY_TO_STRING_SQL = """
+    CREATE OR REPLACE FUNCTION immutable_array_to_string(text[])
+    RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+"""
+
+# Weighted document for keyword search: title > keywords > authors > abstract
+PAPER_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', immutable_array_to_string(keywords)), 'B') || "
+    "setweight(to_tsvector('english', immutable_array_to_string(authors)), 'C') || "
+    "setweight(to_tsvector('english', coalesce(abstract, '')), 'D')"
+)
+
 
 class Paper(Base):
     """Paper model - main papers table"""
     __tablename__ = "papers"
+    __table_args__ = (
+        Index("idx_papers_search_vector", "search_vector", postgresql_using="gin"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(Text, nullable=False)
@@ -41,6 +59,8 @@ class Paper(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Maintained by Postgres and only used in WHERE/ORDER BY, so never loaded
+    search_vector = deferred(Column(TSVECTOR, Computed(PAPER_SEARCH_VECTOR_SQL, persisted=True)))
     
     # Relationships
     diagnostics = relationship(
@@ -69,6 +89,9 @@ class Paper(Base):
     )
 
 
+event.listen(Paper.__table__, "before_create", DDL(IMMUTABLE_ARRAY_TO_STRING_SQL))
+
+
 class Diagnostic(Base):
     """Diagnostic model - one-to-one with papers"""
     __tablename__ = "diagnostics"
@@ -7,8 +7,9 @@ import logging
 from typing import Dict, Any, Optional
 import json
 
-from openai import AsyncOpenAI
 from app.config.settings import get_settings
+from app.core.llm_gateway import llm_gateway
+from app.core.llm_cache import llm_response_cache
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
 
 logger = logging.getLogger(__name__)
@@ -19,9 +20,13 @@ class AIDiagnosticsService:
     Single Responsibility: AI analysis of paper content for diagnostics.
     """
     
+    # Bump when the prompt or expected response shape changes
+    PROMPT_VERSION = "ai-diagnostics-v1"
+    
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.agentic.openai_api_key)
+        self.llm = llm_gateway
+        self.cache = llm_response_cache
         self.model = "gpt-4o-mini"
         self.max_tokens = 2500  # Increased for detailed researcher-focused analysis
         
@@ -146,18 +151,27 @@ Provide detailed, research-grade diagnostics for:
 
 {content}"""
         
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=self.max_tokens,
-            temperature=0.3,  # Low temperature for consistency
-            response_format={"type": "json_object"}
-        )
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        async def generate() -> str:
+            response = await self.llm.chat_completion(
+                model=self.model,
+                messages=messages,
+                max_tokens=self.max_tokens,
+                temperature=0.3,  # Low temperature for consistency
+                response_format={"type": "json_object"}
+            )
+            content = response.choices[0].message.content
+            # Raise before the cache stores a truncated or invalid reply
+            json.loads(content)
+            return content
         
-        return response.choices[0].message.content
+        # Reprocessing a paper yields byte-identical text; reuse the analysis
+        cache_key = self.cache.make_key(self.model, self.PROMPT_VERSION, messages, self.max_tokens)
+        return await self.cache.get_or_generate(cache_key, generate)
     
     def _parse_diagnostics_response(self, response: str) -> Dict[str, str]:
         """Parse and validate GPT-4o mini response."""
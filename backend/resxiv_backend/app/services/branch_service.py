@@ -192,11 +192,12 @@ class BranchService:
             # Enhance with user information
             from app.utils.todo_resolver import TODOResolverFactory
             user_lookup = TODOResolverFactory.get_user_lookup_service(self.session)
-            created_by_info = await user_lookup.get_user_info(str(branches[0].created_by)) if branches else None
+            creators = await user_lookup.get_users_info([str(branch.created_by) for branch in branches])
             
             # Build response
             branch_responses = []
             for branch in branches:
+                created_by_info = creators.get(str(branch.created_by))
                 if created_by_info:
                     # Get file count for this branch
                     branch_files = await self.repository.get_branch_files(branch.id)
@@ -11,7 +11,9 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.enhanced_cache import enhanced_cache, CacheInvalidationStrategy
 from app.repositories.conversation_repository import ConversationRepository
+from app.repositories.conversation_inbox_repository import ConversationInboxRepository
 from app.repositories.project_repository import ProjectRepository
 from app.models.conversation_models import (
     ConversationCreate, ConversationUpdate, ConversationResponse,
@@ -20,6 +22,8 @@ from app.models.conversation_models import (
 
 logger = logging.getLogger(__name__)
 
+CONVERSATION_CACHE_TTL = 600
+
 
 class ConversationCrudService:
     """
@@ -30,6 +34,7 @@ class ConversationCrudService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.conversation_repo = ConversationRepository(session)
+        self.inbox_repo = ConversationInboxRepository(session)
         self.project_repo = ProjectRepository(session)
     
     @handle_service_errors("create conversation")
@@ -118,7 +123,7 @@ class ConversationCrudService:
             Conversation data or error
         """
         # Get conversation
-        conversation = await self.conversation_repo.get_conversation_by_id(conversation_id)
+        conversation = await self._get_conversation_response(conversation_id)
         
         if not conversation:
             raise ServiceError(
@@ -136,7 +141,7 @@ class ConversationCrudService:
         
         return {
             "success": True,
-            "conversation": ConversationResponse.from_orm(conversation)
+            "conversation": conversation
         }
     
     @handle_service_errors("get conversation details")
@@ -160,7 +165,7 @@ class ConversationCrudService:
             Conversation data with optional messages
         """
         # Get conversation
-        conversation = await self.conversation_repo.get_conversation_by_id(conversation_id)
+        conversation = await self._get_conversation_response(conversation_id)
         
         if not conversation:
             raise ServiceError(
@@ -178,7 +183,7 @@ class ConversationCrudService:
         
         result = {
             "success": True,
-            "conversation": ConversationResponse.from_orm(conversation)
+            "conversation": conversation
         }
         
         # If messages are requested, get them with the specified limit
@@ -250,6 +255,7 @@ class ConversationCrudService:
             )
             
             await self.session.commit()
+            await enhanced_cache.invalidate_tags(CacheInvalidationStrategy.conversation_tag(conversation_id))
             
             return {
                 "success": True,
@@ -315,6 +321,7 @@ class ConversationCrudService:
                 await self.conversation_repo.delete_conversation(conversation_id)
             
             await self.session.commit()
+            await enhanced_cache.invalidate_tags(CacheInvalidationStrategy.conversation_tag(conversation_id))
             
             return {
                 "success": True,
@@ -337,7 +344,11 @@ class ConversationCrudService:
         conversation_type: Optional[ConversationType] = None
     ) -> Dict[str, Any]:
         """
-        Get conversations for a user.
+        Get a user's conversations from the materialized inbox.
+        
+        Conversations come back most recently active first with their
+        last-message preview, sender and the user's unread count, read in a
+        single indexed range scan.
         
         Args:
             user_id: User UUID
@@ -350,18 +361,31 @@ class ConversationCrudService:
         """
         offset = (page - 1) * limit
         
-        # Get conversations and count separately
-        conversations = await self.conversation_repo.get_user_conversations(
+        rows, total_count = await self.inbox_repo.list_inbox(
             user_id=user_id,
             limit=limit,
             offset=offset,
             conversation_type=conversation_type
         )
         
-        total_count = await self.conversation_repo.count_user_conversations(
-            user_id=user_id,
-            conversation_type=conversation_type
-        )
+        conversations = [
+            ConversationResponse(
+                id=row["id"],
+                type=row["type"],
+                entity=row["entity"],
+                is_group=row["is_group"],
+                created_by=row["created_by"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+                unread_count=row["unread_count"],
+                last_message=row["last_message_preview"],
+                last_message_id=row["last_message_id"],
+                last_sender_id=row["last_sender_id"],
+                last_sender_name=row["last_sender_name"],
+                last_activity_at=row["last_activity_at"]
+            )
+            for row in rows
+        ]
         
         # Calculate pagination info
         total_pages = (total_count + limit - 1) // limit
@@ -370,7 +394,12 @@ class ConversationCrudService:
         
         return {
             "success": True,
-            "conversations": [ConversationResponse.from_orm(conv) for conv in conversations],
+            "conversations": conversations,
+            "total": total_count,
+            "page": page,
+            "limit": limit,
+            "has_next": has_next,
+            "has_prev": has_prev,
             "pagination": {
                 "current_page": page,
                 "total_pages": total_pages,
@@ -448,6 +477,33 @@ class ConversationCrudService:
             }
         }
     
+    async def _get_conversation_response(
+        self,
+        conversation_id: uuid.UUID
+    ) -> Optional[ConversationResponse]:
+        """
+        Conversation row through the shared cache.
+        
+        Args:
+            conversation_id: Conversation UUID
+            
+        Returns:
+            Conversation response or None if not found
+        """
+        cached = await enhanced_cache.get_or_set(
+            f"conversation:{conversation_id}:meta",
+            lambda: self._load_conversation(conversation_id),
+            ttl=CONVERSATION_CACHE_TTL,
+            tags=[CacheInvalidationStrategy.conversation_tag(conversation_id)]
+        )
+        return ConversationResponse.model_validate(cached) if cached else None
+    
+    async def _load_conversation(self, conversation_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        conversation = await self.conversation_repo.get_conversation_by_id(conversation_id)
+        if not conversation:
+            return None
+        return ConversationResponse.from_orm(conversation).model_dump(mode="json")
+    
     async def _check_conversation_access(
         self,
         conversation_id: uuid.UUID,
@@ -464,7 +520,7 @@ class ConversationCrudService:
             True if user has access, False otherwise
         """
         # Get conversation details
-        conversation = await self.conversation_repo.get_conversation_by_id(conversation_id)
+        conversation = await self._get_conversation_response(conversation_id)
         if not conversation:
             return False
         
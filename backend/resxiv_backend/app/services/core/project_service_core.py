@@ -32,9 +32,12 @@ from app.models.project import (
     MemberUpdate,
 )
 from app.core.error_handler import ProductionErrorHandler, ErrorCategories
+from app.core.enhanced_cache import enhanced_cache, CacheInvalidationStrategy
 
 logger = logging.getLogger(__name__)
 
+PROJECT_CACHE_TTL = 300
+
 class ProjectCoreService(BaseService):
     """
     Core project service focused on essential CRUD operations.
@@ -148,15 +151,17 @@ class ProjectCoreService(BaseService):
     ) -> Optional[ProjectResponse]:
         """Get project details"""
         try:
-            # Load project with members and pending invitations
-            project_obj = await self.repository.get_project_by_id(
-                project_id, include_members=True, include_invitations=True
+            # Project, members, invitations and member count are shared by all
+            # readers; only the access fields below are per user
+            cached = await enhanced_cache.get_or_set(
+                f"project:{project_id}:detail",
+                lambda: self._load_project_detail(project_id),
+                ttl=PROJECT_CACHE_TTL,
+                tags=[CacheInvalidationStrategy.project_tag(project_id)]
             )
-            if not project_obj:
+            if not cached:
                 return None
-
-            # Build Pydantic response
-            project_response = ProjectResponse.from_orm(project_obj)
+            project_response = ProjectResponse.model_validate(cached)
 
             # Set current user's access info
             user_role = await self.repository.get_user_role(project_id, user_id) or "reader"
@@ -166,13 +171,27 @@ class ProjectCoreService(BaseService):
             project_response.current_user_can_admin = user_role in ["admin", "owner"]
             project_response.current_user_is_owner = user_role == "owner"
 
-            # Populate basic stats
-            project_response.member_count = await self.repository.get_project_member_count(project_id)
-
             return project_response
         except Exception as e:
             self.logger.error(f"Failed to get project {project_id}: {e}")
             return None
+
+    async def _load_project_detail(self, project_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """Project with members, pending invitations and member count, as cacheable JSON"""
+        project_obj = await self.repository.get_project_by_id(
+            project_id, include_members=True, include_invitations=True
+        )
+        if not project_obj:
+            return None
+        project_response = ProjectResponse.from_orm(project_obj)
+        project_response.member_count = await self.repository.get_project_member_count(project_id)
+        return project_response.model_dump(mode="json")
+
+    def _invalidate_project(self, project_id: uuid.UUID) -> None:
+        """Drop cached project details once the request's transaction commits"""
+        enhanced_cache.invalidate_tags_after_commit(
+            self.session, CacheInvalidationStrategy.project_tag(project_id)
+        )
     
     async def update_project(
         self,
@@ -188,6 +207,7 @@ class ProjectCoreService(BaseService):
             )
             if not updated:
                 return {"success": False, "error": "Project not found or no changes applied"}
+            self._invalidate_project(project_id)
             return {"success": True}
         except Exception as e:
             self.logger.error(f"Failed to update project {project_id}: {e}")
@@ -204,6 +224,7 @@ class ProjectCoreService(BaseService):
             deleted = await self.repository.soft_delete_project(project_id)
             if not deleted:
                 return {"success": False, "error": "Project not found or already deleted"}
+            self._invalidate_project(project_id)
             return {"success": True}
             
         except Exception as e:
@@ -255,6 +276,7 @@ class ProjectCoreService(BaseService):
                     member_data.user_id,
                     member_data.role.value,
                 )
+                self._invalidate_project(project_id)
 
                 # Optional e-mail
                 if member_data.send_invitation:
@@ -279,6 +301,7 @@ class ProjectCoreService(BaseService):
             invitation = await self.repository.create_invitation(
                 invitation_data, project_id, admin_user_id
             )
+            self._invalidate_project(project_id)
 
             # send email if requested
             if member_data.send_invitation:
@@ -319,6 +342,7 @@ class ProjectCoreService(BaseService):
                 }
             
             await self.repository.remove_member(project_id, member_id)
+            self._invalidate_project(project_id)
             
             return {"success": True}
             
@@ -388,6 +412,7 @@ class ProjectCoreService(BaseService):
                 project_id, user_id_to_use, member_data.permission.value
             )
 
+        self._invalidate_project(project_id)
         return {"success": True}
 
     async def remove_project_member(
@@ -0,0 +1,233 @@
+"""
+Autosave Worker - L6 Engineering Standards
+Background commits of collaborative edits.
+Single Responsibility: Draining ``autosave_queue`` into Git.
+
+- Collaborative editing enqueues one debounced entry per edited file; the
+  worker claims due entries with ``FOR UPDATE SKIP LOCKED``, so every
+  application process can run it without double-committing
+- Claims are short transactions that move entries to ``processing``; Git
+  work happens outside any lock, and claims abandoned by a crashed worker
+  return to the queue after a lease
+- File content is the queued snapshot when one was captured, otherwise the
+  text of the file's latest Yjs document state
+- All files claimed for a branch become one commit through the write
+  scheduler; failures are retried with exponential backoff until
+  ``autosave_max_attempts``, higher-priority entries are claimed first
+"""
+
+import asyncio
+import base64
+import logging
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config.settings import get_settings
+from app.repositories.branch_repository import BranchRepository
+from app.services.git.write_scheduler import GitWriteScheduler, git_write_scheduler
+
+try:
+    from y_py import YDoc, apply_update
+except ImportError:  # Safety for environments without y-py installed
+    YDoc = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+AUTOSAVE_AUTHOR_NAME = "ResXiv Autosave"
+AUTOSAVE_AUTHOR_EMAIL = "autosave@resxiv.com"
+YTEXT_NAME = "content"
+CLAIM_LEASE_SECONDS = 600
+COMPLETED_RETENTION_SECONDS = 86400
+MAX_BACKOFF_SECONDS = 3600
+
+
+def crdt_state_bytes(state: Any) -> Optional[bytes]:
+    """Normalize a stored CRDT state (bytes, base64 text or byte list) to bytes."""
+    if state is None:
+        return None
+    if isinstance(state, (bytes, bytearray, memoryview)):
+        return bytes(state)
+    if isinstance(state, str):
+        return base64.b64decode(state)
+    if isinstance(state, list):
+        return bytes(state)
+    raise ValueError(f"Unsupported CRDT state type: {type(state).__name__}")
+
+
+def render_ydoc_text(state: Any, text_name: str = YTEXT_NAME) -> Optional[str]:
+    """
+    Render the text of a Yjs document state.
+
+    Args:
+        state: Encoded document state as stored in ``document_sessions``
+        text_name: Name of the shared text type holding the file
+
+    Returns:
+        Document text, or None when there is no state to render
+    """
+    data = crdt_state_bytes(state)
+    if not data:
+        return None
+    if YDoc is None:
+        raise RuntimeError("y-py is required to render collaborative documents")
+    ydoc = YDoc()
+    apply_update(ydoc, data)
+    return str(ydoc.get_text(text_name))
+
+
+def commit_message(entries: List[Dict[str, Any]]) -> str:
+    """Autosave commit message listing the files and co-authoring editors."""
+    paths = list(dict.fromkeys(entry["file_path"] for entry in entries))
+    lines = [f"Autosave {paths[0]}" if len(paths) == 1 else f"Autosave {len(paths)} files", ""]
+    for entry in entries:
+        if entry.get("change_summary"):
+            lines.append(f"- {entry['file_path']}: {entry['change_summary']}")
+    if len(lines) == 2:
+        lines.extend(f"- {path}" for path in paths)
+
+    editors = list(dict.fromkeys((e["user_name"], e["user_email"]) for e in entries if e.get("user_email")))
+    if len(editors) > 1:
+        lines.append("")
+        lines.extend(f"Co-authored-by: {name} <{email}>" for name, email in editors)
+    return "\n".join(lines)
+
+
+class AutosaveWorker:
+    """Polls the autosave queue and commits due entries."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        scheduler: Optional[GitWriteScheduler] = None,
+        poll_seconds: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        backoff_seconds: Optional[float] = None,
+        text_name: str = YTEXT_NAME
+    ):
+        settings = get_settings().files
+        self._session_factory = session_factory
+        self.scheduler = scheduler or git_write_scheduler
+        self.poll_seconds = settings.autosave_poll_seconds if poll_seconds is None else poll_seconds
+        self.batch_size = batch_size or settings.autosave_batch_size
+        self.max_attempts = max_attempts or settings.autosave_max_attempts
+        self.backoff_seconds = settings.autosave_backoff_seconds if backoff_seconds is None else backoff_seconds
+        self.text_name = text_name
+        self._task: Optional[asyncio.Task] = None
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.database.connection import db_manager
+        return db_manager.get_postgres_session()
+
+    def start(self) -> None:
+        """Start polling in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("Autosave worker started")
+
+    async def close(self) -> None:
+        """Stop polling; claims in flight return to the queue after their lease."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Autosave pass failed: {e}")
+                claimed = 0
+            # A full batch means more work is due; go again immediately
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
+
+    async def run_once(self) -> int:
+        """
+        Claim and commit one batch of due autosaves.
+
+        Returns:
+            Number of queue entries claimed
+        """
+        async with self._session() as session:
+            repository = BranchRepository(session)
+            recovered = await repository.recover_stale_autosaves(CLAIM_LEASE_SECONDS)
+            if recovered:
+                logger.warning(f"Recovered {recovered} abandoned autosave claim(s)")
+            await repository.prune_autosaves(COMPLETED_RETENTION_SECONDS)
+            entries = await repository.claim_autosave_batch(self.batch_size)
+            await session.commit()
+
+        if not entries:
+            return 0
+
+        branches: "OrderedDict[uuid.UUID, List[Dict[str, Any]]]" = OrderedDict()
+        for entry in entries:
+            branches.setdefault(entry["branch_id"], []).append(entry)
+
+        # Branches commit through independent worktrees, so they go in parallel
+        await asyncio.gather(*(
+            self._commit_branch(branch_id, branch_entries)
+            for branch_id, branch_entries in branches.items()
+        ))
+        return len(entries)
+
+    async def _commit_branch(self, branch_id: uuid.UUID, entries: List[Dict[str, Any]]) -> None:
+        entry_ids = [entry["id"] for entry in entries]
+        commit_hash = None
+        try:
+            files = self._render_files(entries)
+            if files:
+                first = entries[0]
+                editors = {entry["user_email"] for entry in entries}
+                if len(editors) == 1 and first.get("user_email"):
+                    author_name, author_email = first["user_name"], first["user_email"]
+                else:
+                    author_name, author_email = AUTOSAVE_AUTHOR_NAME, AUTOSAVE_AUTHOR_EMAIL
+                written = [entry for entry in entries if (entry.get("file_path") or "").lstrip("/") in files]
+                commit_hash = await self.scheduler.write_files(
+                    Path(first["repo_path"]),
+                    first["branch_name"],
+                    files,
+                    commit_message(written),
+                    author_name,
+                    author_email
+                )
+        except Exception as e:
+            logger.error(f"Autosave of branch {branch_id} failed: {e}")
+            async with self._session() as session:
+                await BranchRepository(session).retry_autosaves(
+                    entry_ids, str(e), self.max_attempts, self.backoff_seconds, MAX_BACKOFF_SECONDS
+                )
+            return
+
+        async with self._session() as session:
+            await BranchRepository(session).complete_autosaves(entry_ids, branch_id, commit_hash)
+        if commit_hash:
+            logger.info(f"Autosaved {len(entry_ids)} entr{'y' if len(entry_ids) == 1 else 'ies'} to {commit_hash[:8]}")
+
+    def _render_files(self, entries: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Content to write per file path; entries with nothing to write are skipped."""
+        files: Dict[str, str] = {}
+        # Entries are ordered oldest first within a priority; the last one per file wins
+        for entry in sorted(entries, key=lambda e: e["created_at"]):
+            if entry.get("file_path") is None or entry.get("file_deleted_at") is not None:
+                continue
+            if entry.get("repo_path") is None or entry.get("branch_name") is None:
+                continue
+            content = entry.get("content_snapshot")
+            if content is None:
+                content = render_ydoc_text(entry.get("crdt_state"), self.text_name)
+            if content is not None:
+                files[entry["file_path"].lstrip("/")] = content
+        return files
+
+
+autosave_worker = AutosaveWorker()
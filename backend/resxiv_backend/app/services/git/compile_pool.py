@@ -0,0 +1,314 @@
+"""
+LaTeX Compile Pool - L6 Engineering Standards
+Bounded, incremental LaTeX builds with PDF caching.
+Single Responsibility: Scheduling and running LaTeX compilations.
+
+- A fixed number of builds run at once; the rest wait for a worker
+- Each LaTeX project has at most one running and one pending build; a new
+  request supersedes the pending one and cancels the running one
+- Builds run ``latexmk`` in place against the sources with a persistent
+  per-project build directory, so reruns only redo what changed
+- Output PDFs are cached by a hash of the sources, engine and main file;
+  compiling unchanged sources copies the cached PDF without running LaTeX
+- Status transitions and build output are pushed through the compile
+  status store as they happen
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import signal
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.settings import get_settings
+from app.services.git.compile_status import CompileStatusStore, compile_status_store
+
+logger = logging.getLogger(__name__)
+
+LATEXMK_ENGINE_FLAGS = {
+    "pdflatex": "-pdf",
+    "xelatex": "-xelatex",
+    "lualatex": "-lualatex",
+    "latex": "-pdfdvi"
+}
+MAX_CACHED_PDFS = 20
+MAX_ERROR_OUTPUT = 20000
+MAX_OUTPUT_LINES = 2000
+LOG_BATCH_LINES = 50
+LOG_BATCH_SECONDS = 0.25
+
+
+@dataclass
+class CompileJob:
+    """One requested compilation and where its results go."""
+    compilation_id: str
+    compilation_dir: Path
+    source_dir: Path
+    build_dir: Path
+    cache_dir: Path
+    main_file: str
+    engine: str
+    metadata: Dict[str, Any]
+    artifact_url: Optional[str] = None
+
+    @property
+    def project_key(self) -> str:
+        return str(self.source_dir)
+
+
+def source_digest(source_dir: Path, main_file: str, engine: str) -> str:
+    """Content hash of every file under ``source_dir`` plus the build options."""
+    digest = hashlib.sha256(f"{engine}\0{main_file}\0".encode())
+    for path in sorted(p for p in source_dir.rglob("*") if p.is_file()):
+        data = path.read_bytes()
+        digest.update(f"{path.relative_to(source_dir).as_posix()}\0{len(data)}\0".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class LatexCompilePool:
+    """Process-wide LaTeX build scheduler."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout_seconds: Optional[int] = None,
+        status_store: Optional[CompileStatusStore] = None
+    ):
+        files = get_settings().files
+        self.max_workers = max_workers or files.latex_compile_workers
+        self.timeout_seconds = timeout_seconds or files.latex_compile_timeout_seconds
+        self.status_store = status_store or compile_status_store
+        self._workers = asyncio.Semaphore(self.max_workers)
+        self._running: Dict[str, Tuple[CompileJob, asyncio.Task]] = {}
+        self._pending: Dict[str, CompileJob] = {}
+
+    # ================================
+    # SCHEDULING
+    # ================================
+
+    async def submit(self, job: CompileJob) -> None:
+        """Queue a build, superseding older builds of the same project."""
+        await self._update(job)
+        key = job.project_key
+        superseded = self._pending.pop(key, None)
+        if superseded is not None:
+            await self._update(
+                superseded,
+                status="cancelled",
+                completed_at=datetime.utcnow().isoformat(),
+                superseded_by=job.compilation_id
+            )
+
+        running = self._running.get(key)
+        if running is None:
+            self._start(job)
+        else:
+            running_job, task = running
+            running_job.metadata["superseded_by"] = job.compilation_id
+            self._pending[key] = job
+            task.cancel()
+
+    def active_builds(self) -> List[str]:
+        return [job.compilation_id for job, _ in self._running.values()]
+
+    async def close(self) -> None:
+        """Cancel queued and running builds."""
+        self._pending.clear()
+        tasks = [task for _, task in self._running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start(self, job: CompileJob) -> None:
+        task = asyncio.create_task(self._run(job))
+        self._running[job.project_key] = (job, task)
+        task.add_done_callback(lambda _: self._finished(job.project_key))
+
+    async def _update(self, job: CompileJob, **updates: Any) -> None:
+        job.metadata.update(updates, updated_at=datetime.utcnow().isoformat())
+        await self.status_store.update(job.metadata)
+
+    def _finished(self, key: str) -> None:
+        self._running.pop(key, None)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            self._start(pending)
+
+    # ================================
+    # BUILD
+    # ================================
+
+    async def _run(self, job: CompileJob) -> None:
+        try:
+            digest = await asyncio.to_thread(source_digest, job.source_dir, job.main_file, job.engine)
+            job.metadata["source_hash"] = digest
+            cached = job.cache_dir / f"{digest}.pdf"
+            if cached.exists():
+                await asyncio.to_thread(self._publish_cached, job, cached)
+                await self._complete(job, cached=True)
+                logger.info(f"LaTeX compilation {job.compilation_id} served from cache")
+                return
+
+            async with self._workers:
+                await self._update(job, status="running")
+                returncode, output = await self._build(job)
+
+            pdf = job.build_dir / f"{Path(job.main_file).stem}.pdf"
+            if returncode == 0 and pdf.exists():
+                # Only cache if the sources did not change while LaTeX was running
+                fresh = await asyncio.to_thread(source_digest, job.source_dir, job.main_file, job.engine)
+                await asyncio.to_thread(self._publish_build, job, pdf, cached if fresh == digest else None)
+                await self._complete(job, cached=False)
+                logger.info(f"LaTeX compilation {job.compilation_id} completed successfully")
+            else:
+                await asyncio.to_thread(self._copy_log, job)
+                await self._update(
+                    job,
+                    status="failed",
+                    errors=[output[-MAX_ERROR_OUTPUT:]],
+                    completed_at=datetime.utcnow().isoformat()
+                )
+                logger.error(f"LaTeX compilation {job.compilation_id} failed")
+
+        except asyncio.CancelledError:
+            await self._update(job, status="cancelled", completed_at=datetime.utcnow().isoformat())
+            raise
+        except asyncio.TimeoutError:
+            await self._update(
+                job,
+                status="timeout",
+                errors=[f"Compilation exceeded {self.timeout_seconds} seconds"],
+                completed_at=datetime.utcnow().isoformat()
+            )
+            logger.error(f"LaTeX compilation {job.compilation_id} timed out")
+        except Exception as e:
+            await self._update(job, status="failed", errors=[str(e)], completed_at=datetime.utcnow().isoformat())
+            logger.error(f"LaTeX compilation {job.compilation_id} failed with exception: {str(e)}")
+
+    async def _build(self, job: CompileJob) -> Tuple[int, str]:
+        job.build_dir.mkdir(parents=True, exist_ok=True)
+        if shutil.which("latexmk"):
+            cmd = [
+                "latexmk",
+                LATEXMK_ENGINE_FLAGS.get(job.engine, "-pdf"),
+                "-interaction=nonstopmode",
+                "-file-line-error",
+                f"-outdir={job.build_dir}",
+                job.main_file
+            ]
+        else:
+            # Single engine pass; still incremental in the sense that aux files persist
+            cmd = [
+                job.engine,
+                "-interaction=nonstopmode",
+                f"-output-directory={job.build_dir}",
+                job.main_file
+            ]
+
+        # Own process group so cancellation also stops the engine latexmk spawned
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(job.source_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
+            limit=1024 * 1024
+        )
+        output: deque = deque(maxlen=MAX_OUTPUT_LINES)
+        try:
+            await asyncio.wait_for(self._stream_output(job, process, output), timeout=self.timeout_seconds)
+        except BaseException:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            raise
+        return process.returncode, "\n".join(output)
+
+    async def _stream_output(self, job: CompileJob, process, output: deque) -> None:
+        """Collect build output and push it to subscribers in small batches."""
+        loop = asyncio.get_running_loop()
+        batch: List[str] = []
+        flushed_at = loop.time()
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            text = line.decode(errors="replace").rstrip("\n")
+            output.append(text)
+            batch.append(text)
+            if len(batch) >= LOG_BATCH_LINES or loop.time() - flushed_at >= LOG_BATCH_SECONDS:
+                await self.status_store.publish_log(job.compilation_id, batch)
+                batch, flushed_at = [], loop.time()
+        await self.status_store.publish_log(job.compilation_id, batch)
+        await process.wait()
+
+    async def _complete(self, job: CompileJob, cached: bool) -> None:
+        output_dir = job.compilation_dir / "output"
+        output_files = [
+            {"name": path.name, "size": path.stat().st_size}
+            for path in sorted(output_dir.glob("*")) if path.is_file()
+        ]
+        await self._update(
+            job,
+            status="completed",
+            cached=cached,
+            output_files=output_files,
+            artifact_url=job.artifact_url,
+            completed_at=datetime.utcnow().isoformat()
+        )
+
+    # ================================
+    # ARTIFACTS
+    # ================================
+
+    def _publish_build(self, job: CompileJob, pdf: Path, cache_path: Optional[Path]) -> None:
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = cache_path.with_suffix(f".{job.compilation_id}.tmp")
+            shutil.copy2(pdf, temp)
+            os.replace(temp, cache_path)
+            self._evict(cache_path.parent)
+            self._link(cache_path, self._output_path(job))
+        else:
+            shutil.copy2(pdf, self._output_path(job))
+        self._copy_log(job)
+
+    def _publish_cached(self, job: CompileJob, cached: Path) -> None:
+        os.utime(cached)  # keep recently used PDFs out of eviction
+        self._link(cached, self._output_path(job))
+
+    def _copy_log(self, job: CompileJob) -> None:
+        log = job.build_dir / f"{Path(job.main_file).stem}.log"
+        if log.exists():
+            shutil.copy2(log, self._output_path(job).with_suffix(".log"))
+
+    @staticmethod
+    def _output_path(job: CompileJob) -> Path:
+        output_dir = job.compilation_dir / "output"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir / f"{Path(job.main_file).stem}.pdf"
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> None:
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    @staticmethod
+    def _evict(cache_dir: Path) -> None:
+        pdfs = sorted(cache_dir.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in pdfs[MAX_CACHED_PDFS:]:
+            stale.unlink(missing_ok=True)
+
+
+latex_compile_pool = LatexCompilePool()
@@ -0,0 +1,256 @@
+"""
+LaTeX Compile Status Store - L6 Engineering Standards
+Push-based compilation status and history.
+Single Responsibility: Recording and broadcasting compile progress.
+
+- The current status of a compilation is a JSON snapshot in Redis
+  (``latex:compile:<id>``), fronted by an in-process LRU for builds running
+  on this node
+- Status transitions and log lines are published on
+  ``latex:compile:events:<id>`` so clients are pushed updates instead of
+  polling
+- Every transition is upserted into the ``latex_compilations`` table, which
+  serves history and is the fallback when Redis is unavailable
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "latex:compile:"
+CHANNEL_PREFIX = "latex:compile:events:"
+SNAPSHOT_TTL_SECONDS = 24 * 3600
+TERMINAL_STATUSES = {"completed", "failed", "timeout", "cancelled"}
+HEARTBEAT_SECONDS = 15
+
+UPSERT_SQL = text("""
+    INSERT INTO latex_compilations (
+        id, project_id, latex_id, latex_name, main_file, engine, output_format,
+        status, cached, source_hash, errors, output_files, artifact_url,
+        compiled_by, started_at, completed_at, updated_at
+    ) VALUES (
+        CAST(:id AS UUID), CAST(:project_id AS UUID), :latex_id, :latex_name, :main_file,
+        :engine, :output_format, :status, :cached, :source_hash, CAST(:errors AS JSONB),
+        CAST(:output_files AS JSONB), :artifact_url, CAST(:compiled_by AS UUID),
+        CAST(:started_at AS TIMESTAMPTZ), CAST(:completed_at AS TIMESTAMPTZ), now()
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        status = EXCLUDED.status,
+        cached = EXCLUDED.cached,
+        source_hash = EXCLUDED.source_hash,
+        errors = EXCLUDED.errors,
+        output_files = EXCLUDED.output_files,
+        artifact_url = EXCLUDED.artifact_url,
+        completed_at = EXCLUDED.completed_at,
+        updated_at = now()
+""")
+
+SELECT_COLUMNS = """
+    CAST(id AS TEXT) AS compilation_id, CAST(project_id AS TEXT) AS project_id, latex_id,
+    latex_name, main_file, engine, output_format, status, cached, source_hash, errors,
+    output_files, artifact_url, CAST(compiled_by AS TEXT) AS compiled_by, started_at,
+    completed_at, updated_at
+"""
+
+
+class CompileStatusStore:
+    """Redis snapshots and pub/sub for compile status, with Postgres history."""
+
+    def __init__(self, redis_client=None, session_factory=None, max_local_entries: int = 500):
+        self._redis = redis_client
+        self._session_factory = session_factory
+        self.max_local_entries = max_local_entries
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # In-process subscribers, used when Redis is unavailable
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def _client(self):
+        if self._redis is not None:
+            return self._redis
+        from app.database.connection import db_manager
+        return db_manager.redis_client
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.database.connection import db_manager
+        return db_manager.get_postgres_session()
+
+    # ================================
+    # WRITES
+    # ================================
+
+    async def update(self, metadata: Dict[str, Any]) -> None:
+        """Record a status transition and push it to subscribers."""
+        compilation_id = metadata["compilation_id"]
+        self._local[compilation_id] = dict(metadata)
+        self._local.move_to_end(compilation_id)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+        snapshot = json.dumps(metadata, default=str)
+        await self._publish(
+            compilation_id,
+            {"event": "status", "data": metadata},
+            snapshot=snapshot
+        )
+        await self._record(metadata)
+
+    async def publish_log(self, compilation_id: str, lines: List[str]) -> None:
+        """Push build output lines; they are not stored."""
+        if lines:
+            await self._publish(compilation_id, {"event": "log", "data": {"lines": lines}})
+
+    async def _publish(self, compilation_id: str, event: Dict[str, Any], snapshot: Optional[str] = None) -> None:
+        client = self._client()
+        if client is None:
+            for queue in tuple(self._subscribers.get(compilation_id, ())):
+                queue.put_nowait(event)
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            if snapshot is not None:
+                pipe.set(KEY_PREFIX + compilation_id, snapshot, ex=SNAPSHOT_TTL_SECONDS)
+            pipe.publish(CHANNEL_PREFIX + compilation_id, json.dumps(event, default=str))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish compile status for {compilation_id}: {e}")
+
+    async def _record(self, metadata: Dict[str, Any]) -> None:
+        try:
+            async with self._session() as session:
+                await session.execute(UPSERT_SQL, {
+                    "id": metadata["compilation_id"],
+                    "project_id": metadata.get("project_id"),
+                    "latex_id": metadata.get("latex_id"),
+                    "latex_name": metadata.get("latex_name"),
+                    "main_file": metadata.get("main_file"),
+                    "engine": metadata.get("engine"),
+                    "output_format": metadata.get("output_format"),
+                    "status": metadata.get("status"),
+                    "cached": bool(metadata.get("cached")),
+                    "source_hash": metadata.get("source_hash"),
+                    "errors": json.dumps(metadata.get("errors") or []),
+                    "output_files": json.dumps(metadata.get("output_files") or []),
+                    "artifact_url": metadata.get("artifact_url"),
+                    "compiled_by": metadata.get("compiled_by"),
+                    "started_at": metadata.get("started_at"),
+                    "completed_at": metadata.get("completed_at")
+                })
+        except Exception as e:
+            logger.error(f"Failed to record compilation {metadata['compilation_id']}: {e}")
+
+    # ================================
+    # READS
+    # ================================
+
+    async def get(self, compilation_id: str) -> Optional[Dict[str, Any]]:
+        """Current status snapshot; never touches the filesystem."""
+        if compilation_id in self._local:
+            return dict(self._local[compilation_id])
+
+        client = self._client()
+        if client is not None:
+            try:
+                snapshot = await client.get(KEY_PREFIX + compilation_id)
+                if snapshot:
+                    return json.loads(snapshot)
+            except Exception as e:
+                logger.warning(f"Compile status lookup failed for {compilation_id}: {e}")
+
+        try:
+            async with self._session() as session:
+                result = await session.execute(
+                    text(f"SELECT {SELECT_COLUMNS} FROM latex_compilations WHERE id = CAST(:id AS UUID)"),
+                    {"id": compilation_id}
+                )
+                row = result.mappings().first()
+        except Exception as e:
+            logger.error(f"Compile history lookup failed for {compilation_id}: {e}")
+            return None
+        return self._row_to_status(row) if row else None
+
+    async def history(self, project_id: str, latex_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent compilations of a LaTeX project, newest first."""
+        async with self._session() as session:
+            result = await session.execute(
+                text(f"""
+                    SELECT {SELECT_COLUMNS} FROM latex_compilations
+                    WHERE project_id = CAST(:project_id AS UUID) AND latex_id = :latex_id
+                    ORDER BY started_at DESC
+                    LIMIT :limit
+                """),
+                {"project_id": str(project_id), "latex_id": latex_id, "limit": limit}
+            )
+            return [self._row_to_status(row) for row in result.mappings().all()]
+
+    async def events(self, compilation_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream status and log events until the compilation finishes.
+
+        The current snapshot is sent first, so late subscribers start from
+        the right state; a ``ping`` event is sent while the build is quiet.
+        """
+        client = self._client()
+        queue: asyncio.Queue = asyncio.Queue()
+        pubsub = None
+        if client is not None:
+            pubsub = client.pubsub()
+            await pubsub.subscribe(CHANNEL_PREFIX + compilation_id)
+        else:
+            self._subscribers.setdefault(compilation_id, set()).add(queue)
+
+        try:
+            # Subscribe before reading the snapshot so no transition is missed
+            snapshot = await self.get(compilation_id)
+            if snapshot is not None:
+                yield {"event": "status", "data": snapshot}
+                if snapshot.get("status") in TERMINAL_STATUSES:
+                    return
+
+            while True:
+                event = await self._next_event(pubsub, queue)
+                if event is None:
+                    yield {"event": "ping", "data": {}}
+                    continue
+                yield event
+                if event["event"] == "status" and event["data"].get("status") in TERMINAL_STATUSES:
+                    return
+        finally:
+            if pubsub is not None:
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+            else:
+                subscribers = self._subscribers.get(compilation_id, set())
+                subscribers.discard(queue)
+                if not subscribers:
+                    self._subscribers.pop(compilation_id, None)
+
+    @staticmethod
+    async def _next_event(pubsub, queue: asyncio.Queue) -> Optional[Dict[str, Any]]:
+        if pubsub is None:
+            try:
+                return await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                return None
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=HEARTBEAT_SECONDS)
+        if not message or message.get("type") != "message":
+            return None
+        return json.loads(message["data"])
+
+    @staticmethod
+    def _row_to_status(row) -> Dict[str, Any]:
+        status = dict(row)
+        for field in ("started_at", "completed_at", "updated_at"):
+            if status.get(field) is not None:
+                status[field] = status[field].isoformat()
+        return status
+
+
+compile_status_store = CompileStatusStore()
@@ -10,13 +10,14 @@ import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
 from app.repositories.branch_repository import BranchRepository
+from app.services.git.object_reader import git_object_store
+from app.services.git.write_scheduler import git_write_scheduler
 from app.schemas.branch import GitRepository, Branch
 from app.config.settings import get_settings
 
@@ -155,15 +156,13 @@ class GitRepositoryService:
             }
         
         try:
-            # Checkout source branch (default to main)
+            # Create the branch ref without touching any working tree; writes
+            # check it out in its own worktree on first use
             source_branch = source_branch_name or "main"
-            await self._run_git_command(["checkout", source_branch], str(repo_path))
-            
-            # Create and checkout new branch
-            await self._run_git_command(["checkout", "-b", branch_name], str(repo_path))
+            await self._run_git_command(["branch", branch_name, source_branch], str(repo_path))
             
             # Get commit hash
-            commit_hash = await self._get_current_commit_hash(repo_path)
+            commit_hash = await self._run_git_command(["rev-parse", f"refs/heads/{branch_name}"], str(repo_path))
             
             return {
                 "success": True,
@@ -212,151 +211,29 @@ class GitRepositoryService:
                 "error": "Repository not found"
             }
         
-        repo_path = Path(git_repo.repo_path)
         relative_path = file_path.lstrip("/")
-        full_file_path = repo_path / relative_path
+        
+        # For LaTeX files, provide minimal template if content is empty
+        actual_content = content
+        if not content.strip():
+            if file_path.endswith('.tex'):
+                # Minimal LaTeX template for empty files
+                actual_content = "% Empty LaTeX file\n% Add your content here\n"
+            else:
+                # For other files, add a comment to make them non-empty
+                actual_content = f"% Empty {file_path.split('.')[-1] if '.' in file_path else 'file'}\n"
         
         try:
-            # Validate Git repository state
-            logger.info(f"Validating Git repository state for project {project_id}")
-            try:
-                # Check if this is a valid Git repository
-                await self._run_git_command(["status", "--porcelain"], str(repo_path))
-                logger.info("Git repository status check passed")
-            except ServiceError as e:
-                logger.error(f"Git repository validation failed: {str(e)}")
-                raise ServiceError(
-                    f"Git repository is in an invalid state: {str(e)}",
-                    ErrorCodes.VALIDATION_ERROR
-                )
-            
-            # Clean up any problematic untracked files that might interfere with staging
-            await self._cleanup_repository_state(repo_path)
-            
-            # Checkout target branch
-            logger.info(f"Checking out branch: {branch_name}")
-            await self._run_git_command(["checkout", branch_name], str(repo_path))
-            
-            # Configure Git user for this repository (needed for commits)
-            logger.info(f"Configuring Git user: {author_name} <{author_email}>")
-            await self._run_git_command(["config", "user.name", author_name], str(repo_path))
-            await self._run_git_command(["config", "user.email", author_email], str(repo_path))
-            
-            # Ensure directory exists - handle conflicts with existing files
-            logger.info(f"Creating directory structure for: {full_file_path}")
-            try:
-                full_file_path.parent.mkdir(parents=True, exist_ok=True)
-            except FileExistsError as e:
-                # Check if a file (not directory) exists with the same name as the directory we're trying to create
-                conflicting_path = None
-                for parent in full_file_path.parents:
-                    if parent.exists() and not parent.is_dir():
-                        conflicting_path = parent
-                        break
-                
-                if conflicting_path:
-                    raise ServiceError(
-                        f"Cannot create directory '{conflicting_path.relative_to(repo_path)}' because a file with the same name already exists. "
-                        f"Please choose a different path or rename the existing file.",
-                        ErrorCodes.VALIDATION_ERROR
-                    )
-                else:
-                    # Re-raise if it's a different type of FileExistsError
-                    raise ServiceError(
-                        f"Directory creation failed: {str(e)}",
-                        ErrorCodes.UPDATE_ERROR
-                    )
-            
-            # For LaTeX files, provide minimal template if content is empty
-            actual_content = content
-            if not content.strip():
-                if file_path.endswith('.tex'):
-                    # Minimal LaTeX template for empty files
-                    actual_content = "% Empty LaTeX file\n% Add your content here\n"
-                else:
-                    # For other files, add a comment to make them non-empty
-                    actual_content = f"% Empty {file_path.split('.')[-1] if '.' in file_path else 'file'}\n"
-            
-            # Write file content
-            logger.info(f"Writing file: {full_file_path}")
-            with open(full_file_path, 'w', encoding='utf-8') as f:
-                f.write(actual_content)
-            
-            # Stage the file with robust retry logic
-            logger.info(f"Staging file: {relative_path}")
-            
-            # Initial staging attempt
-            await self._run_git_command(["add", relative_path], str(repo_path))
-            
-            # Verify file is staged with multiple attempts
-            max_staging_attempts = 3
-            staging_successful = False
-            
-            for attempt in range(max_staging_attempts):
-                try:
-                    staged_files = await self._run_git_command(["diff", "--cached", "--name-only"], str(repo_path))
-                    if relative_path in staged_files:
-                        staging_successful = True
-                        logger.info(f"File {relative_path} successfully staged on attempt {attempt + 1}")
-                        break
-                    else:
-                        logger.warning(f"File {relative_path} not found in staged files on attempt {attempt + 1}")
-                        logger.info(f"Currently staged files: {staged_files}")
-                        
-                        if attempt < max_staging_attempts - 1:
-                            # Try different staging approaches
-                            if attempt == 0:
-                                # Try staging with full path
-                                await self._run_git_command(["add", str(full_file_path)], str(repo_path))
-                            elif attempt == 1:
-                                # Try staging with force flag
-                                await self._run_git_command(["add", "-f", relative_path], str(repo_path))
-                            
-                            # Small delay before retry
-                            await asyncio.sleep(0.1)
-                except Exception as e:
-                    logger.error(f"Error verifying staging on attempt {attempt + 1}: {str(e)}")
-                    if attempt < max_staging_attempts - 1:
-                        await asyncio.sleep(0.1)
-            
-            if not staging_successful:
-                # Last resort: check if file exists and try one more time
-                if full_file_path.exists():
-                    logger.info("File exists but not staged. Attempting final staging with status check.")
-                    
-                    # Check repository status
-                    status_output = await self._run_git_command(["status", "--porcelain"], str(repo_path))
-                    logger.info(f"Repository status: {status_output}")
-                    
-                    # Try staging all changes to this specific file
-                    await self._run_git_command(["add", "-A", relative_path], str(repo_path))
-                    
-                    # Final verification
-                    final_staged = await self._run_git_command(["diff", "--cached", "--name-only"], str(repo_path))
-                    if relative_path not in final_staged:
-                        raise ServiceError(
-                            f"Failed to stage file {relative_path} after multiple attempts. "
-                            f"Repository may have conflicting states. Status: {status_output}",
-                            ErrorCodes.UPDATE_ERROR
-                        )
-                else:
-                    raise ServiceError(
-                        f"File {full_file_path} was not created properly",
-                        ErrorCodes.UPDATE_ERROR
-                    )
-            
-            # Create commit
-            commit_msg = commit_message or f"Update {relative_path}"
-            logger.info(f"Creating commit with message: {commit_msg}")
-            await self._run_git_command([
-                "commit", 
-                "-m", commit_msg,
-                "--author", f"{author_name} <{author_email}>"
-            ], str(repo_path))
-            
-            # Get new commit hash
-            commit_hash = await self._get_current_commit_hash(repo_path)
-            logger.info(f"File committed successfully with hash: {commit_hash}")
+            # Saves to the same branch within the coalescing window share one commit
+            commit_hash = await git_write_scheduler.write(
+                Path(git_repo.repo_path),
+                branch_name,
+                relative_path,
+                actual_content,
+                commit_message or f"Update {relative_path}",
+                author_name,
+                author_email
+            )
             
             return {
                 "success": True,
@@ -398,32 +275,27 @@ class GitRepositoryService:
                 "error": "Repository not found"
             }
         
-        repo_path = Path(git_repo.repo_path)
-        full_file_path = repo_path / file_path.lstrip("/")
+        relative_path = file_path.lstrip("/")
         
         try:
-            # Checkout target branch
-            await self._run_git_command(["checkout", branch_name], str(repo_path))
-            
-            if not full_file_path.exists():
+            # Read from the object database; the working tree is never checked out
+            reader = await git_object_store.reader(Path(git_repo.repo_path))
+            tree = await reader.branch_tree(branch_name)
+            entry = tree.files.get(relative_path)
+            if entry is None:
                 return {
                     "success": False,
                     "error": f"File {file_path} not found"
                 }
             
-            # Read file content
-            with open(full_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Get file stats
-            file_stats = full_file_path.stat()
+            content = (await reader.read_blob(entry.object_id)).decode("utf-8")
             
             return {
                 "success": True,
                 "content": content,
                 "file_path": file_path,
-                "file_size": file_stats.st_size,
-                "last_modified": datetime.fromtimestamp(file_stats.st_mtime).isoformat()
+                "file_size": entry.size,
+                "last_modified": tree.committed_at.isoformat()
             }
             
         except Exception as e:
@@ -456,28 +328,21 @@ class GitRepositoryService:
                 "error": "Repository not found"
             }
         
-        repo_path = Path(git_repo.repo_path)
-        
         try:
-            # Checkout target branch
-            await self._run_git_command(["checkout", branch_name], str(repo_path))
-            
-            # List tracked files
-            result = await self._run_git_command(["ls-files"], str(repo_path))
-            file_list = result.strip().split('\n') if result.strip() else []
-            
-            files = []
-            for file_path in file_list:
-                if file_path:  # Skip empty lines
-                    full_path = repo_path / file_path
-                    if full_path.exists():
-                        file_stats = full_path.stat()
-                        files.append({
-                            "file_path": f"/{file_path}",
-                            "file_name": Path(file_path).name,
-                            "file_size": file_stats.st_size,
-                            "last_modified": datetime.fromtimestamp(file_stats.st_mtime).isoformat()
-                        })
+            reader = await git_object_store.reader(Path(git_repo.repo_path))
+            tree = await reader.branch_tree(branch_name)
+            last_changes = await reader.last_changes(tree)
+            
+            files = [
+                {
+                    "file_path": f"/{file_path}",
+                    "file_name": Path(file_path).name,
+                    "file_size": entry.size,
+                    # Time of the last commit on the branch that changed the file
+                    "last_modified": last_changes.get(file_path, tree.committed_at).isoformat()
+                }
+                for file_path, entry in tree.files.items()
+            ]
             
             return {
                 "success": True,
@@ -648,49 +513,6 @@ Add your LaTeX files using the ResXiv interface for proper collaboration and ver
         logger.info(f"✅ Main branch '{main_branch.name}' created with full permissions for user {created_by}")
         return main_branch
     
-    async def _cleanup_repository_state(self, repo_path: Path) -> None:
-        """Clean up repository state to prevent staging issues"""
-        try:
-            # Check for untracked files that might interfere with operations
-            status_output = await self._run_git_command(["status", "--porcelain"], str(repo_path))
-            
-            if status_output:
-                logger.info(f"Repository has untracked files: {status_output}")
-                
-                # Check for temporary directories that can be safely ignored
-                lines = status_output.strip().split('\n')
-                for line in lines:
-                    if line.startswith('??'):  # Untracked files
-                        file_path = line[3:].strip()  # Remove '?? ' prefix
-                        
-                        # Handle problematic temporary directories
-                        if file_path.startswith('compilations/'):
-                            temp_dir = repo_path / file_path.split('/')[0]
-                            if temp_dir.exists() and temp_dir.is_dir():
-                                logger.info(f"Adding temporary directory to gitignore: {file_path.split('/')[0]}")
-                                
-                                # Add to .gitignore if not already there
-                                gitignore_path = repo_path / '.gitignore'
-                                ignore_pattern = f"{file_path.split('/')[0]}/\n"
-                                
-                                if gitignore_path.exists():
-                                    with open(gitignore_path, 'r', encoding='utf-8') as f:
-                                        gitignore_content = f.read()
-                                    
-                                    if ignore_pattern.strip() not in gitignore_content:
-                                        with open(gitignore_path, 'a', encoding='utf-8') as f:
-                                            f.write(ignore_pattern)
-                                        logger.info(f"Added {file_path.split('/')[0]}/ to .gitignore")
-                                else:
-                                    # Create .gitignore
-                                    with open(gitignore_path, 'w', encoding='utf-8') as f:
-                                        f.write(f"# Automatically generated\n{ignore_pattern}")
-                                    logger.info(f"Created .gitignore with {file_path.split('/')[0]}/")
-                
-        except Exception as e:
-            # Don't fail the entire operation if cleanup fails
-            logger.warning(f"Repository cleanup warning (non-critical): {str(e)}")
-    
     async def _get_current_commit_hash(self, repo_path: Path) -> str:
         """Get current commit hash"""
         try:
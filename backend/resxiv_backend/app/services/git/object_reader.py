@@ -0,0 +1,319 @@
+"""
+Git Object Reader - L6 Engineering Standards
+Checkout-free reads straight from a repository's object database.
+Single Responsibility: Serving branch trees and file contents without
+touching the working tree.
+
+- One long-lived ``git cat-file --batch`` process per repository answers
+  ref, commit and blob lookups over a pipe, so reads do not fork
+- Tree listings (paths, blob IDs, sizes) are cached per commit ID; they
+  are immutable, so a listing is only rebuilt when a branch moves
+- Blob contents are cached in a byte-bounded LRU keyed by object ID
+- Per-file last-change times come from one history walk per commit ID,
+  stopped as soon as every file in the tree has been seen
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.error_handling import ServiceError, ErrorCodes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """A file in a branch tree."""
+    object_id: str
+    size: int
+
+
+@dataclass(frozen=True)
+class BranchTree:
+    """Snapshot of a branch at one commit."""
+    commit_id: str
+    committed_at: datetime
+    files: Dict[str, TreeEntry]
+
+
+class BlobCache:
+    """LRU of blob contents bounded by total size; object IDs are content hashes."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_blob_bytes: int = 2 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_blob_bytes = max_blob_bytes
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+
+    def get(self, object_id: str) -> Optional[bytes]:
+        data = self._blobs.get(object_id)
+        if data is not None:
+            self._blobs.move_to_end(object_id)
+        return data
+
+    def put(self, object_id: str, data: bytes) -> None:
+        if len(data) > self.max_blob_bytes or object_id in self._blobs:
+            return
+        self._blobs[object_id] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._blobs.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class GitObjectReader:
+    """Object database access for one repository through ``git cat-file --batch``."""
+
+    MAX_CACHED_TREES = 16
+
+    def __init__(self, repo_path: Path, blob_cache: BlobCache):
+        self.repo_path = Path(repo_path)
+        self.blob_cache = blob_cache
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+        self._trees: "OrderedDict[str, BranchTree]" = OrderedDict()
+        self._last_changes: "OrderedDict[str, Dict[str, datetime]]" = OrderedDict()
+        self.loop = asyncio.get_running_loop()
+        # Evicted from the store; callers still holding it may finish their reads
+        self.retired = False
+
+    # ================================
+    # PUBLIC API
+    # ================================
+
+    async def branch_tree(self, branch_name: str) -> BranchTree:
+        """Files on a branch with blob IDs and sizes, cached per commit."""
+        commit_id, committed_at = await self._resolve_branch(branch_name)
+        tree = self._trees.get(commit_id)
+        if tree is None:
+            tree = BranchTree(commit_id, committed_at, await self._list_tree(commit_id))
+            self._trees[commit_id] = tree
+            while len(self._trees) > self.MAX_CACHED_TREES:
+                self._trees.popitem(last=False)
+        else:
+            self._trees.move_to_end(commit_id)
+        return tree
+
+    async def last_changes(self, tree: BranchTree) -> Dict[str, datetime]:
+        """Committer time of the last commit touching each file, cached per commit."""
+        changes = self._last_changes.get(tree.commit_id)
+        if changes is None:
+            changes = await self._walk_history(tree.commit_id, set(tree.files))
+            self._last_changes[tree.commit_id] = changes
+            while len(self._last_changes) > self.MAX_CACHED_TREES:
+                self._last_changes.popitem(last=False)
+        else:
+            self._last_changes.move_to_end(tree.commit_id)
+        return changes
+
+    async def branch_tip(self, branch_name: str) -> Tuple[str, str]:
+        """Commit ID and root tree ID at the tip of a branch."""
+        commit_id, body = await self._read_branch(branch_name)
+        return commit_id, body.split(b"\n", 1)[0].split()[1].decode()
+
+    async def read_blob(self, object_id: str) -> bytes:
+        """Blob contents by object ID, served from the LRU when possible."""
+        data = self.blob_cache.get(object_id)
+        if data is None:
+            found = await self._read_object(object_id)
+            if found is None:
+                raise ServiceError(f"Git object {object_id} not found", ErrorCodes.NOT_FOUND_ERROR)
+            data = found[1]
+            self.blob_cache.put(object_id, data)
+        return data
+
+    async def retire(self) -> None:
+        """Stop the batch process once no read is using it."""
+        self.retired = True
+        if not self._lock.locked():
+            await self.close()
+
+    async def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except Exception:
+            process.kill()
+
+    # ================================
+    # OBJECT DATABASE ACCESS
+    # ================================
+
+    async def _resolve_branch(self, branch_name: str) -> Tuple[str, datetime]:
+        commit_id, body = await self._read_branch(branch_name)
+        return commit_id, self._commit_time(body)
+
+    async def _read_branch(self, branch_name: str) -> Tuple[str, bytes]:
+        if not branch_name or any(c in branch_name for c in "\n\r\0"):
+            raise ServiceError(f"Invalid branch name: {branch_name!r}", ErrorCodes.VALIDATION_ERROR)
+        found = await self._read_object(f"refs/heads/{branch_name}")
+        if found is None or found[0][1] != "commit":
+            raise ServiceError(f"Branch {branch_name} not found", ErrorCodes.NOT_FOUND_ERROR)
+        (commit_id, _), body = found
+        return commit_id, body
+
+    async def _read_object(self, spec: str) -> Optional[Tuple[Tuple[str, str], bytes]]:
+        """
+        Look up one object through the batch process.
+
+        Returns:
+            ``((object ID, type), contents)`` or None if it does not exist
+        """
+        async with self._lock:
+            try:
+                return await self._request(spec)
+            finally:
+                if self.retired:
+                    # Evicted while this read was in flight; close on release
+                    await self.close()
+
+    async def _request(self, spec: str) -> Optional[Tuple[Tuple[str, str], bytes]]:
+        for attempt in range(2):
+            process = await self._ensure_process()
+            try:
+                process.stdin.write(spec.encode() + b"\n")
+                await process.stdin.drain()
+                header = (await process.stdout.readline()).decode().split()
+                if not header:
+                    raise ConnectionError("git cat-file exited")
+                if header[-1] == "missing" or header[-1] == "ambiguous":
+                    return None
+                object_id, object_type, size = header
+                data = await process.stdout.readexactly(int(size) + 1)
+                return (object_id, object_type), data[:-1]
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+                # The pipe is out of sync or the process died; restart it once
+                logger.warning(f"git cat-file for {self.repo_path} failed, restarting: {e}")
+                await self.close()
+                if attempt:
+                    raise ServiceError(
+                        f"Failed to read git object {spec}: {e}",
+                        ErrorCodes.EXTERNAL_SERVICE_ERROR
+                    )
+
+    async def _ensure_process(self) -> asyncio.subprocess.Process:
+        if self._process is None or self._process.returncode is not None:
+            self._process = await asyncio.create_subprocess_exec(
+                "git", "cat-file", "--batch",
+                cwd=str(self.repo_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        return self._process
+
+    async def _list_tree(self, commit_id: str) -> Dict[str, TreeEntry]:
+        process = await asyncio.create_subprocess_exec(
+            "git", "ls-tree", "-r", "-l", "-z", commit_id,
+            cwd=str(self.repo_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise ServiceError(
+                f"Failed to list tree {commit_id}: {stderr.decode().strip()}",
+                ErrorCodes.EXTERNAL_SERVICE_ERROR
+            )
+
+        files = {}
+        for record in stdout.decode("utf-8", errors="surrogateescape").split("\0"):
+            if not record:
+                continue
+            # "<mode> <type> <object id> <size>\t<path>"
+            meta, path = record.split("\t", 1)
+            _, object_type, object_id, size = meta.split()
+            if object_type == "blob":
+                files[path] = TreeEntry(object_id, int(size))
+        return files
+
+    async def _walk_history(self, commit_id: str, paths: Set[str]) -> Dict[str, datetime]:
+        process = await asyncio.create_subprocess_exec(
+            "git", "log", "-z", "--no-renames", "--name-only", "--format=%x01%ct", commit_id, "--",
+            cwd=str(self.repo_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+
+        # "\x01<committer time>\0\n<path>\0<path>\0..." per commit, newest first
+        changes: Dict[str, datetime] = {}
+        pending = set(paths)
+        committed_at = None
+        buffer = b""
+        try:
+            while pending:
+                chunk = await process.stdout.read(64 * 1024)
+                if not chunk:
+                    break
+                *records, buffer = (buffer + chunk).split(b"\0")
+                for record in records:
+                    if record.startswith(b"\x01"):
+                        committed_at = datetime.fromtimestamp(int(record[1:]), tz=timezone.utc)
+                        continue
+                    path = record.lstrip(b"\n").decode("utf-8", errors="surrogateescape")
+                    if path in pending:
+                        pending.discard(path)
+                        changes[path] = committed_at
+        finally:
+            if process.returncode is None:
+                # Older history is not needed once every file has been seen
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+            await process.wait()
+        return changes
+
+    @staticmethod
+    def _commit_time(body: bytes) -> datetime:
+        for line in body.split(b"\n"):
+            if line.startswith(b"committer "):
+                timestamp = int(line.rsplit(b" ", 2)[1])
+                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+            if not line:
+                break
+        return datetime.now(timezone.utc)
+
+
+class GitObjectStore:
+    """Registry of per-repository readers sharing one blob cache."""
+
+    def __init__(self, max_repositories: int = 64, blob_cache: Optional[BlobCache] = None):
+        self.max_repositories = max_repositories
+        self.blob_cache = blob_cache or BlobCache()
+        self._readers: "OrderedDict[str, GitObjectReader]" = OrderedDict()
+
+    async def reader(self, repo_path: Path) -> GitObjectReader:
+        key = str(Path(repo_path).resolve())
+        reader = self._readers.get(key)
+        if reader is not None and reader.loop is not asyncio.get_running_loop():
+            # Processes are bound to the loop that spawned them
+            self._readers.pop(key)
+            reader = None
+        if reader is None:
+            reader = GitObjectReader(Path(key), self.blob_cache)
+            self._readers[key] = reader
+            while len(self._readers) > self.max_repositories:
+                _, evicted = self._readers.popitem(last=False)
+                # Another request may be mid-read on it; it closes when that read ends
+                await evicted.retire()
+        else:
+            self._readers.move_to_end(key)
+        return reader
+
+    async def close(self) -> None:
+        readers = list(self._readers.values())
+        self._readers.clear()
+        for reader in readers:
+            await reader.close()
+
+
+git_object_store = GitObjectStore()
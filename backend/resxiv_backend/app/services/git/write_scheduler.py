@@ -0,0 +1,357 @@
+"""
+Git Write Scheduler - L6 Engineering Standards
+Serialized, coalesced commits to project repositories.
+Single Responsibility: Turning file saves into branch commits.
+
+- Every branch writes through its own working tree: the primary checkout
+  serves the branch it has checked out, other branches get a
+  ``git worktree`` under ``.git/resxiv-worktrees``, so saves to different
+  branches never share an index
+- Writes to one branch are serialized; saves arriving within a short
+  window are committed together, one commit per run of consecutive saves
+  by the same author, in arrival order
+- Commits are built with plumbing (update-index, write-tree, commit-tree,
+  update-ref) instead of add/commit and their verification loops
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.config.settings import get_settings
+from app.core.error_handling import ServiceError, ErrorCodes
+from app.services.git.object_reader import git_object_store
+
+logger = logging.getLogger(__name__)
+
+WORKTREE_DIR = "resxiv-worktrees"
+
+
+async def run_git(args: List[str], cwd: Path, env: Optional[Dict[str, str]] = None) -> str:
+    """Run a git command and return its stripped stdout."""
+    process = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=str(cwd),
+        env={**os.environ, **env} if env else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise ServiceError(
+            f"Git command failed: {' '.join(args[:2])} - {stderr.decode().strip()}",
+            ErrorCodes.EXTERNAL_SERVICE_ERROR
+        )
+    return stdout.decode().strip()
+
+
+@dataclass
+class FileWrite:
+    """A pending save waiting for its branch's next commit."""
+    path: str
+    content: Optional[str]  # None removes the file
+    message: str
+    author_name: str
+    author_email: str
+    future: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class BranchWriter:
+    """Serializes and coalesces writes to one branch."""
+
+    def __init__(self, repo_path: Path, branch_name: str, worktree: Path, window: float):
+        self.repo_path = repo_path
+        self.branch_name = branch_name
+        self.worktree = worktree
+        self.window = window
+        self.head: Optional[str] = None
+        self._lock = asyncio.Lock()
+        self._pending: List[FileWrite] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def submit(self, write: FileWrite) -> str:
+        """Queue a write and wait for the commit that contains it."""
+        return (await self.submit_many([write]))[0]
+
+    async def submit_many(self, writes: List[FileWrite]) -> List[str]:
+        """Queue writes into the same batch and wait for their commits."""
+        for write in writes:
+            self._target(write.path)  # reject bad paths before they can fail a whole batch
+        self._pending.extend(writes)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return list(await asyncio.gather(*(asyncio.shield(write.future) for write in writes)))
+
+    async def drain(self) -> None:
+        """Wait for queued writes to be committed."""
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self.window)
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            self._flush_task = None
+
+            # Grouping by author across the batch would let an earlier save
+            # land after a later one; only consecutive saves are merged
+            groups: List[List[FileWrite]] = []
+            for write in batch:
+                if groups and self._author(groups[-1][-1]) == self._author(write):
+                    groups[-1].append(write)
+                else:
+                    groups.append([write])
+
+            for group in groups:
+                try:
+                    commit_id = await self._commit(group)
+                except Exception as e:
+                    logger.error(f"Commit to {self.branch_name} in {self.repo_path} failed: {e}")
+                    for write in group:
+                        write.future.set_exception(e)
+                else:
+                    for write in group:
+                        write.future.set_result(commit_id)
+
+    async def _commit(self, writes: List[FileWrite]) -> str:
+        # Later saves of the same file within the window win
+        files = {write.path: write.content for write in writes}
+        targets = {path: self._target(path) for path in files}
+        reader = await git_object_store.reader(self.repo_path)
+
+        for attempt in range(2):
+            tip, tip_tree = await reader.branch_tip(self.branch_name)
+            try:
+                if self.head != tip:
+                    # First use, or the branch moved outside this writer; read-tree
+                    # resyncs index and files without moving any ref
+                    await run_git(["read-tree", "-u", "--reset", tip], self.worktree)
+                    self.head = tip
+
+                for path, content in files.items():
+                    if content is None:
+                        targets[path].unlink(missing_ok=True)
+                    else:
+                        targets[path].write_text(content, encoding="utf-8")
+                await run_git(["update-index", "--add", "--remove", "--", *files], self.worktree)
+                tree = await run_git(["write-tree"], self.worktree)
+                if tree == tip_tree:
+                    return tip
+
+                author = writes[-1]
+                env = {
+                    "GIT_AUTHOR_NAME": author.author_name,
+                    "GIT_AUTHOR_EMAIL": author.author_email,
+                    "GIT_COMMITTER_NAME": author.author_name,
+                    "GIT_COMMITTER_EMAIL": author.author_email
+                }
+                commit_id = await run_git(
+                    ["commit-tree", tree, "-p", tip, "-m", self._message(writes)],
+                    self.worktree,
+                    env=env
+                )
+                # Compare-and-swap so a concurrent writer in another process is not overwritten
+                await run_git(
+                    ["update-ref", f"refs/heads/{self.branch_name}", commit_id, tip],
+                    self.worktree
+                )
+                self.head = commit_id
+                logger.info(f"Committed {len(files)} file(s) to {self.branch_name}: {commit_id[:8]}")
+                return commit_id
+            except Exception:
+                # The index or files may be half-updated; resync from the branch tip next time
+                self.head = None
+                if attempt:
+                    raise
+
+    def _target(self, path: str) -> Path:
+        target = (self.worktree / path).resolve()
+        root = self.worktree.resolve()
+        if root not in target.parents or (root / ".git") in (target, *target.parents):
+            raise ServiceError(f"Invalid file path: {path}", ErrorCodes.VALIDATION_ERROR)
+
+        conflict = next((p for p in target.parents if p != root and p.exists() and not p.is_dir()), None)
+        if conflict is not None:
+            raise ServiceError(
+                f"Cannot create directory '{conflict.relative_to(root)}' because a file with the same name already exists. "
+                f"Please choose a different path or rename the existing file.",
+                ErrorCodes.VALIDATION_ERROR
+            )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return target
+
+    @staticmethod
+    def _author(write: FileWrite) -> tuple:
+        return write.author_name, write.author_email
+
+    @staticmethod
+    def _message(writes: List[FileWrite]) -> str:
+        messages = list(dict.fromkeys(write.message for write in writes))
+        if len(messages) == 1:
+            return messages[0]
+        return f"Update {len({w.path for w in writes})} files\n\n" + "\n".join(f"- {m}" for m in messages)
+
+
+class RepositoryWriteScheduler:
+    """Branch writers and worktrees for one repository."""
+
+    def __init__(self, repo_path: Path, window: float):
+        self.repo_path = repo_path
+        self.window = window
+        self.loop = asyncio.get_running_loop()
+        self._writers: Dict[str, BranchWriter] = {}
+        self._lock = asyncio.Lock()
+        self._primary_branch: Optional[str] = None
+
+    async def writer(self, branch_name: str) -> BranchWriter:
+        async with self._lock:
+            writer = self._writers.get(branch_name)
+            if writer is None:
+                worktree = await self._worktree(branch_name)
+                writer = BranchWriter(self.repo_path, branch_name, worktree, self.window)
+                self._writers[branch_name] = writer
+            return writer
+
+    async def drain(self) -> None:
+        for writer in list(self._writers.values()):
+            await writer.drain()
+
+    async def _worktree(self, branch_name: str) -> Path:
+        if self._primary_branch is None:
+            try:
+                self._primary_branch = await run_git(["symbolic-ref", "--short", "HEAD"], self.repo_path)
+            except ServiceError:
+                self._primary_branch = ""  # detached HEAD
+        if branch_name == self._primary_branch:
+            return self.repo_path
+
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", branch_name)
+        digest = hashlib.sha1(branch_name.encode()).hexdigest()[:8]
+        worktree = self.repo_path / ".git" / WORKTREE_DIR / f"{safe_name}-{digest}"
+        if not (worktree / ".git").exists():
+            await run_git(["worktree", "prune"], self.repo_path)
+            await run_git(["worktree", "add", "-q", str(worktree), branch_name], self.repo_path)
+            logger.info(f"Created worktree for branch {branch_name} at {worktree}")
+        return worktree
+
+
+class GitWriteScheduler:
+    """Process-wide entry point for repository writes."""
+
+    def __init__(self, window: Optional[float] = None):
+        self.window = window
+        self._repositories: Dict[str, RepositoryWriteScheduler] = {}
+
+    async def write(
+        self,
+        repo_path: Path,
+        branch_name: str,
+        file_path: str,
+        content: str,
+        message: str,
+        author_name: str,
+        author_email: str
+    ) -> str:
+        """
+        Save a file to a branch.
+
+        Args:
+            repo_path: Repository root
+            branch_name: Target branch
+            file_path: Path relative to the repository root
+            content: File content
+            message: Commit message for this save
+            author_name: Git author name
+            author_email: Git author email
+
+        Returns:
+            ID of the commit containing the save
+        """
+        repository = self._repository(Path(repo_path))
+        writer = await repository.writer(branch_name)
+        return await writer.submit(FileWrite(file_path, content, message, author_name, author_email))
+
+    async def write_files(
+        self,
+        repo_path: Path,
+        branch_name: str,
+        files: Dict[str, Optional[str]],
+        message: str,
+        author_name: str,
+        author_email: str
+    ) -> str:
+        """
+        Save several files to a branch in a single commit.
+
+        Args:
+            repo_path: Repository root
+            branch_name: Target branch
+            files: Content by path relative to the repository root; ``None``
+                removes the path
+            message: Commit message
+            author_name: Git author name
+            author_email: Git author email
+
+        Returns:
+            ID of the commit containing the files
+        """
+        repository = self._repository(Path(repo_path))
+        writer = await repository.writer(branch_name)
+        commit_ids = await writer.submit_many([
+            FileWrite(path, content, message, author_name, author_email)
+            for path, content in files.items()
+        ])
+        return commit_ids[-1]
+
+    async def delete_files(
+        self,
+        repo_path: Path,
+        branch_name: str,
+        paths: List[str],
+        message: str,
+        author_name: str,
+        author_email: str
+    ) -> str:
+        """
+        Remove files from a branch in a single commit.
+
+        Args:
+            repo_path: Repository root
+            branch_name: Target branch
+            paths: Paths relative to the repository root
+            message: Commit message
+            author_name: Git author name
+            author_email: Git author email
+
+        Returns:
+            ID of the commit removing the files
+        """
+        return await self.write_files(
+            repo_path, branch_name, dict.fromkeys(paths), message, author_name, author_email
+        )
+
+    async def close(self) -> None:
+        """Commit writes still waiting in a coalescing window."""
+        repositories = list(self._repositories.values())
+        self._repositories.clear()
+        for repository in repositories:
+            await repository.drain()
+
+    def _repository(self, repo_path: Path) -> RepositoryWriteScheduler:
+        key = str(repo_path.resolve())
+        repository = self._repositories.get(key)
+        if repository is None or repository.loop is not asyncio.get_running_loop():
+            window = self.window
+            if window is None:
+                window = get_settings().files.git_write_coalesce_ms / 1000
+            repository = RepositoryWriteScheduler(Path(key), window)
+            self._repositories[key] = repository
+        return repository
+
+
+git_write_scheduler = GitWriteScheduler()
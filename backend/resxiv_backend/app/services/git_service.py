@@ -6,18 +6,19 @@ L6 Engineering Standards - Proper Git repository management
 import logging
 import subprocess
 import asyncio
-import shutil
 from typing import Dict, Any, Optional
 from pathlib import Path
-import json
 import uuid
 from datetime import datetime
 
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.schemas.branch import LaTeXFile, GitRepository
+from app.schemas.branch import Branch, LaTeXFile, GitRepository
 from app.repositories.branch_repository import BranchRepository
+from app.services.git.compile_pool import CompileJob, latex_compile_pool
+from app.services.git.compile_status import compile_status_store
+from app.services.git.write_scheduler import git_write_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -387,17 +388,9 @@ class GitService:
                     }
                 }
             
-            latex_dir = repo_path / latex_name
-            latex_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created LaTeX directory: {latex_dir}")
-            
-            # Create template files
+            # Create database records; the files themselves are committed below
             created_files = []
             for filename, content in files.items():
-                file_path = latex_dir / filename
-                file_path.write_text(content, encoding='utf-8')
-                logger.info(f"Created file: {file_path} ({len(content)} bytes)")
-                
                 # Create database record
                 latex_file = LaTeXFile(
                     project_id=project_uuid,
@@ -412,15 +405,17 @@ class GitService:
                 self.session.add(latex_file)
                 created_files.append(filename)
             
-            logger.info(f"About to commit files to git in: {repo_path}")
-            # Commit files to git
-            commit_result = await self.create_commit(
-                str(repo_path),
+            # Commit through the write scheduler so nothing else commits on
+            # the branch's working tree at the same time
+            commit_hash = await git_write_scheduler.write_files(
+                repo_path,
+                await self._default_branch_name(git_repo),
+                {f"{latex_name}/{filename}": content for filename, content in files.items()},
                 f"Create LaTeX project: {latex_name}",
                 "ResXiv System",
                 "system@resxiv.com"
             )
-            logger.info(f"Commit result: {commit_result}")
+            logger.info(f"Committed LaTeX project {latex_name}: {commit_hash[:8]}")
             
             await self.session.commit()
             
@@ -431,7 +426,7 @@ class GitService:
                     "name": latex_name,
                     "template": template,
                     "files": created_files,
-                    "commit_hash": commit_result.get("commit_hash") if commit_result.get("success") else None
+                    "commit_hash": commit_hash
                 }
             }
             
@@ -537,15 +532,19 @@ class GitService:
             
             if git_repo:
                 repo_path = Path(git_repo.repo_path)
-                latex_dir = repo_path / latex_name
+                branch_name = await self._default_branch_name(git_repo)
+                tracked = await self._run_git_command(
+                    ["ls-tree", "-r", "--name-only", branch_name, "--", f"{latex_name}/"],
+                    str(repo_path)
+                )
+                paths = tracked.splitlines()
                 
-                if latex_dir.exists():
-                    import shutil
-                    shutil.rmtree(latex_dir)
-                    
-                    # Commit deletion
-                    await self.create_commit(
-                        str(repo_path),
+                if paths:
+                    # Commit deletion through the write scheduler
+                    await git_write_scheduler.delete_files(
+                        repo_path,
+                        branch_name,
+                        paths,
                         f"Delete LaTeX project: {latex_name}",
                         "ResXiv System",
                         "system@resxiv.com"
@@ -797,13 +796,11 @@ class GitService:
                 main_file = fallback_tex.name
                 main_file_path = fallback_tex
 
-            # Create compilation directory
+            # Create compilation directory; sources are built in place, so only
+            # output artifacts live here
             compilation_dir = repo_path / "compilations" / compilation_id
             compilation_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy source files to compilation directory
-            shutil.copytree(source_dir, compilation_dir / "source", dirs_exist_ok=True)
-            
             # Store compilation metadata
             compilation_metadata = {
                 "compilation_id": compilation_id,
@@ -822,13 +819,23 @@ class GitService:
                 "output_files": []
             }
             
-            # Save metadata
-            metadata_file = compilation_dir / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(compilation_metadata, f, indent=2)
+            job = CompileJob(
+                compilation_id=compilation_id,
+                compilation_dir=compilation_dir,
+                source_dir=source_dir,
+                build_dir=repo_path / "compilations" / ".build" / f"{latex_name}-{engine}",
+                cache_dir=repo_path / "compilations" / ".cache" / latex_name,
+                main_file=main_file,
+                engine=engine,
+                metadata=compilation_metadata,
+                artifact_url=(
+                    f"/api/v1/latex/projects/{project_id_str}/latex/{latex_id}"
+                    f"/compile/{compilation_id}/download"
+                )
+            )
             
-            # Start compilation in background
-            asyncio.create_task(self._run_latex_compilation(compilation_dir, compilation_metadata))
+            # Queue on the bounded worker pool; supersedes older builds of this project
+            await latex_compile_pool.submit(job)
             
             logger.info(f"Started LaTeX compilation {compilation_id} for project {project_id_str}")
             
@@ -864,44 +871,10 @@ class GitService:
             Dict with compilation status and results
         """
         try:
-            # Convert project_id to UUID and string
-            project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-            project_id_str = str(project_uuid)
-            
-            # Get git repository
-            repo_result = await self.session.execute(
-                select(GitRepository).where(GitRepository.project_id == project_uuid)
-            )
-            git_repo = repo_result.scalar_one_or_none()
-            
-            if not git_repo:
-                return {"success": False, "error": "Git repository not found"}
-            
-            # Check compilation directory
-            repo_path = Path(git_repo.repo_path)
-            compilation_dir = repo_path / "compilations" / compilation_id
-            metadata_file = compilation_dir / "metadata.json"
-            
-            if not metadata_file.exists():
+            metadata = await self._get_compilation(project_id, compilation_id)
+            if not metadata:
                 return {"success": False, "error": "Compilation not found"}
             
-            # Load metadata
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
-            # Check for output files
-            output_dir = compilation_dir / "output"
-            if output_dir.exists():
-                output_files = []
-                for file_path in output_dir.glob("*"):
-                    if file_path.is_file():
-                        output_files.append({
-                            "name": file_path.name,
-                            "size": file_path.stat().st_size,
-                            "path": str(file_path.relative_to(compilation_dir))
-                        })
-                metadata["output_files"] = output_files
-            
             return {
                 "success": True,
                 "compilation": metadata
@@ -911,6 +884,40 @@ class GitService:
             logger.error(f"Error getting compilation status: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    @handle_service_errors("LaTeX compilation history")
+    async def get_compilation_history(
+        self,
+        project_id: uuid.UUID,
+        latex_id: str,
+        limit: int = 20,
+        user_id: Optional[uuid.UUID] = None
+    ) -> Dict[str, Any]:
+        """
+        Get recent compilations of a LaTeX project.
+        
+        Args:
+            project_id: Project UUID
+            latex_id: LaTeX project identifier
+            limit: Maximum number of compilations to return
+            user_id: User requesting history
+            
+        Returns:
+            Dict with compilations, newest first
+        """
+        try:
+            project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
+            compilations = await compile_status_store.history(str(project_uuid), latex_id, limit)
+            
+            return {
+                "success": True,
+                "compilations": compilations,
+                "total_count": len(compilations)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting compilation history: {str(e)}")
+            return {"success": False, "error": str(e)}
+
     @handle_service_errors("LaTeX compiled file retrieval")
     async def get_compiled_file(
         self,
@@ -936,6 +943,13 @@ class GitService:
             project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
             project_id_str = str(project_uuid)
             
+            # Check if compilation completed successfully
+            metadata = await self._get_compilation(project_uuid, compilation_id)
+            if not metadata:
+                return {"success": False, "error": "Compilation not found"}
+            if metadata.get("status") != "completed":
+                return {"success": False, "error": "Compilation not completed or failed"}
+            
             # Get git repository
             repo_result = await self.session.execute(
                 select(GitRepository).where(GitRepository.project_id == project_uuid)
@@ -945,34 +959,8 @@ class GitService:
             if not git_repo:
                 return {"success": False, "error": "Git repository not found"}
             
-            # Check compilation directory
-            repo_path = Path(git_repo.repo_path)
-            compilation_dir = repo_path / "compilations" / compilation_id
-            metadata_file = compilation_dir / "metadata.json"
-            
-            if not metadata_file.exists():
-                return {"success": False, "error": "Compilation not found"}
-            
-            # Load metadata
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
-            # Check if compilation completed successfully
-            if metadata.get("status") != "completed":
-                return {"success": False, "error": "Compilation not completed or failed"}
-            
-            # Look for PDF file in output directory
-            output_dir = compilation_dir / "output"
-            if not output_dir.exists():
-                return {"success": False, "error": "Output directory not found"}
-            
-            # Find PDF files
-            pdf_files = list(output_dir.glob("*.pdf"))
-            if not pdf_files:
-                return {"success": False, "error": "No PDF file found"}
-            
-            # Use the first PDF file (usually main.pdf)
-            pdf_file = pdf_files[0]
+            main_stem = Path(metadata.get("main_file") or "main.tex").stem
+            pdf_file = Path(git_repo.repo_path) / "compilations" / compilation_id / "output" / f"{main_stem}.pdf"
             
             if not pdf_file.exists():
                 return {"success": False, "error": "PDF file not found"}
@@ -993,162 +981,38 @@ class GitService:
             logger.error(f"Error getting compiled file: {str(e)}")
             return {"success": False, "error": str(e)}
 
-    async def _run_latex_compilation(self, compilation_dir: Path, metadata: Dict[str, Any]) -> None:
+    async def compilation_events(self, project_id: uuid.UUID, compilation_id: str):
         """
-        Run LaTeX compilation in background.
+        Event stream of a compilation's status and log output.
         
-        Args:
-            compilation_dir: Directory containing compilation files
-            metadata: Compilation metadata
-        """
-        try:
-            source_dir = compilation_dir / "source"
-            output_dir = compilation_dir / "output"
-            output_dir.mkdir(exist_ok=True)
-            
-            main_file = metadata["main_file"]
-            engine = metadata["engine"]
-            
-            # Run LaTeX compilation
-            cmd = [
-                engine,
-                "-interaction=nonstopmode",
-                "-output-directory=" + str(output_dir),
-                main_file
-            ]
-            
-            # Update status to running
-            metadata["status"] = "running"
-            metadata["updated_at"] = datetime.utcnow().isoformat()
-            
-            # Save updated metadata
-            metadata_file = compilation_dir / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
-            # Execute compilation
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(source_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            # Update metadata with results
-            metadata["completed_at"] = datetime.utcnow().isoformat()
-            
-            if process.returncode == 0:
-                metadata["status"] = "completed"
-                logger.info(f"LaTeX compilation {metadata['compilation_id']} completed successfully")
-            else:
-                metadata["status"] = "failed"
-                error_output = stderr.decode() if stderr else stdout.decode()
-                metadata["errors"] = [error_output]
-                logger.error(f"LaTeX compilation {metadata['compilation_id']} failed: {error_output}")
-            
-            # Save final metadata
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-                
-        except Exception as e:
-            # Update metadata with error
-            metadata["status"] = "failed"
-            metadata["completed_at"] = datetime.utcnow().isoformat()
-            metadata["errors"] = [str(e)]
-            
-            metadata_file = compilation_dir / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
-            logger.error(f"LaTeX compilation {metadata['compilation_id']} failed with exception: {str(e)}")
-
-    # ------------------------------------------------------------------
-    # Compilation monitoring helpers (used by API background task)
-    # ------------------------------------------------------------------
-
-    async def check_compilation_progress(
-        self,
-        project_id: uuid.UUID,
-        latex_id: str,
-        compilation_id: str,
-    ) -> Dict[str, Any]:
-        """Return current status for a running/finished compilation.
-
-        This is a *best-effort* helper so that API endpoints don’t explode if the
-        compilation directory/metadata is missing. If metadata cannot be found
-        we assume the compilation has failed.
+        Raises:
+            ServiceError: If the compilation does not belong to the project
         """
-        try:
-            repo_base = Path(self._get_repo_path(project_id))
-            meta_file = repo_base / "compilations" / compilation_id / "metadata.json"
-            if not meta_file.exists():
-                return {"status": "failed", "reason": "metadata_not_found"}
-
-            data = json.loads(meta_file.read_text())
-            return {"status": data.get("status", "unknown"), "metadata": data}
-        except Exception as exc:
-            logger.error(f"check_compilation_progress error: {exc}")
-            return {"status": "failed", "reason": str(exc)}
-
-    async def mark_compilation_timeout(
-        self,
-        project_id: uuid.UUID,
-        latex_id: str,
-        compilation_id: str,
-    ) -> None:
-        await self._update_compilation_status(project_id, compilation_id, "timeout")
-
-    async def mark_compilation_failed(
-        self,
-        project_id: uuid.UUID,
-        latex_id: str,
-        compilation_id: str,
-        error: str,
-    ) -> None:
-        await self._update_compilation_status(project_id, compilation_id, "failed", error)
+        if not await self._get_compilation(project_id, compilation_id):
+            raise ServiceError("Compilation not found", ErrorCodes.NOT_FOUND_ERROR, status_code=404)
+        return compile_status_store.events(compilation_id)
 
     # ------------------------- internal helpers -------------------------
 
-    def _get_repo_path(self, project_id: uuid.UUID) -> str:
-        """Return repository path for given project from database (sync)."""
-        # For helper methods we do a quick synchronous lookup; if it fails we
-        # fall back to standard repositories directory layout.
-        default_base = Path("/home/yashwardhan/codes/ResXiv_V2/backend/repositories")
-        try:
-            result = self.session.sync_session.execute(
-                select(GitRepository).where(GitRepository.project_id == project_id)
-            )
-            repo = result.scalar_one_or_none()
-            if repo:
-                return repo.repo_path
-        except Exception:
-            pass
-        # Fallback to conventional name
-        return str(default_base / f"sample_project_{str(project_id)[:8]}")
-
-    async def _update_compilation_status(
-        self,
-        project_id: uuid.UUID,
-        compilation_id: str,
-        new_status: str,
-        error: str | None = None,
-    ) -> None:
-        try:
-            repo_base = Path(self._get_repo_path(project_id))
-            meta_file = repo_base / "compilations" / compilation_id / "metadata.json"
-            if not meta_file.exists():
-                return
-            meta = json.loads(meta_file.read_text())
-            meta["status"] = new_status
-            if error:
-                meta.setdefault("errors", []).append(error)
-            meta["completed_at"] = datetime.utcnow().isoformat()
-            meta_file.write_text(json.dumps(meta, indent=2))
-        except Exception as exc:
-            logger.error(f"Failed to update compilation status: {exc}")
+    async def _get_compilation(self, project_id: uuid.UUID, compilation_id: str) -> Optional[Dict[str, Any]]:
+        """Compilation status from the status store, scoped to the project."""
+        project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
+        metadata = await compile_status_store.get(compilation_id)
+        if not metadata or metadata.get("project_id") != str(project_uuid):
+            return None
+        return metadata
 
+    async def _default_branch_name(self, git_repo: GitRepository) -> str:
+        """Name of the repository's default branch, or the checked-out one"""
+        if git_repo.default_branch_id:
+            result = await self.session.execute(
+                select(Branch.name).where(Branch.id == git_repo.default_branch_id)
+            )
+            name = result.scalar_one_or_none()
+            if name:
+                return name
+        return (await self._run_git_command(["symbolic-ref", "--short", "HEAD"], git_repo.repo_path)).strip()
+    
     async def _run_git_command(self, cmd: list, cwd: str) -> str:
         """
         Run a Git command asynchronously
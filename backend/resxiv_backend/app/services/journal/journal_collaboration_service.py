@@ -80,6 +80,50 @@ class JournalCollaborationService:
             can_delete=can_delete
         )
 
+    @handle_service_errors("bulk journal permission check")
+    async def get_journal_permissions(
+        self,
+        journal_ids: List[uuid.UUID],
+        user_id: uuid.UUID
+    ) -> Dict[uuid.UUID, JournalPermissionCheck]:
+        """
+        Resolve a user's permissions on many journals in one query.
+
+        Args:
+            journal_ids: Journals to check
+            user_id: User whose permissions are resolved
+
+        Returns:
+            Permissions keyed by journal ID; journals that do not exist or
+            are deleted are absent
+        """
+        if not journal_ids:
+            return {}
+
+        result = await self.session.execute(
+            text("""
+                SELECT j.id, j.created_by, j.is_public, jc.permission
+                FROM journals j
+                LEFT JOIN journal_collaborators jc ON jc.journal_id = j.id
+                    AND jc.user_id = :user_id
+                WHERE j.id = ANY(:journal_ids) AND j.deleted_at IS NULL
+            """),
+            {"journal_ids": list(journal_ids), "user_id": user_id}
+        )
+
+        permissions = {}
+        for row in result.fetchall():
+            is_owner = row.created_by == user_id
+            level = PermissionType.ADMIN if is_owner else (PermissionType(row.permission) if row.permission else None)
+            permissions[row.id] = JournalPermissionCheck(
+                can_read=level is not None or bool(row.is_public),
+                can_write=level in (PermissionType.WRITE, PermissionType.ADMIN),
+                can_admin=level == PermissionType.ADMIN,
+                is_owner=is_owner,
+                permission_level=level
+            )
+        return permissions
+
     @handle_service_errors("journal collaborator addition")
     async def add_collaborator(
         self, 
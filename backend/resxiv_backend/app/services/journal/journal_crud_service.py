@@ -15,19 +15,23 @@ from sqlalchemy import text
 from fastapi import HTTPException, status
 
 from app.models.journal_models import (
-    JournalCreate, JournalUpdate, JournalResponse, JournalDetailResponse,
+    JournalCreate, JournalUpdate, JournalSummaryResponse, JournalDetailResponse,
     JournalListResponse, JournalStatus
 )
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from .journal_version_store import JournalVersionStore
 
 logger = logging.getLogger(__name__)
 
+EXCERPT_LENGTH = 200
+
 
 class JournalCrudService:
     """Service class for journal CRUD operations"""
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.versions = JournalVersionStore(session)
 
     @handle_service_errors("journal creation")
     async def create_journal(
@@ -62,6 +66,9 @@ class JournalCrudService:
         )
         
         created_journal = result.fetchone()
+        await self.versions.record(
+            journal_id, 1, created_journal.title, journal_data.content or "", None, created_by
+        )
         
         return JournalDetailResponse(
             id=str(created_journal.id),
@@ -180,12 +187,20 @@ class JournalCrudService:
             set_clauses.append("is_public = :is_public")
             params["is_public"] = journal_data.is_public
         
+        # The FROM subquery sees the row as it was before the update, which
+        # the version store needs to diff against
         result = await self.session.execute(
             text(f"""
                 UPDATE journals 
                 SET {', '.join(set_clauses)}
-                WHERE id = :journal_id AND deleted_at IS NULL
-                RETURNING id, title, status, updated_at, version
+                FROM (
+                    SELECT id, content FROM journals
+                    WHERE id = :journal_id AND deleted_at IS NULL
+                    FOR UPDATE
+                ) previous
+                WHERE journals.id = previous.id
+                RETURNING journals.id, journals.title, journals.status, journals.updated_at,
+                          journals.version, previous.content AS previous_content
             """),
             params
         )
@@ -194,6 +209,16 @@ class JournalCrudService:
         if not updated_journal:
             raise HTTPException(status_code=404, detail="Journal not found")
         
+        previous_content = updated_journal.previous_content or ""
+        await self.versions.record(
+            journal_id,
+            updated_journal.version,
+            updated_journal.title,
+            journal_data.content if journal_data.content is not None else previous_content,
+            previous_content,
+            updated_by
+        )
+        
         # Return updated journal
         return await self.get_journal(journal_id)
 
@@ -229,7 +254,7 @@ class JournalCrudService:
         status_filter: Optional[JournalStatus] = None,
         search_query: Optional[str] = None
     ) -> JournalListResponse:
-        """List journals for a project"""
+        """List journals for a project; entries carry an excerpt instead of content"""
         # Build where clause with named parameters
         where_clauses = ["j.project_id = :project_id", "j.deleted_at IS NULL"]
         params = {"project_id": project_id}
@@ -239,8 +264,10 @@ class JournalCrudService:
             params["status_filter"] = status_filter.value
         
         if search_query:
+            # Served by the trigram indexes on title and content
+            escaped = search_query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
             where_clauses.append("(j.title ILIKE :search_term OR j.content ILIKE :search_term)")
-            params["search_term"] = f"%{search_query}%"
+            params["search_term"] = f"%{escaped}%"
         
         # Get total count
         count_result = await self.session.execute(
@@ -255,10 +282,11 @@ class JournalCrudService:
         total_count = count_result.scalar()
         
         # Get journals with pagination
-        params.update({"limit": limit, "offset": offset})
+        params.update({"limit": limit, "offset": offset, "excerpt_length": EXCERPT_LENGTH})
         journals_result = await self.session.execute(
             text(f"""
-                SELECT j.id, j.project_id, j.title, j.content, j.status, j.is_public, 
+                SELECT j.id, j.project_id, j.title, LEFT(j.content, :excerpt_length) AS excerpt,
+                       j.status, j.is_public, 
                        j.created_by, j.version, j.created_at, j.updated_at, j.metadata,
                        u.name as created_by_name
                 FROM journals j
@@ -272,15 +300,16 @@ class JournalCrudService:
         
         journals = []
         for row in journals_result.fetchall():
-            journals.append(JournalResponse(
+            journals.append(JournalSummaryResponse(
                 id=str(row.id),
                 project_id=str(row.project_id),
                 title=row.title,
-                content=row.content or "",
+                excerpt=row.excerpt or "",
                 status=row.status,
                 is_public=row.is_public,
                 metadata=row.metadata if row.metadata else {},
                 created_by=str(row.created_by),
+                creator_name=row.created_by_name,
                 version=row.version,
                 created_at=row.created_at,
                 updated_at=row.updated_at
@@ -296,4 +325,93 @@ class JournalCrudService:
             page=page,
             per_page=limit,
             total_pages=total_pages
-        ) 
\ No newline at end of file
+        )
+
+    @handle_service_errors("bulk journal update")
+    async def bulk_update_journals(
+        self,
+        journal_ids: List[uuid.UUID],
+        journal_data: JournalUpdate,
+        updated_by: uuid.UUID
+    ) -> List[uuid.UUID]:
+        """
+        Set status and/or visibility on many journals with one UPDATE.
+
+        Title and content are per-journal and not applied in bulk. Every
+        updated journal gets a version bump and a history entry, as with
+        ``update_journal``.
+
+        Args:
+            journal_ids: Journals to update
+            journal_data: Status and/or visibility to set
+            updated_by: User making the change
+
+        Returns:
+            IDs of the journals that were updated
+        """
+        set_clauses = ["updated_at = :updated_at", "version = version + 1"]
+        params = {"updated_at": datetime.utcnow(), "journal_ids": list(journal_ids)}
+        changes = []
+
+        if journal_data.status is not None:
+            set_clauses.append("status = :status")
+            params["status"] = journal_data.status.value if hasattr(journal_data.status, 'value') else journal_data.status
+            changes.append(f"status set to {params['status']}")
+
+        if journal_data.is_public is not None:
+            set_clauses.append("is_public = :is_public")
+            params["is_public"] = journal_data.is_public
+            changes.append("made public" if journal_data.is_public else "made private")
+
+        if not changes or not journal_ids:
+            return []
+
+        result = await self.session.execute(
+            text(f"""
+                UPDATE journals
+                SET {', '.join(set_clauses)}
+                WHERE id = ANY(:journal_ids) AND deleted_at IS NULL
+                RETURNING id
+            """),
+            params
+        )
+        updated_ids = [row.id for row in result.fetchall()]
+
+        await self.versions.record_unchanged_content(
+            updated_ids, updated_by, "Bulk update: " + ", ".join(changes)
+        )
+        return updated_ids
+
+    @handle_service_errors("bulk journal deletion")
+    async def bulk_delete_journals(
+        self,
+        journal_ids: List[uuid.UUID],
+        deleted_by: uuid.UUID
+    ) -> List[uuid.UUID]:
+        """
+        Soft delete many journals with one UPDATE.
+
+        Args:
+            journal_ids: Journals to delete
+            deleted_by: User deleting them
+
+        Returns:
+            IDs of the journals that were deleted
+        """
+        if not journal_ids:
+            return []
+
+        result = await self.session.execute(
+            text("""
+                UPDATE journals
+                SET deleted_at = :deleted_at, deleted_by = :deleted_by
+                WHERE id = ANY(:journal_ids) AND deleted_at IS NULL
+                RETURNING id
+            """),
+            {
+                "deleted_at": datetime.utcnow(),
+                "deleted_by": deleted_by,
+                "journal_ids": list(journal_ids)
+            }
+        )
+        return [row.id for row in result.fetchall()]
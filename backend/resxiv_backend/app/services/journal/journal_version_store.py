@@ -0,0 +1,296 @@
+"""
+Journal Version Store - L6 Engineering Standards
+Delta-compressed journal history.
+Single Responsibility: Writing and reconstructing journal versions.
+
+- Every version bump writes one ``journal_versions`` row
+- A row is either a keyframe holding the full content, or a compact
+  line-level delta against the previous version
+- A keyframe is written at least every ``KEYFRAME_INTERVAL`` versions, when
+  the history has a gap, or when the delta would not be smaller than the
+  content, so reading any version applies a bounded number of deltas
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.error_handling import ServiceError, ErrorCodes
+from app.models.journal_models import JournalVersionResponse, JournalVersionSummary
+
+logger = logging.getLogger(__name__)
+
+KEYFRAME_INTERVAL = 20
+
+
+def encode_delta(base: str, target: str) -> List[Any]:
+    """
+    Line-level edit script turning ``base`` into ``target``.
+
+    A positive int copies that many lines from ``base``, a negative int
+    skips that many, and a list of strings inserts those lines.
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    ops: List[Any] = []
+    matcher = SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(i1 - i2)
+        if j2 > j1:
+            ops.append(target_lines[j1:j2])
+    return ops
+
+
+def apply_delta(base: str, ops: List[Any]) -> str:
+    """Rebuild the content an ``encode_delta`` script was made for."""
+    base_lines = base.splitlines(keepends=True)
+    position = 0
+    result: List[str] = []
+    for op in ops:
+        if isinstance(op, list):
+            result.extend(op)
+        elif op > 0:
+            result.extend(base_lines[position:position + op])
+            position += op
+        else:
+            position -= op
+    return "".join(result)
+
+
+class JournalVersionStore:
+    """Keyframe plus delta storage for journal versions"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    # ================================
+    # WRITES
+    # ================================
+
+    async def record(
+        self,
+        journal_id: uuid.UUID,
+        version_number: int,
+        title: str,
+        content: str,
+        previous_content: Optional[str],
+        changed_by: uuid.UUID,
+        change_summary: Optional[str] = None
+    ) -> None:
+        """
+        Store a new version of a journal.
+
+        Args:
+            journal_id: Journal the version belongs to
+            version_number: Version being written
+            title: Journal title at this version
+            content: Journal content at this version
+            previous_content: Content of ``version_number - 1``; None for a new journal
+            changed_by: User who made the change
+            change_summary: Optional description of the change
+        """
+        delta = None
+        if previous_content is not None and await self._can_append_delta(journal_id, version_number):
+            ops = encode_delta(previous_content, content)
+            encoded = json.dumps(ops, separators=(",", ":"))
+            if len(encoded) < len(content):
+                delta = encoded
+
+        await self.session.execute(
+            text("""
+                INSERT INTO journal_versions (
+                    id, journal_id, version_number, title, content, delta,
+                    is_keyframe, changed_by, change_summary, created_at
+                )
+                VALUES (
+                    :id, :journal_id, :version_number, :title, :content, CAST(:delta AS JSONB),
+                    :is_keyframe, :changed_by, :change_summary, :created_at
+                )
+                ON CONFLICT (journal_id, version_number) DO NOTHING
+            """),
+            {
+                "id": uuid.uuid4(),
+                "journal_id": journal_id,
+                "version_number": version_number,
+                "title": title,
+                "content": content if delta is None else None,
+                "delta": delta,
+                "is_keyframe": delta is None,
+                "changed_by": changed_by,
+                "change_summary": change_summary,
+                "created_at": datetime.utcnow()
+            }
+        )
+
+    async def record_unchanged_content(
+        self,
+        journal_ids: List[uuid.UUID],
+        changed_by: uuid.UUID,
+        change_summary: Optional[str] = None
+    ) -> None:
+        """
+        Store the current version of many journals whose content did not change.
+
+        One INSERT ... SELECT applies the same keyframe rules as ``record``
+        using each journal's current row. An unchanged version's delta is a
+        single copy op; ``length(content)`` is never less than the line
+        count, and ``apply_delta`` stops at the end of the base.
+
+        Args:
+            journal_ids: Journals that were just bumped to a new version
+            changed_by: User who made the change
+            change_summary: Optional description of the change
+        """
+        if not journal_ids:
+            return
+
+        await self.session.execute(
+            text("""
+                INSERT INTO journal_versions (
+                    id, journal_id, version_number, title, content, delta,
+                    is_keyframe, changed_by, change_summary, created_at
+                )
+                SELECT
+                    gen_random_uuid(), c.id, c.version, c.title,
+                    CASE WHEN c.use_delta THEN NULL ELSE c.content END,
+                    CASE WHEN c.use_delta THEN c.delta END,
+                    NOT c.use_delta, :changed_by, :change_summary, :created_at
+                FROM (
+                    SELECT
+                        j.id, j.version, j.title, j.content,
+                        jsonb_build_array(length(j.content)) AS delta,
+                        COALESCE(
+                            h.latest = j.version - 1
+                            AND j.version - h.keyframe < :keyframe_interval
+                            AND length(CAST(jsonb_build_array(length(j.content)) AS TEXT)) < length(j.content),
+                            FALSE
+                        ) AS use_delta
+                    FROM journals j
+                    LEFT JOIN (
+                        SELECT journal_id,
+                               MAX(version_number) AS latest,
+                               MAX(version_number) FILTER (WHERE is_keyframe) AS keyframe
+                        FROM journal_versions
+                        WHERE journal_id = ANY(:journal_ids)
+                        GROUP BY journal_id
+                    ) h ON h.journal_id = j.id
+                    WHERE j.id = ANY(:journal_ids)
+                ) c
+                ON CONFLICT (journal_id, version_number) DO NOTHING
+            """),
+            {
+                "journal_ids": list(journal_ids),
+                "changed_by": changed_by,
+                "change_summary": change_summary,
+                "keyframe_interval": KEYFRAME_INTERVAL,
+                "created_at": datetime.utcnow()
+            }
+        )
+
+    async def _can_append_delta(self, journal_id: uuid.UUID, version_number: int) -> bool:
+        result = await self.session.execute(
+            text("""
+                SELECT MAX(version_number) AS latest,
+                       MAX(version_number) FILTER (WHERE is_keyframe) AS keyframe
+                FROM journal_versions
+                WHERE journal_id = :journal_id
+            """),
+            {"journal_id": journal_id}
+        )
+        row = result.fetchone()
+        if row is None or row.latest != version_number - 1 or row.keyframe is None:
+            return False
+        return version_number - row.keyframe < KEYFRAME_INTERVAL
+
+    # ================================
+    # READS
+    # ================================
+
+    async def list_versions(self, journal_id: uuid.UUID) -> List[JournalVersionSummary]:
+        """Version metadata, newest first; content is not reconstructed"""
+        result = await self.session.execute(
+            text("""
+                SELECT jv.id, jv.journal_id, jv.version_number, jv.title,
+                       jv.changed_by, jv.change_summary, jv.created_at,
+                       u.name AS changed_by_name
+                FROM journal_versions jv
+                LEFT JOIN users u ON jv.changed_by = u.id
+                WHERE jv.journal_id = :journal_id
+                ORDER BY jv.version_number DESC
+            """),
+            {"journal_id": journal_id}
+        )
+        return [
+            JournalVersionSummary(
+                id=row.id,
+                journal_id=row.journal_id,
+                version_number=row.version_number,
+                title=row.title,
+                changed_by=row.changed_by,
+                change_summary=row.change_summary,
+                created_at=row.created_at,
+                changed_by_name=row.changed_by_name
+            )
+            for row in result.fetchall()
+        ]
+
+    async def get_version(self, journal_id: uuid.UUID, version_number: int) -> Optional[JournalVersionResponse]:
+        """Rebuild one version from its nearest keyframe"""
+        result = await self.session.execute(
+            text("""
+                SELECT jv.id, jv.journal_id, jv.version_number, jv.title, jv.content,
+                       jv.delta, jv.is_keyframe, jv.changed_by, jv.change_summary,
+                       jv.created_at, u.name AS changed_by_name
+                FROM journal_versions jv
+                LEFT JOIN users u ON jv.changed_by = u.id
+                WHERE jv.journal_id = :journal_id
+                  AND jv.version_number <= :version_number
+                  AND jv.version_number >= (
+                      SELECT MAX(version_number) FROM journal_versions
+                      WHERE journal_id = :journal_id AND is_keyframe
+                        AND version_number <= :version_number
+                  )
+                ORDER BY jv.version_number
+            """),
+            {"journal_id": journal_id, "version_number": version_number}
+        )
+        chain = result.fetchall()
+        if not chain or chain[-1].version_number != version_number:
+            return None
+
+        content = self._rebuild(chain)
+        row = chain[-1]
+        return JournalVersionResponse(
+            id=row.id,
+            journal_id=row.journal_id,
+            version_number=row.version_number,
+            title=row.title,
+            content=content,
+            changed_by=row.changed_by,
+            change_summary=row.change_summary,
+            created_at=row.created_at,
+            changed_by_name=row.changed_by_name
+        )
+
+    @staticmethod
+    def _rebuild(chain) -> str:
+        content = chain[0].content or ""
+        for previous, row in zip(chain, chain[1:]):
+            if row.version_number != previous.version_number + 1:
+                raise ServiceError(
+                    f"Journal history is missing version {previous.version_number + 1}",
+                    ErrorCodes.INTERNAL_ERROR
+                )
+            ops = json.loads(row.delta) if isinstance(row.delta, str) else row.delta
+            content = apply_delta(content, ops)
+        return content
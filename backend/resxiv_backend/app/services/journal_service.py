@@ -15,13 +15,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.journal_models import (
     JournalCreate, JournalUpdate, JournalResponse, JournalDetailResponse,
     JournalCollaboratorCreate, JournalCollaboratorResponse,
-    JournalListResponse, JournalPermissionCheck, PermissionType, JournalStatus
+    JournalListResponse, JournalPermissionCheck, PermissionType, JournalStatus,
+    JournalVersionResponse, JournalVersionSummary,
+    BulkJournalOperation, BulkOperationResult
 )
 from .journal.journal_crud_service import JournalCrudService
 from .journal.journal_collaboration_service import JournalCollaborationService
 
 logger = logging.getLogger(__name__)
 
+# operation -> (required permission, update to apply or None to delete, success message)
+BULK_OPERATIONS = {
+    "delete": ("can_admin", None, "Journal deleted"),
+    "archive": ("can_write", JournalUpdate(status=JournalStatus.ARCHIVED), "Journal archived"),
+    "publish": ("can_write", JournalUpdate(status=JournalStatus.PUBLISHED), "Journal published"),
+    "make_public": ("can_admin", JournalUpdate(is_public=True), "Journal made public"),
+    "make_private": ("can_admin", JournalUpdate(is_public=False), "Journal made private")
+}
+
 
 class JournalService:
     """Unified journal service that delegates to specialized modules"""
@@ -49,6 +60,13 @@ class JournalService:
                                   search_query: Optional[str] = None) -> JournalListResponse:
         return await self.crud_service.list_project_journals(project_id, limit, offset, status_filter, search_query)
 
+    # Version Operations (delegate to the CRUD service's version store)
+    async def get_journal_versions(self, journal_id: uuid.UUID) -> List[JournalVersionSummary]:
+        return await self.crud_service.versions.list_versions(journal_id)
+
+    async def get_journal_version(self, journal_id: uuid.UUID, version_number: int) -> Optional[JournalVersionResponse]:
+        return await self.crud_service.versions.get_version(journal_id, version_number)
+
     # Collaboration Operations (delegate to JournalCollaborationService)
     async def check_journal_permission(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> JournalPermissionCheck:
         return await self.collaboration_service.check_journal_permission(journal_id, user_id)
@@ -68,4 +86,45 @@ class JournalService:
         return await self.collaboration_service.list_collaborators(journal_id)
 
     async def get_user_accessible_journals(self, user_id: uuid.UUID, project_id: Optional[uuid.UUID] = None) -> List[Dict[str, Any]]:
-        return await self.collaboration_service.get_user_accessible_journals(user_id, project_id) 
\ No newline at end of file
+        return await self.collaboration_service.get_user_accessible_journals(user_id, project_id) 
+
+    # Bulk Operations
+    async def bulk_journal_operation(self, operation: BulkJournalOperation, user_id: uuid.UUID) -> BulkOperationResult:
+        """
+        Apply one operation to many journals with set-based queries.
+
+        Permissions for every journal are resolved in one query and each
+        operation is a single UPDATE over the permitted journals, so the
+        number of round trips does not depend on the number of journals.
+        """
+        required, update, message = BULK_OPERATIONS[operation.operation]
+        journal_ids = list(dict.fromkeys(operation.journal_ids))
+        permissions = await self.collaboration_service.get_journal_permissions(journal_ids, user_id)
+
+        permitted = [
+            journal_id for journal_id in journal_ids
+            if journal_id in permissions and getattr(permissions[journal_id], required)
+        ]
+        if update is None:
+            applied = await self.crud_service.bulk_delete_journals(permitted, user_id)
+        else:
+            applied = await self.crud_service.bulk_update_journals(permitted, update, user_id)
+        applied = set(applied)
+
+        results = []
+        for journal_id in journal_ids:
+            if journal_id in applied:
+                results.append({"journal_id": str(journal_id), "status": "success", "message": message})
+            elif journal_id not in permissions or journal_id in permitted:
+                # Permitted but not applied: deleted since the permission check
+                results.append({"journal_id": str(journal_id), "status": "failed", "reason": "Journal not found"})
+            else:
+                results.append({"journal_id": str(journal_id), "status": "failed", "reason": "Insufficient permissions"})
+
+        return BulkOperationResult(
+            operation=operation.operation,
+            total_requested=len(journal_ids),
+            successful=len(applied),
+            failed=len(results) - len(applied),
+            results=results
+        )
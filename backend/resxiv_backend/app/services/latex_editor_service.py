@@ -6,23 +6,25 @@ Supports both text-based and image-based input for LaTeX content editing.
 """
 
 import time
+import json
 import uuid
 import logging
 import base64
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-from openai import AsyncOpenAI
 from fastapi import UploadFile
 from PIL import Image
 import io
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.config.settings import get_settings
+from app.core.llm_gateway import llm_gateway
+from app.core.llm_cache import llm_response_cache
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
 from app.repositories.conversation_repository import ConversationRepository
 from app.models.conversation_models import ConversationType
-from app.database.mongodb import get_mongodb_database
+from app.database.connection import get_mongodb_database
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +36,14 @@ class LaTeXEditorService:
     Supports research-focused editing with project context and conversation management.
     """
     
+    # Bump when the edit prompts or expected response shape change
+    PROMPT_VERSION = "latex-edit-v1"
+    
     def __init__(self, session: AsyncSession):
         self.session = session
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.agentic.openai_api_key)
+        self.llm = llm_gateway
+        self.cache = llm_response_cache
         self.model = "gpt-4o-mini"
         self.conversation_repo = ConversationRepository(session)
         self.mongo_db = None
@@ -98,7 +104,7 @@ class LaTeXEditorService:
             
             # Extract LaTeX content from image if provided
             if image_file and not latex_content:
-                latex_content = await self._extract_latex_from_image(image_file)
+                latex_content = await self._extract_latex_from_image(image_file, project_id)
             
             # Validate input
             if not latex_content and not image_file:
@@ -111,7 +117,8 @@ class LaTeXEditorService:
             edit_result = await self._generate_latex_edit(
                 prompt=prompt,
                 latex_content=latex_content,
-                edit_type=edit_type
+                edit_type=edit_type,
+                project_id=project_id
             )
             
             # Store conversation message
@@ -153,7 +160,7 @@ class LaTeXEditorService:
                 ErrorCodes.AGENTIC_PROCESSING_ERROR
             )
     
-    async def _extract_latex_from_image(self, image_file: UploadFile) -> str:
+    async def _extract_latex_from_image(self, image_file: UploadFile, project_id: Optional[str] = None) -> str:
         """Extract LaTeX content from uploaded image using GPT-4o mini vision."""
         try:
             # Read and validate image
@@ -166,8 +173,9 @@ class LaTeXEditorService:
             image_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
             
             # Use GPT-4o mini vision to extract LaTeX
-            response = await self.client.chat.completions.create(
+            response = await self.llm.chat_completion(
                 model=self.model,
+                project_id=project_id,
                 messages=[
                     {
                         "role": "system",
@@ -208,7 +216,8 @@ class LaTeXEditorService:
         self,
         prompt: str,
         latex_content: str,
-        edit_type: str
+        edit_type: str,
+        project_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Generate edited LaTeX content using GPT-4o mini."""
         
@@ -250,9 +259,10 @@ Focus on research-quality improvements such as:
 - Figure and table integration
 - Cross-referencing consistency"""
 
-        try:
-            response = await self.client.chat.completions.create(
+        async def generate() -> str:
+            response = await self.llm.chat_completion(
                 model=self.model,
+                project_id=project_id,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
@@ -260,18 +270,20 @@ Focus on research-quality improvements such as:
                 max_tokens=4000,
                 temperature=0.3  # Lower temperature for more consistent edits
             )
+            content = response.choices[0].message.content
+            # Raise before the cache stores a reply that is not valid JSON
+            self._parse_edit_response(content)
+            return content
+        
+        try:
+            # Only identical content and instructions reuse an edit: opposite
+            # instructions ("shorter"/"longer") can embed as near-duplicates
+            response_content = await self.cache.get_or_generate(
+                self.cache.make_key(self.model, self.PROMPT_VERSION, system_prompt, user_prompt),
+                generate
+            )
             
-            # Parse JSON response
-            import json
-            response_content = response.choices[0].message.content.strip()
-            
-            # Extract JSON from response (handle potential markdown formatting)
-            if "```json" in response_content:
-                json_start = response_content.find("```json") + 7
-                json_end = response_content.rfind("```")
-                response_content = response_content[json_start:json_end].strip()
-            
-            result = json.loads(response_content)
+            result = self._parse_edit_response(response_content)
             
             # Validate response structure
             required_keys = ["edited_content", "changes_made", "suggestions"]
@@ -293,9 +305,22 @@ Focus on research-quality improvements such as:
             logger.error(f"Failed to generate LaTeX edit: {e}")
             raise ServiceError(
                 "Failed to generate edited content",
-                ErrorCodes.AI_PROCESSING_ERROR
+                ErrorCodes.PROCESSING_ERROR
             )
-    
+
+    @staticmethod
+    def _parse_edit_response(response_content: str) -> Dict[str, Any]:
+        """Parse an edit reply, unwrapping a ```json fence; raises JSONDecodeError"""
+        response_content = response_content.strip()
+
+        # Extract JSON from response (handle potential markdown formatting)
+        if "```json" in response_content:
+            json_start = response_content.find("```json") + 7
+            json_end = response_content.rfind("```")
+            response_content = response_content[json_start:json_end].strip()
+
+        return json.loads(response_content)
+
     async def _store_editing_conversation(
         self,
         conversation_id: str,
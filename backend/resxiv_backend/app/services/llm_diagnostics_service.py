@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 class LLMDiagnosticsService:
     """Service for generating paper diagnostics using LLM models"""
     
+    # Bump when the prompt or expected response shape changes
+    PROMPT_VERSION = "llm-diagnostics-v1"
+    
     def __init__(self, model_type: str = "openai", model_name: str = None):
         """
         Initialize the LLM diagnostics service
@@ -36,30 +39,25 @@ class LLMDiagnosticsService:
             else:  # ollama
                 self.model_name = "llama3.2:latest"
         
-        # Initialize clients
-        self.openai_client = None
+        # Initialize LLM gateway
+        self.llm = None
         self.ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         
         if self.model_type == "openai":
             self._initialize_openai()
     
     def _initialize_openai(self) -> None:
-        """Initialize OpenAI client"""
-        try:
-            import openai
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY environment variable is required")
-            
-            self.openai_client = openai.AsyncOpenAI(api_key=api_key)
-            logger.info("OpenAI client initialized successfully")
-            
-        except ImportError:
-            logger.error("OpenAI library not installed. Install with: pip install openai")
-            raise
-        except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {str(e)}")
-            raise
+        """Attach the shared LLM gateway"""
+        from app.core.llm_gateway import llm_gateway
+        from app.core.llm_cache import llm_response_cache
+        
+        if not llm_gateway.api_key:
+            logger.error("Failed to initialize OpenAI client: OPENAI_API_KEY is not configured")
+            raise ValueError("OPENAI_API_KEY environment variable is required")
+        
+        self.llm = llm_gateway
+        self.cache = llm_response_cache
+        logger.info("LLM gateway attached for diagnostics")
     
     async def generate_diagnostics(
         self,
@@ -169,25 +167,35 @@ class LLMDiagnosticsService:
             # Create prompt for diagnostics
             prompt = self._create_diagnostics_prompt(include_sections)
             
-            response = await self.openai_client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": content
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for more consistent output
-                max_tokens=2000,
-                response_format={"type": "json_object"}
-            )
+            messages = [
+                {
+                    "role": "system",
+                    "content": prompt
+                },
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ]
+            
+            async def generate() -> str:
+                response = await self.llm.chat_completion(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=0.3,  # Lower temperature for more consistent output
+                    max_tokens=2000,
+                    response_format={"type": "json_object"}
+                )
+                content = response.choices[0].message.content
+                # Raise before the cache stores a truncated or invalid reply
+                json.loads(content)
+                return content
+            
+            # Identical extracted text and sections reuse the previous analysis
+            cache_key = self.cache.make_key(self.model_name, self.PROMPT_VERSION, messages)
+            result_text = await self.cache.get_or_generate(cache_key, generate)
             
             # Parse the JSON response
-            result_text = response.choices[0].message.content
             result = json.loads(result_text)
             
             return result
@@ -440,7 +448,7 @@ Important guidelines:
         try:
             if self.model_type == "openai":
                 # Test OpenAI API
-                response = await self.openai_client.chat.completions.create(
+                response = await self.llm.chat_completion(
                     model=self.model_name,
                     messages=[{"role": "user", "content": "Test"}],
                     max_tokens=5
@@ -173,34 +173,6 @@ class MessageReactionsService:
             "total_reactions": len(reactions)
         }
     
-    @handle_service_errors("add read receipt")
-    async def add_read_receipt(
-        self,
-        message_id: str,
-        user_id: uuid.UUID
-    ) -> Dict[str, Any]:
-        """
-        Add read receipt for a message.
-        
-        Args:
-            message_id: Message being read
-            user_id: User reading the message
-            
-        Returns:
-            Success response
-        """
-        # Add read receipt
-        await self.message_repo.add_read_receipt(
-            message_id=message_id,
-            user_id=user_id,
-            read_at=datetime.utcnow()
-        )
-        
-        return {
-            "success": True,
-            "message_text": "Read receipt added"
-        }
-    
     @handle_service_errors("get read receipts")
     async def get_read_receipts(
         self,
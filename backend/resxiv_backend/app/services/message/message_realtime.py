@@ -5,7 +5,7 @@ Focused on real-time messaging features: WebSocket, Redis pub/sub, typing indica
 
 import uuid
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any
 from datetime import datetime, timedelta
 
 from app.services.redis_service import RedisService
@@ -132,12 +132,11 @@ class MessageRealtimeService:
             conversation_id
         )
         
-        # Update unread counts for all except sender
-        for participant_id in participants:
-            if participant_id != sender_id:
-                await self.redis_service.increment_unread_count(
-                    conversation_id, participant_id
-                )
+        # Update unread counts for all except sender in a single pipeline
+        await self.redis_service.increment_unread_counts(
+            conversation_id,
+            [pid for pid in participants if pid != str(sender_id)]
+        )
         
         return {
             "success": True,
@@ -149,28 +148,25 @@ class MessageRealtimeService:
         self,
         conversation_id: uuid.UUID,
         user_id: uuid.UUID,
-        message_ids: Optional[List[str]] = None
+        remaining_unread: int = 0
     ) -> Dict[str, Any]:
         """
-        Mark messages as read for a user.
+        Sync the cached unread counter after a read cursor moved.
         
         Args:
             conversation_id: Target conversation
             user_id: User marking messages as read
-            message_ids: Specific messages to mark (optional)
+            remaining_unread: Messages still unread after the cursor update
             
         Returns:
             Success response
         """
-        if message_ids:
-            # Mark specific messages as read
-            for message_id in message_ids:
-                await self.redis_service.mark_message_read(
-                    conversation_id, user_id, message_id
-                )
+        if remaining_unread > 0:
+            await self.redis_service.set_unread_count(
+                conversation_id, user_id, remaining_unread
+            )
         else:
-            # Mark all messages in conversation as read
-            await self.redis_service.clear_unread_count(conversation_id, user_id)
+            await self.redis_service.reset_unread_count(conversation_id, user_id)
         
         return {
             "success": True,
@@ -191,18 +187,15 @@ class MessageRealtimeService:
         Returns:
             Conversation status data
         """
-        # Get typing indicators
-        typing_users = await self.redis_service.get_typing_users(conversation_id)
-        
-        # Get online participants
         participants = await self.redis_service.get_conversation_participants(
             conversation_id
         )
-        online_users = []
-        for user_id in participants:
-            is_online = await self.redis_service.is_user_online(user_id)
-            if is_online:
-                online_users.append(user_id)
+        
+        # Typing indicators and presence are each one MGET over all participants
+        typing_users = await self.redis_service.get_typing_users(
+            conversation_id, participants
+        )
+        online_users = await self.redis_service.get_online_user_ids(participants)
         
         return {
             "success": True,
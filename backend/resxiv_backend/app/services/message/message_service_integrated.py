@@ -11,10 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.connection import DatabaseManager
 from app.services.redis_service import RedisService
 from app.repositories.message_repository import MessageRepository
+from app.repositories.conversation_inbox_repository import ConversationInboxRepository
 from app.services.message.message_core import MessageCoreService
 from app.services.message.message_realtime import MessageRealtimeService
 from app.services.message.message_reactions import MessageReactionsService
-from app.core.error_handling import handle_service_errors
+from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.utils.mongodb_utils import validate_object_id
 from app.models.conversation_models import (
     MessageCreate, MessageUpdate, MessageReactionCreate
 )
@@ -47,6 +49,7 @@ class MessageService:
         
         # Initialize repositories
         self.message_repo = MessageRepository(db_manager)
+        self.inbox_repo = ConversationInboxRepository(session)
         
         # Initialize specialized services
         self.core_service = MessageCoreService(session, self.message_repo)
@@ -75,6 +78,18 @@ class MessageService:
         )
         
         if result["success"]:
+            message = result["message"]
+            await self._sync_inbox(
+                self.inbox_repo.record_message(
+                    conversation_id,
+                    message.id,
+                    sender_id,
+                    message.message,
+                    message.created_at,
+                    sender_name
+                )
+            )
+            
             # Publish to real-time subscribers
             await self.realtime_service.publish_message(
                 conversation_id, result["message"]
@@ -121,8 +136,63 @@ class MessageService:
     async def update_online_status(self, user_id: uuid.UUID, is_online: bool):
         return await self.realtime_service.update_online_status(user_id, is_online)
     
-    async def mark_messages_read(self, conversation_id: uuid.UUID, user_id: uuid.UUID, message_ids: Optional[List[str]] = None):
-        return await self.realtime_service.mark_messages_read(conversation_id, user_id, message_ids)
+    @handle_service_errors("mark messages read")
+    async def mark_messages_read(
+        self,
+        conversation_id: Optional[uuid.UUID],
+        user_id: uuid.UUID,
+        message_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Mark messages as read by advancing the user's read cursor.
+        
+        Reading a message implies reading everything before it, so only the
+        newest of ``message_ids`` is persisted as the high-water mark.
+        """
+        up_to_message_id = None
+        if message_ids:
+            up_to_message_id = str(max(validate_object_id(m, "Message ID") for m in message_ids))
+            message = await self.message_repo.get_message_by_id(up_to_message_id)
+            if not message or (
+                conversation_id is not None and str(message.conversation_id) != str(conversation_id)
+            ):
+                raise ServiceError("Message not found", ErrorCodes.NOT_FOUND, status_code=404)
+            conversation_id = message.conversation_id
+        
+        marked_count = await self.message_repo.mark_conversation_read(
+            conversation_id, user_id, up_to_message_id
+        )
+        remaining_unread = await self.message_repo.get_unread_count(conversation_id, user_id)
+        await self._sync_inbox(
+            self.inbox_repo.set_unread_count(conversation_id, user_id, remaining_unread)
+        )
+        await self.realtime_service.mark_messages_read(
+            conversation_id, user_id, remaining_unread
+        )
+        
+        return {
+            "success": True,
+            "conversation_id": str(conversation_id),
+            "marked_count": marked_count,
+            "unread_count": remaining_unread,
+            "message_text": "Messages marked as read"
+        }
+    
+    async def _sync_inbox(self, update) -> None:
+        """
+        Commit a conversation inbox update.
+        
+        The message itself already lives in MongoDB, so an inbox failure is
+        logged rather than surfaced - failing the request would invite a
+        retry that duplicates the message. The next message or read
+        overwrites the stale snapshot.
+        """
+        try:
+            await update
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            logger.warning(f"Failed to update conversation inbox: {e}")
     
     async def get_conversation_status(self, conversation_id: uuid.UUID):
         return await self.realtime_service.get_conversation_status(conversation_id)
@@ -138,7 +208,8 @@ class MessageService:
         return await self.reactions_service.get_message_reactions(message_id)
     
     async def add_read_receipt(self, message_id: str, user_id: uuid.UUID):
-        return await self.reactions_service.add_read_receipt(message_id, user_id)
+        # A receipt moves the read cursor, so it must sync the unread counters too
+        return await self.mark_messages_read(None, user_id, [message_id])
     
     # Convenience methods for endpoint compatibility
     async def add_message_reaction(self, message_id: str, user_id: uuid.UUID, reaction_data: MessageReactionCreate):
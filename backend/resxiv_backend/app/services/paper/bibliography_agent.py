@@ -9,17 +9,18 @@ Implements L6 engineering standards with comprehensive error handling and recove
 import asyncio
 import aiohttp
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional, TypedDict
+from typing import Dict, Any, List, Optional, Tuple, TypedDict
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
+import time
 import urllib.parse
 from datetime import datetime
 
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from app.core.error_handling import ServiceError, ErrorCodes
+from .reference_cache import ReferenceCache, reference_cache, reference_keys, normalize_arxiv_id
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ class EnrichmentResult:
     doi: Optional[str] = None
     confidence: float = 0.0
     source: str = ""
+    failed: bool = False  # the source errored, as opposed to finding nothing
 
 
 class BibliographyEnrichmentAgent:
@@ -58,17 +60,53 @@ class BibliographyEnrichmentAgent:
     Implements a state machine for robust metadata extraction:
     1. Parse reference text
     2. Extract IDs (arXiv, DOI)
-    3. Query external APIs (parallel)
+    3. Check the shared reference cache, then query external APIs
     4. Merge results with confidence scoring
     5. Generate BibTeX entry
+    
+    ``enrich_references`` runs the same steps for a whole bibliography with
+    one cache round trip and batched arXiv queries. Use the agent as an async
+    context manager so its HTTP session is closed.
     """
     
-    def __init__(self, timeout: int = 10):
+    ARXIV_BATCH_SIZE = 50
+    ARXIV_BACKOFF_SECONDS = 3.0
+    
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_concurrency: int = 5,
+        cache: Optional[ReferenceCache] = None
+    ):
         """Initialize agent with configurable timeout."""
         self.timeout = timeout
         self.session_timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_concurrency = max_concurrency
+        self.cache = cache or reference_cache
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._arxiv_retry_at = 0.0
         self._build_graph()
     
+    async def __aenter__(self) -> "BibliographyEnrichmentAgent":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, so lookups reuse pooled connections."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.session_timeout,
+                connector=aiohttp.TCPConnector(limit_per_host=self.max_concurrency)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
     def _build_graph(self) -> None:
         """Build LangGraph state machine for bibliography enrichment."""
         workflow = StateGraph(BibliographyState)
@@ -86,9 +124,8 @@ class BibliographyEnrichmentAgent:
         workflow.add_edge("enrich_metadata", "generate_bibtex")
         workflow.add_edge("generate_bibtex", END)
         
-        # Compile with memory for state persistence
-        memory = MemorySaver()
-        self.graph = workflow.compile(checkpointer=memory)
+        # One-shot runs: no checkpointer, so state is not retained per reference
+        self.graph = workflow.compile()
     
     async def enrich_reference(self, reference_text: str, ref_num: int) -> Optional[str]:
         """
@@ -104,7 +141,89 @@ class BibliographyEnrichmentAgent:
         if not reference_text or len(reference_text.strip()) < 10:
             return None
         
-        initial_state: BibliographyState = {
+        try:
+            result = await self.graph.ainvoke(self._initial_state(reference_text))
+            return result.get("final_entry")
+            
+        except Exception as e:
+            logger.error(f"Bibliography enrichment failed for reference {ref_num}: {e}")
+            return None
+    
+    async def enrich_references(self, references: List[str]) -> List[Optional[str]]:
+        """
+        Enrich a whole bibliography.
+        
+        All references are parsed first, then resolved from the shared cache
+        in one round trip; only the misses go upstream, with arXiv IDs
+        batched into ``id_list`` queries and the remaining lookups bounded by
+        ``max_concurrency``. New results are written back in one pipeline.
+        
+        Args:
+            references: Raw reference strings from GROBID
+            
+        Returns:
+            BibTeX entry (or None) for each reference, in order
+        """
+        states: List[Optional[BibliographyState]] = []
+        for ref in references:
+            if not ref or len(ref.strip()) < 10:
+                states.append(None)
+                continue
+            state = await self._parse_reference_node(self._initial_state(ref))
+            states.append(await self._extract_identifiers_node(state))
+        
+        keys = [
+            reference_keys(state["doi"], state["arxiv_id"], state["title"]) if state else []
+            for state in states
+        ]
+        cached = await self.cache.get_many([key for ref_keys in keys for key in ref_keys])
+        
+        pending = []
+        for i, state in enumerate(states):
+            if state is None:
+                continue
+            hit, result = self._cache_hit(keys[i], cached)
+            if not hit:
+                pending.append(i)
+            elif result:
+                self._apply_enrichment(state, result)
+        
+        arxiv_results = await self._fetch_arxiv_batch(
+            [states[i]["arxiv_id"] for i in pending if states[i]["arxiv_id"]]
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def resolve(i: int):
+            state = states[i]
+            async with semaphore:
+                return await self._lookup_sources(
+                    state, arxiv_results.get(normalize_arxiv_id(state["arxiv_id"]))
+                )
+        
+        lookups = await asyncio.gather(*[resolve(i) for i in pending], return_exceptions=True)
+        new_entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        for i, lookup in zip(pending, lookups):
+            if isinstance(lookup, Exception):
+                logger.error(f"Bibliography enrichment failed for reference {i + 1}: {lookup}")
+                continue
+            result, cacheable = lookup
+            if result:
+                self._apply_enrichment(states[i], result)
+            if cacheable:
+                new_entries.update(self._cache_entries(keys[i], result))
+        await self.cache.set_many(new_entries)
+        
+        logger.info(
+            f"Enriched {len(references)} references: "
+            f"{len(states) - states.count(None) - len(pending)} from cache, {len(pending)} looked up"
+        )
+        entries = []
+        for state in states:
+            entries.append((await self._generate_bibtex_node(state))["final_entry"] if state else None)
+        return entries
+    
+    def _initial_state(self, reference_text: str) -> BibliographyState:
+        return {
             "reference_text": reference_text.strip(),
             "title": None,
             "authors": [],
@@ -117,18 +236,6 @@ class BibliographyEnrichmentAgent:
             "errors": [],
             "final_entry": None
         }
-        
-        try:
-            # Execute graph with unique thread ID
-            thread_id = f"ref_{ref_num}_{hash(reference_text) % 10000}"
-            config = {"configurable": {"thread_id": thread_id}}
-            
-            result = await self.graph.ainvoke(initial_state, config)
-            return result.get("final_entry")
-            
-        except Exception as e:
-            logger.error(f"Bibliography enrichment failed for reference {ref_num}: {e}")
-            return None
     
     async def _parse_reference_node(self, state: BibliographyState) -> BibliographyState:
         """Parse basic metadata from reference text."""
@@ -176,48 +283,93 @@ class BibliographyEnrichmentAgent:
         return state
     
     async def _enrich_metadata_node(self, state: BibliographyState) -> BibliographyState:
-        """Enrich metadata using external APIs in parallel."""
-        enrichment_tasks = []
+        """Enrich metadata from the reference cache or external APIs."""
+        keys = reference_keys(state["doi"], state["arxiv_id"], state["title"])
+        hit, result = self._cache_hit(keys, await self.cache.get_many(keys))
+        if not hit:
+            result, cacheable = await self._lookup_sources(state)
+            if cacheable:
+                await self.cache.set_many(self._cache_entries(keys, result))
+        
+        if result:
+            self._apply_enrichment(state, result)
+        return state
+    
+    async def _lookup_sources(
+        self,
+        state: BibliographyState,
+        arxiv_result: Optional[EnrichmentResult] = None
+    ) -> Tuple[Optional[EnrichmentResult], bool]:
+        """
+        Query external APIs for one reference.
         
-        # arXiv enrichment
-        if state["arxiv_id"]:
-            enrichment_tasks.append(
-                self._enrich_from_arxiv(state["arxiv_id"])
-            )
+        Identifier lookups (arXiv, DOI) run first; title searches only run if
+        they found nothing.
         
-        # DOI enrichment
+        Returns:
+            Merged result (or None) and whether the outcome may be cached,
+            i.e. it is a match or no source errored
+        """
+        results: List[EnrichmentResult] = []
+        identifier_tasks = []
+        if state["arxiv_id"]:
+            if arxiv_result is not None:
+                results.append(arxiv_result)
+            else:
+                identifier_tasks.append(self._enrich_from_arxiv(state["arxiv_id"]))
         if state["doi"]:
-            enrichment_tasks.append(
-                self._enrich_from_crossref_doi(state["doi"])
-            )
+            identifier_tasks.append(self._enrich_from_crossref_doi(state["doi"]))
+        if identifier_tasks:
+            results.extend(await asyncio.gather(*identifier_tasks, return_exceptions=True))
         
         # Title-based enrichment (if we have a good title)
-        if state["title"] and len(state["title"]) > 10:
-            enrichment_tasks.append(
-                self._enrich_from_crossref_title(state["title"])
-            )
-            enrichment_tasks.append(
-                self._enrich_from_semantic_scholar(state["title"])
-            )
-        
-        # Execute enrichment tasks in parallel
-        if enrichment_tasks:
-            results = await asyncio.gather(*enrichment_tasks, return_exceptions=True)
-            
-            # Merge results with confidence-based selection
-            best_result = self._merge_enrichment_results(results)
-            if best_result:
-                state.update({
-                    "title": best_result.title or state["title"],
-                    "authors": best_result.authors or state["authors"],
-                    "year": best_result.year or state["year"],
-                    "journal": best_result.journal or state["journal"],
-                    "doi": best_result.doi or state["doi"]
-                })
-                
-                state["enrichment_attempts"][best_result.source] = True
-        
-        return state
+        if not self._merge_enrichment_results(results) and state["title"] and len(state["title"]) > 10:
+            results.extend(await asyncio.gather(
+                self._enrich_from_crossref_title(state["title"]),
+                self._enrich_from_semantic_scholar(state["title"]),
+                return_exceptions=True
+            ))
+        
+        # Merge results with confidence-based selection
+        merged = self._merge_enrichment_results(results)
+        failed = any(not isinstance(r, EnrichmentResult) or r.failed for r in results)
+        return merged, merged is not None or not failed
+    
+    def _apply_enrichment(self, state: BibliographyState, result: EnrichmentResult) -> None:
+        state.update({
+            "title": result.title or state["title"],
+            "authors": result.authors or state["authors"],
+            "year": result.year or state["year"],
+            "journal": result.journal or state["journal"],
+            "doi": result.doi or state["doi"]
+        })
+        state["enrichment_attempts"][result.source] = True
+    
+    @staticmethod
+    def _cache_hit(
+        keys: List[str],
+        cached: Dict[str, Dict[str, Any]]
+    ) -> Tuple[bool, Optional[EnrichmentResult]]:
+        """First cached entry among ``keys``; a negative entry is a hit with no result."""
+        for key in keys:
+            entry = cached.get(key)
+            if entry is not None:
+                if entry.get("confidence", 0) > 0:
+                    return True, EnrichmentResult(**entry)
+                return True, None
+        return False, None
+    
+    @staticmethod
+    def _cache_entries(
+        keys: List[str],
+        result: Optional[EnrichmentResult]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Cache a result under the reference's keys and any identifiers it revealed."""
+        if result is None:
+            return {key: None for key in keys}
+        value = asdict(result)
+        all_keys = keys + reference_keys(result.doi, None, result.title)
+        return {key: value for key in dict.fromkeys(all_keys)}
     
     async def _generate_bibtex_node(self, state: BibliographyState) -> BibliographyState:
         """Generate final BibTeX entry from enriched metadata."""
@@ -406,87 +558,163 @@ class BibliographyEnrichmentAgent:
     # External API enrichment methods
     async def _enrich_from_arxiv(self, arxiv_id: str) -> EnrichmentResult:
         """Enrich from arXiv API."""
+        results = await self._fetch_arxiv_batch([arxiv_id])
+        return results[normalize_arxiv_id(arxiv_id)]
+    
+    async def _fetch_arxiv_batch(self, arxiv_ids: List[str]) -> Dict[str, EnrichmentResult]:
+        """
+        Resolve many arXiv IDs with ``id_list`` queries of up to ARXIV_BATCH_SIZE IDs.
+        
+        Returns:
+            Result for every requested ID, keyed by version-less arXiv ID
+        """
+        ids = list(dict.fromkeys(normalize_arxiv_id(i) for i in arxiv_ids if i))
+        chunks = [ids[i:i + self.ARXIV_BATCH_SIZE] for i in range(0, len(ids), self.ARXIV_BATCH_SIZE)]
+        results: Dict[str, EnrichmentResult] = {}
+        for found in await asyncio.gather(*[self._query_arxiv(chunk) for chunk in chunks]):
+            results.update(found)
+        return results
+    
+    async def _query_arxiv(self, arxiv_ids: List[str]) -> Dict[str, EnrichmentResult]:
+        """
+        Run one arXiv ``id_list`` query.
+        
+        A batch rejected for a malformed ID is retried ID by ID. HTTP and
+        transport errors (rate limits included) fail the batch and back off
+        further arXiv queries instead of multiplying requests.
+        """
+        delay = self._arxiv_retry_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        url = (
+            "http://export.arxiv.org/api/query?"
+            f"id_list={','.join(arxiv_ids)}&max_results={len(arxiv_ids)}"
+        )
         try:
-            url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}&max_results=1"
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return EnrichmentResult(confidence=0.0, source="arxiv")
-                    
-                    xml_text = await resp.text()
-                    root = ET.fromstring(xml_text)
-                    ns = {'atom': 'http://www.w3.org/2005/Atom'}
-                    
-                    entry = root.find('atom:entry', ns)
-                    if entry is None:
-                        return EnrichmentResult(confidence=0.0, source="arxiv")
-                    
-                    title_el = entry.find('atom:title', ns)
-                    title = title_el.text.strip().replace('\n', ' ') if title_el is not None else None
-                    
-                    authors = []
-                    for author in entry.findall('atom:author', ns):
-                        name_el = author.find('atom:name', ns)
-                        if name_el is not None:
-                            authors.append(name_el.text.strip())
-                    
-                    pub_el = entry.find('atom:published', ns)
-                    year = pub_el.text[:4] if pub_el is not None else None
-                    
-                    return EnrichmentResult(
-                        title=title,
-                        authors=authors,
-                        year=year,
-                        journal="arXiv preprint",
-                        confidence=0.9,
-                        source="arxiv"
-                    )
-                    
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                status = resp.status
+                retry_after = resp.headers.get("Retry-After")
+                xml_text = await resp.text()
         except Exception as e:
-            logger.debug(f"arXiv enrichment failed: {e}")
-            return EnrichmentResult(confidence=0.0, source="arxiv")
+            return self._arxiv_batch_failed(arxiv_ids, f"arXiv request failed: {e}")
+        
+        ns = {'atom': 'http://www.w3.org/2005/Atom'}
+        try:
+            entries = ET.fromstring(xml_text).findall('atom:entry', ns)
+        except ET.ParseError:
+            entries = None
+        
+        # A malformed ID fails the whole query with an /api/errors entry
+        if entries and any(self._is_arxiv_error(entry, ns) for entry in entries):
+            if len(arxiv_ids) > 1:
+                logger.debug("arXiv rejected the ID list, retrying individually")
+                singles = await asyncio.gather(*[self._query_arxiv([i]) for i in arxiv_ids])
+                return {k: v for found in singles for k, v in found.items()}
+            logger.debug(f"arXiv rejected ID {arxiv_ids[0]}")
+            return {arxiv_ids[0]: EnrichmentResult(confidence=0.0, source="arxiv", failed=True)}
+        
+        if status != 200 or entries is None:
+            return self._arxiv_batch_failed(arxiv_ids, f"arXiv API returned status {status}", retry_after)
+        
+        results = {
+            arxiv_id: EnrichmentResult(confidence=0.0, source="arxiv")
+            for arxiv_id in arxiv_ids
+        }
+        for entry in entries:
+            arxiv_id = normalize_arxiv_id(entry.find('atom:id', ns).text.rsplit("/abs/", 1)[-1])
+            if arxiv_id in results:
+                results[arxiv_id] = self._parse_arxiv_entry(entry, ns)
+        return results
+    
+    @staticmethod
+    def _is_arxiv_error(entry: ET.Element, ns: Dict[str, str]) -> bool:
+        id_el = entry.find('atom:id', ns)
+        return id_el is None or "/api/errors" in (id_el.text or "")
+    
+    def _arxiv_batch_failed(
+        self,
+        arxiv_ids: List[str],
+        reason: str,
+        retry_after: Optional[str] = None
+    ) -> Dict[str, EnrichmentResult]:
+        """Mark a batch failed and hold off further arXiv queries."""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = self.ARXIV_BACKOFF_SECONDS
+        self._arxiv_retry_at = max(self._arxiv_retry_at, time.monotonic() + delay)
+        logger.warning(f"{reason}; backing off {delay:.0f}s for {len(arxiv_ids)} ID(s)")
+        return {
+            arxiv_id: EnrichmentResult(confidence=0.0, source="arxiv", failed=True)
+            for arxiv_id in arxiv_ids
+        }
+    
+    def _parse_arxiv_entry(self, entry: ET.Element, ns: Dict[str, str]) -> EnrichmentResult:
+        title_el = entry.find('atom:title', ns)
+        title = title_el.text.strip().replace('\n', ' ') if title_el is not None else None
+        
+        authors = []
+        for author in entry.findall('atom:author', ns):
+            name_el = author.find('atom:name', ns)
+            if name_el is not None:
+                authors.append(name_el.text.strip())
+        
+        pub_el = entry.find('atom:published', ns)
+        year = pub_el.text[:4] if pub_el is not None else None
+        
+        return EnrichmentResult(
+            title=title,
+            authors=authors,
+            year=year,
+            journal="arXiv preprint",
+            confidence=0.9,
+            source="arxiv"
+        )
     
     async def _enrich_from_crossref_doi(self, doi: str) -> EnrichmentResult:
         """Enrich from Crossref DOI API."""
         try:
             url = f"https://api.crossref.org/works/{doi}"
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return EnrichmentResult(confidence=0.0, source="crossref_doi")
-                    
-                    data = await resp.json()
-                    message = data.get("message", {})
-                    
-                    title = (message.get("title") or [None])[0]
-                    journal = (message.get("container-title") or [None])[0]
-                    
-                    year = None
-                    if message.get("issued") and message["issued"].get("date-parts"):
-                        year = str(message["issued"]["date-parts"][0][0])
-                    
-                    authors = []
-                    for author in message.get("author", []):
-                        given = author.get("given", "").strip()
-                        family = author.get("family", "").strip()
-                        if given and family:
-                            authors.append(f"{given} {family}")
-                        elif family:
-                            authors.append(family)
-                    
-                    return EnrichmentResult(
-                        title=title,
-                        authors=authors,
-                        year=year,
-                        journal=journal,
-                        doi=doi,
-                        confidence=0.95,
-                        source="crossref_doi"
-                    )
-                    
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    # 404 means the DOI is unknown, which is an answer worth caching
+                    return EnrichmentResult(confidence=0.0, source="crossref_doi", failed=resp.status != 404)
+                
+                data = await resp.json()
+                message = data.get("message", {})
+                
+                title = (message.get("title") or [None])[0]
+                journal = (message.get("container-title") or [None])[0]
+                
+                year = None
+                if message.get("issued") and message["issued"].get("date-parts"):
+                    year = str(message["issued"]["date-parts"][0][0])
+                
+                authors = []
+                for author in message.get("author", []):
+                    given = author.get("given", "").strip()
+                    family = author.get("family", "").strip()
+                    if given and family:
+                        authors.append(f"{given} {family}")
+                    elif family:
+                        authors.append(family)
+                
+                return EnrichmentResult(
+                    title=title,
+                    authors=authors,
+                    year=year,
+                    journal=journal,
+                    doi=doi,
+                    confidence=0.95,
+                    source="crossref_doi"
+                )
+                
         except Exception as e:
             logger.debug(f"Crossref DOI enrichment failed: {e}")
-            return EnrichmentResult(confidence=0.0, source="crossref_doi")
+            return EnrichmentResult(confidence=0.0, source="crossref_doi", failed=True)
     
     async def _enrich_from_crossref_title(self, title: str) -> EnrichmentResult:
         """Enrich from Crossref title search."""
@@ -494,52 +722,52 @@ class BibliographyEnrichmentAgent:
             query = urllib.parse.quote(title)
             url = f"https://api.crossref.org/works?query.bibliographic={query}&rows=1"
             
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return EnrichmentResult(confidence=0.0, source="crossref_title")
-                    
-                    data = await resp.json()
-                    items = data.get("message", {}).get("items", [])
-                    
-                    if not items:
-                        return EnrichmentResult(confidence=0.0, source="crossref_title")
-                    
-                    item = items[0]
-                    
-                    # Calculate confidence based on title similarity
-                    found_title = (item.get("title") or [None])[0]
-                    confidence = 0.7 if found_title else 0.3
-                    
-                    journal = (item.get("container-title") or [None])[0]
-                    doi = item.get("DOI")
-                    
-                    year = None
-                    if item.get("issued") and item["issued"].get("date-parts"):
-                        year = str(item["issued"]["date-parts"][0][0])
-                    
-                    authors = []
-                    for author in item.get("author", []):
-                        given = author.get("given", "").strip()
-                        family = author.get("family", "").strip()
-                        if given and family:
-                            authors.append(f"{given} {family}")
-                        elif family:
-                            authors.append(family)
-                    
-                    return EnrichmentResult(
-                        title=found_title,
-                        authors=authors,
-                        year=year,
-                        journal=journal,
-                        doi=doi,
-                        confidence=confidence,
-                        source="crossref_title"
-                    )
-                    
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return EnrichmentResult(confidence=0.0, source="crossref_title", failed=True)
+                
+                data = await resp.json()
+                items = data.get("message", {}).get("items", [])
+                
+                if not items:
+                    return EnrichmentResult(confidence=0.0, source="crossref_title")
+                
+                item = items[0]
+                
+                # Calculate confidence based on title similarity
+                found_title = (item.get("title") or [None])[0]
+                confidence = 0.7 if found_title else 0.3
+                
+                journal = (item.get("container-title") or [None])[0]
+                doi = item.get("DOI")
+                
+                year = None
+                if item.get("issued") and item["issued"].get("date-parts"):
+                    year = str(item["issued"]["date-parts"][0][0])
+                
+                authors = []
+                for author in item.get("author", []):
+                    given = author.get("given", "").strip()
+                    family = author.get("family", "").strip()
+                    if given and family:
+                        authors.append(f"{given} {family}")
+                    elif family:
+                        authors.append(family)
+                
+                return EnrichmentResult(
+                    title=found_title,
+                    authors=authors,
+                    year=year,
+                    journal=journal,
+                    doi=doi,
+                    confidence=confidence,
+                    source="crossref_title"
+                )
+                
         except Exception as e:
             logger.debug(f"Crossref title enrichment failed: {e}")
-            return EnrichmentResult(confidence=0.0, source="crossref_title")
+            return EnrichmentResult(confidence=0.0, source="crossref_title", failed=True)
     
     async def _enrich_from_semantic_scholar(self, title: str) -> EnrichmentResult:
         """Enrich from Semantic Scholar API."""
@@ -548,36 +776,36 @@ class BibliographyEnrichmentAgent:
             fields = "title,authors,year,venue,externalIds"
             url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={query}&limit=1&fields={fields}"
             
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return EnrichmentResult(confidence=0.0, source="semantic_scholar")
-                    
-                    data = await resp.json()
-                    papers = data.get("data", [])
-                    
-                    if not papers:
-                        return EnrichmentResult(confidence=0.0, source="semantic_scholar")
-                    
-                    paper = papers[0]
-                    
-                    venue = paper.get("venue")
-                    year = str(paper.get("year")) if paper.get("year") else None
-                    authors = [a.get("name") for a in paper.get("authors", []) if a.get("name")]
-                    doi = paper.get("externalIds", {}).get("DOI")
-                    
-                    return EnrichmentResult(
-                        journal=venue,
-                        year=year,
-                        authors=authors,
-                        doi=doi,
-                        confidence=0.8,
-                        source="semantic_scholar"
-                    )
-                    
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return EnrichmentResult(confidence=0.0, source="semantic_scholar", failed=True)
+                
+                data = await resp.json()
+                papers = data.get("data", [])
+                
+                if not papers:
+                    return EnrichmentResult(confidence=0.0, source="semantic_scholar")
+                
+                paper = papers[0]
+                
+                venue = paper.get("venue")
+                year = str(paper.get("year")) if paper.get("year") else None
+                authors = [a.get("name") for a in paper.get("authors", []) if a.get("name")]
+                doi = paper.get("externalIds", {}).get("DOI")
+                
+                return EnrichmentResult(
+                    journal=venue,
+                    year=year,
+                    authors=authors,
+                    doi=doi,
+                    confidence=0.8,
+                    source="semantic_scholar"
+                )
+                
         except Exception as e:
             logger.debug(f"Semantic Scholar enrichment failed: {e}")
-            return EnrichmentResult(confidence=0.0, source="semantic_scholar")
+            return EnrichmentResult(confidence=0.0, source="semantic_scholar", failed=True)
     
     def _merge_enrichment_results(self, results: List[EnrichmentResult]) -> Optional[EnrichmentResult]:
         """Merge enrichment results with confidence-based selection."""
@@ -12,11 +12,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import UploadFile
 
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.enhanced_cache import enhanced_cache, CacheInvalidationStrategy
 from app.repositories.paper_repository import PaperRepository
 from app.models.paper import PaperCreate, PaperUpdate, PaperResponse
 
 logger = logging.getLogger(__name__)
 
+PAPER_LIST_CACHE_TTL = 120
+
 
 class PaperCrudService:
     """
@@ -54,6 +57,7 @@ class PaperCrudService:
             await self.repository.add_paper_to_project(project_id, paper.id)
 
             await self.session.commit()
+            await self.invalidate_paper_caches(paper.id)
 
             return {
                 "success": True,
@@ -130,6 +134,7 @@ class PaperCrudService:
             )
             
             await self.session.commit()
+            await self.invalidate_paper_caches(paper_id)
             
             return {
                 "success": True,
@@ -171,6 +176,9 @@ class PaperCrudService:
                     ErrorCodes.NOT_FOUND_ERROR
                 )
             
+            # Resolve affected lists first: a hard delete removes the project links
+            project_ids = await self.repository.get_project_ids_for_papers([paper.id])
+            
             if soft_delete:
                 # Soft delete
                 await self.repository.soft_delete_paper(paper_id)
@@ -179,6 +187,10 @@ class PaperCrudService:
                 await self.repository.hard_delete_paper(paper_id)
             
             await self.session.commit()
+            await enhanced_cache.invalidate_tags(
+                CacheInvalidationStrategy.paper_tag(paper_id),
+                *[CacheInvalidationStrategy.project_papers_tag(project_id) for project_id in project_ids]
+            )
             
             return {
                 "success": True,
@@ -212,14 +224,15 @@ class PaperCrudService:
         Returns:
             Paginated list of papers
         """
-        offset = (page - 1) * limit
-        
-        papers, total_count = await self.repository.get_papers_by_project(
-            project_id,
-            page=page,
-            size=limit,
-            include_diagnostics=True,
+        cached = await enhanced_cache.get_or_set(
+            f"project_papers:{project_id}:{page}:{limit}",
+            lambda: self._load_project_papers(project_id, page, limit),
+            ttl=PAPER_LIST_CACHE_TTL,
+            tags=lambda page_data: [CacheInvalidationStrategy.project_papers_tag(project_id)] + [
+                CacheInvalidationStrategy.paper_tag(paper["id"]) for paper in page_data["papers"]
+            ]
         )
+        total_count = cached["total"]
         
         # Calculate pagination info
         total_pages = (total_count + limit - 1) // limit
@@ -228,7 +241,7 @@ class PaperCrudService:
         
         return {
             "success": True,
-            "papers": [PaperResponse.from_orm(paper) for paper in papers],
+            "papers": [PaperResponse.model_validate(paper) for paper in cached["papers"]],
             "pagination": {
                 "current_page": page,
                 "total_pages": total_pages,
@@ -239,6 +252,40 @@ class PaperCrudService:
             }
         }
     
+    async def _load_project_papers(self, project_id: uuid.UUID, page: int, limit: int) -> Dict[str, Any]:
+        """One page of a project's papers with diagnostics, as cacheable JSON"""
+        papers, total_count = await self.repository.get_papers_by_project(
+            project_id,
+            page=page,
+            size=limit,
+            include_diagnostics=True,
+        )
+        return {
+            "papers": [PaperResponse.from_orm(paper).model_dump(mode="json") for paper in papers],
+            "total": total_count
+        }
+    
+    async def invalidate_paper_caches(self, *paper_ids: Any) -> None:
+        """
+        Drop cached paper lists after committed paper changes.
+        
+        Lists of the papers' projects are dropped as well, since inserts and
+        deletes shift every page and the totals.
+        """
+        if not paper_ids:
+            return
+        try:
+            project_ids = await self.repository.get_project_ids_for_papers(
+                [uuid.UUID(str(paper_id)) for paper_id in paper_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Could not resolve projects for cache invalidation: {e}")
+            project_ids = []
+        await enhanced_cache.invalidate_tags(
+            *[CacheInvalidationStrategy.paper_tag(paper_id) for paper_id in paper_ids],
+            *[CacheInvalidationStrategy.project_papers_tag(project_id) for project_id in project_ids]
+        )
+    
     @handle_service_errors("search papers")
     async def search_papers(
         self,
@@ -249,7 +296,7 @@ class PaperCrudService:
         limit: int = 20
     ) -> Dict[str, Any]:
         """
-        Search papers by text query.
+        Search papers by full-text query, best matches first.
         
         Args:
             query: Search query
@@ -267,14 +314,17 @@ class PaperCrudService:
                 ErrorCodes.VALIDATION_ERROR
             )
         
-        offset = (page - 1) * limit
-        
+        filters = filters or {}
         papers, total_count = await self.repository.search_papers(
-            query=query,
-            project_id=project_id,
-            filters=filters or {},
-            limit=limit,
-            offset=offset
+            search_query=query.strip(),
+            project_ids=[project_id] if project_id else None,
+            authors=filters.get("authors"),
+            keywords=filters.get("keywords"),
+            date_from=filters.get("date_from"),
+            date_to=filters.get("date_to"),
+            has_diagnostics=filters.get("has_diagnostics"),
+            page=page,
+            size=limit
         )
         
         # Calculate pagination info
@@ -351,6 +401,7 @@ class PaperCrudService:
             )
             
             await self.session.commit()
+            await self.invalidate_paper_caches(*paper_ids)
             
             return {
                 "success": True,
@@ -401,6 +452,7 @@ class PaperCrudService:
             restored_paper = await self.repository.restore_paper(paper_id, restored_by)
             
             await self.session.commit()
+            await self.invalidate_paper_caches(paper_id)
             
             return {
                 "success": True,
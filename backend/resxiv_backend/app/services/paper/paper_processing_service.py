@@ -19,7 +19,6 @@ from app.core.error_handling import handle_service_errors, ServiceError, ErrorCo
 from app.repositories.paper_repository import PaperRepository
 
 import uuid
-import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -490,23 +489,11 @@ class PaperProcessingService:
         bib_filename = f"{paper_id}.bib"
         bib_path = self.bib_dir / bib_filename
         
-        # Initialize LangGraph agent
-        agent = BibliographyEnrichmentAgent(timeout=10)
-        
-        # Process references in parallel with controlled concurrency
-        logger.info(f"Processing {len(references)} references with LangGraph agent")
-        
-        # Limit concurrent requests to avoid overwhelming APIs
-        semaphore = asyncio.Semaphore(3)
-        
-        async def process_reference(ref_data):
-            ref, idx = ref_data
-            async with semaphore:
-                return await agent.enrich_reference(ref, idx + 1)
-        
-        # Process references concurrently
-        tasks = [process_reference((ref, i)) for i, ref in enumerate(references)]
-        bib_entries = await asyncio.gather(*tasks, return_exceptions=True)
+        # Resolve the whole bibliography at once: cached references are served
+        # from the shared reference cache, misses use batched upstream lookups
+        logger.info(f"Processing {len(references)} references with bibliography agent")
+        async with BibliographyEnrichmentAgent(timeout=10) as agent:
+            bib_entries = await agent.enrich_references(references)
         
         # Filter valid entries
         valid_entries = [
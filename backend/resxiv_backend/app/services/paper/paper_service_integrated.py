@@ -685,6 +685,7 @@ class PaperService:
             if update_data:
                 await self.crud_service.repository.update_paper(uuid.UUID(paper_id), update_data)
                 await self.crud_service.session.commit()
+                await self.crud_service.invalidate_paper_caches(paper_id)
                 
         except Exception as e:
             logger.error(f"Failed to update paper {paper_id} with GROBID metadata: {e}")
@@ -756,6 +757,7 @@ class PaperService:
                 await repository.create_diagnostic(diagnostic_create)
                 
             await self.crud_service.session.commit()
+            await self.crud_service.invalidate_paper_caches(paper_id)
             logger.info(f"Generated AI diagnostics for paper {paper_id} using {ai_result['model_used']}")
             
         except Exception as e:
@@ -810,6 +812,7 @@ class PaperService:
             await repository.create_diagnostic(diagnostic_create)
             
         await self.crud_service.session.commit()
+        await self.crud_service.invalidate_paper_caches(paper_id)
     
     def _extract_key_insights(self, abstract: str, title: str, sections: List[str]) -> str:
         """Extract key insights from paper content."""
@@ -1071,6 +1074,7 @@ class PaperService:
                 await repository.create_diagnostic(diagnostic_create)
                 
             await self.crud_service.session.commit()
+            await self.crud_service.invalidate_paper_caches(paper_id)
             logger.info(f"Generated AI diagnostics for paper {paper_id} using GPT-4o mini from PyPDF text")
             
         except Exception as e:
@@ -17,6 +17,7 @@ from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.enhanced_cache import enhanced_cache, CacheInvalidationStrategy
 from app.repositories.paper_repository import PaperRepository
 
 logger = logging.getLogger(__name__)
@@ -204,6 +205,7 @@ class PaperStorageService:
 
             await self.repository.update_paper(paper_id, update_payload)
             await self.session.commit()
+            await enhanced_cache.invalidate_tags(CacheInvalidationStrategy.paper_tag(paper_id))
 
             # Close the file handle
             try:
@@ -0,0 +1,150 @@
+"""
+Reference Enrichment Cache
+==========================
+
+Shared cache of enriched bibliography metadata so well-known references are
+resolved once, not once per paper. Entries are keyed by every identifier a
+reference is known by (DOI, arXiv ID, normalized title) and stored in Redis
+with an in-process LRU in front. Failed lookups are cached briefly as
+negative entries so unresolvable references are not retried on every paper;
+the LRU expires entries on the same TTLs as Redis.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "bib:ref:"
+POSITIVE_TTL_SECONDS = 30 * 24 * 3600
+NEGATIVE_TTL_SECONDS = 24 * 3600
+NEGATIVE = {"confidence": 0.0}
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    if not doi:
+        return None
+    return doi.strip().rstrip(".").lower()
+
+
+def normalize_arxiv_id(arxiv_id: Optional[str]) -> Optional[str]:
+    """Strip prefix and version so ``arXiv:1706.03762v5`` matches ``1706.03762``."""
+    if not arxiv_id:
+        return None
+    arxiv_id = re.sub(r"^arxiv:", "", arxiv_id.strip(), flags=re.IGNORECASE)
+    return re.sub(r"v\d+$", "", arxiv_id)
+
+
+def normalize_title(title: Optional[str]) -> Optional[str]:
+    if not title:
+        return None
+    normalized = " ".join(re.sub(r"[^a-z0-9]+", " ", title.lower()).split())
+    return normalized if len(normalized) > 10 else None
+
+
+def reference_keys(
+    doi: Optional[str] = None,
+    arxiv_id: Optional[str] = None,
+    title: Optional[str] = None
+) -> List[str]:
+    """Cache keys for a reference, most specific identifier first."""
+    keys = []
+    if normalize_doi(doi):
+        keys.append(f"{KEY_PREFIX}doi:{normalize_doi(doi)}")
+    if normalize_arxiv_id(arxiv_id):
+        keys.append(f"{KEY_PREFIX}arxiv:{normalize_arxiv_id(arxiv_id)}")
+    if normalize_title(title):
+        digest = hashlib.sha1(normalize_title(title).encode()).hexdigest()
+        keys.append(f"{KEY_PREFIX}title:{digest}")
+    return keys
+
+
+class ReferenceCache:
+    """Redis-backed enrichment cache with an in-process LRU."""
+
+    def __init__(self, redis_client=None, max_local_entries: int = 5000):
+        self._redis = redis_client
+        self.max_local_entries = max_local_entries
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def _client(self):
+        if self._redis is not None:
+            return self._redis
+        from app.database.connection import db_manager
+        return db_manager.redis_client
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch cached entries for many keys in one round trip.
+
+        Returns:
+            Mapping of key to entry for the keys that were found; negative
+            entries have ``confidence == 0``
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        remote = []
+        now = time.monotonic()
+        for key in dict.fromkeys(keys):
+            cached = self._local.get(key)
+            if cached is not None and cached[0] > now:
+                self._local.move_to_end(key)
+                found[key] = cached[1]
+            else:
+                self._local.pop(key, None)
+                remote.append(key)
+
+        client = self._client()
+        if remote and client is not None:
+            try:
+                values = await client.mget(remote)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Reference cache lookup failed: {e}")
+                values = [None] * len(remote)
+            for key, value in zip(remote, values):
+                if value is not None:
+                    found[key] = json.loads(value)
+                    self._remember(key, found[key])
+
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(set(keys)) - len(found)
+        return found
+
+    async def set_many(self, entries: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Store entries (``None`` records a negative lookup) in one pipeline."""
+        if not entries:
+            return
+        for key, value in entries.items():
+            self._remember(key, value or NEGATIVE)
+        self.stats["stores"] += len(entries)
+
+        client = self._client()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in entries.items():
+                pipe.set(key, json.dumps(value or NEGATIVE), ex=self._ttl(value or NEGATIVE))
+            await pipe.execute()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Reference cache store failed: {e}")
+
+    @staticmethod
+    def _ttl(value: Dict[str, Any]) -> int:
+        return POSITIVE_TTL_SECONDS if value.get("confidence") else NEGATIVE_TTL_SECONDS
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        self._local[key] = (time.monotonic() + self._ttl(value), value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+
+reference_cache = ReferenceCache()
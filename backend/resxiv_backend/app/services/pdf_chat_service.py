@@ -10,16 +10,17 @@ import uuid
 import logging
 import tempfile
 import aiofiles
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from datetime import datetime
 from pathlib import Path
 
-from openai import AsyncOpenAI
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import get_settings
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.llm_gateway import llm_gateway
+from app.core.llm_cache import llm_response_cache
 from app.repositories.conversation_repository import ConversationRepository
 from app.repositories.paper_repository import PaperRepository
 from app.services.paper.paper_processing_service import PaperProcessingService
@@ -36,10 +37,22 @@ class PDFChatService:
     Supports both existing papers and newly uploaded PDFs.
     """
     
+    # Bump when the chat prompt changes
+    PROMPT_VERSION = "paper-chat-v1"
+    
+    # Generation parameters optimized for research analysis
+    CHAT_PARAMS = {
+        "max_tokens": 2000,  # Increased for comprehensive research analysis
+        "temperature": 0.6,  # Slightly lower for more focused, analytical responses
+        "presence_penalty": 0.2,  # Encourage exploration of diverse research aspects
+        "frequency_penalty": 0.05  # Reduced to allow important terms to be repeated
+    }
+    
     def __init__(self, session: AsyncSession):
         self.session = session
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.agentic.openai_api_key)
+        self.llm = llm_gateway
+        self.cache = llm_response_cache
         self.model = "gpt-4o-mini"
         self.conversation_repo = ConversationRepository(session)
         self.paper_repo = PaperRepository(session)
@@ -81,7 +94,33 @@ class PDFChatService:
             Chat response with conversation details
         """
         start_time = time.time()
+        turn = await self.prepare_paper_chat(paper_id, project_id, user_id, message, conversation_id)
+        
+        # Generate AI response
+        ai_response = await self._generate_chat_response(turn["messages"], project_id)
+        
+        # Save messages to MongoDB
+        await self._save_turn(turn, ai_response)
+        
+        return self._turn_result(turn, ai_response, start_time)
+    
+    async def prepare_paper_chat(
+        self,
+        paper_id: str,
+        project_id: str,
+        user_id: str,
+        message: str,
+        conversation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Resolve the paper, conversation and prompt for a paper chat turn.
         
+        Everything that needs the SQL session happens here, so a streamed
+        response can be produced afterwards without it.
+        
+        Returns:
+            Chat turn consumed by ``_generate_chat_response``/``stream_chat_turn``
+        """
         # Verify paper exists and get content
         paper = await self.paper_repo.get_paper_by_id(paper_id)
         if not paper:
@@ -121,44 +160,33 @@ class PDFChatService:
         # Get conversation history
         conversation_history = await self._get_conversation_history(conversation_id)
         
-        # Generate AI response
-        ai_response = await self._generate_chat_response(
-            pdf_content=pdf_content,
-            user_message=message,
-            conversation_history=conversation_history,
-            paper_metadata={
-                "title": paper.title,
-                "authors": paper.authors,
-                "abstract": getattr(paper, 'abstract', None)
-            }
-        )
-        
-        # Save messages to MongoDB
-        await self._save_chat_messages(
-            conversation_id=conversation_id,
-            user_id=user_id,
-            user_message=message,
-            ai_response=ai_response,
-            metadata={
-                "paper_id": paper_id,
-                "paper_title": paper.title,
-                "conversation_type": "PDF"
-            }
-        )
-        
-        processing_time = time.time() - start_time
-        
         return {
-            "success": True,
-            "response": ai_response,
             "conversation_id": conversation_id,
-            "paper_id": paper_id,
-            "processing_time": processing_time,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": {
+            "user_id": user_id,
+            "project_id": project_id,
+            "message": message,
+            "messages": self._build_chat_messages(
+                pdf_content=pdf_content,
+                user_message=message,
+                conversation_history=conversation_history,
+                paper_metadata={
+                    "title": paper.title,
+                    "authors": paper.authors,
+                    "abstract": getattr(paper, 'abstract', None)
+                }
+            ),
+            "save_metadata": {
+                "paper_id": paper_id,
                 "paper_title": paper.title,
-                "conversation_type": "PDF",
-                "user_id": user_id
+                "conversation_type": "PDF"
+            },
+            "result": {
+                "paper_id": paper_id,
+                "metadata": {
+                    "paper_title": paper.title,
+                    "conversation_type": "PDF",
+                    "user_id": user_id
+                }
             }
         }
     
@@ -185,7 +213,30 @@ class PDFChatService:
             Chat response with conversation details
         """
         start_time = time.time()
+        turn = await self.prepare_drop_chat(file, project_id, user_id, message, conversation_id)
+        
+        # Generate AI response
+        ai_response = await self._generate_chat_response(turn["messages"], project_id)
+        
+        # Save messages to MongoDB
+        await self._save_turn(turn, ai_response)
         
+        return self._turn_result(turn, ai_response, start_time)
+    
+    async def prepare_drop_chat(
+        self,
+        file: UploadFile,
+        project_id: str,
+        user_id: str,
+        message: str,
+        conversation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract an uploaded PDF and resolve the conversation and prompt for a drop chat turn.
+        
+        Returns:
+            Chat turn consumed by ``_generate_chat_response``/``stream_chat_turn``
+        """
         # Validate file
         if not file.filename.lower().endswith('.pdf'):
             raise ServiceError(
@@ -225,46 +276,101 @@ class PDFChatService:
         # Get conversation history
         conversation_history = await self._get_conversation_history(conversation_id)
         
-        # Generate AI response
-        ai_response = await self._generate_chat_response(
-            pdf_content=pdf_content,
-            user_message=message,
-            conversation_history=conversation_history,
-            paper_metadata={
-                "filename": file.filename,
-                "file_size": file.size
-            }
-        )
-        
-        # Save messages to MongoDB
-        await self._save_chat_messages(
-            conversation_id=conversation_id,
-            user_id=user_id,
-            user_message=message,
-            ai_response=ai_response,
-            metadata={
+        return {
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "project_id": project_id,
+            "message": message,
+            "messages": self._build_chat_messages(
+                pdf_content=pdf_content,
+                user_message=message,
+                conversation_history=conversation_history,
+                paper_metadata={
+                    "filename": file.filename,
+                    "file_size": file.size
+                }
+            ),
+            "save_metadata": {
                 "file_id": file_id,
                 "file_name": file.filename,
                 "conversation_type": "DROP",
                 "project_id": project_id
+            },
+            "result": {
+                "file_id": file_id,
+                "metadata": {
+                    "file_name": file.filename,
+                    "conversation_type": "DROP",
+                    "project_id": project_id,
+                    "user_id": user_id
+                }
             }
-        )
+        }
+    
+    async def stream_chat_turn(
+        self,
+        turn: Dict[str, Any],
+        start_time: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the AI response for a prepared chat turn.
         
-        processing_time = time.time() - start_time
+        Yields a ``start`` event, one ``token`` event per content delta and a
+        final ``done`` event with the same payload as the non-streaming call.
+        Messages are persisted once the stream completes.
+        """
+        start_time = start_time or time.time()
+        yield {
+            "event": "start",
+            "data": {"conversation_id": turn["conversation_id"], **turn["result"]}
+        }
         
+        key, scope, question = self._cache_keys(turn["messages"])
+        ai_response = await self.cache.lookup(key, scope, question)
+        if ai_response is not None:
+            yield {"event": "token", "data": {"content": ai_response}}
+        else:
+            chunks = []
+            try:
+                async for delta in self.llm.stream_chat_completion(
+                    model=self.model,
+                    messages=turn["messages"],
+                    project_id=turn["project_id"],
+                    **self.CHAT_PARAMS
+                ):
+                    chunks.append(delta)
+                    yield {"event": "token", "data": {"content": delta}}
+            except ServiceError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to stream AI response: {e}")
+                raise ServiceError(
+                    "Failed to generate response",
+                    ErrorCodes.PROCESSING_ERROR
+                )
+            ai_response = "".join(chunks)
+            await self.cache.store(key, ai_response, scope, question)
+        
+        await self._save_turn(turn, ai_response)
+        yield {"event": "done", "data": self._turn_result(turn, ai_response, start_time)}
+    
+    async def _save_turn(self, turn: Dict[str, Any], ai_response: str) -> None:
+        await self._save_chat_messages(
+            conversation_id=turn["conversation_id"],
+            user_id=turn["user_id"],
+            user_message=turn["message"],
+            ai_response=ai_response,
+            metadata=turn["save_metadata"]
+        )
+    
+    def _turn_result(self, turn: Dict[str, Any], ai_response: str, start_time: float) -> Dict[str, Any]:
         return {
             "success": True,
             "response": ai_response,
-            "conversation_id": conversation_id,
-            "file_id": file_id,
-            "processing_time": processing_time,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": {
-                "file_name": file.filename,
-                "conversation_type": "DROP",
-                "project_id": project_id,
-                "user_id": user_id
-            }
+            "conversation_id": turn["conversation_id"],
+            **turn["result"],
+            "processing_time": time.time() - start_time,
+            "timestamp": datetime.utcnow().isoformat()
         }
     
     async def _get_paper_content(self, paper) -> str:
@@ -351,17 +457,16 @@ class PDFChatService:
                 ErrorCodes.PROCESSING_ERROR
             )
     
-    async def _generate_chat_response(
+    def _build_chat_messages(
         self,
         pdf_content: str,
         user_message: str,
         conversation_history: list,
         paper_metadata: Dict[str, Any]
-    ) -> str:
-        """Generate AI response using GPT-4o-mini"""
-        try:
-            # Prepare system prompt
-            system_prompt = """You are a senior researcher and academic expert with extensive experience in peer review, research methodology, and scientific analysis. When discussing research papers, you approach them with the critical eye of a seasoned researcher who understands both the theoretical foundations and practical implications of academic work.
+    ) -> List[Dict[str, Any]]:
+        """Build the research-analysis prompt for a chat turn"""
+        # Prepare system prompt
+        system_prompt = """You are a senior researcher and academic expert with extensive experience in peer review, research methodology, and scientific analysis. When discussing research papers, you approach them with the critical eye of a seasoned researcher who understands both the theoretical foundations and practical implications of academic work.
 
 **Your Research Perspective:**
 - Analyze papers through the lens of methodology, validity, and scientific rigor
@@ -390,11 +495,11 @@ Use precise academic terminology and frame discussions in terms of:
 
 Always think like a researcher who is genuinely curious about advancing knowledge and understanding the deeper implications of the work."""
 
-            # Prepare conversation context
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # Add paper context with research-focused framing
-            paper_context = f"""
+        # Prepare conversation context
+        messages = [{"role": "system", "content": system_prompt}]
+        
+        # Add paper context with research-focused framing
+        paper_context = f"""
 **RESEARCH PAPER FOR ANALYSIS:**
 
 **Bibliographic Information:**
@@ -413,36 +518,46 @@ As you analyze this paper, consider:
 5. What future research directions does this suggest?
 6. What aspects warrant deeper investigation or validation?
 """
-            
+        
+        messages.append({
+            "role": "system", 
+            "content": f"Here is the research paper you'll be analyzing from a researcher's perspective:\n\n{paper_context}"
+        })
+        
+        # Add conversation history (last 10 messages)
+        for msg in conversation_history[-10:]:
+            # Determine if it's an AI response based on metadata
+            is_ai_response = msg.get("metadata", {}).get("ai_response", False)
+            role = "assistant" if is_ai_response else "user"
             messages.append({
-                "role": "system", 
-                "content": f"Here is the research paper you'll be analyzing from a researcher's perspective:\n\n{paper_context}"
+                "role": role,
+                "content": msg.get("message", "")
             })
-            
-            # Add conversation history (last 10 messages)
-            for msg in conversation_history[-10:]:
-                # Determine if it's an AI response based on metadata
-                is_ai_response = msg.get("metadata", {}).get("ai_response", False)
-                role = "assistant" if is_ai_response else "user"
-                messages.append({
-                    "role": role,
-                    "content": msg.get("message", "")
-                })
-            
-            # Add current user message
-            messages.append({"role": "user", "content": user_message})
-            
+        
+        # Add current user message
+        messages.append({"role": "user", "content": user_message})
+        
+        return messages
+    
+    async def _generate_chat_response(
+        self,
+        messages: List[Dict[str, Any]],
+        project_id: Optional[str] = None
+    ) -> str:
+        """Generate AI response using GPT-4o-mini"""
+        async def generate() -> str:
             # Generate response optimized for research analysis
-            response = await self.client.chat.completions.create(
+            response = await self.llm.chat_completion(
                 model=self.model,
                 messages=messages,
-                max_tokens=2000,  # Increased for comprehensive research analysis
-                temperature=0.6,  # Slightly lower for more focused, analytical responses
-                presence_penalty=0.2,  # Encourage exploration of diverse research aspects
-                frequency_penalty=0.05  # Reduced to allow important terms to be repeated
+                project_id=project_id,
+                **self.CHAT_PARAMS
             )
-            
             return response.choices[0].message.content
+        
+        try:
+            key, scope, question = self._cache_keys(messages)
+            return await self.cache.get_or_generate(key, generate, scope=scope, text=question)
             
         except Exception as e:
             logger.error(f"Failed to generate AI response: {e}")
@@ -451,6 +566,10 @@ As you analyze this paper, consider:
                 ErrorCodes.PROCESSING_ERROR
             )
     
+    def _cache_keys(self, messages: List[Dict[str, Any]]):
+        """Response cache keys; questions repeated against the same paper context can be reused"""
+        return self.cache.chat_keys(self.model, self.PROMPT_VERSION, messages, self.CHAT_PARAMS)
+    
     async def _get_conversation_history(self, conversation_id: str) -> list:
         """Get conversation history from MongoDB"""
         try:
@@ -0,0 +1,362 @@
+"""
+Project File Bulk Service - L6 Engineering Standards
+Bulk deletion and moving of uploaded project files.
+Single Responsibility: Set-based ``project_files`` changes with matching disk work.
+
+- All requested files and the caller's admin role are resolved in one query
+- Disk work runs on a bounded thread pool, never on the event loop
+- Changes are ordered like a two-phase commit so that database and disk
+  agree for every file reported as successful:
+    1. prepare on disk - deletions rename each file to a tombstone next to
+       it, moves rename it into the target folder; a file whose disk step
+       fails is reported as failed and left out of the database change
+    2. one statement changes every prepared row, then the transaction
+       commits; if that fails, the disk steps are undone
+    3. finish on disk - tombstones are unlinked; a failure here only leaves
+       an orphaned tombstone behind and is logged
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import get_settings
+from app.core.error_handling import ServiceError, ErrorCodes
+
+logger = logging.getLogger(__name__)
+
+TOMBSTONE_SUFFIX = ".deleting"
+
+RESOLVE_FILES_SQL = text("""
+    SELECT
+        pf.id, pf.file_path, pf.original_filename, pf.file_size, pf.folder, pf.user_id,
+        EXISTS (
+            SELECT 1 FROM project_members pm
+            WHERE pm.project_id = :project_id AND pm.user_id = :user_id AND pm.role = 'admin'
+        ) AS is_admin
+    FROM project_files pf
+    WHERE pf.id = ANY(:file_ids) AND pf.project_id = :project_id
+""")
+
+DELETE_FILES_SQL = text("""
+    DELETE FROM project_files
+    WHERE id = ANY(:file_ids) AND project_id = :project_id
+    RETURNING id
+""")
+
+MOVE_FILES_SQL = text("""
+    UPDATE project_files pf
+    SET folder = :target_folder, file_path = moved.file_path, updated_at = NOW()
+    FROM unnest(CAST(:file_ids AS uuid[]), CAST(:file_paths AS text[])) AS moved(id, file_path)
+    WHERE pf.id = moved.id AND pf.project_id = :project_id
+    RETURNING pf.id
+""")
+
+_io_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """Shared pool for bulk disk work; its size bounds concurrent filesystem calls"""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = ThreadPoolExecutor(
+            max_workers=get_settings().files.bulk_file_io_workers,
+            thread_name_prefix="bulk-file-io"
+        )
+    return _io_pool
+
+
+def tombstone_path(path: Path, token: str) -> Path:
+    """Path a file is renamed to while its deletion is pending."""
+    return path.with_name(f"{path.name}{TOMBSTONE_SUFFIX}-{token}")
+
+
+def normalize_folder(folder: Optional[str]) -> Optional[str]:
+    """
+    Validate a target folder relative to the uploads directory.
+
+    Returns:
+        Folder with redundant separators removed, or None for the root
+
+    Raises:
+        ServiceError: If the folder is absolute or leaves the uploads directory
+    """
+    if folder is None or not str(folder).strip("/ "):
+        return None
+    parts = Path(str(folder).strip()).parts
+    if Path(folder).is_absolute() or ".." in parts:
+        raise ServiceError(f"Invalid target folder: {folder}", ErrorCodes.VALIDATION_ERROR)
+    return "/".join(parts)
+
+
+def _rename_to(source: Path, target: Path) -> bool:
+    """Rename ``source`` to ``target``; False when ``source`` does not exist"""
+    if not source.exists():
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        raise FileExistsError(f"{target.name} already exists in the target folder")
+    os.rename(source, target)
+    return True
+
+
+def _unlink(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+class ProjectFileBulkService:
+    """Bulk operations on uploaded project files."""
+
+    def __init__(self, session: AsyncSession, uploads_root: Optional[Path] = None):
+        self.session = session
+        # Same location the upload endpoint writes general files to
+        self.uploads_root = uploads_root or Path(os.getenv("RESXIV_DATA_DIR", "/ResXiv_V2")) / "uploads"
+
+    # ================================
+    # OPERATIONS
+    # ================================
+
+    async def delete_files(
+        self,
+        project_id: uuid.UUID,
+        file_ids: List[str],
+        user_id: str
+    ) -> Dict[str, Any]:
+        """
+        Delete project files and their stored content.
+
+        Args:
+            project_id: Project the files must belong to
+            file_ids: File IDs to delete
+            user_id: Caller; must own each file or be a project admin
+
+        Returns:
+            Per-file successes and failures with totals
+        """
+        results = {
+            "successful_deletions": [],
+            "failed_deletions": [],
+            "total_processed": len(file_ids),
+            "files_deleted": 0,
+            "space_freed": 0
+        }
+        permitted = await self._resolve(project_id, file_ids, user_id, results["failed_deletions"], "delete")
+
+        # Phase 1: move every file aside so a failed commit can put it back
+        token = uuid.uuid4().hex[:8]
+        renames = [(Path(row.file_path), tombstone_path(Path(row.file_path), token)) for row in permitted]
+        outcomes = await self._run_disk(_rename_to, renames)
+
+        prepared = []
+        for row, (source, tombstone), outcome in zip(permitted, renames, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Failed to delete file from disk: {source}, error: {outcome}")
+                results["failed_deletions"].append({
+                    "file_id": str(row.id),
+                    "filename": row.original_filename,
+                    "error": f"Deletion failed: {outcome}"
+                })
+            else:
+                prepared.append((row, tombstone if outcome else None))
+
+        # Phase 2: one statement for every prepared row
+        try:
+            deleted = await self._apply(DELETE_FILES_SQL, {
+                "file_ids": [row.id for row, _ in prepared],
+                "project_id": project_id
+            })
+        except Exception:
+            await self._undo([(tombstone, Path(row.file_path)) for row, tombstone in prepared if tombstone])
+            raise
+
+        # Rows that vanished since they were resolved keep their files
+        await self._undo([(t, Path(row.file_path)) for row, t in prepared if t and row.id not in deleted])
+
+        # Phase 3: the rows are gone; drop the tombstones
+        tombstones = [tombstone for row, tombstone in prepared if tombstone and row.id in deleted]
+        unlinked = dict(zip(tombstones, await self._run_disk(_unlink, [(t,) for t in tombstones])))
+
+        for row, tombstone in prepared:
+            if row.id not in deleted:
+                results["failed_deletions"].append({
+                    "file_id": str(row.id),
+                    "filename": row.original_filename,
+                    "error": "File not found or not in this project"
+                })
+                continue
+            disk_deleted = tombstone is not None and not isinstance(unlinked[tombstone], BaseException)
+            if tombstone is not None and not disk_deleted:
+                logger.warning(f"Failed to remove deleted file from disk: {tombstone}, error: {unlinked[tombstone]}")
+            results["successful_deletions"].append({
+                "file_id": str(row.id),
+                "filename": row.original_filename,
+                "file_size": row.file_size,
+                "disk_deleted": disk_deleted
+            })
+            results["files_deleted"] += 1
+            results["space_freed"] += row.file_size or 0
+
+        logger.info(f"Bulk deleted {results['files_deleted']} file(s) from project {project_id}")
+        return results
+
+    async def move_files(
+        self,
+        project_id: uuid.UUID,
+        file_ids: List[str],
+        target_folder: Optional[str],
+        user_id: str
+    ) -> Dict[str, Any]:
+        """
+        Move project files to another folder, on disk and in metadata.
+
+        Args:
+            project_id: Project the files must belong to
+            file_ids: File IDs to move
+            target_folder: Folder relative to the uploads directory; None for the root
+            user_id: Caller; must own each file or be a project admin
+
+        Returns:
+            Per-file successes and failures with totals
+        """
+        target_folder = normalize_folder(target_folder)
+        target_dir = self.uploads_root / target_folder if target_folder else self.uploads_root
+        results = {
+            "successful_moves": [],
+            "failed_moves": [],
+            "total_processed": len(file_ids),
+            "files_moved": 0
+        }
+        permitted = await self._resolve(project_id, file_ids, user_id, results["failed_moves"], "move")
+
+        # Phase 1: rename into the target folder
+        renames = [(Path(row.file_path), target_dir / Path(row.file_path).name) for row in permitted]
+        pending = [(row, move) for row, move in zip(permitted, renames) if move[0] != move[1]]
+        outcomes = await self._run_disk(_rename_to, [move for _, move in pending])
+
+        prepared = []
+        for (row, (source, target)), outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                results["failed_moves"].append({
+                    "file_id": str(row.id),
+                    "filename": row.original_filename,
+                    "error": f"Move failed: {outcome}"
+                })
+            else:
+                prepared.append((row, source, target, bool(outcome)))
+
+        # Phase 2: one statement for every prepared row; files already in
+        # the target folder only need their folder column updated
+        unchanged = [row for row, (source, target) in zip(permitted, renames) if source == target]
+        rows = [(row, target) for row, _, target, _ in prepared] + [(row, Path(row.file_path)) for row in unchanged]
+        try:
+            moved = await self._apply(MOVE_FILES_SQL, {
+                "file_ids": [row.id for row, _ in rows],
+                "file_paths": [str(path) for _, path in rows],
+                "target_folder": target_folder,
+                "project_id": project_id
+            })
+        except Exception:
+            await self._undo([(target, source) for _, source, target, on_disk in prepared if on_disk])
+            raise
+
+        for row, _ in rows:
+            if row.id not in moved:
+                results["failed_moves"].append({
+                    "file_id": str(row.id),
+                    "filename": row.original_filename,
+                    "error": "File not found or not in this project"
+                })
+                continue
+            results["successful_moves"].append({
+                "file_id": str(row.id),
+                "filename": row.original_filename,
+                "from_folder": row.folder or "root",
+                "to_folder": target_folder or "root"
+            })
+            results["files_moved"] += 1
+
+        logger.info(f"Bulk moved {results['files_moved']} file(s) in project {project_id} to {target_folder or 'root'}")
+        return results
+
+    # ================================
+    # HELPERS
+    # ================================
+
+    async def _resolve(
+        self,
+        project_id: uuid.UUID,
+        file_ids: List[str],
+        user_id: str,
+        failures: List[Dict[str, Any]],
+        action: str
+    ) -> List[Any]:
+        """Rows the caller may change; every other requested ID is added to ``failures``"""
+        requested: Dict[uuid.UUID, str] = {}
+        for file_id in file_ids:
+            try:
+                requested.setdefault(uuid.UUID(str(file_id)), str(file_id))
+            except ValueError:
+                failures.append({"file_id": file_id, "error": "Invalid file ID"})
+
+        rows = []
+        if requested:
+            result = await self.session.execute(RESOLVE_FILES_SQL, {
+                "file_ids": list(requested),
+                "project_id": project_id,
+                "user_id": user_id
+            })
+            rows = result.fetchall()
+        by_id = {row.id: row for row in rows}
+
+        permitted = []
+        for file_uuid, file_id in requested.items():
+            row = by_id.get(file_uuid)
+            if row is None:
+                failures.append({"file_id": file_id, "error": "File not found or not in this project"})
+            elif str(row.user_id) != str(user_id) and not row.is_admin:
+                failures.append({
+                    "file_id": file_id,
+                    "filename": row.original_filename,
+                    "error": f"Permission denied - only file owner or admin can {action} files"
+                })
+            else:
+                permitted.append(row)
+        return permitted
+
+    async def _apply(self, statement, params: Dict[str, Any]) -> set:
+        """Run one set-based change and commit it; returns the changed IDs"""
+        if not params["file_ids"]:
+            return set()
+        try:
+            result = await self.session.execute(statement, params)
+            changed = {row.id for row in result.fetchall()}
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return changed
+
+    async def _undo(self, renames: List[Tuple[Path, Path]]) -> None:
+        """Put renamed files back after the database change failed"""
+        for (source, target), outcome in zip(renames, await self._run_disk(_rename_to, renames)):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Could not restore {target} from {source}: {outcome}")
+
+    @staticmethod
+    async def _run_disk(func: Callable[..., Any], calls: List[Tuple]) -> List[Any]:
+        """Run ``func`` for each argument tuple on the I/O pool; exceptions are returned"""
+        if not calls:
+            return []
+        loop = asyncio.get_running_loop()
+        pool = _get_io_pool()
+        return await asyncio.gather(
+            *(loop.run_in_executor(pool, func, *args) for args in calls),
+            return_exceptions=True
+        )
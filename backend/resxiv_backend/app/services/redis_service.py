@@ -54,6 +54,7 @@ class RedisService:
         self.USER_ONLINE_TTL = 300  # 5 minutes
         self.TYPING_TTL = 10  # 10 seconds
         self.MESSAGE_CACHE_TTL = 3600  # 1 hour
+        self.UNREAD_COUNT_TTL = 86400  # 24 hours
     
     # ================================
     # REAL-TIME MESSAGING
@@ -237,11 +238,26 @@ class RedisService:
             List of OnlineStatus objects
         """
         try:
+            if not user_ids:
+                return []
+            
+            # Single MGET round trip regardless of participant count
+            keys = [f"{self.USER_ONLINE_PREFIX}{user_id}" for user_id in user_ids]
+            values = await self.redis_client.mget(keys)
+            
             statuses = []
-            for user_id in user_ids:
-                status = await self.get_user_online_status(user_id)
-                if status:
-                    statuses.append(status)
+            for user_id, user_data in zip(user_ids, values):
+                last_seen = None
+                if user_data:
+                    try:
+                        last_seen = datetime.fromisoformat(json.loads(user_data)["last_seen"])
+                    except (json.JSONDecodeError, KeyError, ValueError):
+                        pass
+                statuses.append(OnlineStatus(
+                    user_id=user_id,
+                    is_online=bool(user_data),
+                    last_seen=last_seen
+                ))
             
             return statuses
             
@@ -249,6 +265,51 @@ class RedisService:
             logger.error(f"Error getting online users: {e}")
             return []
     
+    async def get_online_user_ids(self, user_ids: List[str]) -> List[str]:
+        """
+        Filter a list of user IDs down to the ones currently online.
+        
+        Args:
+            user_ids: User IDs to check
+            
+        Returns:
+            User IDs with a live online key
+        """
+        try:
+            if not user_ids:
+                return []
+            
+            keys = [f"{self.USER_ONLINE_PREFIX}{user_id}" for user_id in user_ids]
+            values = await self.redis_client.mget(keys)
+            return [user_id for user_id, value in zip(user_ids, values) if value]
+            
+        except Exception as e:
+            logger.error(f"Error getting online user IDs: {e}")
+            return []
+    
+    async def get_typing_users(self, conversation_id: uuid.UUID, user_ids: List[str]) -> List[str]:
+        """
+        Get the subset of users currently typing in a conversation.
+        
+        Args:
+            conversation_id: Conversation UUID
+            user_ids: Candidate user IDs (conversation participants)
+            
+        Returns:
+            User IDs with a live typing indicator
+        """
+        try:
+            if not user_ids:
+                return []
+            
+            keys = [f"{self.TYPING_PREFIX}{conversation_id}:{user_id}" for user_id in user_ids]
+            values = await self.redis_client.mget(keys)
+            return [user_id for user_id, value in zip(user_ids, values) if value]
+            
+        except Exception as e:
+            logger.error(f"Error getting typing users: {e}")
+            return []
+    
     # ================================
     # WEBSOCKET CONNECTION MANAGEMENT
     # ================================
@@ -257,26 +318,29 @@ class RedisService:
         """
         Track WebSocket connection for user.
         
+        Conversation connections live in a hash keyed by connection ID so they
+        can be removed with a single HDEL instead of scanning a set.
+        
         Args:
             user_id: User UUID
             conversation_id: Conversation UUID
             connection_id: Unique connection identifier
         """
         try:
-            # Track user connections
             user_key = f"{self.WEBSOCKET_PREFIX}user:{user_id}"
-            await self.redis_client.sadd(user_key, connection_id)
-            await self.redis_client.expire(user_key, self.USER_ONLINE_TTL)
-            
-            # Track conversation connections
             conv_key = f"{self.WEBSOCKET_PREFIX}conversation:{conversation_id}"
             connection_data = {
                 "user_id": str(user_id),
                 "connection_id": connection_id,
                 "connected_at": datetime.utcnow().isoformat()
             }
-            await self.redis_client.sadd(conv_key, json.dumps(connection_data, default=str))
-            await self.redis_client.expire(conv_key, self.USER_ONLINE_TTL)
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.sadd(user_key, connection_id)
+            pipe.expire(user_key, self.USER_ONLINE_TTL)
+            pipe.hset(conv_key, connection_id, json.dumps(connection_data, default=str))
+            pipe.expire(conv_key, self.USER_ONLINE_TTL)
+            await pipe.execute()
             
         except Exception as e:
             logger.error(f"Error adding WebSocket connection: {e}")
@@ -291,25 +355,39 @@ class RedisService:
             connection_id: Connection identifier
         """
         try:
-            # Remove from user connections
-            user_key = f"{self.WEBSOCKET_PREFIX}user:{user_id}"
-            await self.redis_client.srem(user_key, connection_id)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.srem(f"{self.WEBSOCKET_PREFIX}user:{user_id}", connection_id)
+            pipe.hdel(f"{self.WEBSOCKET_PREFIX}conversation:{conversation_id}", connection_id)
+            await pipe.execute()
+                    
+        except Exception as e:
+            logger.error(f"Error removing WebSocket connection: {e}")
+    
+    async def get_conversation_connections(self, conversation_id: uuid.UUID) -> List[Dict[str, Any]]:
+        """
+        Get tracked WebSocket connections for a conversation.
+        
+        Args:
+            conversation_id: Conversation UUID
             
-            # Remove from conversation connections
+        Returns:
+            List of connection info dictionaries
+        """
+        try:
             conv_key = f"{self.WEBSOCKET_PREFIX}conversation:{conversation_id}"
-            # Get all connections and remove the matching one
-            connections = await self.redis_client.smembers(conv_key)
+            connections = await self.redis_client.hvals(conv_key)
+            
+            result = []
             for conn_data in connections:
                 try:
-                    conn_info = json.loads(conn_data)
-                    if conn_info["connection_id"] == connection_id:
-                        await self.redis_client.srem(conv_key, conn_data)
-                        break
+                    result.append(json.loads(conn_data))
                 except json.JSONDecodeError:
                     continue
-                    
+            return result
+            
         except Exception as e:
-            logger.error(f"Error removing WebSocket connection: {e}")
+            logger.error(f"Error getting conversation connections: {e}")
+            return []
     
     # ================================
     # MESSAGE CACHING
@@ -386,13 +464,45 @@ class RedisService:
             conversation_id: Conversation UUID
             user_id: User UUID
         """
+        await self.increment_unread_counts(conversation_id, [user_id])
+    
+    async def increment_unread_counts(self, conversation_id: uuid.UUID, user_ids: List[Any]) -> None:
+        """
+        Increment unread message counts for many users in one round trip.
+        
+        Args:
+            conversation_id: Conversation UUID
+            user_ids: Users whose counters should be incremented
+        """
+        try:
+            if not user_ids:
+                return
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            for user_id in user_ids:
+                key = f"{self.UNREAD_COUNT_PREFIX}{user_id}:{conversation_id}"
+                pipe.incr(key)
+                pipe.expire(key, self.UNREAD_COUNT_TTL)
+            await pipe.execute()
+            
+        except Exception as e:
+            logger.error(f"Error incrementing unread counts: {e}")
+    
+    async def set_unread_count(self, conversation_id: uuid.UUID, user_id: uuid.UUID, count: int) -> None:
+        """
+        Overwrite unread message count for user (e.g. after a read cursor moved).
+        
+        Args:
+            conversation_id: Conversation UUID
+            user_id: User UUID
+            count: Number of unread messages
+        """
         try:
             key = f"{self.UNREAD_COUNT_PREFIX}{user_id}:{conversation_id}"
-            await self.redis_client.incr(key)
-            await self.redis_client.expire(key, 86400)  # 24 hours
+            await self.redis_client.setex(key, self.UNREAD_COUNT_TTL, count)
             
         except Exception as e:
-            logger.error(f"Error incrementing unread count: {e}")
+            logger.error(f"Error setting unread count: {e}")
     
     async def reset_unread_count(self, conversation_id: uuid.UUID, user_id: uuid.UUID) -> None:
         """
@@ -440,10 +550,8 @@ class RedisService:
         """
         try:
             key = f"{self.CONVERSATION_PREFIX}{conversation_id}:participants"
-            if await self.redis_client.exists(key):
-                members = await self.redis_client.smembers(key)
-                return [m.decode() if isinstance(m, bytes) else str(m) for m in members]
-            return []
+            members = await self.redis_client.smembers(key)
+            return [m.decode() if isinstance(m, bytes) else str(m) for m in members]
         except Exception as e:
             logger.error(f"Error getting conversation participants: {e}")
             return [] 
\ No newline at end of file
@@ -91,13 +91,95 @@ class ResearchAggregatorService:
         for service in self.services.values():
             await service.__aexit__(exc_type, exc_val, exc_tb)
     
+    # Adaptive timeout based on service reliability
+    SOURCE_TIMEOUTS = {
+        'openalex': 12.0,        # Most reliable, shorter timeout
+        'arxiv': 10.0,           # Generally fast
+        'crossref': 15.0,        # Can be slower
+        'papers_with_code': 20.0 # Often slow, longer timeout
+    }
+    SOURCE_DATA = {
+        'openalex': DataSource.OPENALEX,
+        'arxiv': DataSource.ARXIV,
+        'crossref': DataSource.CROSSREF,
+        'papers_with_code': DataSource.PAPERS_WITH_CODE
+    }
+    
+    def paper_search_sources(self, include_semantics: bool = True, include_code: bool = True) -> List[str]:
+        """
+        Sources a paper search fans out to, in priority order
+        
+        Args:
+            include_semantics: Include CrossRef (slow, good metadata)
+            include_code: Include Papers with Code (valuable, often unreliable)
+            
+        Returns:
+            Source names accepted by ``search_source``
+        """
+        # OpenAlex (most reliable and comprehensive) and arXiv (fast) always run
+        sources = ['openalex', 'arxiv']
+        if include_semantics:
+            sources.append('crossref')
+        if include_code:
+            sources.append('papers_with_code')
+        return sources
+    
+    async def search_source(
+        self,
+        source: str,
+        query: str,
+        limit: int = 20,
+        deadline: Optional[float] = None
+    ) -> SearchResponse:
+        """
+        Search one paper source without raising
+        
+        Args:
+            source: Source name from ``paper_search_sources``
+            query: Search query
+            limit: Number of results
+            deadline: Optional event loop time by which the call must finish
+            
+        Returns:
+            The source's response, or an unsuccessful empty response on timeout or error
+        """
+        timeout = self.SOURCE_TIMEOUTS.get(source, 15.0)
+        if deadline is not None:
+            timeout = max(0.0, min(timeout, deadline - asyncio.get_running_loop().time()))
+        
+        try:
+            result = await asyncio.wait_for(
+                getattr(self, source).search_papers(SearchQuery(query=query, limit=limit)),
+                timeout=timeout
+            )
+            logger.info(f"Service {source} completed successfully")
+            return result
+        except asyncio.TimeoutError:
+            logger.warning(f"Service {source} timed out after {timeout:.1f}s")
+            error, execution_time = {'error': 'Service timeout', 'timeout_seconds': timeout}, timeout
+        except Exception as e:
+            logger.error(f"Service {source} failed: {str(e)}")
+            error, execution_time = {'error': str(e)}, 0.0
+        return SearchResponse(
+            success=False,
+            query=query,
+            data_source=self.SOURCE_DATA.get(source, DataSource.OPENALEX),
+            total_results=0,
+            returned_results=0,
+            offset=0,
+            results=[],
+            execution_time=execution_time,
+            metadata=error
+        )
+    
     async def comprehensive_paper_search(
         self,
         query: str,
         limit: int = 20,
         include_semantics: bool = True,
         include_code: bool = True,
-        cross_reference: bool = True
+        cross_reference: bool = True,
+        timeout_budget: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Comprehensive paper search across multiple sources with cross-referencing
@@ -108,6 +190,8 @@ class ResearchAggregatorService:
             include_semantics: Include Semantic Scholar results
             include_code: Include Papers with Code results
             cross_reference: Cross-reference papers across sources
+            timeout_budget: Optional overall budget (seconds); every source
+                call gets at most the time remaining in it
             
         Returns:
             Aggregated and cross-referenced paper results
@@ -123,87 +207,14 @@ class ResearchAggregatorService:
                 return cached_result['data']
         
         try:
-            search_query = SearchQuery(query=query, limit=limit)
-            
-            # Create individual service tasks with timeout protection
-            async def safe_service_call(service_name: str, service_call, timeout: float = 15.0):
-                """Wrapper to make individual service calls safe"""
-                # Map service names to DataSource enum values
-                data_source_mapping = {
-                    'openalex': DataSource.OPENALEX,
-                    'arxiv': DataSource.ARXIV,
-                    'crossref': DataSource.CROSSREF,
-                    'papers_with_code': DataSource.PAPERS_WITH_CODE
-                }
-                
-                try:
-                    # Adaptive timeout based on service reliability
-                    service_timeouts = {
-                        'openalex': 12.0,        # Most reliable, shorter timeout
-                        'arxiv': 10.0,           # Generally fast
-                        'crossref': 15.0,        # Can be slower
-                        'papers_with_code': 20.0 # Often slow, longer timeout
-                    }
-                    actual_timeout = service_timeouts.get(service_name, timeout)
-                    
-                    result = await asyncio.wait_for(service_call, timeout=actual_timeout)
-                    logger.info(f"Service {service_name} completed successfully")
-                    return service_name, result
-                except asyncio.TimeoutError:
-                    logger.warning(f"Service {service_name} timed out after {actual_timeout}s")
-                    return service_name, SearchResponse(
-                        success=False,
-                        query=query,
-                        data_source=data_source_mapping.get(service_name, DataSource.OPENALEX),
-                        total_results=0,
-                        returned_results=0,
-                        offset=0,
-                        results=[],
-                        execution_time=actual_timeout,
-                        metadata={'error': 'Service timeout', 'timeout_seconds': actual_timeout}
-                    )
-                except Exception as e:
-                    logger.error(f"Service {service_name} failed: {str(e)}")
-                    return service_name, SearchResponse(
-                        success=False,
-                        query=query,
-                        data_source=data_source_mapping.get(service_name, DataSource.OPENALEX),
-                        total_results=0,
-                        returned_results=0,
-                        offset=0,
-                        results=[],
-                        execution_time=0.0,
-                        metadata={'error': str(e)}
-                    )
-            
-            # Build list of service calls with priority ordering
-            search_tasks = []
-            
-            # Priority 1: Always include OpenAlex (most reliable and comprehensive)
-            search_tasks.append(
-                safe_service_call('openalex', self.openalex.search_papers(search_query))
-            )
-            
-            # Priority 2: ArXiv (reliable and fast)
-            search_tasks.append(
-                safe_service_call('arxiv', self.arxiv.search_papers(search_query))
-            )
-            
-            # Priority 3: Conditional services based on user preferences
-            if include_semantics:
-                # CrossRef can be slow but provides good metadata
-                search_tasks.append(
-                    safe_service_call('crossref', self.crossref.search_papers(search_query))
-                )
-            
-            if include_code:
-                # PapersWithCode is valuable but often unreliable
-                search_tasks.append(
-                    safe_service_call('papers_with_code', self.papers_with_code.search_papers(search_query))
-                )
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_budget if timeout_budget is not None else None
+            sources = self.paper_search_sources(include_semantics, include_code)
             
             # Execute all searches with individual timeout protection
-            results = await asyncio.gather(*search_tasks, return_exceptions=True)
+            results = await asyncio.gather(*[
+                self.search_source(source, query, limit, deadline) for source in sources
+            ])
             
             # Process results safely with better error handling
             all_papers = []
@@ -211,13 +222,7 @@ class ResearchAggregatorService:
             successful_sources = 0
             total_execution_time = 0
             
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Search task failed with exception: {result}")
-                    continue
-                    
-                service_name, search_response = result
-                
+            for service_name, search_response in zip(sources, results):
                 if isinstance(search_response, SearchResponse):
                     source_stats[service_name] = {
                         'success': search_response.success,
@@ -253,13 +258,15 @@ class ResearchAggregatorService:
                     "metadata": {
                         "error": "All search sources failed",
                         "successful_sources": 0,
-                        "total_sources": len(search_tasks),
+                        "total_sources": len(sources),
                         "fallback_reason": "service_failures"
                     }
                 }
             else:
-                # Deduplicate papers using multiple strategies
-                if cross_reference and len(all_papers) > 1:
+                # Deduplicate papers using multiple strategies; cross-referencing
+                # is skipped once the budget is spent
+                out_of_time = deadline is not None and loop.time() >= deadline
+                if cross_reference and len(all_papers) > 1 and not out_of_time:
                     deduplicated_papers = await self._cross_reference_papers(all_papers)
                     cross_ref_info = {"deduplicated": True, "original_count": len(all_papers), "final_count": len(deduplicated_papers)}
                 else:
@@ -279,7 +286,7 @@ class ResearchAggregatorService:
                     "execution_time": time.time() - start_time,
                     "metadata": {
                         "successful_sources": successful_sources,
-                        "total_sources": len(search_tasks),
+                        "total_sources": len(sources),
                         "deduplication": cross_ref_info,
                         "ranking_applied": True
                     }
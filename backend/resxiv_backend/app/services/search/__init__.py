@@ -0,0 +1,17 @@
+"""
+Search Services Package - L6 Engineering Standards
+
+Cross-entity search with hybrid vector and full-text retrieval, and
+indexed prefix suggestions for the search box.
+"""
+
+from .hybrid_search_service import HybridSearchService, hybrid_search_service, reciprocal_rank_fusion
+from .suggestion_service import SuggestionService, suggestion_service
+
+__all__ = [
+    "HybridSearchService",
+    "hybrid_search_service",
+    "reciprocal_rank_fusion",
+    "SuggestionService",
+    "suggestion_service"
+]
@@ -0,0 +1,331 @@
+"""
+Hybrid Search Service - L6 Engineering Standards
+Vector and full-text retrieval fused with reciprocal-rank fusion.
+Single Responsibility: Running and combining cross-entity searches.
+
+- Paper search runs the pgvector nearest-neighbour query and the
+  ``search_vector`` full-text query concurrently and fuses the two rankings
+  with reciprocal-rank fusion (RRF), which needs no score normalisation
+- Paper metadata for the fused results is loaded in one batched query
+- Entity searches (papers, projects, users) run in parallel, each on its own
+  session, since one AsyncSession cannot run concurrent queries
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import text
+
+from app.core.error_handling import ServiceError, ErrorCodes
+
+logger = logging.getLogger(__name__)
+
+RRF_K = 60
+CANDIDATE_MULTIPLIER = 3
+SNIPPET_LENGTH = 200
+SEARCH_TYPES = {"semantic", "keyword", "hybrid"}
+
+VECTOR_SQL = text("""
+    SELECT CAST(pe.paper_id AS TEXT) AS paper_id,
+           1 - (pe.embedding <=> CAST(:embedding AS vector)) AS similarity,
+           LEFT(pe.source_text, :snippet_length) AS snippet
+    FROM paper_embeddings pe
+    WHERE pe.embedding IS NOT NULL
+    ORDER BY pe.embedding <=> CAST(:embedding AS vector)
+    LIMIT :limit
+""")
+
+KEYWORD_SQL = text("""
+    SELECT CAST(p.id AS TEXT) AS paper_id, ts_rank_cd(p.search_vector, query) AS rank
+    FROM papers p, websearch_to_tsquery('english', :q) AS query
+    WHERE p.search_vector @@ query AND p.deleted_at IS NULL
+    ORDER BY rank DESC
+    LIMIT :limit
+""")
+
+HYDRATE_SQL = text("""
+    SELECT DISTINCT ON (p.id)
+           CAST(p.id AS TEXT) AS paper_id, p.title, p.authors, p.created_at,
+           LEFT(p.abstract, :snippet_length) AS abstract, pp.project_id
+    FROM papers p
+    LEFT JOIN project_papers pp ON p.id = pp.paper_id
+    WHERE p.id = ANY(CAST(:paper_ids AS UUID[])) AND p.deleted_at IS NULL
+    ORDER BY p.id
+""")
+
+PROJECTS_SQL = text("""
+    SELECT p.id, p.name, p.description, p.created_at,
+           pm.member_count, pp.paper_count,
+           ts_rank(to_tsvector('english', p.name || ' ' || COALESCE(p.description, '')),
+                   plainto_tsquery('english', :q)) AS rank
+    FROM projects p
+    LEFT JOIN (
+        SELECT project_id, COUNT(*) AS member_count
+        FROM project_members
+        GROUP BY project_id
+    ) pm ON p.id = pm.project_id
+    LEFT JOIN (
+        SELECT project_id, COUNT(*) AS paper_count
+        FROM project_papers
+        GROUP BY project_id
+    ) pp ON p.id = pp.project_id
+    WHERE p.deleted_at IS NULL
+    AND to_tsvector('english', p.name || ' ' || COALESCE(p.description, ''))
+        @@ plainto_tsquery('english', :q)
+    ORDER BY rank DESC
+    LIMIT :limit
+""")
+
+USERS_SQL = text("""
+    SELECT u.id, u.name, u.email, u.interests,
+           ts_rank(to_tsvector('english', u.name || ' ' || COALESCE(u.email, '') || ' ' ||
+                               COALESCE(array_to_string(u.interests, ' '), '')),
+                   plainto_tsquery('english', :q)) AS rank
+    FROM users u
+    WHERE u.deleted_at IS NULL
+    AND to_tsvector('english', u.name || ' ' || COALESCE(u.email, '') || ' ' ||
+                    COALESCE(array_to_string(u.interests, ' '), ''))
+        @@ plainto_tsquery('english', :q)
+    ORDER BY rank DESC
+    LIMIT :limit
+""")
+
+
+def reciprocal_rank_fusion(rankings: Dict[str, Sequence[str]], k: int = RRF_K) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked id lists; each list contributes ``1 / (k + rank)`` per id.
+
+    Args:
+        rankings: Ranked ids per retriever, best first
+        k: Damping constant; larger values flatten the head of each list
+
+    Returns:
+        Entries with ``id``, ``score`` and per-retriever ``ranks``, best first
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for source, ids in rankings.items():
+        for rank, item_id in enumerate(ids, start=1):
+            entry = fused.setdefault(item_id, {"id": item_id, "score": 0.0, "ranks": {}})
+            entry["score"] += 1.0 / (k + rank)
+            entry["ranks"][source] = rank
+    return sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+
+
+class HybridSearchService:
+    """Cross-entity search with vector/full-text fusion for papers."""
+
+    def __init__(self, session_factory=None, embed=None):
+        self._session_factory = session_factory
+        self._embed = embed
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.database.connection import db_manager
+        return db_manager.get_postgres_session()
+
+    async def _embedding(self, query: str) -> List[float]:
+        if self._embed is not None:
+            return await self._embed(query)
+        embedder = _shared_embedder()
+        vector = await asyncio.get_running_loop().run_in_executor(
+            embedder.executor, embedder._generate_embedding_sync, query
+        )
+        return vector.tolist()
+
+    # ================================
+    # UNIFIED SEARCH
+    # ================================
+
+    async def search(
+        self,
+        query: str,
+        entity_types: Sequence[str],
+        search_type: str = "hybrid",
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        Search several entity types at once.
+
+        Args:
+            query: Search query
+            entity_types: Any of papers, projects, users
+            search_type: semantic, keyword or hybrid (papers only)
+            limit: Maximum results per entity type
+
+        Returns:
+            Results keyed by entity type, plus the measured search time
+        """
+        started = time.perf_counter()
+        searches = {
+            "papers": lambda: self.search_papers(query, limit, search_type),
+            "projects": lambda: self.search_projects(query, limit),
+            "users": lambda: self.search_users(query, limit)
+        }
+        entities = [entity for entity in entity_types if entity in searches]
+        found = await asyncio.gather(*(searches[entity]() for entity in entities))
+
+        return {
+            "results": {
+                entity: {"total": len(items), "items": items}
+                for entity, items in zip(entities, found)
+            },
+            "search_time_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    # ================================
+    # PAPERS
+    # ================================
+
+    async def search_papers(
+        self,
+        query: str,
+        limit: int = 20,
+        search_type: str = "hybrid",
+        similarity_threshold: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """Ranked papers with metadata; ``relevance_score`` is the RRF score for hybrid."""
+        if search_type not in SEARCH_TYPES:
+            raise ServiceError(
+                f"Unknown search type '{search_type}'; use one of {', '.join(sorted(SEARCH_TYPES))}",
+                ErrorCodes.VALIDATION_ERROR
+            )
+        candidates = limit * CANDIDATE_MULTIPLIER if search_type == "hybrid" else limit
+        vector_hits: List[Dict[str, Any]] = []
+        keyword_hits: List[Dict[str, Any]] = []
+
+        if search_type == "semantic":
+            vector_hits = await self._vector_ranking(query, candidates)
+        elif search_type == "keyword":
+            keyword_hits = await self._keyword_ranking(query, candidates)
+        else:
+            vector_result, keyword_hits = await asyncio.gather(
+                self._vector_ranking(query, candidates),
+                self._keyword_ranking(query, candidates),
+                return_exceptions=True
+            )
+            if isinstance(keyword_hits, BaseException):
+                raise keyword_hits
+            if isinstance(vector_result, BaseException):
+                # Keyword results are still useful when the embedding model is unavailable
+                logger.warning(f"Vector retrieval failed, using full-text only: {vector_result}")
+                vector_result = []
+            vector_hits = vector_result
+
+        vector_hits = [hit for hit in vector_hits if hit["similarity"] >= similarity_threshold]
+        fused = reciprocal_rank_fusion({
+            "semantic": [hit["paper_id"] for hit in vector_hits],
+            "keyword": [hit["paper_id"] for hit in keyword_hits]
+        })[:limit]
+        if not fused:
+            return []
+
+        vector_by_id = {hit["paper_id"]: hit for hit in vector_hits}
+        keyword_by_id = {hit["paper_id"]: hit for hit in keyword_hits}
+        papers = await self._hydrate([entry["id"] for entry in fused])
+
+        items = []
+        for entry in fused:
+            paper = papers.get(entry["id"])
+            if paper is None:
+                continue  # deleted since it was indexed
+            vector_hit = vector_by_id.get(entry["id"])
+            keyword_hit = keyword_by_id.get(entry["id"])
+            if search_type == "semantic":
+                score = vector_hit["similarity"]
+            elif search_type == "keyword":
+                score = keyword_hit["rank"]
+            else:
+                score = entry["score"]
+            snippet = (vector_hit or {}).get("snippet") or paper["abstract"] or ""
+
+            items.append({
+                "id": entry["id"],
+                "title": paper["title"],
+                "authors": paper["authors"] or [],
+                "relevance_score": float(score),
+                "match_type": "+".join(entry["ranks"]) if search_type == "hybrid" else search_type,
+                "ranks": entry["ranks"],
+                "project_id": str(paper["project_id"]) if paper["project_id"] else None,
+                "created_at": paper["created_at"].isoformat() if paper["created_at"] else None,
+                "snippet": snippet + "..." if len(snippet) >= SNIPPET_LENGTH else snippet
+            })
+        return items
+
+    async def _vector_ranking(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        embedding = await self._embedding(query)
+        async with self._session() as session:
+            result = await session.execute(VECTOR_SQL, {
+                "embedding": "[" + ",".join(f"{x:.6f}" for x in embedding) + "]",
+                "limit": limit,
+                "snippet_length": SNIPPET_LENGTH
+            })
+            return [dict(row) for row in result.mappings().all()]
+
+    async def _keyword_ranking(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        async with self._session() as session:
+            result = await session.execute(KEYWORD_SQL, {"q": query, "limit": limit})
+            return [dict(row) for row in result.mappings().all()]
+
+    async def _hydrate(self, paper_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        async with self._session() as session:
+            result = await session.execute(HYDRATE_SQL, {
+                "paper_ids": paper_ids,
+                "snippet_length": SNIPPET_LENGTH
+            })
+            return {row["paper_id"]: dict(row) for row in result.mappings().all()}
+
+    # ================================
+    # PROJECTS AND USERS
+    # ================================
+
+    async def search_projects(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        async with self._session() as session:
+            result = await session.execute(PROJECTS_SQL, {"q": query, "limit": limit})
+            rows = result.fetchall()
+        return [
+            {
+                "id": str(row.id),
+                "name": row.name,
+                "description": row.description,
+                "member_count": row.member_count or 0,
+                "paper_count": row.paper_count or 0,
+                "relevance_score": float(row.rank),
+                "match_type": "keyword",
+                "created_at": row.created_at.isoformat() if row.created_at else None
+            }
+            for row in rows
+        ]
+
+    async def search_users(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        async with self._session() as session:
+            result = await session.execute(USERS_SQL, {"q": query, "limit": limit})
+            rows = result.fetchall()
+        return [
+            {
+                "id": str(row.id),
+                "name": row.name,
+                "email": row.email,
+                "interests": row.interests or [],
+                "relevance_score": float(row.rank),
+                "match_type": "keyword"
+            }
+            for row in rows
+        ]
+
+
+_embedder = None
+
+
+def _shared_embedder():
+    """One embedding model per process instead of one per request"""
+    global _embedder
+    if _embedder is None:
+        from app.services.paper.paper_embedding_service import PaperEmbeddingService
+        _embedder = PaperEmbeddingService(session=None)
+    return _embedder
+
+
+hybrid_search_service = HybridSearchService()
@@ -0,0 +1,155 @@
+"""
+Suggestion Service - L6 Engineering Standards
+Prefix autosuggest for papers, projects and users.
+Single Responsibility: Serving search-box completions.
+
+- Lookups are range scans on ``lower(column) text_pattern_ops`` indexes
+  (migration 011); the range form keeps the index usable under the generic
+  plans asyncpg's prepared statements end up with, where ``LIKE :pattern``
+  would not be
+- Access control is part of the lookup: papers and projects are only
+  suggested from projects the user is a member of, and users only when they
+  share one of those projects
+- All requested entity types are answered in a single round trip, and
+  recent answers are kept in a short per-process TTL cache since typing and
+  backspacing repeat the same prefixes
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+CACHE_TTL_SECONDS = 30
+CACHE_MAX_ENTRIES = 4096
+
+PAPER_SUGGESTIONS_SQL = """
+    (SELECT p.title AS text, 'paper_title' AS type, 'papers' AS category
+     FROM papers p
+     WHERE lower(p.title) ~>=~ :prefix AND lower(p.title) ~<~ :prefix_end
+     AND p.deleted_at IS NULL
+     AND EXISTS (
+         SELECT 1 FROM project_papers pp
+         JOIN project_members pm ON pm.project_id = pp.project_id
+         WHERE pp.paper_id = p.id AND pm.user_id = :user_id
+     )
+     ORDER BY lower(p.title) USING ~<~
+     LIMIT :limit)
+"""
+
+PROJECT_SUGGESTIONS_SQL = """
+    (SELECT p.name AS text, 'project_name' AS type, 'projects' AS category
+     FROM projects p
+     WHERE lower(p.name) ~>=~ :prefix AND lower(p.name) ~<~ :prefix_end
+     AND p.deleted_at IS NULL
+     AND EXISTS (
+         SELECT 1 FROM project_members pm
+         WHERE pm.project_id = p.id AND pm.user_id = :user_id
+     )
+     ORDER BY lower(p.name) USING ~<~
+     LIMIT :limit)
+"""
+
+USER_SUGGESTIONS_SQL = """
+    (SELECT u.name AS text, 'user_name' AS type, 'users' AS category
+     FROM users u
+     WHERE lower(u.name) ~>=~ :prefix AND lower(u.name) ~<~ :prefix_end
+     AND u.deleted_at IS NULL
+     AND EXISTS (
+         SELECT 1 FROM project_members theirs
+         JOIN project_members pm ON pm.project_id = theirs.project_id
+         WHERE theirs.user_id = u.id AND pm.user_id = :user_id
+     )
+     ORDER BY lower(u.name) USING ~<~
+     LIMIT :limit)
+"""
+
+ENTITY_SQL = {
+    "papers": PAPER_SUGGESTIONS_SQL,
+    "projects": PROJECT_SUGGESTIONS_SQL,
+    "users": USER_SUGGESTIONS_SQL
+}
+
+
+def prefix_range(query: str) -> Tuple[str, str]:
+    """
+    Half-open ``[prefix, prefix_end)`` range covering every string starting
+    with the lower-cased query.
+    """
+    prefix = query.strip().lower()
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SuggestionService:
+    """Indexed, ACL-filtered prefix suggestions."""
+
+    def __init__(self, session_factory=None, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._cache: "OrderedDict[tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.database.connection import db_manager
+        return db_manager.get_postgres_session()
+
+    async def suggest(
+        self,
+        query: str,
+        user_id: str,
+        entity_types: Optional[Sequence[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggest entity names starting with ``query``.
+
+        Args:
+            query: Partial input from the search box
+            user_id: User whose project memberships scope every result
+            entity_types: Any of papers, projects, users; all when omitted
+            limit: Maximum suggestions overall
+
+        Returns:
+            Suggestions with ``text``, ``type`` and ``category``
+        """
+        entities = [e for e in (entity_types or ENTITY_SQL) if e in ENTITY_SQL]
+        if not query.strip() or not entities:
+            return []
+
+        key = (str(user_id), tuple(entities), query.strip().lower(), limit)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._ttl_seconds:
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        prefix, prefix_end = prefix_range(query)
+        per_entity = max(1, -(-limit // len(entities)))
+        statement = text(" UNION ALL ".join(ENTITY_SQL[e] for e in entities))
+
+        async with self._session() as session:
+            result = await session.execute(statement, {
+                "prefix": prefix,
+                "prefix_end": prefix_end,
+                "user_id": str(user_id),
+                "limit": per_entity
+            })
+            rows = result.mappings().all()
+
+        suggestions = []
+        seen = set()
+        for row in rows:
+            if (row["type"], row["text"]) in seen:
+                continue
+            seen.add((row["type"], row["text"]))
+            suggestions.append({"text": row["text"], "type": row["type"], "category": row["category"]})
+        suggestions = suggestions[:limit]
+
+        self._cache[key] = (time.monotonic(), suggestions)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return suggestions
+
+
+suggestion_service = SuggestionService()
@@ -22,7 +22,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from app.core.llm_gateway import llm_gateway
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from .research_agent_core import SearchQuery, SearchResponse, Paper, DataSource
@@ -86,7 +86,7 @@ class SemanticResearchOrchestrator:
     """
     
     def __init__(self, openai_api_key: str, model_name: str = "gpt-4o-mini"):
-        self.llm = ChatOpenAI(
+        self.llm = llm_gateway.chat_model(
             model=model_name,
             api_key=openai_api_key,
             temperature=0.1
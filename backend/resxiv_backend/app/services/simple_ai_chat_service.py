@@ -9,16 +9,15 @@ import time
 import uuid
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from openai import AsyncOpenAI
-
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
 from app.repositories.conversation_repository import ConversationRepository
 from app.models.conversation_models import ConversationType
 from app.database.connection import DatabaseManager
 from app.config.settings import get_settings
+from app.core.llm_gateway import llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +33,13 @@ class SimpleAIChatService:
     - No complex tool orchestration
     """
     
+    CHAT_PARAMS = {"max_tokens": 1000, "temperature": 0.7}
+    
     def __init__(self, session: AsyncSession):
         self.session = session
         self.conversation_repo = ConversationRepository(session)
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.agentic.openai_api_key)
+        self.llm = llm_gateway
         self.mongo_db = None
         
     async def initialize(self):
@@ -78,85 +79,17 @@ class SimpleAIChatService:
         try:
             logger.info(f"Processing AI chat for user {user_id}, project {project_id}, conversation_id: {conversation_id}")
             
-            if self.mongo_db is None:
-                await self.initialize()
-            
-            project_uuid = uuid.UUID(project_id)
-            
-            # Get or create conversation
-            conversation = None
-            
-            if conversation_id:
-                try:
-                    conv_uuid = uuid.UUID(conversation_id)
-                    existing_conversation = await self.conversation_repo.get_conversation_by_id(conv_uuid)
-                    
-                    # Validate the existing conversation
-                    if (existing_conversation and 
-                        existing_conversation.type == ConversationType.AI and
-                        existing_conversation.entity == project_uuid and
-                        str(existing_conversation.created_by) == user_id):
-                        
-                        conversation = existing_conversation
-                        conversation_id = str(conversation.id)  # Ensure conversation_id is properly set
-                        logger.info(f"Using existing AI conversation {conversation_id}")
-                    else:
-                        # Log why we're not using the provided conversation_id
-                        if not existing_conversation:
-                            logger.warning(f"Conversation {conversation_id} not found, creating new AI conversation")
-                        elif existing_conversation.type != ConversationType.AI:
-                            logger.warning(f"Conversation {conversation_id} is type {existing_conversation.type}, not AI. Creating new AI conversation")
-                        elif existing_conversation.entity != project_uuid:
-                            logger.warning(f"Conversation {conversation_id} belongs to different project, creating new AI conversation")
-                        else:
-                            logger.warning(f"User {user_id} doesn't have access to conversation {conversation_id}, creating new AI conversation")
-                            
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid conversation_id format '{conversation_id}': {e}. Creating new AI conversation")
-            
-            # Create new AI conversation if we don't have a valid one
-            if not conversation:
-                conversation = await self.conversation_repo.create(
-                    type=ConversationType.AI,
-                    entity=project_uuid,  # AI conversations belong to projects
-                    is_group=False,
-                    created_by=uuid.UUID(user_id)
-                )
-                await self.session.commit()
-                conversation_id = str(conversation.id)
-                logger.info(f"Created new AI conversation {conversation_id} for project {project_id}")
-            
-            # Get conversation history for context
-            history = await self._get_conversation_history(conversation_id)
+            turn = await self.prepare_chat(user_id, project_id, message, conversation_id)
             
             # Generate AI response
-            ai_response = await self._generate_ai_response(message, history)
+            ai_response = await self._generate_ai_response(turn["messages"], project_id)
             
             # Save messages to MongoDB
-            await self._save_chat_messages(
-                conversation_id=conversation_id,
-                user_id=user_id,
-                project_id=project_id,
-                user_message=message,
-                ai_response=ai_response
-            )
-            
-            processing_time = time.time() - start_time
-            
-            logger.info(f"AI chat completed successfully for conversation {conversation_id} in {processing_time:.3f}s")
+            await self._save_turn(turn, ai_response)
             
-            return {
-                "success": True,
-                "response": ai_response,
-                "conversation_id": conversation_id,
-                "processing_time": processing_time,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "metadata": {
-                    "conversation_type": "AI",
-                    "model": self.settings.agentic.agentic_model,
-                    "project_id": project_id
-                }
-            }
+            result = self._chat_result(turn, ai_response, start_time)
+            logger.info(f"AI chat completed successfully for conversation {turn['conversation_id']} in {result['processing_time']:.3f}s")
+            return result
             
         except ServiceError:
             raise
@@ -167,6 +100,142 @@ class SimpleAIChatService:
                 ErrorCodes.AGENTIC_PROCESSING_ERROR
             )
     
+    async def prepare_chat(
+        self,
+        user_id: str,
+        project_id: str,
+        message: str,
+        conversation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Resolve the AI conversation and prompt for a chat turn.
+        
+        Everything that needs the SQL session happens here, so a streamed
+        response can be produced afterwards without it.
+        
+        Returns:
+            Chat turn consumed by ``_generate_ai_response``/``stream_chat``
+        """
+        if self.mongo_db is None:
+            await self.initialize()
+        
+        project_uuid = uuid.UUID(project_id)
+        
+        # Get or create conversation
+        conversation = None
+        
+        if conversation_id:
+            try:
+                conv_uuid = uuid.UUID(conversation_id)
+                existing_conversation = await self.conversation_repo.get_conversation_by_id(conv_uuid)
+                
+                # Validate the existing conversation
+                if (existing_conversation and 
+                    existing_conversation.type == ConversationType.AI and
+                    existing_conversation.entity == project_uuid and
+                    str(existing_conversation.created_by) == user_id):
+                    
+                    conversation = existing_conversation
+                    conversation_id = str(conversation.id)  # Ensure conversation_id is properly set
+                    logger.info(f"Using existing AI conversation {conversation_id}")
+                else:
+                    # Log why we're not using the provided conversation_id
+                    if not existing_conversation:
+                        logger.warning(f"Conversation {conversation_id} not found, creating new AI conversation")
+                    elif existing_conversation.type != ConversationType.AI:
+                        logger.warning(f"Conversation {conversation_id} is type {existing_conversation.type}, not AI. Creating new AI conversation")
+                    elif existing_conversation.entity != project_uuid:
+                        logger.warning(f"Conversation {conversation_id} belongs to different project, creating new AI conversation")
+                    else:
+                        logger.warning(f"User {user_id} doesn't have access to conversation {conversation_id}, creating new AI conversation")
+                        
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Invalid conversation_id format '{conversation_id}': {e}. Creating new AI conversation")
+        
+        # Create new AI conversation if we don't have a valid one
+        if not conversation:
+            conversation = await self.conversation_repo.create(
+                type=ConversationType.AI,
+                entity=project_uuid,  # AI conversations belong to projects
+                is_group=False,
+                created_by=uuid.UUID(user_id)
+            )
+            await self.session.commit()
+            conversation_id = str(conversation.id)
+            logger.info(f"Created new AI conversation {conversation_id} for project {project_id}")
+        
+        # Get conversation history for context
+        history = await self._get_conversation_history(conversation_id)
+        
+        return {
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "project_id": project_id,
+            "message": message,
+            "messages": self._build_messages(message, history)
+        }
+    
+    async def stream_chat(
+        self,
+        turn: Dict[str, Any],
+        start_time: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the AI response for a prepared chat turn.
+        
+        Yields a ``start`` event, one ``token`` event per content delta and a
+        final ``done`` event with the same payload as ``chat``. Messages are
+        persisted once the stream completes.
+        """
+        start_time = start_time or time.time()
+        yield {"event": "start", "data": {"conversation_id": turn["conversation_id"]}}
+        
+        chunks = []
+        try:
+            async for delta in self.llm.stream_chat_completion(
+                model=self.settings.agentic.agentic_model,
+                messages=turn["messages"],
+                project_id=turn["project_id"],
+                **self.CHAT_PARAMS
+            ):
+                chunks.append(delta)
+                yield {"event": "token", "data": {"content": delta}}
+        except ServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to stream AI response: {e}")
+            raise ServiceError(
+                "Failed to generate AI response",
+                ErrorCodes.EXTERNAL_SERVICE_ERROR
+            )
+        
+        ai_response = "".join(chunks)
+        await self._save_turn(turn, ai_response)
+        yield {"event": "done", "data": self._chat_result(turn, ai_response, start_time)}
+    
+    async def _save_turn(self, turn: Dict[str, Any], ai_response: str) -> None:
+        await self._save_chat_messages(
+            conversation_id=turn["conversation_id"],
+            user_id=turn["user_id"],
+            project_id=turn["project_id"],
+            user_message=turn["message"],
+            ai_response=ai_response
+        )
+    
+    def _chat_result(self, turn: Dict[str, Any], ai_response: str, start_time: float) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "response": ai_response,
+            "conversation_id": turn["conversation_id"],
+            "processing_time": time.time() - start_time,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "metadata": {
+                "conversation_type": "AI",
+                "model": self.settings.agentic.agentic_model,
+                "project_id": turn["project_id"]
+            }
+        }
+    
     async def _get_conversation_history(self, conversation_id: str) -> List[Dict[str, Any]]:
         """Get recent conversation history for context"""
         try:
@@ -182,47 +251,55 @@ class SimpleAIChatService:
             logger.warning(f"Failed to get conversation history: {e}")
             return []
     
-    async def _generate_ai_response(
+    def _build_messages(
         self,
         user_message: str,
         history: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Build OpenAI chat messages from history and the new user message"""
+        # Build messages for OpenAI
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a helpful AI assistant for ResXiv, a research platform. "
+                    "You are currently helping within a specific research project context. "
+                    "Assist users with research-related questions, project discussions, "
+                    "general inquiries, and provide helpful, accurate responses. "
+                    "Be concise but informative."
+                )
+            }
+        ]
+        
+        # Add conversation history
+        for msg in history[-6:]:  # Last 6 messages for context
+            is_ai_response = msg.get("metadata", {}).get("ai_response", False)
+            role = "assistant" if is_ai_response else "user"
+            messages.append({
+                "role": role,
+                "content": msg["message"]
+            })
+        
+        # Add current user message
+        messages.append({
+            "role": "user",
+            "content": user_message
+        })
+        
+        return messages
+    
+    async def _generate_ai_response(
+        self,
+        messages: List[Dict[str, Any]],
+        project_id: Optional[str] = None
     ) -> str:
         """Generate AI response using OpenAI GPT"""
         try:
-            # Build messages for OpenAI
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a helpful AI assistant for ResXiv, a research platform. "
-                        "You are currently helping within a specific research project context. "
-                        "Assist users with research-related questions, project discussions, "
-                        "general inquiries, and provide helpful, accurate responses. "
-                        "Be concise but informative."
-                    )
-                }
-            ]
-            
-            # Add conversation history
-            for msg in history[-6:]:  # Last 6 messages for context
-                is_ai_response = msg.get("metadata", {}).get("ai_response", False)
-                role = "assistant" if is_ai_response else "user"
-                messages.append({
-                    "role": role,
-                    "content": msg["message"]
-                })
-            
-            # Add current user message
-            messages.append({
-                "role": "user",
-                "content": user_message
-            })
-            
-            response = await self.client.chat.completions.create(
+            response = await self.llm.chat_completion(
                 model=self.settings.agentic.agentic_model,
                 messages=messages,
-                max_tokens=1000,
-                temperature=0.7
+                project_id=project_id,
+                **self.CHAT_PARAMS
             )
             
             return response.choices[0].message.content
@@ -231,7 +308,7 @@ class SimpleAIChatService:
             logger.error(f"Failed to generate AI response: {e}")
             raise ServiceError(
                 "Failed to generate AI response",
-                ErrorCodes.EXTERNAL_API_ERROR
+                ErrorCodes.EXTERNAL_SERVICE_ERROR
             )
     
     async def _save_chat_messages(
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user_repository import UserRepository
 from app.core.error_handling import handle_service_errors, ServiceError, ErrorCodes
+from app.core.user_directory import user_directory
 from app.models.user import UserResponse, UserProfileUpdate
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,7 @@ class UserProfileService:
         
         # Update profile
         updated_user = await self.repository.update_user_profile(user_id, profile_data)
+        user_directory.invalidate_after_commit(self.session, user_id)
         
         return {
             "success": True,
@@ -235,6 +237,7 @@ class UserProfileService:
         
         # Soft delete user account
         await self.repository.soft_delete_user(user_id)
+        user_directory.invalidate_after_commit(self.session, user_id)
         
         # Invalidate all tokens
         await self.repository.invalidate_all_refresh_tokens(user_id)
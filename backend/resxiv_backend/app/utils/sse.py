@@ -0,0 +1,51 @@
+"""
+Server-Sent Events helpers
+
+Services expose streams as async iterators of ``{"event": ..., "data": ...}``
+dicts; these helpers encode them as ``text/event-stream`` frames.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from fastapi.responses import StreamingResponse
+
+from app.core.error_handling import ServiceError
+
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"  # disable nginx response buffering
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one SSE frame with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _encode(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    # Send a comment first so proxies and clients see the first byte immediately
+    yield ": stream open\n\n"
+    try:
+        async for event in events:
+            yield format_sse(event["event"], event.get("data"))
+    except ServiceError as e:
+        logger.warning(f"Stream failed: {e.message}")
+        yield format_sse("error", {"message": e.message, "error_code": e.error_code})
+    except Exception as e:
+        logger.error(f"Stream failed: {e}")
+        yield format_sse("error", {"message": "Stream interrupted", "error_code": "internal_error"})
+
+
+def sse_response(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Wrap an event iterator in a streaming ``text/event-stream`` response.
+
+    Errors raised after the stream has started are sent as an ``error`` event,
+    since the HTTP status has already been committed.
+    """
+    return StreamingResponse(_encode(events), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -8,6 +8,8 @@ from typing import Dict, Any, Optional, Protocol
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from app.core.user_directory import user_directory
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +26,13 @@ class AdminChecker(Protocol):
 
 
 class ProductionUserLookupService:
-    """Production implementation of user lookup service"""
+    """
+    Production implementation of user lookup service.
+    
+    Served by the process-wide user directory, which batches lookups across
+    concurrent callers and caches the answers; ``session`` is kept for
+    interface compatibility.
+    """
     
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -32,25 +40,7 @@ class ProductionUserLookupService:
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get basic user information by ID"""
         try:
-            query = text("""
-                SELECT id, name, email, created_at, deleted_at
-                FROM users 
-                WHERE id = :user_id
-            """)
-            
-            result = await self.session.execute(query, {"user_id": user_id})
-            row = result.fetchone()
-            
-            if row:
-                return {
-                    "id": str(row.id),
-                    "name": row.name,
-                    "email": row.email,
-                    "created_at": row.created_at.isoformat() if row.created_at else None,
-                    "is_active": row.deleted_at is None
-                }
-            
-            return None
+            return await user_directory.get(user_id)
             
         except Exception as e:
             logger.error(f"Failed to lookup user {user_id}: {str(e)}")
@@ -62,30 +52,7 @@ class ProductionUserLookupService:
             if not user_ids:
                 return {}
             
-            # Create placeholders for the IN clause
-            placeholders = ",".join([f":user_id_{i}" for i in range(len(user_ids))])
-            params = {f"user_id_{i}": uid for i, uid in enumerate(user_ids)}
-            
-            query = text(f"""
-                SELECT id, name, email, created_at, deleted_at
-                FROM users 
-                WHERE id IN ({placeholders})
-            """)
-            
-            result = await self.session.execute(query, params)
-            rows = result.fetchall()
-            
-            users_map = {}
-            for row in rows:
-                users_map[str(row.id)] = {
-                    "id": str(row.id),
-                    "name": row.name,
-                    "email": row.email,
-                    "created_at": row.created_at.isoformat() if row.created_at else None,
-                    "is_active": row.deleted_at is None
-                }
-            
-            return users_map
+            return await user_directory.get_many(user_ids)
             
         except Exception as e:
             logger.error(f"Failed to lookup users {user_ids}: {str(e)}")
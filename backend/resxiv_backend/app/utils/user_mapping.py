@@ -10,8 +10,8 @@ import logging
 from typing import Dict, Any, List, Union, Optional
 from uuid import UUID
 
+from app.core.user_directory import user_directory, fallback_name
 from app.database.connection import db_manager
-from app.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
@@ -30,18 +30,12 @@ async def resolve_user_uuid_to_name(user_id: Union[str, UUID]) -> str:
         return "Unknown User"
         
     try:
-        async with db_manager.get_postgres_session() as session:
-            user_service = UserService(session)
-            user_info = await user_service.get_user_basic_info(user_id)
-            
-            if user_info:
-                return user_info["name"]
-            else:
-                return f"User {str(user_id)[:8]}..."
+        user_info = await user_directory.get(user_id)
+        return user_info["name"] if user_info else fallback_name(user_id)
                 
     except Exception as e:
         logger.warning(f"Error resolving user UUID {user_id}: {e}")
-        return f"User {str(user_id)[:8]}..."
+        return fallback_name(user_id)
 
 
 async def resolve_user_uuids_to_names(user_ids: List[Union[str, UUID]]) -> Dict[str, str]:
@@ -58,26 +52,11 @@ async def resolve_user_uuids_to_names(user_ids: List[Union[str, UUID]]) -> Dict[
         return {}
         
     try:
-        async with db_manager.get_postgres_session() as session:
-            user_service = UserService(session)
-            users_info = await user_service.get_users_basic_info_batch(user_ids)
-            
-            # Convert to name mapping
-            user_mapping = {}
-            for user_id_str, user_info in users_info.items():
-                user_mapping[user_id_str] = user_info["name"]
-                
-            # Add fallback for any missing users
-            for uid in user_ids:
-                uid_str = str(uid)
-                if uid_str not in user_mapping:
-                    user_mapping[uid_str] = f"User {uid_str[:8]}..."
-                    
-            return user_mapping
+        return await user_directory.get_names(user_ids)
             
     except Exception as e:
         logger.error(f"Error resolving user UUIDs to names: {e}")
-        return {str(uid): f"User {str(uid)[:8]}..." for uid in user_ids if uid}
+        return {str(uid): fallback_name(uid) for uid in user_ids if uid}
 
 
 async def get_user_details_by_uuid(user_id: Union[str, UUID]) -> Optional[Dict[str, Any]]:
@@ -94,9 +73,7 @@ async def get_user_details_by_uuid(user_id: Union[str, UUID]) -> Optional[Dict[s
         return None
         
     try:
-        async with db_manager.get_postgres_session() as session:
-            user_service = UserService(session)
-            return await user_service.get_user_basic_info(user_id)
+        return await user_directory.get(user_id)
             
     except Exception as e:
         logger.error(f"Error getting user details for {user_id}: {e}")
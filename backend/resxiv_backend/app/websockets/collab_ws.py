@@ -3,9 +3,10 @@ Collaborative Editing WebSocket Provider
 
 - Authenticating with JWT
 - Branch-level ACL enforcement (read/write)
-- Broadcast Yjs update messages to peers
-- Persist latest state in `document_sessions`
-- Mark autosave_queue entries for background Git commit
+- Merge every update into the state in `document_sessions` under a row
+  lock, so concurrent editors never overwrite each other's edits
+- Broadcast each stored update to peers on every worker (see room_broker)
+- Queue debounced autosave entries for background Git commit (autosave_worker)
 
 Protocol (binary):
 client → server : raw Yjs update (Uint8Array)
@@ -13,32 +14,42 @@ server → client : raw Yjs update (same)
 First server message after connect is the full state-vector+update snapshot.
 """
 
-import asyncio
 import logging
 import uuid
-from typing import Dict, Set
+from datetime import datetime, timezone
+from typing import Dict
 
 from fastapi import WebSocket, WebSocketDisconnect, Depends
 from fastapi.routing import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.settings import get_settings
 from app.database.connection import get_postgres_session
 from api.dependencies import get_current_user_required, verify_project_access
 from app.repositories.branch_repository import BranchRepository
 from app.schemas.branch import DocumentSession, CRDTStateType
 from app.models.branch import DocumentSessionCreate
+from app.services.git.autosave_worker import crdt_state_bytes
+from app.websockets.room_broker import room_broker
 
 try:
-    from y_py import YDoc, YTransaction, encode_state_as_update, apply_update
+    from y_py import YDoc, encode_state_as_update, apply_update
 except ImportError:  # Safety for environments without y-py installed
     YDoc = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
+settings = get_settings()
 
-# In-memory room registry: {session_id: set(websocket)}
-ROOMS: Dict[str, Set[WebSocket]] = {}
-LOCK = asyncio.Lock()
+
+def merge_crdt_updates(*updates):
+    """Encoded state of a Yjs document with ``updates`` applied; empty ones are skipped."""
+    ydoc = YDoc()
+    for update in updates:
+        data = crdt_state_bytes(update)
+        if data:
+            apply_update(ydoc, data)
+    return encode_state_as_update(ydoc)
 
 
 async def get_branch_permission(
@@ -85,48 +96,42 @@ async def collaborative_ws(
 
     room_id = str(doc_session.id)
 
-    # Register connection
-    async with LOCK:
-        ROOMS.setdefault(room_id, set()).add(websocket)
-
-    # Send existing state to client
-    if YDoc is None:
-        await websocket.send_bytes(b"\x00")  # Placeholder
-    else:
-        ydoc = YDoc()
-        if doc_session.crdt_state:
-            with ydoc.begin_transaction() as t:
-                apply_update(ydoc, bytes(doc_session.crdt_state), t)
-        snapshot = encode_state_as_update(ydoc)
-        await websocket.send_bytes(snapshot)
+    # Register connection before reading the snapshot: updates are stored
+    # before they are broadcast, so each one is either in the snapshot or
+    # delivered to this peer (Yjs ignores the ones that are both)
+    peer = await room_broker.join(room_id, websocket)
 
     try:
+        # Send existing state to client (through the peer queue: single writer)
+        if YDoc is None:
+            peer.offer(b"\x00")  # Placeholder
+        else:
+            current = await repo.reload_document_session(doc_session.id)
+            peer.offer(bytes(merge_crdt_updates(current.crdt_state if current else None)))
+
         while True:
             data = await websocket.receive_bytes()
-            # Broadcast to peers
-            async with LOCK:
-                for peer in ROOMS.get(room_id, set()):
-                    if peer is not websocket:
-                        await peer.send_bytes(data)
 
-            # Merge into server doc and persist
+            # Merge into the stored state, not a per-connection doc: other
+            # editors' updates reach this worker only through the broker, and
+            # the autosave worker renders whatever is stored here
             if YDoc is not None:
-                if doc_session.crdt_state:
-                    base = bytearray(doc_session.crdt_state)
-                else:
-                    base = bytearray()
-                # simple append, safe because Yjs merges
-                base.extend(data)
-                doc_session.crdt_state = bytes(base)
-                doc_session.last_activity = asyncio.get_event_loop().time()
-                doc_session.autosave_pending = True
+                stored = await repo.lock_document_session(doc_session.id)
+                if stored is None:
+                    break
+                stored.crdt_state = merge_crdt_updates(stored.crdt_state, data)
+                stored.last_activity = datetime.now(timezone.utc)
+                stored.autosave_pending = True
+                if perm.can_write:
+                    await repo.enqueue_autosave(
+                        file_id, branch_id, user_id, settings.files.autosave_delay_seconds
+                    )
                 await session.commit()
+
+            # Broadcast to peers (non-blocking, relayed to other workers)
+            await room_broker.broadcast(room_id, data, sender=peer)
     except WebSocketDisconnect:
         pass
     finally:
         # unregister
-        async with LOCK:
-            peers = ROOMS.get(room_id, set())
-            peers.discard(websocket)
-            if not peers:
-                ROOMS.pop(room_id, None) 
\ No newline at end of file
+        await room_broker.leave(room_id, peer) 
\ No newline at end of file
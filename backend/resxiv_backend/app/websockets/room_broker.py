@@ -0,0 +1,238 @@
+"""
+Collaborative Editing Room Broker
+
+Fans Yjs updates out to every editor of a document session, across
+uvicorn workers and hosts:
+
+- Local peers are tracked per room, each room with its own lock
+- Every peer has a bounded send queue drained by its own task, so a slow
+  client never blocks the sender or other peers
+- Updates are relayed to other nodes over Redis pub/sub
+  (channel ``collab:room:<session_id>``); each frame is prefixed with the
+  publishing node's ID so a node ignores its own echoes
+
+If Redis is unavailable the broker degrades to single-node fan-out.
+"""
+
+import asyncio
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Set
+
+import redis.asyncio as redis
+from fastapi import WebSocket
+
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CHANNEL_PREFIX = "collab:room:"
+NODE_ID_BYTES = 16
+
+
+class PeerConnection:
+    """A room member with its own bounded outbound queue."""
+
+    # Close code sent to peers that cannot keep up ("Try Again Later");
+    # the Yjs client reconnects and resyncs from the persisted snapshot.
+    SLOW_CONSUMER_CLOSE_CODE = 1013
+
+    # Close tasks started from offer(); the loop only keeps weak references
+    _background: Set[asyncio.Task] = set()
+
+    def __init__(self, websocket: WebSocket, max_queue: int = 256):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._sender: Optional[asyncio.Task] = None
+        self.closed = False
+
+    def start(self) -> None:
+        self._sender = asyncio.create_task(self._drain())
+
+    def offer(self, data: bytes) -> bool:
+        """Queue an update without blocking; drops the peer if its queue is full."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(data)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Collaborative peer too slow, disconnecting")
+            self.closed = True
+            task = asyncio.create_task(self.close(self.SLOW_CONSUMER_CLOSE_CODE))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            return False
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                data = await self.queue.get()
+                await self.websocket.send_bytes(data)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Collaborative peer send failed: {e}")
+            self.closed = True
+
+    async def close(self, code: Optional[int] = None) -> None:
+        if self.closed and code is None:
+            return
+        self.closed = True
+        sender = self._sender if self._sender is not asyncio.current_task() else None
+        if sender:
+            sender.cancel()
+        if code is not None:
+            try:
+                await self.websocket.close(code=code)
+            except Exception:
+                pass
+        if sender:
+            await asyncio.gather(sender, return_exceptions=True)
+
+
+class RoomBroker:
+    """Room registry with per-room locks and cross-node Redis relay."""
+
+    def __init__(self, redis_url: Optional[str] = None, max_queue: int = 256):
+        self.node_id = uuid.uuid4().bytes
+        self.redis_url = redis_url or settings.database.redis_url
+        self.max_queue = max_queue
+        self.rooms: Dict[str, Set[PeerConnection]] = {}
+        self._room_locks: Dict[str, asyncio.Lock] = {}
+        self._room_lock_users: Dict[str, int] = {}
+        self._redis: Optional[redis.Redis] = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def _room_lock(self, room_id: str):
+        # Counted per room so a lock is only dropped once nobody holds or
+        # waits on it; dropping it earlier would let a later caller create a
+        # second lock for the same room
+        lock = self._room_locks.get(room_id)
+        if lock is None:
+            lock = self._room_locks[room_id] = asyncio.Lock()
+        self._room_lock_users[room_id] = self._room_lock_users.get(room_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._room_lock_users[room_id] -= 1
+            if not self._room_lock_users[room_id]:
+                del self._room_lock_users[room_id]
+                self._room_locks.pop(room_id, None)
+
+    async def _ensure_started(self) -> None:
+        if self._pubsub is not None or self.redis_url is None:
+            return
+        async with self._start_lock:
+            if self._pubsub is not None:
+                return
+            try:
+                # Separate binary-safe client: Yjs frames are not UTF-8
+                self._redis = redis.from_url(self.redis_url, decode_responses=False)
+                await self._redis.ping()
+                self._pubsub = self._redis.pubsub()
+            except Exception as e:
+                logger.warning(f"Room broker running without Redis relay: {e}")
+                self._redis = None
+                self.redis_url = None
+
+    async def join(self, room_id: str, websocket: WebSocket) -> PeerConnection:
+        """Register a websocket in a room and start its sender task."""
+        await self._ensure_started()
+        peer = PeerConnection(websocket, self.max_queue)
+        peer.start()
+
+        async with self._room_lock(room_id):
+            peers = self.rooms.setdefault(room_id, set())
+            first_local_peer = not peers
+            peers.add(peer)
+            try:
+                if first_local_peer and self._pubsub is not None:
+                    await self._pubsub.subscribe(CHANNEL_PREFIX + room_id)
+                    if self._listener is None or self._listener.done():
+                        self._listener = asyncio.create_task(self._listen())
+            except BaseException:
+                # The caller never gets the peer, so it cannot leave() the room
+                peers.discard(peer)
+                if not peers:
+                    self.rooms.pop(room_id, None)
+                await peer.close()
+                raise
+        return peer
+
+    async def leave(self, room_id: str, peer: PeerConnection) -> None:
+        """Unregister a peer; unsubscribes the node once the room is empty."""
+        await peer.close()
+        async with self._room_lock(room_id):
+            peers = self.rooms.get(room_id)
+            if peers is None:
+                return
+            peers.discard(peer)
+            if not peers:
+                self.rooms.pop(room_id, None)
+                if self._pubsub is not None:
+                    await self._pubsub.unsubscribe(CHANNEL_PREFIX + room_id)
+
+    def _fan_out(self, room_id: str, data: bytes, exclude: Optional[PeerConnection] = None) -> None:
+        # Snapshot the set: offer() never awaits, so no lock is needed here
+        for peer in tuple(self.rooms.get(room_id, ())):
+            if peer is not exclude:
+                peer.offer(data)
+
+    async def broadcast(self, room_id: str, data: bytes, sender: Optional[PeerConnection] = None) -> None:
+        """Deliver an update to local peers and relay it to other nodes."""
+        self._fan_out(room_id, data, exclude=sender)
+        if self._redis is not None:
+            try:
+                await self._redis.publish(CHANNEL_PREFIX + room_id, self.node_id + data)
+            except Exception as e:
+                logger.error(f"Error relaying collaborative update: {e}")
+
+    async def _listen(self) -> None:
+        while self._pubsub is not None:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(0.1)
+                    continue
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if not message or message.get("type") != "message":
+                    continue
+                payload = message["data"]
+                if payload[:NODE_ID_BYTES] == self.node_id:
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                self._fan_out(channel[len(CHANNEL_PREFIX):], payload[NODE_ID_BYTES:])
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Room broker listener error: {e}")
+                await asyncio.sleep(1.0)
+
+    async def close(self) -> None:
+        """Stop relaying and disconnect all local peers."""
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+        for room_id in list(self.rooms):
+            for peer in list(self.rooms.get(room_id, ())):
+                await peer.close()
+        self.rooms.clear()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+room_broker = RoomBroker()
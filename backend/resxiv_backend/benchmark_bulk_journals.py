@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Bulk Journal Operation Benchmark
+
+Compares archiving journals one at a time (a permission check plus an
+``update_journal`` call per ID, as ``/journals/bulk`` used to) with the
+set-based ``JournalService.bulk_journal_operation``. Journal tables are
+copied into a scratch schema that is dropped afterwards, and every run is
+rolled back, so real journals are never touched.
+
+Usage:
+    python benchmark_bulk_journals.py                    # 1k and 10k journals
+    python benchmark_bulk_journals.py --sizes 1000 50000 # Custom batch sizes
+    python benchmark_bulk_journals.py --skip-per-id      # Only time the set-based path
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+
+from app.database.connection import db_manager
+from app.models.journal_models import BulkJournalOperation, JournalStatus, JournalUpdate
+from app.services.journal_service import JournalService
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCHEMA = "bench_bulk_journals"
+TABLES = ("journals", "journal_collaborators", "journal_versions")
+
+
+async def build(session, journals: int, user_id: uuid.UUID) -> None:
+    await session.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await session.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    for table in TABLES:
+        # LIKE copies columns, defaults, checks and indexes but not foreign keys
+        await session.execute(text(f"CREATE TABLE {SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)"))
+
+    started = time.perf_counter()
+    await session.execute(
+        text(f"""
+            INSERT INTO {SCHEMA}.journals (id, project_id, created_by, title, content, status, version)
+            SELECT gen_random_uuid(), CAST(:project_id AS uuid), CAST(:user_id AS uuid),
+                   'Journal ' || g.i, repeat('Lab notes line ' || g.i || E'\\n', 20), 'draft', 1
+            FROM generate_series(1, :journals) AS g(i)
+        """),
+        {"journals": journals, "project_id": uuid.uuid4(), "user_id": user_id}
+    )
+    await session.execute(text(f"""
+        INSERT INTO {SCHEMA}.journal_versions (id, journal_id, version_number, title, content, is_keyframe, changed_by)
+        SELECT gen_random_uuid(), id, 1, title, content, TRUE, created_by FROM {SCHEMA}.journals
+    """))
+    for table in TABLES:
+        await session.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+    await session.commit()
+    logger.info(f"Inserted {journals} journals in {time.perf_counter() - started:.1f}s")
+
+
+async def timed_run(session, journal_ids, user_id: uuid.UUID, per_id: bool) -> float:
+    """Archive ``journal_ids`` inside a transaction that is rolled back afterwards"""
+    await session.execute(text(f"SET LOCAL search_path TO {SCHEMA}, public"))
+    service = JournalService(session)
+
+    started = time.perf_counter()
+    if per_id:
+        update = JournalUpdate(status=JournalStatus.ARCHIVED)
+        for journal_id in journal_ids:
+            permissions = await service.collaboration_service.get_journal_permissions([journal_id], user_id)
+            if journal_id in permissions and permissions[journal_id].can_write:
+                await service.update_journal(journal_id, update, user_id)
+    else:
+        result = await service.bulk_journal_operation(
+            BulkJournalOperation(operation="archive", journal_ids=journal_ids), user_id
+        )
+        assert result.successful == len(journal_ids), result.failed
+    elapsed = time.perf_counter() - started
+
+    await session.rollback()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk journal operations")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000], help="Journals per bulk request")
+    parser.add_argument("--skip-per-id", action="store_true", help="Do not time the per-ID loop")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema")
+    args = parser.parse_args()
+
+    user_id = uuid.uuid4()
+    await db_manager.initialize()
+    try:
+        async with db_manager.get_postgres_session() as session:
+            await build(session, max(args.sizes), user_id)
+            result = await session.execute(text(f"SELECT id FROM {SCHEMA}.journals ORDER BY id"))
+            all_ids = [row.id for row in result.fetchall()]
+            await session.commit()
+
+            print(f"\n{'journals':>10}{'per-ID loop (s)':>18}{'set-based (s)':>16}{'speedup':>10}")
+            for size in args.sizes:
+                journal_ids = all_ids[:size]
+                bulk = await timed_run(session, journal_ids, user_id, per_id=False)
+                if args.skip_per_id:
+                    print(f"{size:>10}{'-':>18}{bulk:>16.2f}{'-':>10}")
+                    continue
+                loop = await timed_run(session, journal_ids, user_id, per_id=True)
+                print(f"{size:>10}{loop:>18.2f}{bulk:>16.2f}{loop / bulk:>9.0f}x")
+
+            if not args.keep:
+                await session.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+                await session.commit()
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
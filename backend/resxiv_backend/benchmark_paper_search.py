@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Paper Keyword Search Benchmark
+
+Compares the old ILIKE scan with the indexed ``search_vector`` query on a
+synthetic papers table. Everything runs in a scratch schema that is dropped
+afterwards, so the real ``papers`` table is never touched.
+
+Usage:
+    python benchmark_paper_search.py                     # 1M papers, 5 runs per query
+    python benchmark_paper_search.py --papers 200000     # Smaller table
+    python benchmark_paper_search.py --keep              # Keep the scratch schema
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+
+from app.database.connection import db_manager
+from app.schemas.paper import IMMUTABLE_ARRAY_TO_STRING_SQL, PAPER_SEARCH_VECTOR_SQL
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCHEMA = "bench_paper_search"
+
+VOCABULARY = (
+    "attention transformer graph neural network diffusion model language vision retrieval "
+    "reinforcement learning policy gradient optimization convex stochastic bayesian inference "
+    "variational autoencoder generative adversarial contrastive representation embedding "
+    "semantic segmentation detection tracking robotics control quantum circuit protein folding "
+    "molecular dynamics genome sequencing clinical trial survival analysis causal discovery "
+    "federated privacy differential fairness robustness adversarial benchmark dataset scaling "
+    "sparse mixture experts distillation pruning quantization compiler kernel scheduling "
+    "distributed consensus blockchain cryptography lattice theorem proof verification"
+).split()
+
+AUTHORS = (
+    "Smith Chen Garcia Müller Rossi Tanaka Kim Ivanova Okafor Dubois Silva Nguyen "
+    "Kowalski Haddad Larsen Patel Cohen Novak Sato Fischer"
+).split()
+
+QUERIES = ["transformer", "graph neural network", "\"protein folding\"", "Okafor", "quantum -circuit"]
+
+OLD_QUERY = f"""
+    SELECT id FROM {SCHEMA}.papers
+    WHERE deleted_at IS NULL AND (
+        title ILIKE :pattern OR abstract ILIKE :pattern
+        OR array_to_string(authors, ' ') ILIKE :pattern
+        OR array_to_string(keywords, ' ') ILIKE :pattern
+    )
+    ORDER BY created_at DESC
+    LIMIT 20
+"""
+
+NEW_QUERY = f"""
+    SELECT id FROM {SCHEMA}.papers, websearch_to_tsquery('english', :q) AS query
+    WHERE deleted_at IS NULL AND search_vector @@ query
+    ORDER BY ts_rank_cd(search_vector, query) DESC, created_at DESC
+    LIMIT 20
+"""
+
+
+def words(vocabulary_param: str, count: int) -> str:
+    """SQL for ``count`` random words, re-evaluated per generated row"""
+    vocabulary = f"CAST({vocabulary_param} AS TEXT[])"
+    return (
+        f"(SELECT string_agg(({vocabulary})[1 + floor(random() * array_length({vocabulary}, 1))::int], ' ') "
+        f"FROM generate_series(1, {count}) WHERE g.i > 0)"
+    )
+
+
+async def build(session, papers: int) -> None:
+    await session.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await session.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await session.execute(text(IMMUTABLE_ARRAY_TO_STRING_SQL))
+    await session.execute(text(f"""
+        CREATE TABLE {SCHEMA}.papers (
+            id BIGINT PRIMARY KEY,
+            title TEXT NOT NULL,
+            authors TEXT[],
+            keywords TEXT[],
+            abstract TEXT,
+            created_at TIMESTAMPTZ DEFAULT now(),
+            deleted_at TIMESTAMPTZ,
+            search_vector tsvector GENERATED ALWAYS AS ({PAPER_SEARCH_VECTOR_SQL}) STORED
+        )
+    """))
+
+    started = time.perf_counter()
+    await session.execute(
+        text(f"""
+            INSERT INTO {SCHEMA}.papers (id, title, authors, keywords, abstract, created_at)
+            SELECT g.i,
+                   {words(':vocabulary', 8)},
+                   string_to_array({words(':authors', 3)}, ' '),
+                   string_to_array({words(':vocabulary', 4)}, ' '),
+                   {words(':vocabulary', 150)},
+                   now() - g.i * interval '1 minute'
+            FROM generate_series(1, :papers) AS g(i)
+        """),
+        {"vocabulary": VOCABULARY, "authors": AUTHORS, "papers": papers}
+    )
+    logger.info(f"Inserted {papers} papers in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    await session.execute(text(f"CREATE INDEX ON {SCHEMA}.papers USING gin (search_vector)"))
+    await session.execute(text(f"ANALYZE {SCHEMA}.papers"))
+    logger.info(f"Built GIN index in {time.perf_counter() - started:.1f}s")
+    await session.commit()
+
+
+async def execution_ms(session, sql: str, params: dict) -> float:
+    result = await session.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params)
+    plan = result.scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return plan[0]["Execution Time"]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark paper keyword search")
+    parser.add_argument("--papers", type=int, default=1_000_000, help="Number of synthetic papers")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema")
+    args = parser.parse_args()
+
+    await db_manager.initialize()
+    try:
+        async with db_manager.get_postgres_session() as session:
+            await build(session, args.papers)
+
+            print(f"\n{'query':<24}{'ILIKE scan (ms)':>18}{'tsvector + GIN (ms)':>22}")
+            for q in QUERIES:
+                plain = q.strip('"').split(" -")[0]
+                old = [await execution_ms(session, OLD_QUERY, {"pattern": f"%{plain}%"}) for _ in range(args.repeat)]
+                new = [await execution_ms(session, NEW_QUERY, {"q": q}) for _ in range(args.repeat)]
+                print(f"{q:<24}{statistics.median(old):>18.1f}{statistics.median(new):>22.1f}")
+
+            if not args.keep:
+                await session.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+                await session.commit()
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Index Advisor Runner
+
+Runs the hot query registry in ``app/database/index_advisor.py`` under
+``EXPLAIN (ANALYZE, BUFFERS)`` and reports sequential scans, collection
+scans and missing indexes. Point it at a disposable database: ``--seed``
+inserts synthetic users, projects, papers, conversations and messages so the
+planner sees production-like row counts.
+
+Usage:
+    python run_index_advisor.py                       # Explain hot queries against the configured databases
+    python run_index_advisor.py --seed 50000          # Seed ~50k papers first (disposable databases only)
+    python run_index_advisor.py --apply               # Create missing indexes, then explain again
+    python run_index_advisor.py --emit-migration      # Print a migration for missing Postgres indexes
+"""
+
+import asyncio
+import sys
+import argparse
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+
+from app.database.connection import db_manager
+from app.database.index_advisor import DEFAULT_MIN_ROWS, IndexAdvisor, render_migration
+from app.database.migrations import migration_manager
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+HOT_QUERY_MIGRATION = "014_add_hot_query_indexes"
+MESSAGE_BATCH = 5_000
+
+
+async def seed_postgres(papers: int, tag: str) -> list:
+    """Insert synthetic rows sized off ``papers``; returns the seeded conversation ids"""
+    users = max(papers // 50, 10)
+    projects = max(papers // 100, 5)
+    params = {"tag": tag, "users": users, "projects": projects, "papers": papers}
+
+    async with db_manager.get_postgres_session() as session:
+        await session.execute(text("""
+            INSERT INTO users (name, email, password)
+            SELECT 'Advisor ' || g.i, :tag || '.' || g.i || '@example.com', 'not-a-password'
+            FROM generate_series(1, :users) AS g(i)
+        """), params)
+        await session.execute(text("""
+            INSERT INTO projects (name, slug, created_by)
+            SELECT 'Advisor project ' || g.i, :tag || '-' || g.i,
+                   (SELECT id FROM users WHERE email = :tag || '.' || (1 + g.i % :users) || '@example.com')
+            FROM generate_series(1, :projects) AS g(i)
+        """), params)
+        await session.execute(text("""
+            INSERT INTO project_members (user_id, project_id, role)
+            SELECT u.id, p.id, 'write'
+            FROM projects p
+            JOIN users u ON u.email LIKE :tag || '.%' AND abs(hashtext(u.email || p.slug)) % 10 = 0
+            WHERE p.slug LIKE :tag || '-%'
+            ON CONFLICT DO NOTHING
+        """), params)
+        await session.execute(text("""
+            INSERT INTO papers (title, checksum, authors, keywords, created_at)
+            SELECT :tag || ' paper ' || g.i, md5(:tag || g.i), ARRAY['Author ' || g.i % 997],
+                   ARRAY['kw' || g.i % 101], now() - g.i * interval '1 minute'
+            FROM generate_series(1, :papers) AS g(i)
+        """), params)
+        await session.execute(text("""
+            INSERT INTO project_papers (project_id, paper_id)
+            SELECT pr.id, pa.id
+            FROM (SELECT id, row_number() OVER () AS n FROM papers WHERE title LIKE :tag || ' paper %') pa
+            JOIN (SELECT id, row_number() OVER () AS n FROM projects WHERE slug LIKE :tag || '-%') pr
+              ON pr.n = 1 + pa.n % :projects
+            ON CONFLICT DO NOTHING
+        """), params)
+
+        result = await session.execute(text("""
+            INSERT INTO conversations (type, entity, is_group, created_by)
+            SELECT 'GROUP', p.id, TRUE, p.created_by
+            FROM projects p WHERE p.slug LIKE :tag || '-%'
+            RETURNING id
+        """), params)
+        conversation_ids = [row.id for row in result.fetchall()]
+        await session.commit()
+
+        # pgvector may be missing on a scratch server; the rest of the seed is still useful
+        try:
+            await session.execute(text("""
+                INSERT INTO paper_embeddings (paper_id, embedding, source_text)
+                SELECT p.id,
+                       CAST(ARRAY(SELECT random() FROM generate_series(1, 384) WHERE p.id IS NOT NULL) AS vector),
+                       p.title
+                FROM papers p
+                WHERE p.title LIKE :tag || ' paper %'
+                ON CONFLICT DO NOTHING
+            """), params)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"Skipping paper_embeddings seed: {e}")
+
+        for table in ("users", "projects", "project_members", "papers", "project_papers",
+                      "paper_embeddings", "conversations"):
+            await session.execute(text(f"ANALYZE {table}"))
+
+    logger.info(f"Seeded {users} users, {projects} projects, {papers} papers (tag {tag})")
+    return conversation_ids
+
+
+async def seed_messages(conversation_ids: list, messages: int) -> None:
+    """Spread ``messages`` synthetic messages across the seeded conversations"""
+    if not conversation_ids:
+        return
+    collection = db_manager.mongodb_database["messages"]
+    started = datetime.utcnow() - timedelta(days=30)
+    batch = []
+    for i in range(messages):
+        conversation_id = conversation_ids[i % len(conversation_ids)]
+        created_at = started + timedelta(seconds=i)
+        batch.append({
+            "conversation_id": str(conversation_id),
+            "sender_id": str(uuid.uuid4()),
+            "content": f"Advisor message {i}",
+            "type": "text",
+            "metadata": {},
+            "created_at": created_at,
+            "updated_at": created_at,
+            "deleted_at": None,
+            "reactions": [],
+            "edited": False
+        })
+        if len(batch) == MESSAGE_BATCH:
+            await collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await collection.insert_many(batch, ordered=False)
+    logger.info(f"Seeded {messages} messages across {len(conversation_ids)} conversations")
+
+
+def print_report(report: dict) -> None:
+    print(f"\n{'query':<28}{'status':<10}{'ms':>10}  findings")
+    for entry in report["postgres"] + report["mongo"]:
+        ms = entry.get("execution_ms")
+        ms = f"{ms:.2f}" if isinstance(ms, (int, float)) else "-"
+        if entry["status"] in ("skipped", "error"):
+            detail = entry["reason"]
+        else:
+            findings = entry.get("seq_scans", entry.get("findings", []))
+            detail = ", ".join(
+                f"{f.get('node', f.get('stage'))} {f.get('relation') or ''} {f.get('rows_read', '')}".strip()
+                for f in findings
+            ) or "-"
+        print(f"{entry['query']:<28}{entry['status']:<10}{ms:>10}  {detail}")
+
+    print(f"\nMissing Postgres indexes: {', '.join(report['missing_indexes']) or 'none'}")
+    print(f"Missing MongoDB indexes: {', '.join(report['missing_mongo_indexes']) or 'none'}")
+
+
+async def main():
+    """Main CLI function"""
+    parser = argparse.ArgumentParser(
+        description="Hot query index advisor for ResXiv Backend",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python run_index_advisor.py                          # Explain hot queries and list missing indexes
+  python run_index_advisor.py --seed 50000 --apply     # Seed a scratch database, add indexes, re-check
+  python run_index_advisor.py --emit-migration         # Print migration source for missing indexes
+  python run_index_advisor.py --json                   # Machine-readable report
+        """
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        metavar="PAPERS",
+        help="Insert synthetic data sized off this many papers first (disposable databases only)"
+    )
+
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=200_000,
+        help="Messages to insert into MongoDB when seeding (default: 200000)"
+    )
+
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help=f"Run {HOT_QUERY_MIGRATION} and create missing MongoDB indexes, then explain again"
+    )
+
+    parser.add_argument(
+        "--emit-migration",
+        action="store_true",
+        help="Print MigrationManager source creating the missing Postgres indexes"
+    )
+
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=DEFAULT_MIN_ROWS,
+        help=f"Flag sequential scans reading at least this many rows (default: {DEFAULT_MIN_ROWS})"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON"
+    )
+
+    args = parser.parse_args()
+
+    await db_manager.initialize()
+    try:
+        if args.seed:
+            started = time.perf_counter()
+            conversation_ids = await seed_postgres(args.seed, f"advisor-{uuid.uuid4().hex[:8]}")
+            if db_manager.mongodb_database is not None:
+                await seed_messages(conversation_ids, args.messages)
+            logger.info(f"Seeding took {time.perf_counter() - started:.1f}s")
+
+        advisor = IndexAdvisor(mongo_db=db_manager.mongodb_database, min_rows=args.min_rows)
+
+        if args.apply:
+            if not await migration_manager.run_migration(HOT_QUERY_MIGRATION):
+                sys.exit(1)
+            if db_manager.mongodb_database is not None:
+                await advisor.ensure_mongo_indexes()
+
+        report = await advisor.analyze()
+
+        if args.json:
+            print(json.dumps(report, indent=2, default=str))
+        else:
+            print_report(report)
+
+        if args.emit_migration:
+            missing = await advisor.missing_indexes()
+            if missing:
+                print()
+                print(render_migration("015_add_advised_indexes", "1.14.0", missing))
+            else:
+                logger.info("No missing Postgres indexes; nothing to emit")
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.v1.endpoints.analytics.analytics_user import get_user_analytics, get_user_engagement
 from api.v1.endpoints.analytics.analytics_project import get_project_analytics, get_project_collaboration_analytics
-from api.v1.endpoints.analytics.analytics_system import get_system_metrics, get_system_health
+from api.v1.endpoints.analytics.analytics_system import get_system_metrics, get_system_health, get_llm_usage
 
 
 class TestAnalyticsUserModule:
@@ -257,6 +257,42 @@ class TestAnalyticsSystemModule:
         assert "database" in result["components"]
         assert "error_rate" in result["components"]
 
+    @pytest.mark.asyncio
+    async def test_llm_usage_across_projects_is_admin_only(self, mock_session, mock_current_user):
+        """Test that non-admins cannot read usage for every project"""
+        with patch('app.services.admin_service.AdminService.is_system_admin', AsyncMock(return_value=False)):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_llm_usage(project_id=None, current_user=mock_current_user, session=mock_session)
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_llm_usage_for_project_requires_membership(self, mock_session, mock_current_user):
+        """Test that non-admins only read usage for their own projects"""
+        project_id = uuid.uuid4()
+        with patch('app.services.admin_service.AdminService.is_system_admin', AsyncMock(return_value=False)), \
+             patch('app.repositories.project_repository.ProjectRepository.is_user_member',
+                   AsyncMock(side_effect=[False, True])) as is_member, \
+             patch('app.core.llm_gateway.llm_gateway.get_usage', return_value={}) as get_usage:
+            with pytest.raises(HTTPException) as exc_info:
+                await get_llm_usage(project_id=project_id, current_user=mock_current_user, session=mock_session)
+            result = await get_llm_usage(project_id=project_id, current_user=mock_current_user, session=mock_session)
+
+        assert exc_info.value.status_code == 403
+        assert result["success"] is True
+        assert is_member.await_args.args == (project_id, uuid.UUID(mock_current_user["user_id"]))
+        get_usage.assert_called_once_with(project_id)
+
+    @pytest.mark.asyncio
+    async def test_llm_usage_for_admin(self, mock_session, mock_current_user):
+        """Test that admins read usage for all projects"""
+        with patch('app.services.admin_service.AdminService.is_system_admin', AsyncMock(return_value=True)), \
+             patch('app.core.llm_gateway.llm_gateway.get_usage', return_value={"p": {}}) as get_usage:
+            result = await get_llm_usage(project_id=None, current_user=mock_current_user, session=mock_session)
+
+        assert result["usage"] == {"p": {}}
+        get_usage.assert_called_once_with(None)
+
     @pytest.mark.asyncio
     async def test_system_health_database_error(self, mock_session, mock_current_user):
         """Test system health when database fails"""
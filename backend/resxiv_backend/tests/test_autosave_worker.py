@@ -0,0 +1,186 @@
+"""
+Tests for the autosave worker draining autosave_queue into Git.
+"""
+
+import base64
+import subprocess
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.git.autosave_worker import (
+    AUTOSAVE_AUTHOR_NAME, AutosaveWorker, commit_message, crdt_state_bytes
+)
+from app.services.git.object_reader import GitObjectStore
+from app.services.git.write_scheduler import GitWriteScheduler
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "main.tex").write_text("hello")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    monkeypatch.setattr("app.services.git.write_scheduler.git_object_store", GitObjectStore())
+    return tmp_path
+
+
+def entry(repo, path, content, branch_id, user="Alice", minutes=0, **overrides):
+    row = {
+        "id": uuid.uuid4(), "file_id": uuid.uuid4(), "branch_id": branch_id, "user_id": uuid.uuid4(),
+        "content_snapshot": content, "change_summary": None, "priority": 0, "attempts": 0,
+        "created_at": datetime(2024, 1, 1) + timedelta(minutes=minutes),
+        "file_path": path, "file_deleted_at": None, "branch_name": "main", "repo_path": str(repo),
+        "user_name": user, "user_email": f"{user.lower()}@example.com", "crdt_state": None
+    }
+    row.update(overrides)
+    return row
+
+
+class FakeQueue:
+    """BranchRepository stand-in serving one claimed batch"""
+
+    def __init__(self, entries):
+        self.repository = Mock()
+        self.repository.recover_stale_autosaves = AsyncMock(return_value=0)
+        self.repository.prune_autosaves = AsyncMock(return_value=0)
+        self.repository.claim_autosave_batch = AsyncMock(return_value=entries)
+        self.repository.complete_autosaves = AsyncMock()
+        self.repository.retry_autosaves = AsyncMock()
+        self.sessions = []
+
+    @asynccontextmanager
+    async def session(self):
+        session = Mock(commit=AsyncMock())
+        self.sessions.append(session)
+        yield session
+
+    def worker(self, **kwargs):
+        return AutosaveWorker(
+            session_factory=self.session, scheduler=GitWriteScheduler(window=0),
+            batch_size=10, max_attempts=3, backoff_seconds=30, **kwargs
+        )
+
+
+@pytest.fixture
+def queue_for(monkeypatch):
+    def build(entries):
+        queue = FakeQueue(entries)
+        monkeypatch.setattr("app.services.git.autosave_worker.BranchRepository", lambda session: queue.repository)
+        return queue
+    return build
+
+
+class TestCommitMessage:
+    """Autosave commit messages"""
+
+    def test_single_file(self):
+        assert commit_message([{"file_path": "main.tex", "user_name": "A", "user_email": "a@x"}]) == "Autosave main.tex\n\n- main.tex"
+
+    def test_summaries_and_co_authors(self):
+        message = commit_message([
+            {"file_path": "a.tex", "change_summary": "fix typo", "user_name": "A", "user_email": "a@x"},
+            {"file_path": "b.tex", "user_name": "B", "user_email": "b@x"}
+        ])
+
+        assert message.splitlines()[0] == "Autosave 2 files"
+        assert "- a.tex: fix typo" in message
+        assert message.endswith("Co-authored-by: A <a@x>\nCo-authored-by: B <b@x>")
+
+
+class TestCrdtState:
+    """Stored Yjs state decoding"""
+
+    def test_accepts_bytes_base64_and_lists(self):
+        assert crdt_state_bytes(b"\x01\x02") == b"\x01\x02"
+        assert crdt_state_bytes(base64.b64encode(b"\x01\x02").decode()) == b"\x01\x02"
+        assert crdt_state_bytes([1, 2]) == b"\x01\x02"
+        assert crdt_state_bytes(None) is None
+
+    def test_rejects_unknown_types(self):
+        with pytest.raises(ValueError):
+            crdt_state_bytes({"not": "yjs"})
+
+
+class TestAutosaveWorker:
+    """Claimed entries become one commit per branch"""
+
+    @pytest.mark.asyncio
+    async def test_branch_files_coalesce_into_one_commit(self, repo, queue_for):
+        branch_id = uuid.uuid4()
+        initial = git(repo, "rev-parse", "main")
+        entries = [
+            entry(repo, "main.tex", "old", branch_id, minutes=0),
+            entry(repo, "sections/intro.tex", "intro", branch_id, minutes=1),
+            entry(repo, "main.tex", "new", branch_id, minutes=2)
+        ]
+        queue = queue_for(entries)
+
+        claimed = await queue.worker().run_once()
+
+        head = git(repo, "rev-parse", "main")
+        assert claimed == 3
+        assert git(repo, "rev-parse", f"{head}^") == initial
+        assert git(repo, "show", f"{head}:main.tex") == "new"
+        assert git(repo, "show", f"{head}:sections/intro.tex") == "intro"
+        assert git(repo, "log", "-1", "--format=%an|%s", head) == "Alice|Autosave 2 files"
+        queue.repository.complete_autosaves.assert_awaited_once_with([e["id"] for e in entries], branch_id, head)
+        queue.sessions[0].commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_multiple_editors_commit_as_autosave_with_co_authors(self, repo, queue_for):
+        branch_id = uuid.uuid4()
+        queue = queue_for([
+            entry(repo, "a.tex", "a", branch_id, user="Alice"),
+            entry(repo, "b.tex", "b", branch_id, user="Bob")
+        ])
+
+        await queue.worker().run_once()
+
+        log = git(repo, "log", "-1", "--format=%an%n%B", "main")
+        assert log.startswith(AUTOSAVE_AUTHOR_NAME)
+        assert "Co-authored-by: Bob <bob@example.com>" in log
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried_with_backoff(self, repo, queue_for):
+        branch_id = uuid.uuid4()
+        bad = entry(repo, "../escape.tex", "x", branch_id)
+        queue = queue_for([bad])
+
+        await queue.worker().run_once()
+
+        queue.repository.retry_autosaves.assert_awaited_once()
+        ids, error, max_attempts, backoff, _ = queue.repository.retry_autosaves.await_args.args
+        assert ids == [bad["id"]] and "Invalid file path" in error
+        assert (max_attempts, backoff) == (3, 30)
+        queue.repository.complete_autosaves.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deleted_files_complete_without_commit(self, repo, queue_for):
+        branch_id = uuid.uuid4()
+        initial = git(repo, "rev-parse", "main")
+        gone = entry(repo, "main.tex", "x", branch_id, file_deleted_at=datetime(2024, 1, 2))
+        queue = queue_for([gone])
+
+        await queue.worker().run_once()
+
+        assert git(repo, "rev-parse", "main") == initial
+        queue.repository.complete_autosaves.assert_awaited_once_with([gone["id"]], branch_id, None)
+
+    @pytest.mark.asyncio
+    async def test_empty_queue(self, queue_for):
+        queue = queue_for([])
+
+        assert await queue.worker().run_once() == 0
+        queue.repository.recover_stale_autosaves.assert_awaited_once()
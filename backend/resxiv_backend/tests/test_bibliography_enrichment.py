@@ -0,0 +1,189 @@
+"""
+Tests for Bibliography Enrichment
+L6 Engineering Standards - Cached, batched reference resolution
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.paper.bibliography_agent import BibliographyEnrichmentAgent, EnrichmentResult
+from app.services.paper import reference_cache
+from app.services.paper.reference_cache import ReferenceCache, reference_keys
+
+
+ARXIV_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/1706.03762v7</id>
+    <title>Attention Is All
+      You Need</title>
+    <published>2017-06-12T17:57:34Z</published>
+    <author><name>Ashish Vaswani</name></author>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/1810.04805v2</id>
+    <title>BERT: Pre-training of Deep Bidirectional Transformers</title>
+    <published>2018-10-11T00:59:01Z</published>
+    <author><name>Jacob Devlin</name></author>
+  </entry>
+</feed>"""
+
+ARXIV_ERROR_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/api/errors#incorrect_id_format_for_not-an-id</id>
+    <title>Error</title>
+  </entry>
+</feed>"""
+
+REFERENCES = [
+    'A. Vaswani et al. "Attention is all you need." arXiv:1706.03762, 2017.',
+    'J. Devlin et al. "BERT: Pre-training of deep bidirectional transformers." arXiv:1810.04805v1, 2019.',
+    'K. He et al. "Deep residual learning for image recognition." CVPR, 2016. doi:10.1109/CVPR.2016.90',
+]
+
+
+class FakeResponse:
+    def __init__(self, status, text, headers=None):
+        self.status = status
+        self._text = text
+        self.headers = headers or {}
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    def __init__(self, status=200, text=ARXIV_FEED, headers=None):
+        self.urls = []
+        self.status = status
+        self.text = text
+        self.headers = headers
+        self.closed = False
+
+    def get(self, url):
+        self.urls.append(url)
+        return FakeResponse(self.status, self.text, self.headers)
+
+    async def close(self):
+        self.closed = True
+
+
+def resnet_result():
+    return EnrichmentResult(
+        title="Deep Residual Learning for Image Recognition",
+        authors=["Kaiming He"],
+        year="2016",
+        journal="CVPR",
+        doi="10.1109/CVPR.2016.90",
+        confidence=0.95,
+        source="crossref_doi"
+    )
+
+
+@pytest.fixture
+def agent():
+    agent = BibliographyEnrichmentAgent(cache=ReferenceCache(redis_client=None))
+    agent.cache._client = lambda: None  # in-process cache only
+    agent._session = FakeSession()
+    return agent
+
+
+class TestBibliographyEnrichment:
+    """Test cases for cached, batched bibliography enrichment"""
+
+    @pytest.mark.asyncio
+    async def test_arxiv_ids_are_resolved_in_one_query(self, agent):
+        with patch.object(agent, "_enrich_from_crossref_doi", AsyncMock(return_value=resnet_result())):
+            entries = await agent.enrich_references(REFERENCES)
+
+        assert len(agent._session.urls) == 1
+        assert "id_list=1706.03762,1810.04805&max_results=2" in agent._session.urls[0]
+        assert "Vaswani" in entries[0] and "eprint = {1706.03762}" in entries[0]
+        assert "Devlin" in entries[1]
+        assert "doi = {10.1109/CVPR.2016.90}" in entries[2]
+
+    @pytest.mark.asyncio
+    async def test_second_paper_builds_from_cache(self, agent):
+        crossref = AsyncMock(return_value=resnet_result())
+        with patch.object(agent, "_enrich_from_crossref_doi", crossref):
+            first = await agent.enrich_references(REFERENCES)
+            agent._session.urls.clear()
+            second = await agent.enrich_references(list(reversed(REFERENCES)))
+
+        assert agent._session.urls == []
+        crossref.assert_awaited_once()
+        assert second == list(reversed(first))
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_single_ids(self, agent):
+        agent._session = FakeSession(status=400, text=ARXIV_ERROR_FEED)
+
+        results = await agent._fetch_arxiv_batch(["1706.03762", "1810.04805"])
+
+        assert len(agent._session.urls) == 3
+        assert all(r.failed and r.confidence == 0 for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_batch_fails_and_backs_off(self, agent):
+        agent._session = FakeSession(status=503, text="Retry later", headers={"Retry-After": "20"})
+        ids = [f"2101.{n:05d}" for n in range(50)]
+
+        with patch("app.services.paper.bibliography_agent.asyncio.sleep", AsyncMock()) as sleep:
+            results = await agent._fetch_arxiv_batch(ids)
+            assert len(agent._session.urls) == 1
+            assert len(results) == 50 and all(r.failed for r in results.values())
+            sleep.assert_not_awaited()
+
+            await agent._fetch_arxiv_batch(["1706.03762"])
+
+        assert 19 < sleep.await_args.args[0] <= 20
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_are_not_cached(self, agent):
+        reference = 'K. He et al. "Deep residual learning for image recognition." CVPR, 2016.'
+        failing = AsyncMock(return_value=EnrichmentResult(source="crossref_title", failed=True))
+        not_found = AsyncMock(return_value=EnrichmentResult(source="semantic_scholar"))
+
+        with patch.object(agent, "_enrich_from_crossref_title", failing), \
+             patch.object(agent, "_enrich_from_semantic_scholar", not_found):
+            await agent.enrich_references([reference])
+            await agent.enrich_references([reference])
+
+        assert failing.await_count == 2
+        assert agent.cache.stats["stores"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_keys_normalize_identifiers(self):
+        assert reference_keys(arxiv_id="arXiv:1706.03762v5") == reference_keys(arxiv_id="1706.03762")
+        assert reference_keys(doi="10.1109/CVPR.2016.90.") == reference_keys(doi="10.1109/cvpr.2016.90")
+        assert reference_keys(title="Attention is all you need!") == reference_keys(title="ATTENTION IS ALL YOU NEED")
+
+    @pytest.mark.asyncio
+    async def test_local_negative_entries_expire(self, monkeypatch):
+        cache = ReferenceCache()
+        clock = [1000.0]
+        monkeypatch.setattr(reference_cache.time, "monotonic", lambda: clock[0])
+        key = reference_keys(doi="10.1000/later-registered")[0]
+        await cache.set_many({key: None})
+
+        clock[0] += reference_cache.NEGATIVE_TTL_SECONDS - 1
+        assert await cache.get_many([key]) == {key: reference_cache.NEGATIVE}
+
+        clock[0] += 2
+        assert await cache.get_many([key]) == {}
+        assert key not in cache._local
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_session(self):
+        async with BibliographyEnrichmentAgent(cache=ReferenceCache()) as agent:
+            session = FakeSession()
+            agent._session = session
+
+        assert session.closed
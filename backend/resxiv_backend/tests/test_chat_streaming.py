@@ -0,0 +1,144 @@
+"""
+Tests for Chat Streaming
+L6 Engineering Standards - Server-sent-event delivery of chat responses
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.pdf_chat_service import PDFChatService
+from app.services.simple_ai_chat_service import SimpleAIChatService
+from app.core.error_handling import ServiceError, ErrorCodes
+from app.core.llm_cache import LLMResponseCache
+from app.utils.sse import format_sse, sse_response
+from api.v1.endpoints import agentic_production
+
+
+def fake_stream(*deltas, error=None):
+    async def stream(**kwargs):
+        for delta in deltas:
+            yield delta
+        if error:
+            raise error
+    return MagicMock(side_effect=stream)
+
+
+def make_turn(**result):
+    return {
+        "conversation_id": "conv-1",
+        "user_id": "user-1",
+        "project_id": "project-1",
+        "message": "What is this paper about?",
+        "messages": [{"role": "user", "content": "What is this paper about?"}],
+        "save_metadata": {},
+        "result": result
+    }
+
+
+def make_cache():
+    cache = LLMResponseCache(enabled=True, semantic_enabled=False)
+    cache.redis_url = None
+    return cache
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+class TestChatStreaming:
+    """Test cases for streamed chat turns"""
+
+    @pytest.mark.asyncio
+    async def test_paper_chat_streams_tokens_then_saves(self):
+        service = PDFChatService(MagicMock())
+        service.cache = make_cache()
+        service.llm = MagicMock(stream_chat_completion=fake_stream("Trans", "formers"))
+        service._save_chat_messages = AsyncMock()
+
+        events = await collect(service.stream_chat_turn(make_turn(paper_id="paper-1")))
+
+        assert [e["event"] for e in events] == ["start", "token", "token", "done"]
+        assert events[0]["data"] == {"conversation_id": "conv-1", "paper_id": "paper-1"}
+        assert events[-1]["data"]["response"] == "Transformers"
+        assert events[-1]["data"]["paper_id"] == "paper-1"
+        assert service._save_chat_messages.await_args.kwargs["ai_response"] == "Transformers"
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_is_not_saved(self):
+        service = PDFChatService(MagicMock())
+        service.cache = make_cache()
+        service.llm = MagicMock(stream_chat_completion=fake_stream("Trans", error=RuntimeError("reset")))
+        service._save_chat_messages = AsyncMock()
+
+        with pytest.raises(ServiceError):
+            await collect(service.stream_chat_turn(make_turn(paper_id="paper-1")))
+
+        service._save_chat_messages.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cached_answer_is_replayed_without_llm_call(self):
+        service = PDFChatService(MagicMock())
+        service.cache = make_cache()
+        service.llm = MagicMock(stream_chat_completion=fake_stream("Trans", "formers"))
+        service._save_chat_messages = AsyncMock()
+
+        await collect(service.stream_chat_turn(make_turn(paper_id="paper-1")))
+        events = await collect(service.stream_chat_turn(make_turn(paper_id="paper-1")))
+
+        assert [e["event"] for e in events] == ["start", "token", "done"]
+        assert events[1]["data"]["content"] == "Transformers"
+        assert service.llm.stream_chat_completion.call_count == 1
+        assert service._save_chat_messages.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_simple_chat_streams_with_project_attribution(self):
+        service = SimpleAIChatService(MagicMock())
+        service.llm = MagicMock(stream_chat_completion=fake_stream("Hi", "!"))
+        service._save_chat_messages = AsyncMock()
+
+        events = await collect(service.stream_chat(make_turn()))
+
+        assert [e["event"] for e in events] == ["start", "token", "token", "done"]
+        assert events[-1]["data"]["response"] == "Hi!"
+        assert service.llm.stream_chat_completion.call_args.kwargs["project_id"] == "project-1"
+
+    @pytest.mark.asyncio
+    async def test_sse_response_encodes_events_and_errors(self):
+        async def events():
+            yield {"event": "token", "data": {"content": "a"}}
+            raise ServiceError("boom", ErrorCodes.PROCESSING_ERROR)
+
+        response = sse_response(events())
+        body = "".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == "text/event-stream"
+        assert response.headers["x-accel-buffering"] == "no"
+        assert format_sse("token", {"content": "a"}) in body
+        assert body.rstrip().endswith('"error_code": "processing_error"}')
+
+    @pytest.mark.asyncio
+    async def test_stream_runs_on_its_own_session(self, monkeypatch):
+        stream_session = MagicMock()
+        opened = []
+
+        @asynccontextmanager
+        async def get_postgres_session():
+            opened.append(stream_session)
+            yield stream_session
+            opened.remove(stream_session)
+
+        monkeypatch.setattr(agentic_production.db_manager, "get_postgres_session", get_postgres_session)
+        sessions = []
+
+        class RecordingService(SimpleAIChatService):
+            async def initialize(self):
+                sessions.append(self.session)
+                self.llm = MagicMock(stream_chat_completion=fake_stream("Hi"))
+                self._save_chat_messages = AsyncMock(side_effect=lambda **kwargs: sessions.append(list(opened)))
+
+        events = await collect(agentic_production._stream_turn(RecordingService, "stream_chat", make_turn(), 0.0))
+
+        assert events[-1]["event"] == "done"
+        assert sessions == [stream_session, [stream_session]]
+        assert opened == []
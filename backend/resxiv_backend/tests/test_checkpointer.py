@@ -0,0 +1,176 @@
+"""
+Tests for Redis LangGraph Checkpointer
+L6 Engineering Standards - Persistent, bounded agent session state
+"""
+
+import fnmatch
+import operator
+import pytest
+from datetime import datetime
+from typing import Annotated, List, TypedDict
+
+from langgraph.graph import StateGraph, START, END
+
+from app.agentic.checkpointer import RedisCheckpointSaver
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the saver uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    @staticmethod
+    def _b(value):
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    async def ping(self):
+        return True
+
+    async def hset(self, key, field, value):
+        self.data.setdefault(key, {})[self._b(field)] = value
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(self._b(field))
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hkeys(self, key):
+        return list(self.data.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(self._b(field), None)
+
+    async def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(self._b(member))
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key.encode()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append(getattr(self.redis, name)(*args, **kwargs))
+        return queue
+
+    async def execute(self):
+        return [await call for call in self.calls]
+
+
+class State(TypedDict):
+    steps: Annotated[List[str], operator.add]
+    started_at: datetime
+
+
+def build_graph(saver):
+    graph = StateGraph(State)
+    graph.add_node("plan", lambda state: {"steps": ["plan"]})
+    graph.add_node("act", lambda state: {"steps": ["act"]})
+    graph.add_edge(START, "plan")
+    graph.add_edge("plan", "act")
+    graph.add_edge("act", END)
+    return graph.compile(checkpointer=saver)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+def make_saver(redis_client, **kwargs):
+    return RedisCheckpointSaver(redis_url="redis://unused", ttl_seconds=600, client=redis_client, **kwargs)
+
+
+class TestRedisCheckpointSaver:
+    """Test cases for RedisCheckpointSaver"""
+
+    @pytest.mark.asyncio
+    async def test_session_resumes_on_another_worker(self, redis_client):
+        config = {"configurable": {"thread_id": "session-1"}}
+        started_at = datetime(2024, 1, 1, 12, 0)
+        await build_graph(make_saver(redis_client)).ainvoke(
+            {"steps": [], "started_at": started_at}, config
+        )
+
+        # A second worker shares only the Redis backend
+        other_worker = build_graph(make_saver(redis_client))
+        state = await other_worker.aget_state(config)
+        assert state.values == {"steps": ["plan", "act"], "started_at": started_at}
+
+        await other_worker.ainvoke({"steps": ["again"]}, config)
+        state = await other_worker.aget_state(config)
+        assert state.values["steps"] == ["plan", "act", "again", "plan", "act"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_are_capped_and_ttl_refreshed(self, redis_client):
+        saver = make_saver(redis_client, max_checkpoints=3)
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": "session-2"}}
+
+        for _ in range(3):
+            await graph.ainvoke({"steps": ["x"], "started_at": datetime.now()}, config)
+
+        checkpoints_key = saver._checkpoints_key("session-2", "")
+        assert len(redis_client.data[checkpoints_key]) == 3
+        assert redis_client.ttls[checkpoints_key] == 600
+        writes_keys = [k for k in redis_client.data if ":writes:" in k]
+        kept = {cid.decode() for cid in redis_client.data[checkpoints_key]}
+        assert all(k.rsplit(":", 1)[1] in kept for k in writes_keys)
+        history = [c async for c in graph.aget_state_history(config)]
+        assert len(history) == 3
+
+    @pytest.mark.asyncio
+    async def test_large_checkpoints_are_compressed(self, redis_client):
+        saver = make_saver(redis_client)
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": "session-3"}}
+
+        await graph.ainvoke({"steps": ["word " * 2000], "started_at": datetime.now()}, config)
+
+        blobs = redis_client.data[saver._checkpoints_key("session-3", "")].values()
+        assert all(len(blob) < 2000 for blob in blobs)
+        assert (await graph.aget_state(config)).values["steps"][0] == "word " * 2000
+
+    @pytest.mark.asyncio
+    async def test_delete_thread_removes_all_keys(self, redis_client):
+        saver = make_saver(redis_client)
+        config = {"configurable": {"thread_id": "session-4"}}
+        await build_graph(saver).ainvoke({"steps": [], "started_at": datetime.now()}, config)
+
+        await saver.adelete_thread("session-4")
+
+        assert not [k for k in redis_client.data if k.startswith("langgraph:session-4:")]
+        assert await saver.aget_tuple(config) is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_without_redis(self):
+        saver = RedisCheckpointSaver(redis_url="redis://127.0.0.1:1/0")
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": "session-5"}}
+
+        await graph.ainvoke({"steps": [], "started_at": datetime.now()}, config)
+
+        assert (await graph.aget_state(config)).values["steps"] == ["plan", "act"]
@@ -0,0 +1,203 @@
+"""
+Tests for the collaborative editing WebSocket provider.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+try:
+    import y_py
+except ImportError:
+    y_py = None
+
+from app.websockets import collab_ws
+from app.websockets.room_broker import RoomBroker
+
+
+class FakeWebSocket:
+    """Client socket fed from a queue; ``None`` disconnects"""
+
+    def __init__(self):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+        self.accept = AsyncMock()
+        self.close = AsyncMock()
+
+    async def receive_bytes(self):
+        data = await self.incoming.get()
+        if data is None:
+            raise WebSocketDisconnect()
+        return data
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+
+class FakeBranchRepository:
+    """One stored document session shared by every connection"""
+
+    def __init__(self):
+        self.row = SimpleNamespace(id=uuid.uuid4(), crdt_state=None, last_activity=None, autosave_pending=False)
+        self.enqueue_autosave = AsyncMock()
+
+    async def get_file_active_session(self, file_id):
+        # Each connection's own session loads its own copy of the row
+        return SimpleNamespace(**vars(self.row))
+
+    async def reload_document_session(self, session_id):
+        return SimpleNamespace(**vars(self.row))
+
+    async def lock_document_session(self, session_id):
+        return self.row
+
+
+def client_update(text_value):
+    doc = y_py.YDoc()
+    text = doc.get_text("content")
+    with doc.begin_transaction() as txn:
+        text.extend(txn, text_value)
+    return bytes(y_py.encode_state_as_update(doc))
+
+
+def stored_text(state):
+    doc = y_py.YDoc()
+    y_py.apply_update(doc, bytes(state))
+    return str(doc.get_text("content"))
+
+
+async def edit_concurrently(monkeypatch, repository, alice_update, bob_update):
+    """Two editors on one file each send one update, then disconnect."""
+    broker = RoomBroker()
+    broker.redis_url = None  # local-only mode
+    monkeypatch.setattr(collab_ws, "BranchRepository", lambda session: repository)
+    monkeypatch.setattr(collab_ws, "room_broker", broker)
+    monkeypatch.setattr(
+        collab_ws, "get_branch_permission",
+        AsyncMock(return_value=SimpleNamespace(can_read=True, can_write=True))
+    )
+
+    async def connect(websocket):
+        await collab_ws.collaborative_ws(
+            websocket, uuid.uuid4(), uuid.uuid4(), uuid.uuid4(),
+            session=Mock(commit=AsyncMock()), current_user={"user_id": uuid.uuid4()},
+            _project_access=None
+        )
+
+    alice, bob = FakeWebSocket(), FakeWebSocket()
+    tasks = [asyncio.create_task(connect(alice)), asyncio.create_task(connect(bob))]
+    await asyncio.sleep(0.01)
+
+    alice.incoming.put_nowait(alice_update)
+    await asyncio.sleep(0.01)
+    bob.incoming.put_nowait(bob_update)
+    await asyncio.sleep(0.01)
+    alice.incoming.put_nowait(None)
+    bob.incoming.put_nowait(None)
+    await asyncio.gather(*tasks)
+    await broker.close()
+
+
+class TestCollaborativeWebSocket:
+    """Concurrent editors merge into the stored state"""
+
+    @pytest.mark.asyncio
+    async def test_updates_merge_into_the_locked_row(self, monkeypatch):
+        repository = FakeBranchRepository()
+        merged_states = []
+
+        def fake_merge(*updates):
+            merged_states.append(updates)
+            return b"".join(bytes(update) for update in updates if update)
+
+        # Stand-in for y_py: any non-None YDoc enables the merge path
+        monkeypatch.setattr(collab_ws, "YDoc", object)
+        monkeypatch.setattr(collab_ws, "merge_crdt_updates", fake_merge)
+
+        await edit_concurrently(monkeypatch, repository, b"alice;", b"bob;")
+
+        # Bob's update is merged onto the row holding Alice's, not onto the
+        # stale copy his connection loaded before she typed
+        assert repository.row.crdt_state == b"alice;bob;"
+        assert merged_states[-1] == (b"alice;", b"bob;")
+        assert repository.row.autosave_pending is True
+        assert repository.enqueue_autosave.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_snapshot_read_after_joining_the_room(self, monkeypatch):
+        repository = FakeBranchRepository()
+        broker = RoomBroker()
+        broker.redis_url = None  # local-only mode
+        join = broker.join
+
+        async def join_after_an_edit_lands(room_id, websocket):
+            # Another editor's update is stored after this connection
+            # loaded its session row but before it subscribed
+            repository.row.crdt_state = b"early;"
+            return await join(room_id, websocket)
+
+        monkeypatch.setattr(broker, "join", join_after_an_edit_lands)
+        monkeypatch.setattr(collab_ws, "room_broker", broker)
+        monkeypatch.setattr(collab_ws, "BranchRepository", lambda session: repository)
+        monkeypatch.setattr(
+            collab_ws, "get_branch_permission",
+            AsyncMock(return_value=SimpleNamespace(can_read=True, can_write=True))
+        )
+        monkeypatch.setattr(collab_ws, "YDoc", object)
+        monkeypatch.setattr(
+            collab_ws, "merge_crdt_updates",
+            lambda *updates: b"".join(bytes(update) for update in updates if update)
+        )
+
+        websocket = FakeWebSocket()
+        connection = asyncio.create_task(collab_ws.collaborative_ws(
+            websocket, uuid.uuid4(), uuid.uuid4(), uuid.uuid4(),
+            session=Mock(commit=AsyncMock()), current_user={"user_id": uuid.uuid4()},
+            _project_access=None
+        ))
+        await asyncio.sleep(0.01)
+        websocket.incoming.put_nowait(None)
+        await connection
+        await broker.close()
+
+        assert websocket.sent == [b"early;"]
+
+    @pytest.mark.asyncio
+    async def test_updates_are_stored_before_broadcast(self, monkeypatch):
+        repository = FakeBranchRepository()
+        stored_at_broadcast = []
+        monkeypatch.setattr(collab_ws, "YDoc", object)
+        monkeypatch.setattr(
+            collab_ws, "merge_crdt_updates",
+            lambda *updates: b"".join(bytes(update) for update in updates if update)
+        )
+        broadcast = RoomBroker.broadcast
+
+        async def record_stored_state(broker, room_id, data, sender=None):
+            stored_at_broadcast.append(repository.row.crdt_state)
+            await broadcast(broker, room_id, data, sender=sender)
+
+        monkeypatch.setattr(RoomBroker, "broadcast", record_stored_state)
+
+        await edit_concurrently(monkeypatch, repository, b"alice;", b"bob;")
+
+        # A peer that joins between the two steps reads the update from the
+        # stored state, since it is there before anyone is told about it
+        assert stored_at_broadcast == [b"alice;", b"alice;bob;"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(y_py is None, reason="y-py is not installed")
+    async def test_two_connections_keep_both_edits(self, monkeypatch):
+        repository = FakeBranchRepository()
+
+        await edit_concurrently(
+            monkeypatch, repository, client_update("from alice "), client_update("from bob ")
+        )
+
+        text = stored_text(repository.row.crdt_state)
+        assert "from alice" in text and "from bob" in text
+        assert repository.row.autosave_pending is True
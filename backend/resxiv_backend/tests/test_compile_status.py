@@ -0,0 +1,150 @@
+"""
+Tests for push-based LaTeX compile status.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.git.compile_status import CHANNEL_PREFIX, KEY_PREFIX, CompileStatusStore
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value, ex))
+
+    def publish(self, channel, message):
+        self.commands.append(("publish", channel, message))
+
+    async def execute(self):
+        for command in self.commands:
+            if command[0] == "set":
+                self.redis.values[command[1]] = command[2]
+            else:
+                self.redis.published.append((command[1], json.loads(command[2])))
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+def make_session(rows=None):
+    session = AsyncMock()
+    result = MagicMock()
+    result.mappings.return_value.first.return_value = (rows or [None])[0]
+    result.mappings.return_value.all.return_value = rows or []
+    session.execute.return_value = result
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return session, factory
+
+
+def metadata(status="running", **extra):
+    return {
+        "compilation_id": "11111111-1111-1111-1111-111111111111",
+        "project_id": "22222222-2222-2222-2222-222222222222",
+        "latex_id": "paper",
+        "status": status,
+        "started_at": "2026-01-01T00:00:00",
+        **extra
+    }
+
+
+class TestCompileStatusStore:
+    """Snapshots, history and event streams"""
+
+    @pytest.mark.asyncio
+    async def test_update_publishes_snapshot_and_records_row(self):
+        redis = FakeRedis()
+        session, factory = make_session()
+        store = CompileStatusStore(redis_client=redis, session_factory=factory)
+
+        await store.update(metadata())
+
+        compilation_id = metadata()["compilation_id"]
+        assert json.loads(redis.values[KEY_PREFIX + compilation_id])["status"] == "running"
+        assert redis.published == [(CHANNEL_PREFIX + compilation_id, {"event": "status", "data": metadata()})]
+        params = session.execute.await_args.args[1]
+        assert params["id"] == compilation_id
+        assert params["status"] == "running"
+
+    @pytest.mark.asyncio
+    async def test_get_reads_redis_then_postgres(self):
+        redis = FakeRedis()
+        redis.values[KEY_PREFIX + "a"] = json.dumps({"compilation_id": "a", "status": "completed"})
+        row = {"compilation_id": "b", "status": "failed", "started_at": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+        session, factory = make_session([row])
+        store = CompileStatusStore(redis_client=redis, session_factory=factory)
+
+        assert (await store.get("a"))["status"] == "completed"
+        from_db = await store.get("b")
+        assert from_db["status"] == "failed"
+        assert from_db["started_at"] == "2026-01-01T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_history_queries_table(self):
+        row = {"compilation_id": "a", "status": "completed", "started_at": datetime(2026, 1, 1)}
+        session, factory = make_session([row])
+        store = CompileStatusStore(redis_client=FakeRedis(), session_factory=factory)
+
+        history = await store.history("22222222-2222-2222-2222-222222222222", "paper", limit=5)
+
+        assert history == [{"compilation_id": "a", "status": "completed", "started_at": "2026-01-01T00:00:00"}]
+        assert session.execute.await_args.args[1]["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_events_stream_until_terminal_status(self, monkeypatch):
+        monkeypatch.setattr("app.database.connection.db_manager.redis_client", None)
+        _, factory = make_session()
+        store = CompileStatusStore(session_factory=factory)
+        await store.update(metadata("started"))
+
+        received = []
+
+        async def consume():
+            async for event in store.events(metadata()["compilation_id"]):
+                received.append(event)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        await store.update(metadata("running"))
+        await store.publish_log(metadata()["compilation_id"], ["line 1", "line 2"])
+        await store.update(metadata("completed", artifact_url="/download"))
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert [e["event"] for e in received] == ["status", "status", "log", "status"]
+        assert received[0]["data"]["status"] == "started"
+        assert received[2]["data"]["lines"] == ["line 1", "line 2"]
+        assert received[-1]["data"]["artifact_url"] == "/download"
+        assert not store._subscribers
+
+    @pytest.mark.asyncio
+    async def test_events_for_finished_compilation_end_immediately(self, monkeypatch):
+        monkeypatch.setattr("app.database.connection.db_manager.redis_client", None)
+        _, factory = make_session()
+        store = CompileStatusStore(session_factory=factory)
+        await store.update(metadata("failed"))
+
+        events = [event async for event in store.events(metadata()["compilation_id"])]
+
+        assert len(events) == 1
+        assert events[0]["data"]["status"] == "failed"
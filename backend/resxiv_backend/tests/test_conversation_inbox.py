@@ -0,0 +1,234 @@
+"""
+Tests for the materialized conversation inbox
+L6 Engineering Standards - single-read sidebar, message fan-out and read sync
+"""
+
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.conversation_models import ConversationType, MessageCreate, MessageResponse, MessageType
+from app.repositories.conversation_inbox_repository import ConversationInboxRepository, message_preview
+from app.services.conversation.conversation_crud_service import ConversationCrudService
+from app.services.message.message_service_integrated import MessageService
+
+
+def inbox_row(total_count=1, **overrides):
+    row = {
+        "id": uuid.uuid4(), "type": "GROUP", "entity": uuid.uuid4(), "is_group": True,
+        "created_by": uuid.uuid4(), "created_at": datetime(2024, 1, 1), "updated_at": datetime(2024, 1, 1),
+        "last_activity_at": datetime(2024, 1, 2), "last_message_id": "65a000000000000000000001",
+        "last_message_preview": "see section 3", "last_sender_id": uuid.uuid4(), "last_sender_name": "Ada",
+        "unread_count": 2, "total_count": total_count
+    }
+    row.update(overrides)
+    return row
+
+
+def session_returning(*results):
+    session = Mock()
+    session.execute = AsyncMock(side_effect=list(results))
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+def rows_result(rows):
+    result = Mock()
+    result.mappings.return_value.all.return_value = rows
+    return result
+
+
+class TestMessagePreview:
+    """Sidebar preview text"""
+
+    def test_whitespace_collapsed(self):
+        assert message_preview("see\n\n  section   3") == "see section 3"
+
+    def test_long_messages_truncated(self):
+        preview = message_preview("x" * 500, length=10)
+        assert preview == "x" * 9 + "…"
+
+    def test_empty_content(self):
+        assert message_preview(None) == ""
+
+
+class TestInboxRepository:
+    """Single range read with the total carried on every row"""
+
+    @pytest.mark.asyncio
+    async def test_page_and_total_in_one_query(self):
+        session = session_returning(rows_result([inbox_row(total_count=230), inbox_row(total_count=230)]))
+
+        rows, total = await ConversationInboxRepository(session).list_inbox(uuid.uuid4(), limit=200)
+
+        assert len(rows) == 2 and total == 230
+        assert session.execute.await_count == 1
+        sql = str(session.execute.call_args.args[0])
+        assert "ORDER BY ib.last_activity_at DESC, ib.conversation_id DESC" in sql
+        assert "count(*) OVER ()" in sql
+        assert "conversation_type" not in sql
+
+    @pytest.mark.asyncio
+    async def test_type_filter(self):
+        session = session_returning(rows_result([]))
+
+        await ConversationInboxRepository(session).list_inbox(uuid.uuid4(), conversation_type=ConversationType.AI)
+
+        assert "ib.conversation_type = :conversation_type" in str(session.execute.call_args.args[0])
+        assert session.execute.call_args.args[1]["conversation_type"] == "AI"
+
+    @pytest.mark.asyncio
+    async def test_page_past_end_falls_back_to_count(self):
+        count = Mock()
+        count.scalar.return_value = 7
+        session = session_returning(rows_result([]), count)
+
+        rows, total = await ConversationInboxRepository(session).list_inbox(uuid.uuid4(), limit=20, offset=40)
+
+        assert rows == [] and total == 7
+        assert "LIMIT" not in str(session.execute.call_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_record_message_fans_out_in_one_statement(self):
+        result = Mock(rowcount=3)
+        session = session_returning(result)
+        conversation_id, sender_id = uuid.uuid4(), uuid.uuid4()
+
+        written = await ConversationInboxRepository(session).record_message(
+            conversation_id, "65a000000000000000000002", sender_id, "hello\nall", datetime(2024, 1, 3), "Ada"
+        )
+
+        assert written == 3
+        sql, params = str(session.execute.call_args.args[0]), session.execute.call_args.args[1]
+        assert "ON CONFLICT (user_id, conversation_id) DO UPDATE" in sql
+        assert "CASE WHEN p.user_id = :sender_id THEN 0 ELSE 1 END" in sql
+        assert params["preview"] == "hello all"
+        assert params["sender_id"] == sender_id
+
+    @pytest.mark.asyncio
+    async def test_unread_count_never_negative(self):
+        session = session_returning(Mock())
+
+        await ConversationInboxRepository(session).set_unread_count(uuid.uuid4(), uuid.uuid4(), -3)
+
+        assert session.execute.call_args.args[1]["unread_count"] == 0
+
+
+class TestUserConversations:
+    """Conversation list served from the inbox"""
+
+    @pytest.mark.asyncio
+    async def test_list_carries_preview_sender_and_unread(self):
+        row = inbox_row(total_count=45)
+        service = ConversationCrudService(AsyncMock())
+        service.inbox_repo = AsyncMock()
+        service.inbox_repo.list_inbox.return_value = ([row], 45)
+        service.conversation_repo = AsyncMock()
+
+        result = await service.get_user_conversations(uuid.uuid4(), page=2, limit=20)
+
+        conversation = result["conversations"][0]
+        assert conversation.unread_count == 2
+        assert conversation.last_message == "see section 3"
+        assert conversation.last_sender_name == "Ada"
+        assert conversation.last_activity_at == datetime(2024, 1, 2)
+        assert (result["total"], result["page"], result["has_next"], result["has_prev"]) == (45, 2, True, True)
+        assert service.inbox_repo.list_inbox.await_args.kwargs["offset"] == 20
+        service.conversation_repo.get_user_conversations.assert_not_awaited()
+        service.conversation_repo.count_user_conversations.assert_not_awaited()
+
+
+class TestMessageInboxSync:
+    """Sending and reading keep the inbox current"""
+
+    def make_service(self):
+        service = MessageService(Mock(commit=AsyncMock(), rollback=AsyncMock()), Mock(), Mock())
+        service.inbox_repo = AsyncMock()
+        service.core_service = AsyncMock()
+        service.realtime_service = AsyncMock()
+        service.message_repo = AsyncMock()
+        return service
+
+    def sent_message(self, conversation_id, sender_id):
+        now = datetime(2024, 1, 3)
+        return MessageResponse(
+            id="65a000000000000000000002", conversation_id=conversation_id, sender_id=sender_id,
+            sender_name="Ada", message="hello", message_type=MessageType.TEXT,
+            timestamp=now, created_at=now, updated_at=now
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_records_message_and_commits(self):
+        service = self.make_service()
+        conversation_id, sender_id = uuid.uuid4(), uuid.uuid4()
+        message = self.sent_message(conversation_id, sender_id)
+        service.core_service.create_message.return_value = {"success": True, "message": message}
+
+        await service.create_message(conversation_id, sender_id, MessageCreate(content="hello"), "Ada")
+
+        service.inbox_repo.record_message.assert_awaited_once_with(
+            conversation_id, message.id, sender_id, "hello", message.created_at, "Ada"
+        )
+        service.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_inbox_failure_does_not_fail_send(self):
+        service = self.make_service()
+        conversation_id, sender_id = uuid.uuid4(), uuid.uuid4()
+        service.core_service.create_message.return_value = {
+            "success": True, "message": self.sent_message(conversation_id, sender_id)
+        }
+        service.inbox_repo.record_message.side_effect = RuntimeError("db down")
+
+        result = await service.create_message(conversation_id, sender_id, MessageCreate(content="hello"))
+
+        assert result["success"] is True
+        service.session.rollback.assert_awaited_once()
+        service.realtime_service.publish_message.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_read_stores_remaining_unread(self):
+        service = self.make_service()
+        conversation_id, user_id = uuid.uuid4(), uuid.uuid4()
+        service.message_repo.mark_conversation_read.return_value = 4
+        service.message_repo.get_unread_count.return_value = 1
+
+        await service.mark_conversation_as_read(conversation_id, user_id)
+
+        service.inbox_repo.set_unread_count.assert_awaited_once_with(conversation_id, user_id, 1)
+        service.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_read_receipt_syncs_unread_counters(self):
+        service = self.make_service()
+        message = self.sent_message(uuid.uuid4(), uuid.uuid4())
+        reader_id = uuid.uuid4()
+        service.message_repo.get_message_by_id.return_value = message
+        service.message_repo.get_unread_count.return_value = 0
+
+        await service.add_read_receipt(message.id, reader_id)
+
+        service.message_repo.mark_conversation_read.assert_awaited_once_with(
+            message.conversation_id, reader_id, message.id
+        )
+        service.inbox_repo.set_unread_count.assert_awaited_once_with(message.conversation_id, reader_id, 0)
+        service.realtime_service.mark_messages_read.assert_awaited_once_with(
+            message.conversation_id, reader_id, 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_rejects_message_from_other_conversation(self):
+        service = self.make_service()
+        other = self.sent_message(uuid.uuid4(), uuid.uuid4())
+        service.message_repo.get_message_by_id.return_value = other
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.mark_messages_read(uuid.uuid4(), uuid.uuid4(), [other.id])
+
+        assert exc_info.value.status_code == 404
+
+        service.message_repo.mark_conversation_read.assert_not_called()
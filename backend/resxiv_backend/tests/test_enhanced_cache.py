@@ -0,0 +1,279 @@
+"""
+Tests for the shared EnhancedCache
+L6 Engineering Standards - LRU, tag/SCAN invalidation, single-flight and L1 coherence
+"""
+
+import asyncio
+import fnmatch
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.enhanced_cache import EnhancedCache, INVALIDATION_CHANNEL, TAG_PREFIX
+from app.services.conversation.conversation_crud_service import ConversationCrudService
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class FakeRedis:
+    """The subset of redis.asyncio the cache uses, in memory"""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS blocks Redis; use SCAN")
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    return EnhancedCache(redis_client=redis_client, max_local_entries=2, default_ttl=60, local_ttl=30, enabled=True)
+
+
+def published(redis_client):
+    return [json.loads(message[16:]) for channel, message in redis_client.published if channel == INVALIDATION_CHANNEL]
+
+
+class TestLocalLayer:
+    """L1 LRU with TTL"""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, cache):
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1
+        await cache.set("c", 3)
+
+        assert list(cache.memory_cache) == ["a", "c"]
+        assert cache.cache_stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_fall_through_to_redis(self, redis_client):
+        cache = EnhancedCache(redis_client=redis_client, local_ttl=0.01, enabled=True)
+        await cache.set("k", {"v": 1})
+        await asyncio.sleep(0.02)
+
+        assert await cache.get("k") == {"v": 1}
+        assert cache.cache_stats["redis_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_values_are_not_shared_between_callers(self, cache):
+        await cache.set("k", {"items": [1]})
+        first = await cache.get("k")
+        first["items"].append(2)
+
+        assert await cache.get("k") == {"items": [1]}
+
+    @pytest.mark.asyncio
+    async def test_msgpack_serializer(self, redis_client):
+        cache = EnhancedCache(redis_client=redis_client, serializer="msgpack", enabled=True)
+        await cache.set("k", {"id": "p1", "authors": ["A", "B"]})
+        cache.memory_cache.clear()
+
+        assert await cache.get("k") == {"id": "p1", "authors": ["A", "B"]}
+        assert cache.serializer.name == "msgpack"
+
+    def test_unknown_serializer(self):
+        with pytest.raises(ValueError):
+            EnhancedCache(redis_client=FakeRedis(), serializer="pickle")
+
+
+class TestInvalidation:
+    """Tag sets, SCAN patterns and cross-worker L1 coherence"""
+
+    @pytest.mark.asyncio
+    async def test_tags_invalidate_every_tagged_key(self, cache, redis_client):
+        await cache.set("project:1:detail", {"n": 1}, tags=["project:1"])
+        await cache.set("project:1:papers", {"n": 2}, tags=["project:1", "paper:9"])
+        await cache.set("project:2:detail", {"n": 3}, tags=["project:2"])
+
+        deleted = await cache.invalidate_tags("project:1")
+
+        assert deleted == 2
+        assert set(redis_client.data) == {"project:2:detail", TAG_PREFIX + "project:2", TAG_PREFIX + "paper:9"}
+        assert await cache.get("project:1:detail") is None
+        assert published(redis_client) == [{"keys": ["project:1:detail", "project:1:papers"]}]
+
+    @pytest.mark.asyncio
+    async def test_pattern_invalidation_scans(self, cache, redis_client):
+        for i in range(3):
+            await cache.set(f"conversation:{i}:meta", i)
+
+        assert await cache.invalidate_pattern("conversation:*") == 3
+        assert redis_client.data == {}
+        assert len(cache.memory_cache) == 0
+        assert published(redis_client) == [{"patterns": ["conversation:*"]}]
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_local_copies(self, cache):
+        await cache.set("project:1:detail", 1)
+        await cache.set("conversation:1:meta", 2)
+
+        cache.handle_invalidation(json.dumps({"keys": ["project:1:detail"]}).encode())
+        assert "project:1:detail" not in cache.memory_cache
+        cache.handle_invalidation(json.dumps({"patterns": ["conversation:*"]}).encode())
+        assert len(cache.memory_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidation_waits_for_commit(self, cache, redis_client):
+        await cache.set("project:1:detail", 1, tags=["project:1"])
+        session = Session()
+
+        cache.invalidate_tags_after_commit(session, "project:1")
+        await asyncio.sleep(0)
+        assert "project:1:detail" in redis_client.data
+
+        session.commit()
+        await asyncio.gather(*cache._background)
+        assert "project:1:detail" not in redis_client.data
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_pending_invalidation(self, cache, redis_client):
+        await cache.set("project:1:detail", 1, tags=["project:1"])
+        session = Session(create_engine("sqlite://"))
+
+        session.execute(text("SELECT 1"))
+        cache.invalidate_tags_after_commit(session, "project:1")
+        session.rollback()
+        session.commit()
+        await asyncio.sleep(0)
+
+        assert "project:1:detail" in redis_client.data
+
+
+class TestGetOrSet:
+    """Read-through with request coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache):
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(cache.get_or_set("k", load) for _ in range(10)))
+
+        assert calls == 1
+        assert all(result == {"value": 42} for result in results)
+        assert cache.cache_stats["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_tags_can_depend_on_value(self, cache, redis_client):
+        async def load():
+            return {"papers": [{"id": "p1"}, {"id": "p2"}]}
+
+        await cache.get_or_set("list", load, tags=lambda value: [f"paper:{p['id']}" for p in value["papers"]])
+
+        assert redis_client.data[TAG_PREFIX + "paper:p2"] == {"list"}
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_stored(self, cache):
+        async def load():
+            await cache.invalidate_tags("project:1")
+            return "stale"
+
+        assert await cache.get_or_set("project:1:detail", load, tags=["project:1"]) == "stale"
+        assert await cache.get("project:1:detail") is None
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_propagate_to_all_waiters(self, cache):
+        async def load():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(*(cache.get_or_set("k", load) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_failures_degrade_to_loader(self):
+        broken = FakeRedis()
+        broken.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = EnhancedCache(redis_client=broken, enabled=True)
+
+        assert await cache.get_or_set("k", AsyncMock(return_value=5)) == 5
+        assert cache.cache_stats["errors"] == 1
+
+
+class TestConversationMetadataCache:
+    """Conversation reads are served from the shared cache"""
+
+    @pytest.mark.asyncio
+    async def test_conversation_loaded_once_and_invalidated_on_update(self, cache):
+        conversation_id, user_id = uuid.uuid4(), uuid.uuid4()
+        row = SimpleNamespace(
+            id=conversation_id, type="AI", entity=None, is_group=False, created_by=user_id,
+            created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1)
+        )
+        service = ConversationCrudService(AsyncMock())
+        service.conversation_repo = AsyncMock()
+        service.conversation_repo.get_conversation_by_id.return_value = row
+        service.conversation_repo.is_user_participant.return_value = True
+        service.conversation_repo.update_conversation.return_value = row
+
+        with patch("app.services.conversation.conversation_crud_service.enhanced_cache", cache):
+            first = await service.get_conversation(conversation_id, user_id)
+            second = await service.get_conversation(conversation_id, user_id)
+            assert service.conversation_repo.get_conversation_by_id.await_count == 1
+            assert first["conversation"] == second["conversation"]
+
+            update = SimpleNamespace(dict=lambda exclude_none: {})
+            await service.update_conversation(conversation_id, update, user_id)
+            await service.get_conversation(conversation_id, user_id)
+
+        assert service.conversation_repo.get_conversation_by_id.await_count == 3
@@ -0,0 +1,232 @@
+"""
+Tests for checkout-free Git reads through the object database.
+"""
+
+import os
+import subprocess
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.error_handling import ServiceError, ErrorCodes
+from app.services.git.object_reader import BlobCache, GitObjectStore
+
+
+def git(repo, *args, env=None):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True,
+        env={**os.environ, **env} if env else None
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "main.tex").write_text("hello main")
+    (tmp_path / "sections").mkdir()
+    (tmp_path / "sections" / "intro.tex").write_text("intro")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    git(tmp_path, "branch", "feature")
+    return tmp_path
+
+
+def commit_file(repo, name, content, branch="main", committed_at=None):
+    """Commit a file to ``branch`` and switch back to ``main``."""
+    git(repo, "checkout", "-q", branch)
+    (repo / name).write_text(content)
+    git(repo, "add", name)
+    env = {"GIT_COMMITTER_DATE": f"{committed_at} +0000"} if committed_at else None
+    git(repo, "commit", "-q", "-m", f"update {name}", env=env)
+    git(repo, "checkout", "-q", "main")
+
+
+class TestGitObjectReader:
+    """Reads served by the long-lived cat-file process"""
+
+    @pytest.mark.asyncio
+    async def test_lists_branch_with_sizes(self, repo):
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+
+        tree = await reader.branch_tree("main")
+
+        assert set(tree.files) == {"main.tex", "sections/intro.tex"}
+        assert tree.files["main.tex"].size == len("hello main")
+        assert tree.commit_id == git(repo, "rev-parse", "main").strip()
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_other_branch_without_checkout(self, repo):
+        commit_file(repo, "main.tex", "feature text", branch="feature")
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+
+        tree = await reader.branch_tree("feature")
+        content = await reader.read_blob(tree.files["main.tex"].object_id)
+
+        assert content == b"feature text"
+        assert git(repo, "rev-parse", "--abbrev-ref", "HEAD").strip() == "main"
+        assert (repo / "main.tex").read_text() == "hello main"
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_sees_new_commits(self, repo):
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+        before = await reader.branch_tree("main")
+
+        commit_file(repo, "main.tex", "second version")
+        after = await reader.branch_tree("main")
+
+        assert after.commit_id != before.commit_id
+        assert await reader.read_blob(after.files["main.tex"].object_id) == b"second version"
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_last_changes_per_file(self, repo):
+        commit_file(repo, "main.tex", "v2", committed_at=2000000000)
+        commit_file(repo, "notes.tex", "notes", committed_at=2000000100)
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+
+        tree = await reader.branch_tree("main")
+        changes = await reader.last_changes(tree)
+
+        initial = int(git(repo, "log", "-1", "--format=%ct", "--", "sections/intro.tex"))
+        assert changes == {
+            "main.tex": datetime.fromtimestamp(2000000000, tz=timezone.utc),
+            "notes.tex": datetime.fromtimestamp(2000000100, tz=timezone.utc),
+            "sections/intro.tex": datetime.fromtimestamp(initial, tz=timezone.utc)
+        }
+        assert await reader.last_changes(tree) is changes
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_blob_cache_skips_process(self, repo):
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+        object_id = (await reader.branch_tree("main")).files["main.tex"].object_id
+        await reader.read_blob(object_id)
+
+        with patch.object(reader, "_read_object", AsyncMock()) as read_object:
+            assert await reader.read_blob(object_id) == b"hello main"
+        read_object.assert_not_called()
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_branch_raises_not_found(self, repo):
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+
+        with pytest.raises(ServiceError) as exc_info:
+            await reader.branch_tree("does-not-exist")
+
+        assert exc_info.value.error_code == ErrorCodes.NOT_FOUND_ERROR
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_restarts_dead_process(self, repo):
+        store = GitObjectStore()
+        reader = await store.reader(repo)
+        await reader.branch_tree("main")
+
+        reader._process.kill()
+        await reader._process.wait()
+
+        assert (await reader.branch_tree("feature")).files
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_eviction_lets_in_flight_read_finish(self, repo, tmp_path_factory):
+        other = tmp_path_factory.mktemp("other")
+        git(other, "init", "-q", "-b", "main")
+        store = GitObjectStore(max_repositories=1)
+        reader = await store.reader(repo)
+        await reader.branch_tree("main")
+
+        async with reader._lock:  # a read in flight on another request
+            await store.reader(other)
+            assert reader.retired and reader._process is not None
+
+        assert (await reader.branch_tree("feature")).files
+        assert reader._process is None
+        await store.close()
+
+
+class TestBlobCache:
+    """Byte-bounded blob LRU"""
+
+    def test_evicts_least_recently_used(self):
+        cache = BlobCache(max_bytes=10, max_blob_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.get("a")
+        cache.put("c", b"12345")
+
+        assert cache.get("a") == b"12345"
+        assert cache.get("b") is None
+
+    def test_skips_oversized_blobs(self):
+        cache = BlobCache(max_bytes=100, max_blob_bytes=4)
+        cache.put("a", b"12345")
+        assert cache.get("a") is None
+
+
+class TestGitRepositoryServiceReads:
+    """Service methods read without checking out the branch"""
+
+    @pytest.fixture
+    def service(self, repo):
+        from app.services.git.git_repository_service import GitRepositoryService
+
+        service = GitRepositoryService(MagicMock())
+        service.repository = MagicMock()
+        service.repository.get_project_git_repository = AsyncMock(
+            return_value=SimpleNamespace(repo_path=str(repo))
+        )
+        service._run_git_command = AsyncMock(side_effect=AssertionError("no git commands expected"))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_read_file(self, service, repo):
+        store = GitObjectStore()
+        with patch("app.services.git.git_repository_service.git_object_store", store):
+            result = await service.read_file_from_repository(uuid.uuid4(), "main", "/sections/intro.tex")
+            with pytest.raises(HTTPException):
+                await service.read_file_from_repository(uuid.uuid4(), "main", "nope.tex")
+        await store.close()
+
+        assert result["success"] is True
+        assert result["content"] == "intro"
+        assert result["file_size"] == 5
+
+    @pytest.mark.asyncio
+    async def test_list_files(self, service, repo):
+        store = GitObjectStore()
+        with patch("app.services.git.git_repository_service.git_object_store", store):
+            result = await service.list_repository_files(uuid.uuid4(), "feature")
+        await store.close()
+
+        assert result["total_count"] == 2
+        paths = {f["file_path"]: f["file_size"] for f in result["files"]}
+        assert paths == {"/main.tex": 10, "/sections/intro.tex": 5}
+
+    @pytest.mark.asyncio
+    async def test_list_files_reports_each_files_last_change(self, service, repo):
+        commit_file(repo, "main.tex", "feature text", branch="feature", committed_at=2000000000)
+        store = GitObjectStore()
+        with patch("app.services.git.git_repository_service.git_object_store", store):
+            result = await service.list_repository_files(uuid.uuid4(), "feature")
+        await store.close()
+
+        modified = {f["file_path"]: f["last_modified"] for f in result["files"]}
+        initial = int(git(repo, "log", "-1", "--format=%ct", "main"))
+        assert modified["/main.tex"] == datetime.fromtimestamp(2000000000, tz=timezone.utc).isoformat()
+        assert modified["/sections/intro.tex"] == datetime.fromtimestamp(initial, tz=timezone.utc).isoformat()
@@ -0,0 +1,205 @@
+"""
+Tests for serialized, coalesced repository writes.
+"""
+
+import asyncio
+import os
+import subprocess
+
+import pytest
+
+from app.core.error_handling import ServiceError, ErrorCodes
+from app.services.git.object_reader import GitObjectStore
+from app.services.git import write_scheduler
+from app.services.git.write_scheduler import GitWriteScheduler
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "main.tex").write_text("hello")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    git(tmp_path, "branch", "feature")
+    monkeypatch.setattr("app.services.git.write_scheduler.git_object_store", GitObjectStore())
+    return tmp_path
+
+
+def save(scheduler, repo, path, content, branch="main", author="Alice"):
+    return scheduler.write(
+        repo, branch, path, content, f"Update {path}", author, f"{author.lower()}@example.com"
+    )
+
+
+class TestGitWriteScheduler:
+    """Plumbing commits through per-branch worktrees"""
+
+    @pytest.mark.asyncio
+    async def test_single_write_commits(self, repo):
+        scheduler = GitWriteScheduler(window=0)
+        initial = git(repo, "rev-parse", "main")
+
+        commit_id = await save(scheduler, repo, "sections/intro.tex", "intro")
+
+        assert git(repo, "rev-parse", "main") == commit_id
+        assert git(repo, "rev-parse", f"{commit_id}^") == initial
+        assert git(repo, "show", f"{commit_id}:sections/intro.tex") == "intro"
+        assert git(repo, "log", "-1", "--format=%an <%ae>|%s", commit_id) == "Alice <alice@example.com>|Update sections/intro.tex"
+        assert git(repo, "status", "--porcelain") == ""
+
+    @pytest.mark.asyncio
+    async def test_saves_in_window_share_one_commit(self, repo):
+        scheduler = GitWriteScheduler(window=0.05)
+        initial = git(repo, "rev-parse", "main")
+
+        results = await asyncio.gather(
+            save(scheduler, repo, "a.tex", "first"),
+            save(scheduler, repo, "b.tex", "b"),
+            save(scheduler, repo, "a.tex", "second")
+        )
+
+        assert len(set(results)) == 1
+        assert git(repo, "rev-parse", f"{results[0]}^") == initial
+        assert git(repo, "show", f"{results[0]}:a.tex") == "second"
+        assert git(repo, "show", f"{results[0]}:b.tex") == "b"
+
+    @pytest.mark.asyncio
+    async def test_authors_get_separate_commits(self, repo):
+        scheduler = GitWriteScheduler(window=0.05)
+
+        alice, bob = await asyncio.gather(
+            save(scheduler, repo, "a.tex", "a", author="Alice"),
+            save(scheduler, repo, "b.tex", "b", author="Bob")
+        )
+
+        assert alice != bob
+        assert git(repo, "rev-parse", f"{bob}^") == alice
+        assert git(repo, "log", "-1", "--format=%an", bob) == "Bob"
+
+    @pytest.mark.asyncio
+    async def test_interleaved_authors_keep_arrival_order(self, repo):
+        scheduler = GitWriteScheduler(window=0.05)
+
+        first, bob, latest = await asyncio.gather(
+            save(scheduler, repo, "f.txt", "A1", author="Alice"),
+            save(scheduler, repo, "f.txt", "B1", author="Bob"),
+            save(scheduler, repo, "f.txt", "A2-latest", author="Alice")
+        )
+
+        assert len({first, bob, latest}) == 3
+        assert git(repo, "rev-parse", f"{latest}^") == bob
+        assert git(repo, "rev-parse", f"{bob}^") == first
+        assert git(repo, "show", "main:f.txt") == "A2-latest"
+
+    @pytest.mark.asyncio
+    async def test_any_failure_resyncs_next_commit(self, repo, monkeypatch):
+        scheduler = GitWriteScheduler(window=0)
+        await save(scheduler, repo, "a.tex", "a")
+        writer = await scheduler._repository(repo).writer("main")
+        real_run_git = write_scheduler.run_git
+
+        async def failing_run_git(args, cwd, env=None):
+            if args[0] == "write-tree":
+                raise OSError("disk full")
+            return await real_run_git(args, cwd, env)
+
+        monkeypatch.setattr(write_scheduler, "run_git", failing_run_git)
+        with pytest.raises(OSError):
+            await save(scheduler, repo, "a.tex", "lost")
+        assert writer.head is None
+
+        monkeypatch.setattr(write_scheduler, "run_git", real_run_git)
+        commit_id = await save(scheduler, repo, "b.tex", "b")
+        assert git(repo, "show", f"{commit_id}:a.tex") == "a"
+        assert git(repo, "status", "--porcelain") == ""
+
+    @pytest.mark.asyncio
+    async def test_branches_write_in_separate_worktrees(self, repo):
+        scheduler = GitWriteScheduler(window=0.01)
+
+        main_commit, feature_commit = await asyncio.gather(
+            save(scheduler, repo, "main.tex", "on main"),
+            save(scheduler, repo, "main.tex", "on feature", branch="feature")
+        )
+
+        assert git(repo, "show", f"{main_commit}:main.tex") == "on main"
+        assert git(repo, "show", f"{feature_commit}:main.tex") == "on feature"
+        assert git(repo, "rev-parse", "feature") == feature_commit
+        assert git(repo, "symbolic-ref", "--short", "HEAD") == "main"
+        assert "resxiv-worktrees" in git(repo, "worktree", "list")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_does_not_commit(self, repo):
+        scheduler = GitWriteScheduler(window=0)
+        initial = git(repo, "rev-parse", "main")
+
+        assert await save(scheduler, repo, "main.tex", "hello") == initial
+        assert git(repo, "rev-parse", "main") == initial
+
+    @pytest.mark.asyncio
+    async def test_resyncs_when_branch_moves(self, repo):
+        scheduler = GitWriteScheduler(window=0)
+        await save(scheduler, repo, "feature.tex", "one", branch="feature")
+
+        # Another process commits to the branch behind the writer's back
+        env = {**os.environ, "GIT_INDEX_FILE": str(repo.parent / "other-index")}
+        blob = subprocess.run(
+            ["git", "hash-object", "-w", "--stdin"], cwd=repo, input="extra",
+            check=True, capture_output=True, text=True
+        ).stdout.strip()
+        for args in (["read-tree", "feature"], ["update-index", "--add", "--cacheinfo", f"100644,{blob},extra.tex"]):
+            subprocess.run(["git", *args], cwd=repo, env=env, check=True)
+        tree = subprocess.run(["git", "write-tree"], cwd=repo, env=env, check=True, capture_output=True, text=True).stdout.strip()
+        git(repo, "update-ref", "refs/heads/feature", git(repo, "commit-tree", tree, "-p", "feature", "-m", "extra"))
+        moved = git(repo, "rev-parse", "feature")
+
+        commit_id = await save(scheduler, repo, "feature.tex", "two", branch="feature")
+
+        assert git(repo, "rev-parse", f"{commit_id}^") == moved
+        assert git(repo, "show", f"{commit_id}:extra.tex") == "extra"
+
+    @pytest.mark.asyncio
+    async def test_write_files_is_one_commit(self, repo):
+        scheduler = GitWriteScheduler(window=0)
+        initial = git(repo, "rev-parse", "main")
+
+        commit_id = await scheduler.write_files(
+            repo, "main", {"a.tex": "a", "b.tex": "b"}, "Autosave 2 files", "Alice", "alice@example.com"
+        )
+
+        assert git(repo, "rev-parse", f"{commit_id}^") == initial
+        assert git(repo, "show", f"{commit_id}:a.tex") == "a"
+        assert git(repo, "show", f"{commit_id}:b.tex") == "b"
+        assert git(repo, "log", "-1", "--format=%s", commit_id) == "Autosave 2 files"
+
+    @pytest.mark.asyncio
+    async def test_delete_files_removes_paths(self, repo):
+        scheduler = GitWriteScheduler(window=0)
+        await scheduler.write_files(
+            repo, "main", {"paper/main.tex": "a", "paper/refs.bib": "b"}, "Create paper", "Alice", "alice@example.com"
+        )
+
+        commit_id = await scheduler.delete_files(
+            repo, "main", ["paper/main.tex", "paper/refs.bib"], "Delete paper", "Alice", "alice@example.com"
+        )
+
+        assert git(repo, "ls-tree", "-r", "--name-only", commit_id) == "main.tex"
+        assert not (repo / "paper" / "main.tex").exists()
+        assert git(repo, "status", "--porcelain") == ""
+
+    @pytest.mark.asyncio
+    async def test_rejects_paths_outside_repository(self, repo):
+        scheduler = GitWriteScheduler(window=0)
+
+        for path in ("../escape.tex", ".git/config"):
+            with pytest.raises(ServiceError) as exc_info:
+                await save(scheduler, repo, path, "x")
+            assert exc_info.value.error_code == ErrorCodes.VALIDATION_ERROR
@@ -0,0 +1,161 @@
+"""
+Tests for hybrid paper search and reciprocal-rank fusion.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.error_handling import ServiceError
+from app.services.search.hybrid_search_service import (
+    HYDRATE_SQL, KEYWORD_SQL, PROJECTS_SQL, USERS_SQL, VECTOR_SQL,
+    HybridSearchService, reciprocal_rank_fusion
+)
+
+PAPERS = {
+    pid: {"paper_id": pid, "title": f"Paper {pid}", "authors": ["A"], "created_at": datetime(2024, 1, 1),
+          "abstract": f"abstract {pid}", "project_id": None}
+    for pid in ("p1", "p2", "p3", "p4")
+}
+
+
+class FakeDatabase:
+    """Answers the service's queries and records how they were issued"""
+
+    def __init__(self, vector=(), keyword=(), delay=0.05):
+        self.vector = list(vector)
+        self.keyword = list(keyword)
+        self.delay = delay
+        self.statements = []
+        self.open_sessions = 0
+        self.max_open_sessions = 0
+
+    @asynccontextmanager
+    async def session(self):
+        self.open_sessions += 1
+        self.max_open_sessions = max(self.max_open_sessions, self.open_sessions)
+        session = Mock()
+        session.execute = self.execute
+        try:
+            yield session
+        finally:
+            self.open_sessions -= 1
+
+    async def execute(self, statement, params):
+        self.statements.append((statement, params))
+        await asyncio.sleep(self.delay)
+        if statement is VECTOR_SQL:
+            rows = [{"paper_id": pid, "similarity": sim, "snippet": f"chunk {pid}"} for pid, sim in self.vector]
+        elif statement is KEYWORD_SQL:
+            rows = [{"paper_id": pid, "rank": rank} for pid, rank in self.keyword]
+        elif statement is HYDRATE_SQL:
+            rows = [PAPERS[pid] for pid in params["paper_ids"] if pid in PAPERS]
+        else:
+            rows = []
+        result = Mock()
+        result.mappings.return_value.all.return_value = rows
+        result.fetchall.return_value = []
+        return result
+
+
+async def fake_embed(query):
+    return [0.1, 0.2]
+
+
+def make_service(db: FakeDatabase, embed=fake_embed) -> HybridSearchService:
+    return HybridSearchService(session_factory=db.session, embed=embed)
+
+
+class TestReciprocalRankFusion:
+    """Rank fusion without score normalisation"""
+
+    def test_items_in_both_lists_rank_first(self):
+        fused = reciprocal_rank_fusion({"semantic": ["a", "b", "c"], "keyword": ["c", "d"]})
+
+        assert fused[0]["id"] == "c"
+        assert fused[0]["ranks"] == {"semantic": 3, "keyword": 1}
+        assert fused[0]["score"] == pytest.approx(1 / 63 + 1 / 61)
+        # b and d tie on 1/62; the sort is stable so b keeps its earlier position
+        assert [entry["id"] for entry in fused[1:]] == ["a", "b", "d"]
+
+    def test_empty(self):
+        assert reciprocal_rank_fusion({"semantic": [], "keyword": []}) == []
+
+
+class TestHybridSearchService:
+    """Concurrent retrieval, fusion and batched hydration"""
+
+    @pytest.mark.asyncio
+    async def test_hybrid_fuses_vector_and_keyword(self):
+        db = FakeDatabase(vector=[("p1", 0.9), ("p2", 0.8)], keyword=[("p2", 0.5), ("p3", 0.4)])
+
+        items = await make_service(db).search_papers("graphs", limit=3, search_type="hybrid")
+
+        assert [item["id"] for item in items] == ["p2", "p1", "p3"]
+        assert items[0]["match_type"] == "semantic+keyword"
+        assert items[0]["snippet"] == "chunk p2"
+        assert items[2]["snippet"] == "abstract p3"
+        hydrations = [params for statement, params in db.statements if statement is HYDRATE_SQL]
+        assert len(hydrations) == 1
+        assert sorted(hydrations[0]["paper_ids"]) == ["p1", "p2", "p3"]
+
+    @pytest.mark.asyncio
+    async def test_retrievers_run_concurrently_on_separate_sessions(self):
+        db = FakeDatabase(vector=[("p1", 0.9)], keyword=[("p2", 0.5)])
+
+        await make_service(db).search_papers("graphs", search_type="hybrid")
+
+        assert db.max_open_sessions == 2
+
+    @pytest.mark.asyncio
+    async def test_hybrid_falls_back_to_keyword_when_embedding_fails(self):
+        async def broken_embed(query):
+            raise RuntimeError("model unavailable")
+
+        db = FakeDatabase(keyword=[("p3", 0.4)])
+
+        items = await make_service(db, embed=broken_embed).search_papers("graphs", search_type="hybrid")
+
+        assert [item["id"] for item in items] == ["p3"]
+        assert items[0]["match_type"] == "keyword"
+
+    @pytest.mark.asyncio
+    async def test_semantic_threshold_and_scores(self):
+        db = FakeDatabase(vector=[("p1", 0.9), ("p2", 0.3)])
+
+        items = await make_service(db).search_papers(
+            "graphs", search_type="semantic", similarity_threshold=0.5
+        )
+
+        assert [item["id"] for item in items] == ["p1"]
+        assert items[0]["relevance_score"] == pytest.approx(0.9)
+        assert not any(statement is KEYWORD_SQL for statement, _ in db.statements)
+
+    @pytest.mark.asyncio
+    async def test_deleted_papers_are_dropped(self):
+        db = FakeDatabase(keyword=[("gone", 0.9), ("p4", 0.2)])
+
+        items = await make_service(db).search_papers("graphs", search_type="keyword")
+
+        assert [item["id"] for item in items] == ["p4"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_search_type(self):
+        with pytest.raises(ServiceError):
+            await make_service(FakeDatabase()).search_papers("graphs", search_type="fuzzy")
+
+    @pytest.mark.asyncio
+    async def test_entity_searches_run_in_parallel(self):
+        db = FakeDatabase(keyword=[("p1", 0.5)], delay=0.1)
+        service = make_service(db)
+
+        found = await service.search("graphs", ["papers", "projects", "users", "conversations"], "keyword")
+
+        assert set(found["results"]) == {"papers", "projects", "users"}
+        assert found["results"]["papers"]["total"] == 1
+        assert db.max_open_sessions >= 3
+        issued = [statement for statement, _ in db.statements]
+        assert PROJECTS_SQL in issued and USERS_SQL in issued
@@ -0,0 +1,189 @@
+"""
+Tests for the hot query index advisor.
+"""
+
+import ast
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from app.database.index_advisor import (
+    HOT_QUERIES,
+    MONGO_INDEXES,
+    POSTGRES_INDEXES,
+    HotQuery,
+    IndexAdvisor,
+    mongo_plan_findings,
+    plan_findings,
+    render_migration,
+)
+from app.database.migrations import MigrationManager
+
+
+def seq_scan(relation, rows, removed=0, loops=1):
+    return {
+        "Node Type": "Seq Scan", "Relation Name": relation, "Actual Rows": rows,
+        "Rows Removed by Filter": removed, "Actual Loops": loops, "Filter": "(checksum = 'x')"
+    }
+
+
+def session_factory(*results):
+    session = Mock(rollback=AsyncMock())
+    session.execute = AsyncMock(side_effect=list(results))
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory, session
+
+
+def sampled(row):
+    result = Mock()
+    result.mappings.return_value.first.return_value = row
+    return result
+
+
+def explained(plan, execution_ms=1.5):
+    result = Mock()
+    result.scalar.return_value = json.dumps([{"Plan": plan, "Execution Time": execution_ms}])
+    return result
+
+
+class TestPlanFindings:
+    """Sequential scans over the row threshold are flagged anywhere in the plan"""
+
+    def test_nested_seq_scan_counts_filtered_rows(self):
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Index Scan", "Relation Name": "project_papers", "Actual Rows": 5},
+                seq_scan("papers", rows=1, removed=49_999)
+            ]
+        }
+
+        findings = plan_findings(plan, min_rows=1000)
+
+        assert findings == [{
+            "node": "Seq Scan", "relation": "papers", "rows_read": 50_000, "filter": "(checksum = 'x')"
+        }]
+
+    def test_small_scans_and_loops(self):
+        assert plan_findings(seq_scan("users", rows=50), min_rows=1000) == []
+        assert plan_findings(seq_scan("users", rows=50, loops=40), min_rows=1000)[0]["rows_read"] == 2000
+
+
+class TestMongoPlanFindings:
+    """Collection scans and blocking sorts in classic and SBE explain output"""
+
+    def test_classic_plan(self):
+        explain = {"queryPlanner": {"winningPlan": {
+            "stage": "LIMIT",
+            "inputStage": {"stage": "SORT", "sortPattern": {"_id": -1}, "inputStage": {"stage": "COLLSCAN"}}
+        }}}
+
+        assert [f["stage"] for f in mongo_plan_findings(explain)] == ["SORT", "COLLSCAN"]
+
+    def test_sbe_index_plan_is_clean(self):
+        explain = {"queryPlanner": {"winningPlan": {"queryPlan": {
+            "stage": "LIMIT", "inputStage": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}
+        }}}}
+
+        assert mongo_plan_findings(explain) == []
+
+
+class TestRenderMigration:
+    """Emitted source drops straight into MigrationManager"""
+
+    def test_renders_valid_registry_entry_and_methods(self):
+        specs = [POSTGRES_INDEXES["idx_papers_checksum"], POSTGRES_INDEXES["idx_project_papers_paper_id"]]
+
+        source = render_migration("015_add_advised_indexes", "1.14.0", specs)
+
+        entry, methods = source.split("\n\n", 1)
+        assert '"id": "015_add_advised_indexes"' in entry
+        assert '"up": self._add_advised_indexes_up' in entry
+        ast.parse("class M:\n" + methods)
+        for spec in specs:
+            assert spec.create_sql in methods
+            assert spec.drop_sql in methods
+
+    @pytest.mark.asyncio
+    async def test_hot_query_migration_matches_registry(self):
+        migration = next(m for m in MigrationManager().migrations if m["id"] == "014_add_hot_query_indexes")
+        session = Mock(execute=AsyncMock())
+
+        await migration["up"](session)
+
+        executed = " ".join(" ".join(str(call.args[0]).split()) for call in session.execute.await_args_list)
+        for name in ("idx_papers_checksum", "idx_project_papers_paper_id"):
+            assert POSTGRES_INDEXES[name].create_sql in executed
+
+
+class TestIndexAdvisor:
+    """Explain runs against sampled parameters and never keeps side effects"""
+
+    @pytest.mark.asyncio
+    async def test_flags_seq_scan_with_buffers(self):
+        query = HotQuery("paper_by_file_hash", "PaperRepository", "SELECT 1 WHERE :checksum IS NOT NULL",
+                         "SELECT 'x' AS checksum", ("idx_papers_checksum",))
+        plan = {**seq_scan("papers", rows=0, removed=20_000), "Shared Hit Blocks": 12, "Shared Read Blocks": 300}
+        factory, session = session_factory(sampled({"checksum": "x"}), explained(plan, 42.0))
+
+        report = await IndexAdvisor(factory).explain(query)
+
+        assert report["status"] == "flagged"
+        assert report["execution_ms"] == 42.0
+        assert report["shared_read_blocks"] == 300
+        assert report["seq_scans"][0]["relation"] == "papers"
+        explain_sql, params = session.execute.call_args.args
+        assert str(explain_sql).startswith("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT 1")
+        assert params == {"checksum": "x"}
+        session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_without_sample_and_reports_errors(self):
+        factory, _ = session_factory(sampled(None), RuntimeError("relation does not exist"))
+        advisor = IndexAdvisor(factory)
+
+        skipped = await advisor.explain(HOT_QUERIES[0])
+        failed = await advisor.explain(HOT_QUERIES[1])
+
+        assert skipped["status"] == "skipped"
+        assert failed["status"] == "error" and "does not exist" in failed["reason"]
+
+    @pytest.mark.asyncio
+    async def test_missing_indexes(self):
+        result = Mock()
+        result.fetchall.return_value = [SimpleNamespace(indexname=name) for name in POSTGRES_INDEXES
+                                        if name != "idx_project_papers_paper_id"]
+        factory, _ = session_factory(result)
+
+        missing = await IndexAdvisor(factory).missing_indexes()
+
+        assert [spec.name for spec in missing] == ["idx_project_papers_paper_id"]
+
+    @pytest.mark.asyncio
+    async def test_mongo_index_matched_by_keys_not_name(self):
+        spec = MONGO_INDEXES["conversation_messages_optimized"]
+        read_position = MONGO_INDEXES["conversation_read_position"]
+        collection = Mock(create_index=AsyncMock())
+        collection.index_information = AsyncMock(return_value={
+            "_id_": {"key": [("_id", 1)]},
+            "conversation_id_1_deleted_at_1__id_-1": {"key": list(spec.keys)},
+            "conversation_id_1_created_at_1__id_1": {"key": list(read_position.keys)}
+        })
+        mongo_db = MagicMock()
+        mongo_db.__getitem__.return_value = collection
+
+        assert await IndexAdvisor(mongo_db=mongo_db).ensure_mongo_indexes() == []
+
+        collection.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            "conversation_read_position": {"key": list(read_position.keys)}
+        }
+        assert await IndexAdvisor(mongo_db=mongo_db).ensure_mongo_indexes() == [spec.name]
+        collection.create_index.assert_awaited_once_with(list(spec.keys), name=spec.name, background=True)
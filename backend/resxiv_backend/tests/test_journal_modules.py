@@ -17,7 +17,7 @@ from app.services.journal.journal_collaboration_service import JournalCollaborat
 from app.services.journal_service import JournalService
 from app.models.journal_models import (
     JournalCreate, JournalUpdate, JournalStatus,
-    JournalCollaboratorCreate, PermissionType
+    JournalCollaboratorCreate, PermissionType, BulkJournalOperation
 )
 
 
@@ -171,37 +171,45 @@ class TestJournalCrudService:
         mock_count_result = Mock()
         mock_count_result.scalar.return_value = 2
         
-        # Mock journals result
-        mock_journals_result = Mock()
-        mock_journals_result.fetchall.return_value = [
-            Mock(
-                id=uuid.uuid4(),
-                title="Journal 1",
-                status=JournalStatus.DRAFT.value,
-                is_public=False,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                created_by_name="User 1"
-            ),
-            Mock(
+        def journal_row(title, journal_status, is_public, creator):
+            return Mock(
                 id=uuid.uuid4(),
-                title="Journal 2",
-                status=JournalStatus.PUBLISHED.value,
-                is_public=True,
+                project_id=project_id,
+                title=title,
+                excerpt=f"{title} excerpt",
+                status=journal_status.value,
+                is_public=is_public,
+                metadata={},
+                created_by=uuid.uuid4(),
+                version=1,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow(),
-                created_by_name="User 2"
+                created_by_name=creator
             )
+        
+        # Mock journals result
+        mock_journals_result = Mock()
+        mock_journals_result.fetchall.return_value = [
+            journal_row("Journal 1", JournalStatus.DRAFT, False, "User 1"),
+            journal_row("Journal 2", JournalStatus.PUBLISHED, True, "User 2")
         ]
         
         crud_service.session.execute.side_effect = [mock_count_result, mock_journals_result]
         
-        result = await crud_service.list_project_journals(project_id)
+        result = await crud_service.list_project_journals(project_id, search_query="50%_done")
         
-        assert result.total_count == 2
+        assert result.total == 2
         assert len(result.journals) == 2
         assert result.journals[0].title == "Journal 1"
-        assert result.journals[1].title == "Journal 2"
+        assert result.journals[0].excerpt == "Journal 1 excerpt"
+        assert result.journals[1].creator_name == "User 2"
+        assert not hasattr(result.journals[0], "content")
+        
+        # Listing never selects full content, and LIKE wildcards in the query are literal
+        list_sql = str(crud_service.session.execute.call_args_list[1].args[0])
+        assert "LEFT(j.content, :excerpt_length) AS excerpt" in list_sql
+        assert "j.title, j.content" not in list_sql
+        assert crud_service.session.execute.call_args_list[1].args[1]["search_term"] == "%50\\%\\_done%"
 
 
 class TestJournalCollaborationService:
@@ -347,6 +355,105 @@ class TestJournalServiceIntegration:
         journal_service.collaboration_service.check_journal_permission.assert_called_once_with(journal_id, user_id)
 
 
+class TestBulkJournalOperations:
+    """Set-based bulk operations with a per-journal report"""
+
+    @pytest.fixture
+    def journal_service(self):
+        return JournalService(AsyncMock(spec=AsyncSession))
+
+    def permission_rows(self, user_id, owned=(), writable=(), readable=()):
+        rows = [Mock(id=jid, created_by=user_id, is_public=False, permission=None) for jid in owned]
+        rows += [Mock(id=jid, created_by=uuid.uuid4(), is_public=False, permission="write") for jid in writable]
+        rows += [Mock(id=jid, created_by=uuid.uuid4(), is_public=True, permission=None) for jid in readable]
+        result = Mock()
+        result.fetchall.return_value = rows
+        return result
+
+    def updated(self, journal_ids):
+        result = Mock()
+        result.fetchall.return_value = [Mock(id=jid) for jid in journal_ids]
+        return result
+
+    @pytest.mark.asyncio
+    async def test_permissions_resolved_in_one_query(self, journal_service):
+        user_id = uuid.uuid4()
+        owned, writable, readable = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        journal_service.session.execute.return_value = self.permission_rows(
+            user_id, owned=[owned], writable=[writable], readable=[readable]
+        )
+
+        permissions = await journal_service.collaboration_service.get_journal_permissions(
+            [owned, writable, readable, uuid.uuid4()], user_id
+        )
+
+        assert journal_service.session.execute.await_count == 1
+        assert "j.id = ANY(:journal_ids)" in str(journal_service.session.execute.call_args.args[0])
+        assert set(permissions) == {owned, writable, readable}
+        assert permissions[owned].can_admin and permissions[owned].is_owner
+        assert permissions[writable].can_write and not permissions[writable].can_admin
+        assert permissions[readable].can_read and not permissions[readable].can_write
+
+    @pytest.mark.asyncio
+    async def test_archive_is_one_update_with_per_journal_report(self, journal_service):
+        user_id = uuid.uuid4()
+        writable = [uuid.uuid4() for _ in range(3)]
+        readable, missing = uuid.uuid4(), uuid.uuid4()
+        session = journal_service.session
+        session.execute.side_effect = [
+            self.permission_rows(user_id, writable=writable, readable=[readable]),
+            self.updated(writable),
+            Mock()
+        ]
+
+        result = await journal_service.bulk_journal_operation(
+            BulkJournalOperation(operation="archive", journal_ids=writable + [readable, missing, writable[0]]), user_id
+        )
+
+        assert session.execute.await_count == 3
+        update_sql, update_params = str(session.execute.call_args_list[1].args[0]), session.execute.call_args_list[1].args[1]
+        assert "WHERE id = ANY(:journal_ids)" in update_sql
+        assert update_params["journal_ids"] == writable
+        assert update_params["status"] == "archived"
+        # The repeated ID is reported once, so the counts add up
+        assert (result.total_requested, result.successful, result.failed) == (5, 3, 2)
+        assert len(result.results) == result.total_requested
+        reasons = {r["journal_id"]: r.get("reason") for r in result.results}
+        assert reasons[str(readable)] == "Insufficient permissions"
+        assert reasons[str(missing)] == "Journal not found"
+
+    @pytest.mark.asyncio
+    async def test_delete_requires_admin(self, journal_service):
+        user_id = uuid.uuid4()
+        owned, writable = uuid.uuid4(), uuid.uuid4()
+        session = journal_service.session
+        session.execute.side_effect = [
+            self.permission_rows(user_id, owned=[owned], writable=[writable]),
+            self.updated([owned])
+        ]
+
+        result = await journal_service.bulk_journal_operation(
+            BulkJournalOperation(operation="delete", journal_ids=[owned, writable]), user_id
+        )
+
+        assert "SET deleted_at = :deleted_at" in str(session.execute.call_args.args[0])
+        assert session.execute.call_args.args[1]["journal_ids"] == [owned]
+        assert [r["status"] for r in result.results] == ["success", "failed"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_permitted_skips_update(self, journal_service):
+        user_id = uuid.uuid4()
+        readable = uuid.uuid4()
+        journal_service.session.execute.return_value = self.permission_rows(user_id, readable=[readable])
+
+        result = await journal_service.bulk_journal_operation(
+            BulkJournalOperation(operation="make_public", journal_ids=[readable]), user_id
+        )
+
+        assert journal_service.session.execute.await_count == 1
+        assert result.successful == 0 and result.failed == 1
+
+
 @pytest.mark.integration
 class TestJournalModulesIntegration:
     """Integration tests for journal modules"""
@@ -0,0 +1,186 @@
+"""
+Tests for delta-compressed journal version storage.
+"""
+
+import json
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.error_handling import ServiceError
+from app.services.journal.journal_version_store import (
+    KEYFRAME_INTERVAL, JournalVersionStore, apply_delta, encode_delta
+)
+
+
+def version_row(version_number, content=None, delta=None):
+    return Mock(
+        id=uuid.uuid4(),
+        journal_id=uuid.uuid4(),
+        version_number=version_number,
+        title=f"v{version_number}",
+        content=content,
+        delta=delta,
+        is_keyframe=delta is None,
+        changed_by=None,
+        change_summary=None,
+        created_at=datetime.utcnow(),
+        changed_by_name=None
+    )
+
+
+def result(row=None, rows=None):
+    mock_result = Mock()
+    mock_result.fetchone.return_value = row
+    mock_result.fetchall.return_value = rows or []
+    return mock_result
+
+
+def inserted(session) -> dict:
+    return session.execute.call_args_list[-1].args[1]
+
+
+class TestDeltaEncoding:
+    """Line-level edit scripts"""
+
+    @pytest.mark.parametrize("base,target", [
+        ("", "new journal\n"),
+        ("one\ntwo\nthree\n", "one\n2\nthree\nfour"),
+        ("a\nb\nc\n", ""),
+        ("same\n", "same\n"),
+        ("no trailing newline", "no trailing newline\nplus a line")
+    ])
+    def test_round_trip(self, base, target):
+        ops = encode_delta(base, target)
+
+        assert apply_delta(base, ops) == target
+        assert json.loads(json.dumps(ops)) == ops
+
+    def test_small_edit_to_long_text_is_compact(self):
+        base = "".join(f"paragraph {i} " * 10 + "\n" for i in range(500))
+        target = base.replace("paragraph 250 ", "edited 250 ", 1)
+
+        encoded = json.dumps(encode_delta(base, target))
+
+        assert len(encoded) < len(target) // 50
+
+
+class TestJournalVersionStore:
+    """Keyframe placement and reconstruction"""
+
+    @pytest.fixture
+    def store(self):
+        return JournalVersionStore(AsyncMock(spec=AsyncSession))
+
+    @pytest.mark.asyncio
+    async def test_new_journal_is_keyframe(self, store):
+        await store.record(uuid.uuid4(), 1, "Title", "content", None, uuid.uuid4())
+
+        params = inserted(store.session)
+        assert store.session.execute.await_count == 1
+        assert params["is_keyframe"] is True
+        assert params["content"] == "content"
+        assert params["delta"] is None
+
+    @pytest.mark.asyncio
+    async def test_edit_stored_as_delta(self, store):
+        previous = "line\n" * 200
+        content = previous + "appended\n"
+        store.session.execute.side_effect = [result(Mock(latest=4, keyframe=1)), Mock()]
+
+        await store.record(uuid.uuid4(), 5, "Title", content, previous, uuid.uuid4())
+
+        params = inserted(store.session)
+        assert params["is_keyframe"] is False
+        assert params["content"] is None
+        assert apply_delta(previous, json.loads(params["delta"])) == content
+
+    @pytest.mark.asyncio
+    async def test_keyframe_interval(self, store):
+        previous = "line\n" * 200
+        store.session.execute.side_effect = [result(Mock(latest=KEYFRAME_INTERVAL, keyframe=1)), Mock()]
+
+        await store.record(uuid.uuid4(), KEYFRAME_INTERVAL + 1, "Title", previous + "x\n", previous, uuid.uuid4())
+
+        assert inserted(store.session)["is_keyframe"] is True
+
+    @pytest.mark.asyncio
+    async def test_gap_in_history_forces_keyframe(self, store):
+        previous = "line\n" * 200
+        store.session.execute.side_effect = [result(Mock(latest=None, keyframe=None)), Mock()]
+
+        await store.record(uuid.uuid4(), 7, "Title", previous + "x\n", previous, uuid.uuid4())
+
+        assert inserted(store.session)["is_keyframe"] is True
+
+    @pytest.mark.asyncio
+    async def test_rewrite_falls_back_to_keyframe(self, store):
+        store.session.execute.side_effect = [result(Mock(latest=1, keyframe=1)), Mock()]
+
+        await store.record(uuid.uuid4(), 2, "Title", "entirely new", "old text", uuid.uuid4())
+
+        params = inserted(store.session)
+        assert params["is_keyframe"] is True
+        assert params["content"] == "entirely new"
+
+    @pytest.mark.asyncio
+    async def test_get_version_applies_deltas_from_keyframe(self, store):
+        v1 = "intro\nbody\n"
+        v2 = "intro\nbody\nmore\n"
+        v3 = "Intro\nbody\nmore\n"
+        chain = [
+            version_row(1, content=v1),
+            version_row(2, delta=encode_delta(v1, v2)),
+            version_row(3, delta=json.dumps(encode_delta(v2, v3)))
+        ]
+        store.session.execute.return_value = result(rows=chain)
+
+        version = await store.get_version(uuid.uuid4(), 3)
+
+        assert version.version_number == 3
+        assert version.title == "v3"
+        assert version.content == v3
+
+    @pytest.mark.asyncio
+    async def test_get_missing_version(self, store):
+        store.session.execute.return_value = result(rows=[])
+
+        assert await store.get_version(uuid.uuid4(), 9) is None
+
+    @pytest.mark.asyncio
+    async def test_broken_chain_raises(self, store):
+        chain = [version_row(1, content="a\n"), version_row(3, delta=[1])]
+        store.session.execute.return_value = result(rows=chain)
+
+        with pytest.raises(ServiceError):
+            await store.get_version(uuid.uuid4(), 3)
+
+    @pytest.mark.asyncio
+    async def test_list_versions_has_no_content(self, store):
+        store.session.execute.return_value = result(rows=[version_row(2), version_row(1)])
+
+        versions = await store.list_versions(uuid.uuid4())
+
+        assert [v.version_number for v in versions] == [2, 1]
+        assert not hasattr(versions[0], "content")
+        assert "content" not in str(store.session.execute.call_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_recorded_in_one_statement(self, store):
+        journal_ids = [uuid.uuid4() for _ in range(3)]
+
+        await store.record_unchanged_content(journal_ids, uuid.uuid4(), "Bulk update")
+
+        sql, params = str(store.session.execute.call_args.args[0]), inserted(store.session)
+        assert store.session.execute.await_count == 1
+        assert "WHERE j.id = ANY(:journal_ids)" in sql
+        assert params["journal_ids"] == journal_ids
+        assert params["keyframe_interval"] == KEYFRAME_INTERVAL
+
+    @pytest.mark.parametrize("content", ["", "one line", "a\nb\r\nc\n", "\n\n\n", "x\x0by z"])
+    def test_copy_all_delta_reproduces_content(self, content):
+        # The delta record_unchanged_content writes: one copy op of length(content)
+        assert apply_delta(content, [len(content)]) == content
@@ -3,8 +3,11 @@ Comprehensive Tests for LangGraph Orchestrator
 L6 Engineering Standards - Production-ready LangGraph testing
 """
 
+import asyncio
+import time
 import pytest
 import uuid
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
@@ -15,7 +18,14 @@ from app.agentic.production_langgraph import (
     WorkflowStatus,
     AgentState
 )
+from app.agentic.checkpointer import RedisCheckpointSaver
 from app.core.error_handling import ServiceError, ErrorCodes
+from tests.test_checkpointer import FakeRedis
+
+
+def redis_checkpointer():
+    """The production Redis saver over an in-memory Redis"""
+    return RedisCheckpointSaver(client=FakeRedis())
 
 
 class TestLangGraphConfig:
@@ -85,31 +95,30 @@ class TestProductionLangGraphOrchestrator:
     @pytest.fixture
     def orchestrator(self, mock_openai_key, test_config):
         """Create orchestrator instance for testing"""
-        with patch('app.agentic.production_langgraph.ChatOpenAI') as mock_llm:
+        with patch('app.core.llm_gateway.ChatOpenAI') as mock_llm:
             mock_llm.return_value = Mock()
-            return ProductionLangGraphOrchestrator(mock_openai_key, test_config)
+            yield ProductionLangGraphOrchestrator(mock_openai_key, test_config)
     
     def test_orchestrator_initialization(self, mock_openai_key, test_config):
         """Test orchestrator initialization"""
-        with patch('app.agentic.production_langgraph.ChatOpenAI') as mock_llm, \
-             patch('app.agentic.production_langgraph.MemorySaver') as mock_saver:
+        with patch('app.core.llm_gateway.ChatOpenAI'), \
+             patch('app.agentic.production_langgraph.create_checkpointer', side_effect=redis_checkpointer) as mock_factory:
             
             orchestrator = ProductionLangGraphOrchestrator(mock_openai_key, test_config)
             
             assert orchestrator.config == test_config
             assert orchestrator.openai_api_key == mock_openai_key
-            mock_llm.assert_called_once_with(
-                api_key=mock_openai_key,
-                model=test_config.model_name,
-                temperature=test_config.temperature,
-                timeout=30
-            )
-            mock_saver.assert_called_once()
+            assert orchestrator.llm.model_name == test_config.model_name
+            assert orchestrator.llm.options["api_key"] == mock_openai_key
+            assert orchestrator.llm.options["temperature"] == test_config.temperature
+            assert orchestrator.llm.options["timeout"] == 30
+            mock_factory.assert_called_once()
+            assert isinstance(orchestrator.checkpointer, RedisCheckpointSaver)
     
     def test_orchestrator_initialization_default_config(self, mock_openai_key):
         """Test orchestrator initialization with default config"""
-        with patch('app.agentic.production_langgraph.ChatOpenAI'), \
-             patch('app.agentic.production_langgraph.MemorySaver'):
+        with patch('app.core.llm_gateway.ChatOpenAI'), \
+             patch('app.agentic.production_langgraph.create_checkpointer', side_effect=redis_checkpointer):
             
             orchestrator = ProductionLangGraphOrchestrator(mock_openai_key)
             
@@ -444,9 +453,9 @@ class TestAgentHandlers:
     @pytest.fixture
     def orchestrator(self):
         """Create orchestrator instance for testing"""
-        with patch('app.agentic.production_langgraph.ChatOpenAI'), \
-             patch('app.agentic.production_langgraph.MemorySaver'):
-            return ProductionLangGraphOrchestrator("test-key")
+        with patch('app.core.llm_gateway.ChatOpenAI'), \
+             patch('app.agentic.production_langgraph.create_checkpointer', side_effect=redis_checkpointer):
+            yield ProductionLangGraphOrchestrator("test-key")
     
     @pytest.mark.asyncio
     async def test_handle_research(self, orchestrator):
@@ -601,15 +610,133 @@ class TestAgentHandlers:
         assert result["result"]["context"] == {"some": "context"}
 
 
+class TestConcurrentResearch:
+    """Test concurrent multi-term research execution"""
+    
+    @pytest.fixture
+    def orchestrator(self):
+        config = LangGraphConfig(research_budget_seconds=1.0, research_target_papers=2)
+        with patch('app.core.llm_gateway.ChatOpenAI'):
+            yield ProductionLangGraphOrchestrator("test-key", config)
+    
+    def _state(self) -> AgentState:
+        return {
+            "messages": [{"content": "find papers on graphs"}],
+            "user_intent": "find papers on graphs",
+            "context": {},
+            "tool_calls_count": 0
+        }
+    
+    def _aggregator(self, search, sources=("openalex",)):
+        aggregator = Mock()
+        aggregator.paper_search_sources = Mock(return_value=list(sources))
+        aggregator.search_source = search
+        aggregator.__aenter__ = AsyncMock(return_value=aggregator)
+        aggregator.__aexit__ = AsyncMock(return_value=None)
+        return aggregator
+    
+    @staticmethod
+    def _response(papers):
+        return SimpleNamespace(success=True, results=papers)
+    
+    @pytest.mark.asyncio
+    async def test_terms_run_concurrently_and_stop_early(self, orchestrator):
+        """Slow terms are cancelled once enough high-quality papers arrive"""
+        cancelled = []
+        
+        async def search(source, query, limit, deadline):
+            try:
+                await asyncio.sleep(0.05 if query == "fast" else 5)
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+            return self._response([
+                {"title": f"{query} {i}", "abstract": "abstract", "citation_count": 10, "authors": []}
+                for i in range(2)
+            ])
+        
+        aggregator = self._aggregator(search)
+        strategy = {"research_type": "paper_search", "search_terms": ["slow one", "fast", "slow two"]}
+        with patch('app.services.research_aggregator_service.ResearchAggregatorService', return_value=aggregator):
+            started = time.monotonic()
+            results = await orchestrator._execute_research_strategy(strategy, self._state())
+        
+        assert time.monotonic() - started < 0.5
+        assert [p["title"] for p in results["papers"]] == ["fast 0", "fast 1"]
+        assert sorted(cancelled) == ["slow one", "slow two"]
+        assert sorted(results["metadata"]["cancelled_terms"]) == ["slow one", "slow two"]
+    
+    @pytest.mark.asyncio
+    async def test_budget_bounds_total_latency(self, orchestrator):
+        """Results gathered before the budget expires are kept"""
+        orchestrator.config.research_budget_seconds = 0.2
+        
+        async def search(source, query, limit, deadline):
+            if query == "stuck":
+                await asyncio.sleep(5)
+            return self._response([{"title": query, "abstract": None, "citation_count": 0, "authors": ["A"]}])
+        
+        aggregator = self._aggregator(search)
+        strategy = {"research_type": "paper_search", "search_terms": ["stuck", "quick"]}
+        with patch('app.services.research_aggregator_service.ResearchAggregatorService', return_value=aggregator):
+            started = time.monotonic()
+            results = await orchestrator._execute_research_strategy(strategy, self._state())
+        
+        assert time.monotonic() - started < 1.0
+        assert [p["title"] for p in results["papers"]] == ["quick"]
+        assert results["metadata"]["cancelled_terms"] == ["stuck"]
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_term_keeps_sources_that_answered(self, orchestrator):
+        """A slow source only loses its own papers, and every search shares one deadline"""
+        orchestrator.config.research_budget_seconds = 0.2
+        deadlines = set()
+        
+        async def search(source, query, limit, deadline):
+            deadlines.add(deadline)
+            if source == "crossref":
+                await asyncio.sleep(5)
+            return self._response([{"title": f"{query} via {source}", "abstract": None,
+                                    "citation_count": 0, "authors": []}])
+        
+        aggregator = self._aggregator(search, sources=("openalex", "arxiv", "crossref"))
+        strategy = {"research_type": "paper_search", "search_terms": ["graphs"]}
+        with patch('app.services.research_aggregator_service.ResearchAggregatorService', return_value=aggregator):
+            results = await orchestrator._execute_research_strategy(strategy, self._state())
+        
+        assert sorted(p["title"] for p in results["papers"]) == ["graphs via arxiv", "graphs via openalex"]
+        assert results["metadata"]["cancelled_searches"] == ["graphs:crossref"]
+        assert len(deadlines) == 1
+
+    
+    @pytest.mark.asyncio
+    async def test_source_search_gets_remaining_time(self):
+        """A source call is bounded by the time left, not its own full timeout"""
+        from app.services.research_aggregator_service import ResearchAggregatorService
+        
+        async def stalled(query):
+            await asyncio.sleep(5)
+        
+        aggregator = ResearchAggregatorService()
+        aggregator.openalex.search_papers = stalled
+        deadline = asyncio.get_running_loop().time() + 0.05
+        
+        started = time.monotonic()
+        response = await aggregator.search_source("openalex", "graphs", limit=10, deadline=deadline)
+        
+        assert time.monotonic() - started < 0.5
+        assert response.success is False
+        assert response.metadata["timeout_seconds"] <= 0.05
+
 class TestWorkflowExecution:
     """Test complete workflow execution"""
     
     @pytest.fixture
     def orchestrator(self):
         """Create orchestrator instance for testing"""
-        with patch('app.agentic.production_langgraph.ChatOpenAI'), \
-             patch('app.agentic.production_langgraph.MemorySaver'):
-            return ProductionLangGraphOrchestrator("test-key")
+        with patch('app.core.llm_gateway.ChatOpenAI'), \
+             patch('app.agentic.production_langgraph.create_checkpointer', side_effect=redis_checkpointer):
+            yield ProductionLangGraphOrchestrator("test-key")
     
     @pytest.mark.asyncio
     async def test_execute_workflow_success(self, orchestrator):
@@ -676,12 +803,29 @@ class TestWorkflowExecution:
             
             assert result is None
     
+    @pytest.mark.asyncio
+    async def test_session_state_round_trips_through_redis(self, orchestrator):
+        """Test session state is stored in and read back from the Redis saver"""
+        session_id = str(uuid.uuid4())
+        config = {"configurable": {"thread_id": session_id}}
+        
+        await orchestrator.app.aupdate_state(
+            config,
+            {"status": WorkflowStatus.COMPLETED.value, "messages": [{"content": "hi"}]},
+            as_node="response_formatter"
+        )
+        
+        result = await orchestrator.get_session_state(session_id)
+        
+        assert result == {"status": WorkflowStatus.COMPLETED.value, "messages": [{"content": "hi"}]}
+        assert f"langgraph:{session_id}::checkpoints" in orchestrator.checkpointer._redis.data
+    
     @pytest.mark.asyncio
     async def test_get_session_state_no_checkpointer(self):
         """Test session state retrieval without checkpointer"""
         config = LangGraphConfig(enable_memory=False)
         
-        with patch('app.agentic.production_langgraph.ChatOpenAI'):
+        with patch('app.core.llm_gateway.ChatOpenAI'):
             orchestrator = ProductionLangGraphOrchestrator("test-key", config)
             
             result = await orchestrator.get_session_state("test-session")
@@ -0,0 +1,211 @@
+"""
+Tests for the bounded LaTeX compile pool and its PDF cache.
+
+TeX is not required: builds run a small fake engine that writes a PDF.
+"""
+
+import asyncio
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.git.compile_pool import CompileJob, LatexCompilePool, source_digest
+from app.services.git.compile_status import CompileStatusStore
+
+FAKE_ENGINE = """#!{python}
+import pathlib, sys, time
+args = sys.argv[1:]
+outdir = pathlib.Path(next(a.split("=", 1)[1] for a in args if a.startswith("-output-directory=")))
+main = pathlib.Path(args[-1])
+calls = outdir.parent / "calls"
+calls.write_text(calls.read_text() + "x" if calls.exists() else "x")
+source = main.read_text()
+time.sleep(float(source.split("sleep=")[1].split()[0]) if "sleep=" in source else 0)
+if "FAIL" in source:
+    print("! Undefined control sequence.")
+    sys.exit(1)
+(outdir / (main.stem + ".pdf")).write_text("%PDF " + source)
+(outdir / (main.stem + ".log")).write_text("log")
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    engine = tmp_path / "fake-latex"
+    engine.write_text(FAKE_ENGINE.format(python=sys.executable))
+    engine.chmod(0o755)
+    source = tmp_path / "repo" / "paper"
+    source.mkdir(parents=True)
+    (source / "main.tex").write_text("hello")
+    return tmp_path, engine, source
+
+
+def make_job(project) -> CompileJob:
+    root, engine, source = project
+    compilation_id = str(uuid.uuid4())
+    compilation_dir = root / "repo" / "compilations" / compilation_id
+    compilation_dir.mkdir(parents=True)
+    job = CompileJob(
+        compilation_id=compilation_id,
+        compilation_dir=compilation_dir,
+        source_dir=source,
+        build_dir=root / "repo" / "compilations" / ".build" / "paper",
+        cache_dir=root / "repo" / "compilations" / ".cache" / "paper",
+        main_file="main.tex",
+        engine=str(engine),
+        metadata={"compilation_id": compilation_id, "status": "started"}
+    )
+    return job
+
+
+def status(job: CompileJob) -> dict:
+    return job.metadata
+
+
+@asynccontextmanager
+async def null_session():
+    yield AsyncMock()
+
+
+def make_pool(**kwargs) -> LatexCompilePool:
+    store = CompileStatusStore(session_factory=null_session)
+    store.publish_log = AsyncMock(wraps=store.publish_log)
+    return LatexCompilePool(status_store=store, **kwargs)
+
+
+def engine_calls(project) -> int:
+    calls = project[0] / "repo" / "compilations" / ".build" / "calls"
+    return len(calls.read_text()) if calls.exists() else 0
+
+
+async def wait_idle(pool: LatexCompilePool) -> None:
+    while pool.active_builds():
+        await asyncio.sleep(0.02)
+
+
+@pytest.fixture(autouse=True)
+def no_latexmk():
+    with patch("app.services.git.compile_pool.shutil.which", return_value=None):
+        yield
+
+
+class TestLatexCompilePool:
+    """Scheduling, caching and cancellation"""
+
+    @pytest.mark.asyncio
+    async def test_compiles_and_publishes_pdf(self, project):
+        pool = make_pool(max_workers=2, timeout_seconds=10)
+        job = make_job(project)
+
+        await pool.submit(job)
+        await wait_idle(pool)
+
+        result = status(job)
+        assert result["status"] == "completed"
+        assert result["cached"] is False
+        assert (job.compilation_dir / "output" / "main.pdf").read_text() == "%PDF hello"
+        assert (job.compilation_dir / "output" / "main.log").exists()
+        assert result["output_files"][0]["name"] == "main.log"
+        assert not (job.compilation_dir / "metadata.json").exists()
+        stored = await pool.status_store.get(job.compilation_id)
+        assert stored["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sources_served_from_cache(self, project):
+        pool = make_pool(max_workers=2, timeout_seconds=10)
+        first, second = make_job(project), make_job(project)
+
+        await pool.submit(first)
+        await wait_idle(pool)
+        await pool.submit(second)
+        await wait_idle(pool)
+
+        assert status(second)["status"] == "completed"
+        assert status(second)["cached"] is True
+        assert (second.compilation_dir / "output" / "main.pdf").read_text() == "%PDF hello"
+        assert engine_calls(project) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_build_supersedes_running_and_pending(self, project):
+        pool = make_pool(max_workers=2, timeout_seconds=10)
+        source = project[2]
+        (source / "main.tex").write_text("slow sleep=5 ")
+        running = make_job(project)
+        await pool.submit(running)
+        await asyncio.sleep(0.3)
+
+        pending, latest = make_job(project), make_job(project)
+        await pool.submit(pending)
+        (source / "main.tex").write_text("final")
+        await pool.submit(latest)
+        await wait_idle(pool)
+
+        assert status(running)["status"] == "cancelled"
+        assert status(pending)["status"] == "cancelled"
+        assert status(pending)["superseded_by"] == latest.compilation_id
+        assert status(latest)["status"] == "completed"
+        assert (latest.compilation_dir / "output" / "main.pdf").read_text() == "%PDF final"
+
+    @pytest.mark.asyncio
+    async def test_worker_limit_bounds_concurrency(self, project, tmp_path):
+        pool = make_pool(max_workers=1, timeout_seconds=10)
+        jobs = []
+        for name in ("a", "b", "c"):
+            source = tmp_path / "repo" / name
+            source.mkdir()
+            (source / "main.tex").write_text(f"{name} sleep=0.3 ")
+            job = make_job((project[0], project[1], source))
+            job.build_dir = job.build_dir.parent / name
+            jobs.append(job)
+
+        for job in jobs:
+            await pool.submit(job)
+        await asyncio.sleep(0.15)
+        running = [status(job)["status"] for job in jobs].count("running")
+        await wait_idle(pool)
+
+        assert running == 1
+        assert all(status(job)["status"] == "completed" for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_failed_build_records_output(self, project):
+        pool = make_pool(max_workers=1, timeout_seconds=10)
+        (project[2] / "main.tex").write_text("FAIL")
+        job = make_job(project)
+
+        await pool.submit(job)
+        await wait_idle(pool)
+
+        result = status(job)
+        assert result["status"] == "failed"
+        assert "Undefined control sequence" in result["errors"][0]
+        logged = [line for call in pool.status_store.publish_log.await_args_list for line in call.args[1]]
+        assert "! Undefined control sequence." in logged
+        assert not list(job.cache_dir.glob("*.pdf"))
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, project):
+        pool = make_pool(max_workers=1, timeout_seconds=1)
+        (project[2] / "main.tex").write_text("sleep=5 ")
+        job = make_job(project)
+
+        await pool.submit(job)
+        await wait_idle(pool)
+
+        assert status(job)["status"] == "timeout"
+
+
+class TestSourceDigest:
+    """Cache keys follow source content and build options"""
+
+    def test_digest_changes_with_content_and_engine(self, tmp_path):
+        (tmp_path / "main.tex").write_text("a")
+        base = source_digest(tmp_path, "main.tex", "pdflatex")
+
+        assert source_digest(tmp_path, "main.tex", "pdflatex") == base
+        assert source_digest(tmp_path, "main.tex", "xelatex") != base
+        (tmp_path / "main.tex").write_text("b")
+        assert source_digest(tmp_path, "main.tex", "pdflatex") != base
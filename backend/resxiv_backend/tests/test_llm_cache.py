@@ -0,0 +1,178 @@
+"""
+Tests for LLM Response Cache
+L6 Engineering Standards - Exact and semantic reuse of LLM completions
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core import llm_cache
+from app.core.llm_cache import LLMResponseCache
+from app.services.ai_diagnostics_service import AIDiagnosticsService
+from app.services.latex_editor_service import LaTeXEditorService
+
+
+# Toy embedding: questions mentioning the same topic words land close together
+TOPICS = ["method", "dataset", "limitation"]
+
+
+def topic_embedder(text):
+    text = text.lower()
+    return [1.0 if topic in text else 0.0 for topic in TOPICS] + [0.01]
+
+
+@pytest.fixture
+def cache():
+    cache = LLMResponseCache(
+        max_entries=3,
+        ttl_seconds=60,
+        similarity_threshold=0.95,
+        embedder=topic_embedder,
+        enabled=True,
+        semantic_enabled=True
+    )
+    cache.redis_url = None  # in-process only
+    return cache
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache"""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_skips_generation(self, cache):
+        generate = AsyncMock(return_value="analysis")
+        key = cache.make_key("gpt-4o-mini", "v1", "paper text")
+
+        first = await cache.get_or_generate(key, generate)
+        second = await cache.get_or_generate(key, generate)
+
+        assert first == second == "analysis"
+        generate.assert_awaited_once()
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate_percent"]) == (1, 1, 50.0)
+
+    @pytest.mark.asyncio
+    async def test_template_version_changes_key(self, cache):
+        assert cache.make_key("gpt-4o-mini", "v1", "text") != cache.make_key("gpt-4o-mini", "v2", "text")
+        assert cache.make_key("gpt-4o-mini", "v1", "text") != cache.make_key("gpt-4o", "v1", "text")
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_ttl(self, cache):
+        for i in range(4):
+            await cache.set(f"k{i}", f"v{i}")
+
+        assert await cache.get("k0") is None
+        assert await cache.get("k3") == "v3"
+        assert cache.get_stats()["evictions"] == 1
+
+        await cache.set("short", "lived", ttl=1)
+        cache._entries["short"] = (0.0, "lived")  # force expiry
+        assert await cache.get("short") is None
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_question_in_same_scope(self, cache):
+        context = [{"role": "system", "content": "paper A"}]
+        asked = context + [{"role": "user", "content": "What method do they use?"}]
+        rephrased = context + [{"role": "user", "content": "Explain the method please"}]
+        other_paper = [{"role": "system", "content": "paper B"}, rephrased[-1]]
+
+        key, scope, question = cache.chat_keys("m", "v1", asked)
+        await cache.store(key, "They use attention.", scope, question)
+
+        assert await cache.lookup(*cache.chat_keys("m", "v1", rephrased)) == "They use attention."
+        assert await cache.lookup(*cache.chat_keys("m", "v1", other_paper)) is None
+        unrelated = context + [{"role": "user", "content": "Which dataset?"}]
+        assert await cache.lookup(*cache.chat_keys("m", "v1", unrelated)) is None
+        assert cache.get_stats()["semantic_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_embedding_model_loads_once_off_the_request_path(self, cache, monkeypatch):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return topic_embedder
+
+        monkeypatch.setattr(llm_cache, "_default_embedder", load)
+        cache._embedder = None
+        cache._semantic["scope"] = []
+
+        # Concurrent first lookups skip the semantic layer instead of loading the model
+        results = await asyncio.gather(*[cache.semantic_get("scope", "Explain the method") for _ in range(5)])
+        assert results == [None] * 5
+        await cache._warm_up_task
+
+        assert loads == [1]
+        await cache.semantic_set("scope", "What method do they use?", "Attention.")
+        assert await cache.semantic_get("scope", "Explain the method") == "Attention."
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_generation(self, cache):
+        calls = 0
+
+        async def generate():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "shared"
+
+        results = await asyncio.gather(*[cache.get_or_generate("k", generate) for _ in range(5)])
+
+        assert results == ["shared"] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, cache):
+        generate = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_generate("k", generate)
+
+        assert await cache.get_or_generate("k", generate) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_reprocessing_identical_text_reuses_diagnostics(self, cache):
+        service = AIDiagnosticsService()
+        service.cache = cache
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content='{"summary": "s"}'))]
+        service.llm = MagicMock(chat_completion=AsyncMock(return_value=response))
+
+        for _ in range(2):
+            await service._call_gpt4o_mini("TITLE: T\n\nFULL TEXT: same text")
+
+        service.llm.chat_completion.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_diagnostics_are_not_cached(self, cache):
+        service = AIDiagnosticsService()
+        service.cache = cache
+        truncated, valid = MagicMock(), MagicMock()
+        truncated.choices = [MagicMock(message=MagicMock(content='{"summary": "cut o'))]
+        valid.choices = [MagicMock(message=MagicMock(content='{"summary": "s"}'))]
+        service.llm = MagicMock(chat_completion=AsyncMock(side_effect=[truncated, valid]))
+
+        with pytest.raises(ValueError):
+            await service._call_gpt4o_mini("TITLE: T\n\nFULL TEXT: same text")
+
+        assert await service._call_gpt4o_mini("TITLE: T\n\nFULL TEXT: same text") == '{"summary": "s"}'
+        assert service.llm.chat_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_latex_edits_need_an_exact_match(self, cache):
+        service = LaTeXEditorService(MagicMock())
+        service.cache = cache
+        replies = []
+        for edited in ("short method", "long method"):
+            reply = MagicMock()
+            reply.choices = [MagicMock(message=MagicMock(content=f'{{"edited_content": "{edited}"}}'))]
+            replies.append(reply)
+        service.llm = MagicMock(chat_completion=AsyncMock(side_effect=replies))
+
+        # Both instructions embed identically under the toy embedder
+        shorter = await service._generate_latex_edit("Shorten the method", "\\section{Method}", "general")
+        longer = await service._generate_latex_edit("Lengthen the method", "\\section{Method}", "general")
+
+        assert (shorter["edited_content"], longer["edited_content"]) == ("short method", "long method")
+        assert cache.get_stats()["semantic_hits"] == 0
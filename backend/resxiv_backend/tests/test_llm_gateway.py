@@ -0,0 +1,225 @@
+"""
+Tests for LLM Gateway
+L6 Engineering Standards - Shared pooled LLM access, exercised against a
+local fake OpenAI-compatible server
+"""
+
+import json
+import time
+import asyncio
+import threading
+import openai
+import pytest
+import pytest_asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.core.llm_gateway import LLMGateway
+from app.core.error_handling import ServiceError
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append(body)
+            server.client_ports.add(self.client_address[1])
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            rate_limited = server.rate_limit_remaining > 0
+            if rate_limited:
+                server.rate_limit_remaining -= 1
+        try:
+            time.sleep(server.delay)
+            if rate_limited:
+                self._send(429, {"error": {"message": "slow down", "type": "rate_limit"}}, {"retry-after": "0"})
+                return
+            if body.get("stream"):
+                self._send_stream(body["model"], ["po", "ng"])
+                return
+            self._send(200, {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "pong"},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10}
+            })
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send_stream(self, model, deltas):
+        chunk = {"id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": model}
+        events = [
+            {**chunk, "choices": [{"index": 0, "delta": {"content": d}, "finish_reason": None}]}
+            for d in deltas
+        ]
+        events.append({**chunk, "choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10}})
+        data = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+        data = data.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def fake_openai():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.client_ports = set()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.rate_limit_remaining = 0
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest_asyncio.fixture
+async def gateway(fake_openai):
+    gateway = LLMGateway(
+        api_key="test-key",
+        base_url=f"http://127.0.0.1:{fake_openai.server_address[1]}/v1",
+        max_concurrency=2,
+        max_retries=2,
+        backoff_base=0.01,
+        backoff_max=0.05
+    )
+    yield gateway
+    await gateway.close()
+
+
+MESSAGES = [{"role": "user", "content": "ping"}]
+
+
+class TestLLMGateway:
+    """Test cases for LLMGateway"""
+
+    @pytest.mark.asyncio
+    async def test_completion_is_accounted_per_project(self, gateway, fake_openai):
+        response = await gateway.chat_completion(MESSAGES, model="gpt-4o-mini", project_id="p1")
+
+        assert response.choices[0].message.content == "pong"
+        stats = gateway.get_usage("p1")["p1"]["gpt-4o-mini"]
+        assert stats["requests"] == 1
+        assert stats["total_tokens"] == 10
+        assert stats["latency_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_connections_are_pooled(self, gateway, fake_openai):
+        for _ in range(3):
+            await gateway.chat_completion(MESSAGES, model="gpt-4o-mini")
+
+        assert len(fake_openai.requests) == 3
+        assert len(fake_openai.client_ports) == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_are_retried(self, gateway, fake_openai):
+        fake_openai.rate_limit_remaining = 2
+
+        response = await gateway.chat_completion(MESSAGES, model="gpt-4o-mini", project_id="p1")
+
+        assert response.choices[0].message.content == "pong"
+        stats = gateway.get_usage("p1")["p1"]["gpt-4o-mini"]
+        assert (stats["requests"], stats["retries"], stats["errors"]) == (1, 2, 0)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_raise_and_release_slot(self, gateway, fake_openai):
+        fake_openai.rate_limit_remaining = 3
+
+        with pytest.raises(openai.RateLimitError):
+            await gateway.chat_completion(MESSAGES, model="gpt-4o-mini", project_id="p1")
+
+        assert gateway.get_usage("p1")["p1"]["gpt-4o-mini"]["errors"] == 1
+        # The slot is free again for the next caller
+        await gateway.chat_completion(MESSAGES, model="gpt-4o-mini", project_id="p1")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped_per_model(self, gateway, fake_openai):
+        fake_openai.delay = 0.1
+
+        await asyncio.gather(*[
+            gateway.chat_completion(MESSAGES, model="gpt-4o-mini") for _ in range(6)
+        ])
+
+        assert fake_openai.max_in_flight == 2
+        assert gateway.get_usage()["unattributed"]["gpt-4o-mini"]["queue_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_raises_service_unavailable(self, gateway, fake_openai):
+        fake_openai.delay = 0.3
+        gateway.queue_timeout = 0.05
+
+        results = await asyncio.gather(*[
+            gateway.chat_completion(MESSAGES, model="gpt-4o-mini") for _ in range(3)
+        ], return_exceptions=True)
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        assert len(errors) == 1
+        assert isinstance(errors[0], ServiceError)
+        assert errors[0].status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_langchain_model_uses_project_scope(self, gateway, fake_openai):
+        llm = gateway.chat_model("gpt-4o-mini", temperature=0.1)
+
+        with gateway.project_scope("p2"):
+            response = await llm.ainvoke([{"role": "user", "content": "ping"}])
+
+        assert response.content == "pong"
+        assert gateway.get_usage("p2")["p2"]["gpt-4o-mini"]["total_tokens"] == 10
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_and_records_usage(self, gateway, fake_openai):
+        fake_openai.rate_limit_remaining = 1
+
+        deltas = [d async for d in gateway.stream_chat_completion(MESSAGES, model="gpt-4o-mini", project_id="p1")]
+
+        assert deltas == ["po", "ng"]
+        assert fake_openai.requests[-1]["stream"] is True
+        stats = gateway.get_usage("p1")["p1"]["gpt-4o-mini"]
+        assert (stats["requests"], stats["retries"], stats["total_tokens"]) == (1, 1, 10)
+        # The slot was released when the stream finished
+        assert gateway._semaphore("gpt-4o-mini")._value == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_backoff_releases_slot(self, gateway, fake_openai):
+        fake_openai.rate_limit_remaining = 1
+        gateway._backoff_delay = lambda attempt, error: 0.2
+
+        async def consume():
+            return [d async for d in gateway.stream_chat_completion(MESSAGES, model="gpt-4o-mini")]
+
+        stream = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+
+        # Backing off after the 429 does not hold a slot other callers could use
+        assert gateway._semaphore("gpt-4o-mini")._value == 2
+        assert await stream == ["po", "ng"]
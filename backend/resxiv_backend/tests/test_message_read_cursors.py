@@ -0,0 +1,156 @@
+"""
+Tests for Message Read Cursors
+L6 Engineering Standards - Read high-water marks instead of per-message receipts
+"""
+
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+
+from app.repositories.message.read_cursor_repository import ReadCursorRepository
+
+
+class TestReadCursorRepository:
+    """Test cases for ReadCursorRepository"""
+
+    @pytest.fixture
+    def db_manager(self):
+        db_manager = MagicMock()
+        db_manager.mongodb_database.messages = MagicMock()
+        db_manager.mongodb_database.message_read_cursors = MagicMock()
+        return db_manager
+
+    @pytest.fixture
+    def repo(self, db_manager):
+        return ReadCursorRepository(db_manager)
+
+    @pytest.mark.asyncio
+    async def test_mark_read_counts_only_newly_read_messages(self, repo):
+        conversation_id, user_id = uuid.uuid4(), uuid.uuid4()
+        previous_id, target_id = ObjectId(), ObjectId()
+        previous_at, target_at = datetime(2026, 1, 1, 12, 0, 0), datetime(2026, 1, 1, 12, 0, 5)
+        repo.messages.find_one = AsyncMock(return_value={"_id": target_id, "created_at": target_at})
+        repo.read_cursors.find_one_and_update = AsyncMock(
+            return_value={"last_read_message_id": previous_id, "last_read_created_at": previous_at}
+        )
+        repo.messages.count_documents = AsyncMock(return_value=3)
+
+        marked = await repo.mark_read_up_to(conversation_id, user_id, str(target_id))
+
+        assert marked == 3
+        stage = repo.read_cursors.find_one_and_update.call_args[0][1][0]["$set"]
+        assert stage["last_read_created_at"]["$cond"][1] == target_at
+        assert stage["last_read_message_id"]["$cond"][1] == target_id
+        query = repo.messages.count_documents.call_args[0][0]
+        assert query["$and"] == [
+            {"$or": [
+                {"created_at": {"$lt": target_at}},
+                {"created_at": target_at, "_id": {"$lte": target_id}}
+            ]},
+            {"$or": [
+                {"created_at": {"$gt": previous_at}},
+                {"created_at": previous_at, "_id": {"$gt": previous_id}}
+            ]}
+        ]
+        assert query["sender_id"] == {"$ne": str(user_id)}
+        ownership = repo.messages.find_one.call_args[0][0]
+        assert ownership == {"_id": target_id, "conversation_id": str(conversation_id)}
+
+    @pytest.mark.asyncio
+    async def test_mark_read_rejects_message_from_other_conversation(self, repo):
+        repo.messages.find_one = AsyncMock(return_value=None)
+        repo.read_cursors.find_one_and_update = AsyncMock()
+
+        marked = await repo.mark_read_up_to(uuid.uuid4(), uuid.uuid4(), str(ObjectId()))
+
+        assert marked == 0
+        repo.read_cursors.find_one_and_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mark_read_never_moves_cursor_backwards(self, repo):
+        older_id, newer_id = ObjectId(), ObjectId()
+        now = datetime.utcnow()
+        repo.messages.find_one = AsyncMock(return_value={"_id": older_id, "created_at": now})
+        repo.read_cursors.find_one_and_update = AsyncMock(
+            return_value={"last_read_message_id": newer_id, "last_read_created_at": now}
+        )
+        repo.messages.count_documents = AsyncMock()
+
+        marked = await repo.mark_read_up_to(uuid.uuid4(), uuid.uuid4(), str(older_id))
+
+        assert marked == 0
+        repo.messages.count_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mark_read_defaults_to_latest_message(self, repo):
+        latest_id, latest_at = ObjectId(), datetime.utcnow()
+        repo.messages.find_one = AsyncMock(return_value={"_id": latest_id, "created_at": latest_at})
+        repo.read_cursors.find_one_and_update = AsyncMock(return_value=None)
+        repo.messages.count_documents = AsyncMock(return_value=7)
+
+        marked = await repo.mark_read_up_to(uuid.uuid4(), uuid.uuid4())
+
+        assert marked == 7
+        assert repo.messages.find_one.call_args.kwargs["sort"] == [("created_at", -1), ("_id", -1)]
+        query = repo.messages.count_documents.call_args[0][0]
+        assert query["$and"] == [{"$or": [
+            {"created_at": {"$lt": latest_at}},
+            {"created_at": latest_at, "_id": {"$lte": latest_id}}
+        ]}]
+
+    @pytest.mark.asyncio
+    async def test_cursor_position_orders_on_created_at_before_object_id(self, repo):
+        # Another worker's message from the same second can carry a smaller ObjectId
+        cursor_at = datetime(2026, 1, 1, 12, 0, 0, 400000)
+        cursor_id = ObjectId("650000000000000000000002")
+        later_at, later_id = cursor_at + timedelta(milliseconds=100), ObjectId("650000000000000000000001")
+        repo.messages.find_one = AsyncMock(return_value={"_id": later_id, "created_at": later_at})
+        repo.read_cursors.find_one_and_update = AsyncMock(
+            return_value={"last_read_message_id": cursor_id, "last_read_created_at": cursor_at}
+        )
+        repo.messages.count_documents = AsyncMock(return_value=1)
+
+        marked = await repo.mark_read_up_to(uuid.uuid4(), uuid.uuid4(), str(later_id))
+
+        assert marked == 1
+        receipts = ReadCursorRepository.readers_of(
+            {"_id": later_id, "created_at": later_at, "sender_id": "someone"},
+            [{"user_id": "reader", "last_read_message_id": cursor_id, "last_read_created_at": cursor_at}]
+        )
+        assert receipts == []
+
+    @pytest.mark.asyncio
+    async def test_unread_count_uses_cursor(self, repo):
+        cursor_id, cursor_at = ObjectId(), datetime.utcnow()
+        repo.read_cursors.find_one = AsyncMock(
+            return_value={"last_read_message_id": cursor_id, "last_read_created_at": cursor_at}
+        )
+        repo.messages.count_documents = AsyncMock(return_value=2)
+
+        count = await repo.get_unread_count(uuid.uuid4(), uuid.uuid4(), {"deleted_at": None})
+
+        assert count == 2
+        query = repo.messages.count_documents.call_args[0][0]
+        assert query["$or"] == [
+            {"created_at": {"$gt": cursor_at}},
+            {"created_at": cursor_at, "_id": {"$gt": cursor_id}}
+        ]
+        assert query["deleted_at"] is None
+
+    def test_readers_of_derives_receipts(self):
+        sender, reader, laggard = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+        before, message_id, after = ObjectId(), ObjectId(), ObjectId()
+        now = datetime.utcnow()
+        cursors = [
+            {"user_id": reader, "last_read_message_id": after, "last_read_created_at": now, "last_read_at": now},
+            {"user_id": sender, "last_read_message_id": after, "last_read_created_at": now, "last_read_at": now},
+            {"user_id": laggard, "last_read_message_id": before, "last_read_created_at": now, "last_read_at": now},
+        ]
+
+        receipts = ReadCursorRepository.readers_of(
+            {"_id": message_id, "created_at": now, "sender_id": sender}, cursors
+        )
+
+        assert receipts == [{"user_id": reader, "read_at": now}]
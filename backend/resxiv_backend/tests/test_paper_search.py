@@ -0,0 +1,90 @@
+"""
+Tests for indexed paper keyword search.
+
+Queries are compiled for PostgreSQL and inspected; no database is needed.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.repositories.paper_repository import PaperRepository
+from app.schemas.paper import Paper
+
+
+def compiled(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect())).lower()
+
+
+@pytest.fixture
+def repository():
+    session = AsyncMock(spec=AsyncSession)
+    count = Mock()
+    count.scalar.return_value = 0
+    rows = Mock()
+    rows.scalars.return_value.all.return_value = []
+    session.execute.side_effect = [count, rows]
+    return PaperRepository(session)
+
+
+def page_query(repository) -> str:
+    return compiled(repository.session.execute.call_args_list[1].args[0])
+
+
+class TestPaperSearchVector:
+    """Generated column and index definition"""
+
+    def test_weighted_generated_column(self):
+        ddl = str(CreateTable(Paper.__table__).compile(dialect=postgresql.dialect()))
+
+        assert "search_vector TSVECTOR GENERATED ALWAYS AS" in ddl
+        assert "STORED" in ddl
+        assert "coalesce(title, '')), 'A')" in ddl
+        assert "immutable_array_to_string(keywords)), 'B')" in ddl
+        assert "immutable_array_to_string(authors)), 'C')" in ddl
+        assert "coalesce(abstract, '')), 'D')" in ddl
+
+    def test_gin_index(self):
+        index = next(i for i in Paper.__table__.indexes if i.name == "idx_papers_search_vector")
+
+        assert "using gin" in str(CreateIndex(index).compile(dialect=postgresql.dialect())).lower()
+
+    def test_search_vector_not_loaded_with_papers(self):
+        assert "search_vector" not in compiled(select(Paper)).split("from")[0]
+
+
+class TestPaperRepositorySearch:
+    """Keyword search paths use the tsvector index"""
+
+    @pytest.mark.asyncio
+    async def test_project_search_uses_full_text_index(self, repository):
+        await repository.get_papers_by_project(
+            uuid.uuid4(), search_query="graph networks", sort_by="relevance", include_diagnostics=False
+        )
+
+        sql = page_query(repository)
+        assert "papers.search_vector @@ websearch_to_tsquery" in sql
+        assert "ilike" not in sql
+        assert "order by ts_rank_cd(papers.search_vector" in sql
+
+    @pytest.mark.asyncio
+    async def test_project_search_keeps_requested_sort(self, repository):
+        await repository.get_papers_by_project(
+            uuid.uuid4(), search_query="graph", sort_by="title", sort_order="asc", include_diagnostics=False
+        )
+
+        assert "order by papers.title asc" in page_query(repository)
+
+    @pytest.mark.asyncio
+    async def test_search_papers_ranks_matches(self, repository):
+        await repository.search_papers("\"protein folding\" -review")
+
+        sql = page_query(repository)
+        assert "papers.search_vector @@ websearch_to_tsquery" in sql
+        assert "ilike" not in sql
+        assert "order by ts_rank_cd(papers.search_vector" in sql
@@ -0,0 +1,165 @@
+"""
+Tests for set-based bulk deletion and moving of project files.
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.core.error_handling import ServiceError
+from app.services.project_file_bulk_service import ProjectFileBulkService, normalize_folder
+
+
+def file_row(path, owner, folder=None, is_admin=False, size=10):
+    return SimpleNamespace(
+        id=uuid.uuid4(), file_path=str(path), original_filename=path.name, file_size=size,
+        folder=folder, user_id=owner, is_admin=is_admin
+    )
+
+
+def fetched(rows):
+    result = Mock()
+    result.fetchall.return_value = rows
+    return result
+
+
+def changed(rows):
+    return fetched([SimpleNamespace(id=row.id) for row in rows])
+
+
+def make_service(tmp_path, *results):
+    session = Mock(commit=AsyncMock(), rollback=AsyncMock())
+    session.execute = AsyncMock(side_effect=list(results))
+    return ProjectFileBulkService(session, uploads_root=tmp_path)
+
+
+@pytest.fixture
+def uploads(tmp_path):
+    def write(name, folder=None):
+        directory = tmp_path / folder if folder else tmp_path
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / name
+        path.write_text(name)
+        return path
+    return write
+
+
+class TestNormalizeFolder:
+    """Target folders stay inside the uploads directory"""
+
+    def test_root(self):
+        assert normalize_folder(None) is None
+        assert normalize_folder("/") is None
+
+    def test_nested(self):
+        assert normalize_folder("figures//plots/") == "figures/plots"
+
+    @pytest.mark.parametrize("folder", ["../etc", "/abs", "a/../../b"])
+    def test_rejects_escapes(self, folder):
+        with pytest.raises(ServiceError):
+            normalize_folder(folder)
+
+
+class TestBulkDelete:
+    """One DELETE, disk work in parallel, per-file report"""
+
+    @pytest.mark.asyncio
+    async def test_deletes_rows_and_files(self, tmp_path, uploads):
+        owner = uuid.uuid4()
+        rows = [file_row(uploads(f"f{i}.png"), owner) for i in range(3)]
+        service = make_service(tmp_path, fetched(rows), changed(rows))
+
+        results = await service.delete_files(uuid.uuid4(), [str(row.id) for row in rows], str(owner))
+
+        assert results["files_deleted"] == 3 and results["space_freed"] == 30
+        assert all(entry["disk_deleted"] for entry in results["successful_deletions"])
+        assert list(tmp_path.iterdir()) == []
+        assert service.session.execute.await_count == 2
+        delete_sql, params = service.session.execute.call_args.args
+        assert "WHERE id = ANY(:file_ids)" in str(delete_sql)
+        assert params["file_ids"] == [row.id for row in rows]
+        service.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_permission_and_lookup_failures_reported_per_file(self, tmp_path, uploads):
+        owner, other = uuid.uuid4(), uuid.uuid4()
+        mine, theirs = file_row(uploads("mine.tex"), owner), file_row(uploads("theirs.tex"), other)
+        missing = str(uuid.uuid4())
+        service = make_service(tmp_path, fetched([mine, theirs]), changed([mine]))
+
+        results = await service.delete_files(uuid.uuid4(), [str(mine.id), str(theirs.id), missing, "bad"], str(owner))
+
+        errors = {entry["file_id"]: entry["error"] for entry in results["failed_deletions"]}
+        assert errors[str(theirs.id)].startswith("Permission denied")
+        assert errors[missing] == "File not found or not in this project"
+        assert errors["bad"] == "Invalid file ID"
+        assert (tmp_path / "theirs.tex").exists()
+        assert service.session.execute.call_args.args[1]["file_ids"] == [mine.id]
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_restores_files(self, tmp_path, uploads):
+        owner = uuid.uuid4()
+        row = file_row(uploads("keep.tex"), owner)
+        service = make_service(tmp_path, fetched([row]), RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError):
+            await service.delete_files(uuid.uuid4(), [str(row.id)], str(owner))
+
+        assert [path.name for path in tmp_path.iterdir()] == ["keep.tex"]
+        service.session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_on_disk_still_deletes_row(self, tmp_path):
+        owner = uuid.uuid4()
+        row = file_row(tmp_path / "gone.tex", owner)
+        service = make_service(tmp_path, fetched([row]), changed([row]))
+
+        results = await service.delete_files(uuid.uuid4(), [str(row.id)], str(owner))
+
+        assert results["successful_deletions"][0]["disk_deleted"] is False
+
+
+class TestBulkMove:
+    """One UPDATE over unnest, files renamed into the target folder"""
+
+    @pytest.mark.asyncio
+    async def test_moves_files_on_disk_and_in_metadata(self, tmp_path, uploads):
+        owner = uuid.uuid4()
+        rows = [file_row(uploads(f"f{i}.png", "old"), owner, folder="old") for i in range(2)]
+        service = make_service(tmp_path, fetched(rows), changed(rows))
+
+        results = await service.move_files(uuid.uuid4(), [str(row.id) for row in rows], "figures", str(owner))
+
+        assert results["files_moved"] == 2
+        assert sorted(path.name for path in (tmp_path / "figures").iterdir()) == ["f0.png", "f1.png"]
+        params = service.session.execute.call_args.args[1]
+        assert params["target_folder"] == "figures"
+        assert params["file_paths"] == [str(tmp_path / "figures" / f"f{i}.png") for i in range(2)]
+        assert results["successful_moves"][0]["from_folder"] == "old"
+
+    @pytest.mark.asyncio
+    async def test_name_clash_fails_only_that_file(self, tmp_path, uploads):
+        owner = uuid.uuid4()
+        uploads("a.png", "figures")
+        clash, free = file_row(uploads("a.png"), owner), file_row(uploads("b.png"), owner)
+        service = make_service(tmp_path, fetched([clash, free]), changed([free]))
+
+        results = await service.move_files(uuid.uuid4(), [str(clash.id), str(free.id)], "figures", str(owner))
+
+        assert [entry["file_id"] for entry in results["successful_moves"]] == [str(free.id)]
+        assert "already exists" in results["failed_moves"][0]["error"]
+        assert (tmp_path / "a.png").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_moves_files_back(self, tmp_path, uploads):
+        owner = uuid.uuid4()
+        row = file_row(uploads("a.png"), owner)
+        service = make_service(tmp_path, fetched([row]), RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError):
+            await service.move_files(uuid.uuid4(), [str(row.id)], "figures", str(owner))
+
+        assert (tmp_path / "a.png").exists()
+        assert not (tmp_path / "figures" / "a.png").exists()
@@ -0,0 +1,86 @@
+"""
+Tests for Redis Real-time Fan-out
+L6 Engineering Standards - Constant round trips per conversation
+"""
+
+import json
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.redis_service import RedisService
+from app.services.message.message_realtime import MessageRealtimeService
+
+
+@pytest.fixture
+def redis_client():
+    client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    client.pipeline.return_value = pipe
+    return client
+
+
+@pytest.fixture
+def redis_service(redis_client):
+    db_manager = MagicMock()
+    db_manager.redis_client = redis_client
+    return RedisService(db_manager)
+
+
+class TestRedisFanout:
+    """Test cases for pipelined RedisService operations"""
+
+    @pytest.mark.asyncio
+    async def test_unread_fanout_is_one_pipeline(self, redis_service, redis_client):
+        conversation_id = uuid.uuid4()
+        members = [str(uuid.uuid4()) for _ in range(50)]
+
+        await redis_service.increment_unread_counts(conversation_id, members)
+
+        pipe = redis_client.pipeline.return_value
+        assert redis_client.pipeline.call_count == 1
+        assert pipe.incr.call_count == 50
+        assert pipe.expire.call_count == 50
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_online_user_ids_uses_single_mget(self, redis_service, redis_client):
+        online, offline = str(uuid.uuid4()), str(uuid.uuid4())
+        redis_client.mget = AsyncMock(return_value=['{"last_seen": "2024-01-01T00:00:00"}', None])
+
+        result = await redis_service.get_online_user_ids([online, offline])
+
+        assert result == [online]
+        redis_client.mget.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_hash_fields(self, redis_service, redis_client):
+        user_id, conversation_id = uuid.uuid4(), uuid.uuid4()
+
+        await redis_service.add_websocket_connection(user_id, conversation_id, "conn-1")
+        await redis_service.remove_websocket_connection(user_id, conversation_id, "conn-1")
+
+        pipe = redis_client.pipeline.return_value
+        conv_key = f"ws:connections:conversation:{conversation_id}"
+        assert pipe.hset.call_args[0][:2] == (conv_key, "conn-1")
+        assert json.loads(pipe.hset.call_args[0][2])["user_id"] == str(user_id)
+        pipe.hdel.assert_called_once_with(conv_key, "conn-1")
+        redis_client.smembers.assert_not_called()
+
+
+class TestMessageRealtimeFanout:
+    """Test cases for MessageRealtimeService fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_update_unread_counts_excludes_sender(self):
+        sender, other = uuid.uuid4(), uuid.uuid4()
+        redis_service = MagicMock()
+        redis_service.get_conversation_participants = AsyncMock(return_value=[str(sender), str(other)])
+        redis_service.increment_unread_counts = AsyncMock()
+        service = MessageRealtimeService(redis_service)
+        conversation_id = uuid.uuid4()
+
+        await service.update_unread_counts(conversation_id, sender)
+
+        redis_service.increment_unread_counts.assert_awaited_once_with(conversation_id, [str(other)])
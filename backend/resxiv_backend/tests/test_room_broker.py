@@ -0,0 +1,153 @@
+"""
+Tests for Collaborative Editing Room Broker
+L6 Engineering Standards - Horizontally scalable Yjs fan-out
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.websockets.room_broker import RoomBroker, PeerConnection, CHANNEL_PREFIX
+
+
+def make_websocket():
+    websocket = MagicMock()
+    websocket.send_bytes = AsyncMock()
+    websocket.close = AsyncMock()
+    return websocket
+
+
+@pytest.fixture
+def broker():
+    broker = RoomBroker(max_queue=4)
+    broker.redis_url = None  # local-only mode
+    return broker
+
+
+class TestRoomBroker:
+    """Test cases for RoomBroker"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_peers_except_sender(self, broker):
+        alice_ws, bob_ws = make_websocket(), make_websocket()
+        alice = await broker.join("room", alice_ws)
+        await broker.join("room", bob_ws)
+
+        await broker.broadcast("room", b"update", sender=alice)
+        await asyncio.sleep(0)
+
+        bob_ws.send_bytes.assert_awaited_once_with(b"update")
+        alice_ws.send_bytes.assert_not_awaited()
+        await broker.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_peer_is_disconnected_without_blocking_others(self, broker):
+        fast_ws, slow_ws = make_websocket(), make_websocket()
+        blocked = asyncio.Event()
+
+        async def never_completes(data):
+            await blocked.wait()
+
+        slow_ws.send_bytes = AsyncMock(side_effect=never_completes)
+        await broker.join("room", fast_ws)
+        await broker.join("room", slow_ws)
+
+        for i in range(10):
+            await broker.broadcast("room", bytes([i]))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert fast_ws.send_bytes.await_count == 10
+        slow_ws.close.assert_awaited_once_with(code=PeerConnection.SLOW_CONSUMER_CLOSE_CODE)
+        await broker.close()
+
+    @pytest.mark.asyncio
+    async def test_leave_removes_empty_room(self, broker):
+        peer = await broker.join("room", make_websocket())
+
+        await broker.leave("room", peer)
+
+        assert "room" not in broker.rooms
+        assert "room" not in broker._room_locks
+
+    @pytest.mark.asyncio
+    async def test_room_lock_kept_while_a_join_waits_on_it(self, broker):
+        unsubscribe_gate, subscribe_gate = asyncio.Event(), asyncio.Event()
+        subscribe_gate.set()
+
+        async def unsubscribe(channel):
+            await unsubscribe_gate.wait()
+
+        async def subscribe(channel):
+            await subscribe_gate.wait()
+
+        broker._pubsub = MagicMock(
+            subscribed=False, subscribe=AsyncMock(side_effect=subscribe),
+            unsubscribe=AsyncMock(side_effect=unsubscribe), aclose=AsyncMock()
+        )
+        alice = await broker.join("room", make_websocket())
+        subscribe_gate.clear()
+
+        leaving = asyncio.create_task(broker.leave("room", alice))
+        await asyncio.sleep(0.01)
+        joining = asyncio.create_task(broker.join("room", make_websocket()))
+        await asyncio.sleep(0.01)
+        lock = broker._room_locks["room"]
+
+        unsubscribe_gate.set()
+        await leaving
+        await asyncio.sleep(0.01)
+
+        # The join that waited through the leave holds the same lock a later
+        # caller will get, so the two cannot run side by side
+        assert broker._room_locks.get("room") is lock and lock.locked()
+        late = asyncio.create_task(broker.join("room", make_websocket()))
+        await asyncio.sleep(0.01)
+        assert not late.done()
+
+        subscribe_gate.set()
+        bob, carol = await asyncio.gather(joining, late)
+        await broker.leave("room", bob)
+        await broker.leave("room", carol)
+        assert "room" not in broker._room_locks
+        await broker.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_subscribe_does_not_leak_peer(self, broker):
+        broker._pubsub = MagicMock(subscribe=AsyncMock(side_effect=ConnectionError("redis down")))
+
+        with pytest.raises(ConnectionError):
+            await broker.join("room", make_websocket())
+
+        assert "room" not in broker.rooms
+        # The peer's sender task was stopped, not left draining a dead socket
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        broker._pubsub = None
+        await broker.close()
+
+    @pytest.mark.asyncio
+    async def test_remote_frames_are_delivered_and_own_echoes_skipped(self, broker):
+        websocket = make_websocket()
+        await broker.join("room", websocket)
+        other_node = b"\x01" * 16
+        frames = [
+            {"type": "message", "channel": (CHANNEL_PREFIX + "room").encode(), "data": broker.node_id + b"own"},
+            {"type": "message", "channel": (CHANNEL_PREFIX + "room").encode(), "data": other_node + b"remote"},
+        ]
+        pubsub = MagicMock()
+        pubsub.subscribed = True
+
+        async def get_message(**kwargs):
+            if frames:
+                return frames.pop(0)
+            broker._pubsub = None  # stop the listener loop
+            return None
+
+        pubsub.get_message = get_message
+        broker._pubsub = pubsub
+
+        await broker._listen()
+        await asyncio.sleep(0)
+
+        websocket.send_bytes.assert_awaited_once_with(b"remote")
+        await broker.close()
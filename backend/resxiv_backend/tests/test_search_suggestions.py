@@ -0,0 +1,132 @@
+"""
+Tests for indexed, ACL-filtered search suggestions.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.search.suggestion_service import SuggestionService, prefix_range
+
+
+def suggestion_row(text, type_, category):
+    return {"text": text, "type": type_, "category": category}
+
+
+class FakeSessions:
+    """Session factory returning fixed rows and recording every query"""
+
+    def __init__(self, rows):
+        self.session = Mock()
+        result = Mock()
+        result.mappings.return_value.all.return_value = rows
+        self.session.execute = AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def __call__(self):
+        yield self.session
+
+    def sql(self, call=0) -> str:
+        return str(self.session.execute.call_args_list[call].args[0])
+
+    def params(self, call=0) -> dict:
+        return self.session.execute.call_args_list[call].args[1]
+
+
+class TestPrefixRange:
+    """Index range for a typed prefix"""
+
+    def test_range_is_case_insensitive_and_half_open(self):
+        assert prefix_range("  Graph ") == ("graph", "grapi")
+
+    def test_wildcards_are_literal(self):
+        assert prefix_range("50%_") == ("50%_", "50%`")
+
+
+class TestSuggestionService:
+    """Single indexed lookup with ACL filtering and caching"""
+
+    @pytest.mark.asyncio
+    async def test_all_entities_in_one_round_trip(self):
+        sessions = FakeSessions([
+            suggestion_row("Graph Attention Networks", "paper_title", "papers"),
+            suggestion_row("Graph Lab", "project_name", "projects"),
+            suggestion_row("Grace Hopper", "user_name", "users")
+        ])
+
+        suggestions = await SuggestionService(sessions).suggest("gra", user_id="u1", limit=9)
+
+        assert [s["category"] for s in suggestions] == ["papers", "projects", "users"]
+        assert sessions.session.execute.await_count == 1
+        sql = sessions.sql()
+        assert sql.count("UNION ALL") == 2
+        assert "ILIKE" not in sql
+        assert "~>=~ :prefix" in sql and "~<~ :prefix_end" in sql
+        assert sessions.params() == {"prefix": "gra", "prefix_end": "grb", "user_id": "u1", "limit": 3}
+
+    @pytest.mark.asyncio
+    async def test_papers_and_projects_scoped_to_membership(self):
+        sessions = FakeSessions([])
+
+        await SuggestionService(sessions).suggest("gr", user_id="u1", entity_types=["papers", "projects"])
+
+        sql = sessions.sql()
+        assert sql.count("pm.user_id = :user_id") == 2
+        assert "FROM users" not in sql
+
+    @pytest.mark.asyncio
+    async def test_users_scoped_to_shared_projects(self):
+        sessions = FakeSessions([])
+
+        await SuggestionService(sessions).suggest("gr", user_id="u1", entity_types=["users"])
+
+        sql = sessions.sql()
+        assert "theirs.user_id = u.id" in sql
+        assert "pm.project_id = theirs.project_id" in sql
+        assert "pm.user_id = :user_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_duplicates_removed_and_limit_applied(self):
+        sessions = FakeSessions([
+            suggestion_row("Survey", "paper_title", "papers"),
+            suggestion_row("Survey", "paper_title", "papers"),
+            suggestion_row("Survey", "project_name", "projects"),
+            suggestion_row("Surveys II", "paper_title", "papers")
+        ])
+
+        suggestions = await SuggestionService(sessions).suggest("sur", user_id="u1", limit=2)
+
+        assert suggestions == [
+            suggestion_row("Survey", "paper_title", "papers"),
+            suggestion_row("Survey", "project_name", "projects")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_repeated_prefix_served_from_cache_per_user(self):
+        sessions = FakeSessions([suggestion_row("Graph Lab", "project_name", "projects")])
+        service = SuggestionService(sessions)
+
+        first = await service.suggest("Gra", user_id="u1")
+        again = await service.suggest("gra ", user_id="u1")
+        await service.suggest("gra", user_id="u2")
+
+        assert again == first
+        assert sessions.session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refreshed(self):
+        sessions = FakeSessions([])
+        service = SuggestionService(sessions, ttl_seconds=0)
+
+        await service.suggest("gra", user_id="u1")
+        await service.suggest("gra", user_id="u1")
+
+        assert sessions.session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_entity_type_returns_nothing(self):
+        sessions = FakeSessions([])
+
+        assert await SuggestionService(sessions).suggest("gra", user_id="u1", entity_types=["conversations"]) == []
+        sessions.session.execute.assert_not_awaited()
@@ -0,0 +1,190 @@
+"""
+Tests for the batched, cached user directory.
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.user_directory import UserDirectory, fallback_name
+from app.utils import user_mapping
+
+
+def user_row(name, deleted=False):
+    return SimpleNamespace(
+        id=uuid.uuid4(), name=name, email=f"{name.lower()}@example.com",
+        created_at=datetime(2024, 1, 1), deleted_at=datetime(2024, 2, 1) if deleted else None
+    )
+
+
+class FakeUsers:
+    """Session factory answering ``WHERE id = ANY(:ids)`` from a fixed user list"""
+
+    def __init__(self, *rows):
+        self.rows = {row.id: row for row in rows}
+        self.queries = []
+
+    @asynccontextmanager
+    async def session(self):
+        async def execute(statement, params):
+            self.queries.append(list(params["ids"]))
+            result = Mock()
+            result.fetchall.return_value = [self.rows[i] for i in params["ids"] if i in self.rows]
+            return result
+
+        yield Mock(execute=AsyncMock(side_effect=execute))
+
+    def directory(self, **kwargs):
+        return UserDirectory(session_factory=self.session, ttl_seconds=60, max_entries=100, **kwargs)
+
+
+class TestLookups:
+    """Batching, coalescing and caching"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self):
+        ada, bob = user_row("Ada"), user_row("Bob")
+        users = FakeUsers(ada, bob)
+        directory = users.directory()
+
+        first, second, both = await asyncio.gather(
+            directory.get(ada.id), directory.get(str(ada.id)), directory.get_many([ada.id, bob.id])
+        )
+
+        assert first["name"] == second["name"] == "Ada"
+        assert set(both) == {str(ada.id), str(bob.id)}
+        assert len(users.queries) == 1 and set(users.queries[0]) == {ada.id, bob.id}
+        assert directory.stats["coalesced"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_are_cache_hits(self):
+        ada = user_row("Ada", deleted=True)
+        users = FakeUsers(ada)
+        directory = users.directory()
+
+        await directory.get(ada.id)
+        info = await directory.get(ada.id)
+
+        assert info["is_active"] is False
+        assert len(users.queries) == 1
+        assert directory.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_users_are_cached_as_missing(self):
+        users = FakeUsers()
+        directory = users.directory()
+        missing = uuid.uuid4()
+
+        assert await directory.get(missing) is None
+        assert await directory.get(missing) is None
+        assert len(users.queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_ids_are_ignored(self):
+        users = FakeUsers()
+        directory = users.directory()
+
+        assert await directory.get_many(["not-a-uuid", None, ""]) == {}
+        assert users.queries == []
+
+    @pytest.mark.asyncio
+    async def test_names_fall_back_for_unknown_users(self):
+        ada = user_row("Ada")
+        missing = uuid.uuid4()
+        directory = FakeUsers(ada).directory()
+
+        names = await directory.get_names([ada.id, missing])
+
+        assert names == {str(ada.id): "Ada", str(missing): fallback_name(missing)}
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        rows = [user_row(f"U{i}") for i in range(5)]
+        directory = UserDirectory(session_factory=FakeUsers(*rows).session, ttl_seconds=60, max_entries=3)
+
+        await directory.get_many(row.id for row in rows)
+
+        assert directory.get_stats()["entries"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_query_reaches_every_waiter(self):
+        @asynccontextmanager
+        async def broken():
+            yield Mock(execute=AsyncMock(side_effect=RuntimeError("db down")))
+
+        directory = UserDirectory(session_factory=broken, ttl_seconds=60, max_entries=10)
+        user_id = uuid.uuid4()
+
+        results = await asyncio.gather(directory.get(user_id), directory.get(user_id), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert directory.get_stats()["entries"] == 0
+
+
+class TestInvalidation:
+    """Profile changes drop cached entries"""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self):
+        ada = user_row("Ada")
+        users = FakeUsers(ada)
+        directory = users.directory()
+
+        await directory.get(ada.id)
+        ada.name = "Ada L."
+        directory.invalidate(ada.id)
+
+        assert (await directory.get(ada.id))["name"] == "Ada L."
+        assert len(users.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_waits_for_commit(self):
+        ada = user_row("Ada")
+        directory = FakeUsers(ada).directory()
+        await directory.get(ada.id)
+        session = Session()
+
+        directory.invalidate_after_commit(session, ada.id)
+        assert directory.get_stats()["entries"] == 1
+
+        session.commit()
+        assert directory.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_pending_invalidation(self):
+        ada = user_row("Ada")
+        directory = FakeUsers(ada).directory()
+        await directory.get(ada.id)
+        session = Session(create_engine("sqlite://"))
+
+        session.execute(text("SELECT 1"))
+        directory.invalidate_after_commit(session, ada.id)
+        session.rollback()
+        session.commit()
+
+        assert directory.get_stats()["entries"] == 1
+
+
+class TestUserMapping:
+    """Name resolution helpers use the directory"""
+
+    @pytest.mark.asyncio
+    async def test_resolve_names(self, monkeypatch):
+        ada = user_row("Ada")
+        users = FakeUsers(ada)
+        monkeypatch.setattr(user_mapping, "user_directory", users.directory())
+        missing = uuid.uuid4()
+
+        names = await user_mapping.resolve_user_uuids_to_names([ada.id, missing, "bad"])
+        single = await user_mapping.resolve_user_uuid_to_name(ada.id)
+
+        assert names[str(ada.id)] == "Ada" and single == "Ada"
+        assert names[str(missing)] == fallback_name(missing)
+        assert len(users.queries) == 1
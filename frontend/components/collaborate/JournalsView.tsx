@@ -359,9 +359,9 @@ export function JournalsView({ projectId }: JournalsViewProps) {
                         <div className="font-medium text-foreground line-clamp-1 hover:text-primary transition-colors">
                           {journal.title}
                         </div>
-                        {journal.content && (
+                        {journal.excerpt && (
                           <div className="text-sm text-muted-foreground line-clamp-1">
-                            {truncateContent(journal.content, 80)}
+                            {truncateContent(journal.excerpt, 80)}
                           </div>
                         )}
                       </div>
@@ -15,6 +15,10 @@ export interface ConversationResponse {
   participant_count?: number;
   unread_count?: number;
   last_message?: string;
+  last_message_id?: string;
+  last_sender_id?: string;
+  last_sender_name?: string;
+  last_activity_at?: string;
 }
 
 export interface ConversationListResponse {
@@ -27,7 +27,8 @@ export interface JournalUpdate {
 export interface JournalResponse {
   id: string;
   title: string;
-  content: string;
+  content?: string; // Only returned for a single journal
+  excerpt?: string; // Start of the content, returned by list endpoints
   is_public: boolean;
   status: string;
   metadata?: any;